@@ -5,22 +5,36 @@ Alias: nwpver
 '''
 
 # GLOBAL MODULES
+import asyncio
 import copy
+import json
+import mmap
+import multiprocessing
+import fnmatch
+import hashlib
 import os
 import platform
 import re
 import requests
+import struct
 import subprocess
+import tempfile
+import weakref
+import zlib
 import xml.etree.ElementTree as ET
-from dataclasses import dataclass
-from datetime import datetime
-from lxml import html
+from contextlib import AbstractContextManager, ExitStack, contextmanager, nullcontext
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timezone
+from lxml import etree, html
 from lxml.html import HtmlElement
+from queue import Queue
 from re import Match, Pattern
 from requests import Response
 from subprocess import CompletedProcess
-from time import sleep
-from typing import Any, Callable, Final, Literal, Optional, Tuple, cast, Protocol, runtime_checkable
+from threading import Condition, Event, Lock, Thread
+from time import sleep, time
+from typing import Any, Callable, Final, Hashable, Iterator, Literal, Optional, Tuple, Union, cast, Protocol, runtime_checkable
 from xml.etree.ElementTree import Element
 
 # LOCAL MODULES
@@ -31,6 +45,40 @@ class DEFAULT:
 
     ONLY_STABLE_RELEASES : Final[bool] = True
     WAITING_TIME : Final[int] = 10
+    MAX_RETRIES : Final[int] = 2
+    RETRY_BACKOFF : Final[int] = 5
+    NEGATIVE_CACHE_TTL : Final[int] = 86400
+    CONNECT_TIMEOUT : Final[float] = 5.0
+    READ_TIMEOUT : Final[float] = 30.0
+    INDEX_URL : Final[str] = "https://pypi.org"
+    HEDGE_DELAY : Final[float] = 2.0
+    HEDGE_WORKERS : Final[int] = 16
+    MIN_CONCURRENCY : Final[int] = 1
+    MAX_CONCURRENCY : Final[int] = 16
+    LATENCY_SPIKE_FACTOR : Final[float] = 3.0
+    FETCH_WORKERS : Final[int] = 4
+    PARSE_WORKERS : Final[int] = 2
+    QUEUE_SIZE : Final[int] = 32
+    HISTORY_MAX_BYTES : Final[int] = 2 * 1024 * 1024
+    HISTORY_CHUNK_SIZE : Final[int] = 16 * 1024
+    SUMMARY_CACHE_TTL : Final[int] = 3600
+    SUMMARY_CACHE_GRACE : Final[int] = 86400
+    RELEASE_CACHE_TTL : Final[int] = 3600
+    RELEASE_CACHE_GRACE : Final[int] = 6 * 3600
+    MIN_RELEASE_CACHE_TTL : Final[int] = 900
+    MAX_RELEASE_CACHE_TTL : Final[int] = 7 * 86400
+    CADENCE_TTL_FACTOR : Final[float] = 0.1
+    CADENCE_WINDOW : Final[int] = 10
+    CACHE_DIR : Final[str] = os.path.join(os.path.expanduser("~"), ".cache", "nwpackageversions")
+    JOURNAL_DIR : Final[str] = os.path.join(CACHE_DIR, "journals")
+    WATCH_POLL_INTERVAL : Final[int] = 1
+    PROXY_FEED_TTL : Final[int] = 60
+    PROXY_NOT_FOUND_TTL : Final[int] = 300
+    PROXY_RATE_LIMIT : Final[float] = 5.0
+    BASELINE_FRESHNESS : Final[int] = 7 * 86400
+    JOURNAL_MAX_AGE : Final[int] = 86400
+    CACHE_STATS_BATCH : Final[int] = 100
+    AGE_HISTOGRAM_BUCKETS : Final[list[Tuple[str, float]]] = [("<1h", 3600), ("1h-1d", 86400), ("1d-7d", 7 * 86400), (">7d", float("inf"))]
     
 # DTOs
 @dataclass(frozen = True)
@@ -120,13 +168,19 @@ class Release():
 @dataclass(frozen = True)
 class FSession():
 
-    '''Represents a fetching session.'''
+    '''
+        Represents a fetching session.
+
+        When served by a release cache, "age" is the number of seconds since it was fetched and "is_stale" tells if it's being revalidated.
+    '''
 
     package_name : str
     most_recent_release : Release
     releases : list[Release]
     xml_items : list[XMLItem]
     badges : Optional[list[Badge]]
+    age : float = 0.0
+    is_stale : bool = False
 
     def __str__(self):
 
@@ -139,18 +193,85 @@ class FSession():
                 f"'most_recent_release': '{mrr_formatter(self.most_recent_release)}', "
                 f"'releases': '{len(self.releases)}', "
                 f"'xml_items': '{len(self.xml_items)}', "
-                f"'badges': '{badge_formatter(self.badges)}'"
+                f"'badges': '{badge_formatter(self.badges)}', "
+                f"'age': '{self.age:.2f}', "
+                f"'is_stale': '{self.is_stale}'"
+                " }"                
+            )
+@dataclass(frozen = True)
+class DSession():
+
+    '''Represents a downloading session: the raw content of the releases.xml and #history pages, not parsed yet.'''
+
+    package_name : str
+    only_stable_releases : bool
+    url : str
+    releases_content : str
+    history_content : Optional[bytes]
+
+    def __str__(self):
+
+        history_formatter : Callable[[Optional[bytes]], str] = lambda content : str(None) if content is None else str(len(content))
+
+        return str(
+                "{ "
+                f"'package_name': '{self.package_name}', "
+                f"'only_stable_releases': '{self.only_stable_releases}', "
+                f"'url': '{self.url}', "
+                f"'releases_content': '{len(self.releases_content)}', "
+                f"'history_content': '{history_formatter(self.history_content)}'"
+                " }"                
+            )
+@dataclass(frozen = True)
+class PSession():
+
+    '''Represents a parsing session: the compact, picklable result of parsing the content of a DSession.'''
+
+    package_name : str
+    only_stable_releases : bool
+    url : str
+    xml_items : list[XMLItem]
+    badges : Optional[list[Badge]]
+
+    def __str__(self):
+        return str(
+                "{ "
+                f"'package_name': '{self.package_name}', "
+                f"'only_stable_releases': '{self.only_stable_releases}', "
+                f"'url': '{self.url}', "
+                f"'xml_items': '{len(self.xml_items)}', "
+                f"'badges': '{str(None) if self.badges is None else len(self.badges)}'"
                 " }"                
             )
 @dataclass(frozen = True)
 class RequirementDetail():
 
-    '''Represents a detailed requirement status.'''
+    '''
+        Represents a detailed requirement status.
+
+        The "outcome" field is:
+        
+            - "error" when the package couldn't be fetched;
+            - "unchecked" when the run deadline has been hit before the package could be fetched;
+            - "unknown" when the checker is offline and the package isn't available locally.
+        
+        In these cases "most_recent_release" is None. If "outcome" is omitted, it's "matching" or "mismatching" according to "is_version_matching".
+
+        The "age" and "is_stale" fields come from the FSession the detail has been created from.
+    '''
 
     current_package : Package
-    most_recent_release : Release
+    most_recent_release : Optional[Release]
     is_version_matching : bool
     description : str
+    outcome : Optional[Literal["matching", "mismatching", "error", "unchecked", "unknown"]] = None
+    age : float = 0.0
+    is_stale : bool = False
+
+    def __post_init__(self) -> None:
+
+        if self.outcome is None:
+            object.__setattr__(self, "outcome", "matching" if self.is_version_matching else "mismatching")
 @dataclass(frozen = True)
 class RequirementSummary():
 
@@ -162,6 +283,325 @@ class RequirementSummary():
     mismatching : int
     mismatching_prc : str
     details : list[RequirementDetail]
+    errors : int = 0
+    errors_prc : str = "0.00%"
+    unchecked : int = 0
+    unchecked_prc : str = "0.00%"
+    unknown : int = 0
+    unknown_prc : str = "0.00%"
+@dataclass(frozen = True)
+class WSession():
+
+    '''
+        Represents a watching session: the LSession last loaded from a file and the RequirementSummary computed out of it.
+
+        "added", "changed" and "removed" compare the LSession with the one of the previous WSession (packages are matched by name).
+        "rechecked" lists the packages that have actually been fetched, since the conclusive details of the others have been reused.
+    '''
+
+    l_session : LSession
+    requirement_summary : RequirementSummary
+    added : list[Package]
+    changed : list[Package]
+    removed : list[Package]
+    rechecked : list[Package]
+
+    def __str__(self):
+        return str(
+                "{ "
+                f"'added': '{len(self.added)}', "
+                f"'changed': '{len(self.changed)}', "
+                f"'removed': '{len(self.removed)}', "
+                f"'rechecked': '{len(self.rechecked)}'"
+                " }"                
+            )
+@dataclass(frozen = True)
+class BaselineEntry():
+
+    '''Represents a RequirementDetail saved into a baseline, along with the point in time (seconds since the epoch) its release has been fetched at.'''
+
+    requirement_detail : RequirementDetail
+    fetched_at : float
+@dataclass(frozen = True)
+class Baseline():
+
+    '''Represents the RequirementDetail objects of a previous run, saved to be compared with (and partially reused by) the next one.'''
+
+    only_stable_releases : bool
+    saved_at : float
+    entries : list[BaselineEntry]
+
+    def __str__(self):
+        return str(
+                "{ "
+                f"'only_stable_releases': '{self.only_stable_releases}', "
+                f"'saved_at': '{self.saved_at}', "
+                f"'entries': '{len(self.entries)}'"
+                " }"
+            )
+@dataclass(frozen = True)
+class BaselineReport():
+
+    '''
+        Represents the outcome of a check against a baseline.
+
+        "reused" lists the packages whose most recent release has been taken from the baseline, "refetched" the ones that have been fetched again.
+        "newly_outdated" lists the packages that were matching in the baseline and are mismatching now, "newly_current" the opposite (packages are matched by name).
+    '''
+
+    requirement_summary : RequirementSummary
+    baseline : Baseline
+    reused : list[Package]
+    refetched : list[Package]
+    newly_outdated : list[Package]
+    newly_current : list[Package]
+
+    def __str__(self):
+        return str(
+                "{ "
+                f"'reused': '{len(self.reused)}', "
+                f"'refetched': '{len(self.refetched)}', "
+                f"'newly_outdated': '{len(self.newly_outdated)}', "
+                f"'newly_current': '{len(self.newly_current)}'"
+                " }"
+            )
+@dataclass(frozen = True)
+class WarmSummary():
+
+    '''Represents the outcome of a cache warm-up. Each package appears once, even if it's listed in more than one file.'''
+
+    total_packages : int
+    warmed : int
+    errors : int
+    unchecked : int
+    details : list[RequirementDetail]
+
+    def __str__(self):
+        return str(
+                "{ "
+                f"'total_packages': '{self.total_packages}', "
+                f"'warmed': '{self.warmed}', "
+                f"'errors': '{self.errors}', "
+                f"'unchecked': '{self.unchecked}'"
+                " }"                
+            )
+@dataclass(frozen = True)
+class CacheStats():
+
+    '''
+        Represents the state of a FileReleaseCache instance.
+        
+        "hits" and "misses" are collected across all the processes sharing the cache. "age_histogram" counts the entries by age bucket.
+    '''
+
+    entries : int
+    size : int
+    hits : int
+    misses : int
+    hit_ratio : str
+    age_histogram : dict[str, int]
+
+    def __str__(self):
+
+        histogram_formatter : Callable[[dict[str, int]], str] = lambda histogram : ", ".join(f"{bucket}: {count}" for bucket, count in histogram.items())
+
+        return str(
+                "{ "
+                f"'entries': '{self.entries}', "
+                f"'size': '{self.size}', "
+                f"'hits': '{self.hits}', "
+                f"'misses': '{self.misses}', "
+                f"'hit_ratio': '{self.hit_ratio}', "
+                f"'age_histogram': '{histogram_formatter(self.age_histogram)}'"
+                " }"                
+            )
+@dataclass(frozen = True)
+class PruneSummary():
+
+    '''Represents what a FileReleaseCache.prune() call removed: expired entries first, then the least recently used ones.'''
+
+    expired : int
+    evicted : int
+    freed : int
+
+    def __str__(self):
+        return str(
+                "{ "
+                f"'expired': '{self.expired}', "
+                f"'evicted': '{self.evicted}', "
+                f"'freed': '{self.freed}'"
+                " }"                
+            )
+@dataclass(frozen = True)
+class SnapshotEntry():
+
+    '''Represents a FSession stored in a snapshot file, along with the point in time it was fetched at.'''
+
+    package_name : str
+    only_stable_releases : bool
+    fetched_at : float
+    f_session : FSession
+@dataclass(frozen = True)
+class ProxyResponse():
+
+    '''Represents a response returned by CachingProxy. is_hit is True when the body comes from the disk cache.'''
+
+    status : int
+    content_type : str
+    body : bytes
+    is_hit : bool
+@dataclass(frozen = True)
+class HedgingStats():
+
+    '''Represents the counters collected by a HedgedGetter instance.'''
+
+    requests : int
+    hedges_fired : int
+    hedges_won : int
+    time_saved : float
+
+    def __str__(self):
+        return str(
+                "{ "
+                f"'requests': '{self.requests}', "
+                f"'hedges_fired': '{self.hedges_fired}', "
+                f"'hedges_won': '{self.hedges_won}', "
+                f"'time_saved': '{self.time_saved:.2f}'"
+                " }"                
+            )
+@dataclass(frozen = True)
+class ConcurrencyStats():
+
+    '''Represents the live metrics of an AIMDController instance.'''
+
+    limit : int
+    in_flight : int
+    increases : int
+    decreases : int
+
+    def __str__(self):
+        return str(
+                "{ "
+                f"'limit': '{self.limit}', "
+                f"'in_flight': '{self.in_flight}', "
+                f"'increases': '{self.increases}', "
+                f"'decreases': '{self.decreases}'"
+                " }"                
+            )
+@dataclass(frozen = True)
+class SingleFlightStats():
+
+    '''Represents the counters collected by a SingleFlight instance.'''
+
+    leaders : int
+    coalesced : int
+
+    def __str__(self):
+        return str(
+                "{ "
+                f"'leaders': '{self.leaders}', "
+                f"'coalesced': '{self.coalesced}'"
+                " }"                
+            )
+@dataclass(frozen = True)
+class StreamingStats():
+
+    '''Represents what a streamed download of a #history page cost.'''
+
+    package_name : str
+    bytes_read : int
+    bytes_kept : int
+    stopped_early : bool
+    truncated : bool
+    peak_bytes_held : int = 0
+    fell_back : bool = False
+
+    def __str__(self):
+        return str(
+                "{ "
+                f"'package_name': '{self.package_name}', "
+                f"'bytes_read': '{self.bytes_read}', "
+                f"'bytes_kept': '{self.bytes_kept}', "
+                f"'stopped_early': '{self.stopped_early}', "
+                f"'truncated': '{self.truncated}', "
+                f"'peak_bytes_held': '{self.peak_bytes_held}', "
+                f"'fell_back': '{self.fell_back}'"
+                " }"                
+            )
+@dataclass(frozen = True)
+class SyncReport():
+
+    '''Represents the outcome of a sync against the index's global updates feed.'''
+
+    watermark : Optional[datetime]
+    changed : list[str]
+    invalidated : list[str]
+    is_gap : bool
+
+    def __str__(self):
+        return str(
+                "{ "
+                f"'watermark': '{self.watermark}', "
+                f"'changed': '{len(self.changed)}', "
+                f"'invalidated': '{len(self.invalidated)}', "
+                f"'is_gap': '{self.is_gap}'"
+                " }"                
+            )
+@dataclass(frozen = True)
+class SummaryCacheKey():
+
+    '''Identifies a RequirementSummary: same file content, same loading strategy, same options and same index give the same summary.'''
+
+    content_hash : str
+    loader_type : Literal["requirements", "dockerfile"]
+    only_stable_releases : bool
+    index_url : str
+
+    def __str__(self):
+        return str(
+                "{ "
+                f"'content_hash': '{self.content_hash}', "
+                f"'loader_type': '{self.loader_type}', "
+                f"'only_stable_releases': '{self.only_stable_releases}', "
+                f"'index_url': '{self.index_url}'"
+                " }"                
+            )
+@dataclass(frozen = True)
+class CachedSummary():
+
+    '''Represents a RequirementSummary served by a SummaryCache, along with its age in seconds.'''
+
+    summary : RequirementSummary
+    age : float
+    is_stale : bool
+
+    def __str__(self):
+        return str(
+                "{ "
+                f"'summary': '{self.summary}', "
+                f"'age': '{self.age:.2f}', "
+                f"'is_stale': '{self.is_stale}'"
+                " }"                
+            )
+@dataclass(frozen = True)
+class PipelineSettings():
+
+    '''Represents the sizing of the staged pipeline used by RequirementChecker.'''
+
+    fetch_workers : int = DEFAULT.FETCH_WORKERS
+    parse_workers : int = DEFAULT.PARSE_WORKERS
+    queue_size : int = DEFAULT.QUEUE_SIZE
+    parse_in_processes : bool = False
+
+    def __str__(self):
+        return str(
+                "{ "
+                f"'fetch_workers': '{self.fetch_workers}', "
+                f"'parse_workers': '{self.parse_workers}', "
+                f"'queue_size': '{self.queue_size}', "
+                f"'parse_in_processes': '{self.parse_in_processes}'"
+                " }"                
+            )
 
 # STATIC CLASSES
 class _MessageCollectionLambdaCollection():
@@ -182,6 +622,14 @@ class _MessageCollectionValidator():
     @staticmethod
     def provided_file_path_doesnt_exist(file_path : str) -> str:
         return f"The provided 'file_path' doesn't exist: '{file_path}'."
+
+    @staticmethod
+    def deadline_must_be_greater_than_zero(deadline : int) -> str:
+        return f"Deadline ('{str(deadline)}') must be greater than zero seconds."
+
+    @staticmethod
+    def freshness_cant_be_negative(freshness : int) -> str:
+        return f"Freshness ('{str(freshness)}') can't be negative."
 class _MessageCollectionLocalPackageLoader():
 
     '''Collects all the messages used for logging and for the exceptions used by LocalPackageLoader.'''
@@ -202,6 +650,34 @@ class _MessageCollectionRequirementChecker():
     @staticmethod
     def current_version_doesnt_match(current_package : Package, most_recent_release : Release) -> str:
         return f"The current version ('{current_package.version}') of '{current_package.name}' doesn't match with the most recent release ('{most_recent_release.version}', '{most_recent_release.date.strftime("%Y-%m-%d")}')."
+    @staticmethod
+    def current_version_couldnt_be_checked(current_package : Package, error : str) -> str:
+        return f"The current version ('{current_package.version}') of '{current_package.name}' couldn't be checked due to the following error: '{error}'."
+    @staticmethod
+    def current_version_not_checked_deadline(current_package : Package, deadline : int) -> str:
+        return f"The current version ('{current_package.version}') of '{current_package.name}' hasn't been checked because the run deadline ('{str(deadline)}' seconds) has been hit."
+    @staticmethod
+    def current_version_unknown_offline(current_package : Package) -> str:
+        return f"The current version ('{current_package.version}') of '{current_package.name}' is unknown, because no local data is available for it while offline."
+    @staticmethod
+    def file_rechecked(file_path : str, w_session : "WSession") -> str:
+        return f"The file '{file_path}' has been (re)checked: {str(w_session)}."
+    @staticmethod
+    def baseline_updated(baseline_path : str, baseline_report : "BaselineReport") -> str:
+        return f"The baseline '{baseline_path}' has been updated: {str(baseline_report)}."
+    @staticmethod
+    def packages_newly_outdated(packages : list[Package]) -> str:
+        return f"Newly outdated since the baseline: {", ".join(f"'{package.name}'" for package in packages)}."
+    @staticmethod
+    def packages_newly_current(packages : list[Package]) -> str:
+        return f"Newly current since the baseline: {", ".join(f"'{package.name}'" for package in packages)}."
+class _MessageCollectionFormatter():
+
+    '''Collects all the messages used by the formatters.'''
+
+    @staticmethod
+    def stale_requirement_detail(description : str, age : float) -> str:
+        return f"{description} (stale: fetched {age:.0f} seconds ago, refreshing)"
 class _MessageCollectionPyPiReleaseFetcher():
 
     '''Collects all the messages used for logging and for the exceptions used by PyPiReleaseFetcher.'''
@@ -209,6 +685,29 @@ class _MessageCollectionPyPiReleaseFetcher():
     @staticmethod
     def no_suitable_xml_items_found(url : str) -> str:
         return f"No suitable XML items found in '{url}'. The application is not able to establish the most recent release."
+    @staticmethod
+    def package_not_allowed(package_name : str) -> str:
+        return f"The package '{package_name}' is not allowed to be fetched from the index (e.g. a private package)."
+    @staticmethod
+    def package_known_to_be_missing(package_name : str, reason : str) -> str:
+        return f"The package '{package_name}' is known to be missing from the index (negative cache): '{reason}'."
+class _MessageCollectionSnapshot():
+
+    '''Collects all the messages used for logging and for the exceptions used by SnapshotWriter and SnapshotReleaseCache.'''
+
+    @staticmethod
+    def provided_file_isnt_a_snapshot(file_path : str) -> str:
+        return f"The provided file isn't a valid snapshot: '{file_path}'."
+    @staticmethod
+    def snapshot_exported(snapshot_path : str, entries : int) -> str:
+        return f"The snapshot has been written to '{snapshot_path}' ('entries': '{entries}')."
+class _MessageCollectionBaselineStore():
+
+    '''Collects all the messages used for logging and for the exceptions used by BaselineStore.'''
+
+    @staticmethod
+    def provided_file_isnt_a_baseline(file_path : str) -> str:
+        return f"The provided file isn't a valid baseline: '{file_path}'."
 class _MessageCollectionRuntimeChecker():
 
     '''Collects all the messages used for logging and for the exceptions used by RuntimeChecker.'''
@@ -237,6 +736,9 @@ class _MessageCollection(
     _MessageCollectionLocalPackageLoader,
     _MessageCollectionRequirementChecker,
     _MessageCollectionPyPiReleaseFetcher,
+    _MessageCollectionFormatter,
+    _MessageCollectionSnapshot,
+    _MessageCollectionBaselineStore,
     _MessageCollectionRuntimeChecker):
 
     '''Collects all the messages used for logging and for the exceptions.'''
@@ -263,11 +765,25 @@ class LambdaCollection():
         return content
 
     @staticmethod
-    def get_function() -> Callable[[str], Response]:
+    def get_function(connect_timeout : float = DEFAULT.CONNECT_TIMEOUT, read_timeout : float = DEFAULT.READ_TIMEOUT) -> Callable[[str], Response]:
+
+        '''An adapter around requests.get(url, timeout).'''
+
+        return lambda url : requests.get(url, timeout = (connect_timeout, read_timeout))
+    @staticmethod
+    def stream_function(connect_timeout : float = DEFAULT.CONNECT_TIMEOUT, read_timeout : float = DEFAULT.READ_TIMEOUT) -> Callable[[str], Response]:
+
+        '''An adapter around requests.get(url, timeout, stream = True). The body is read only on demand.'''
+
+        return lambda url : requests.get(url, timeout = (connect_timeout, read_timeout), stream = True)
+    @staticmethod
+    def pooled_get_function(connect_timeout : float = DEFAULT.CONNECT_TIMEOUT, read_timeout : float = DEFAULT.READ_TIMEOUT) -> Callable[[str], Response]:
+
+        '''An adapter around requests.Session.get(url, timeout). Connections are kept alive and reused across calls.'''
 
-        '''An adapter around requests.get(url).'''
+        session : requests.Session = requests.Session()
 
-        return lambda url : requests.get(url)
+        return lambda url : session.get(url, timeout = (connect_timeout, read_timeout))
     @staticmethod
     def logging_function() -> Callable[[str], None]:
 
@@ -287,6 +803,12 @@ class LambdaCollection():
 
         return lambda waiting_time : sleep(cast(float, waiting_time))      
     @staticmethod
+    def now_function() -> Callable[[], float]:
+
+        '''An adapter around time.time().'''
+
+        return lambda : time()
+    @staticmethod
     def do_nothing_function() -> Callable[[Any], None]:
 
         '''Does nothing.'''
@@ -312,6 +834,46 @@ class Validator():
         if not os.path.isfile(file_path):
             raise Exception(_MessageCollection.provided_file_path_doesnt_exist(file_path))
 
+    @staticmethod
+    def validate_deadline(deadline : Optional[int]) -> None:
+
+        '''Raises an Exception if deadline is provided and it's not greater than zero.'''
+
+        if deadline is not None and deadline <= 0:
+            raise Exception(_MessageCollection.deadline_must_be_greater_than_zero(deadline))
+
+    @staticmethod
+    def validate_freshness(freshness : int) -> None:
+
+        '''Raises an Exception if freshness is negative.'''
+
+        if freshness < 0:
+            raise Exception(_MessageCollection.freshness_cant_be_negative(freshness))
+class SnapshotFormat():
+
+    '''
+        Describes the layout of a snapshot file:
+
+            header: magic, number of entries, offset of the index, offset and length of the package names.
+            records: one zlib-compressed JSON record per entry.
+            index: one fixed-size item per entry (key, record offset, record length), sorted by key.
+            package names: a zlib-compressed JSON list.
+
+        The key is the first 16 bytes of the SHA-256 of "package_name|only_stable_releases". 
+        Since the index is sorted and its items have a fixed size, a key can be looked up by binary search without loading the index.
+    '''
+
+    MAGIC : Final[bytes] = b"NWPSNAP1"
+    HEADER : Final[struct.Struct] = struct.Struct("<8sIQQI")
+    INDEX_ITEM : Final[struct.Struct] = struct.Struct("<16sQI")
+
+    @staticmethod
+    def create_key(package_name : str, only_stable_releases : bool) -> bytes:
+
+        '''Returns the index key for the provided package_name and only_stable_releases.'''
+
+        return hashlib.sha256(f"{package_name}|{only_stable_releases}".encode("utf-8")).digest()[:16]
+
 # PROTOCOLS
 @runtime_checkable
 class Formatter(Protocol):
@@ -321,6 +883,25 @@ class Formatter(Protocol):
     def format_requirement_detail(self, requirement_detail : RequirementDetail) -> str: ...
     def format_requirement_details(self, requirement_details : list[RequirementDetail]) -> str: ...
     def format_requirement_summary(self, requirement_summary : RequirementSummary, with_details : bool = True) -> str: ...
+@runtime_checkable
+class ReleaseCache(Protocol):
+
+    '''
+        This protocol defines the interface for caching FSession objects by (package_name, only_stable_releases).
+
+        try_get() returns fresh and stale entries, with their "age" and "is_stale" fields set, and None for missing or expired ones.
+        With include_expired = True, expired entries are returned as stale instead (e.g. offline lookups, which can't refetch them).
+        With count_lookup = False, the lookup isn't counted in the cache's stats (e.g. the second check of a miss under lock()).
+
+        lock() returns a context manager that serializes the filling of an entry among all the users of the cache.
+    '''
+
+    def try_get(self, package_name : str, only_stable_releases : bool, include_expired : bool = False, count_lookup : bool = True) -> Optional[FSession]: ...
+    def add(self, package_name : str, only_stable_releases : bool, f_session : FSession, stored_at : Optional[float] = None) -> None: ...
+    def invalidate(self, package_name : str) -> None: ...
+    def clear(self) -> None: ...
+    def get_package_names(self) -> list[str]: ...
+    def lock(self, package_name : str, only_stable_releases : bool) -> AbstractContextManager[None]: ...
         
 # CLASSES
 class JsonFormatter():
@@ -333,6 +914,9 @@ class JsonFormatter():
 
         formatted : str = str("{ " f"'description': '{requirement_detail.description}'" " }")
 
+        if requirement_detail.is_stale:
+            formatted = str("{ " f"'description': '{requirement_detail.description}', 'age': '{requirement_detail.age:.0f}', 'is_stale': 'True'" " }")
+
         return formatted
     def format_requirement_details(self, requirement_details : list[RequirementDetail]) -> str:
 
@@ -348,14 +932,23 @@ class JsonFormatter():
 
         '''Formats the provided object.'''
 
-        formatted : str = str(
-            "{ "
-            f"'total_packages': '{str(requirement_summary.total_packages)}', "
-            f"'matching': '{str(requirement_summary.matching)}', "
-            f"'matching_prc': '{requirement_summary.matching_prc}', "
-            f"'mismatching': '{str(requirement_summary.mismatching)}', "
-            f"'mismatching_prc': '{requirement_summary.mismatching_prc}'"
-            " }")
+        pairs : list[str] = [
+            f"'total_packages': '{str(requirement_summary.total_packages)}'",
+            f"'matching': '{str(requirement_summary.matching)}'",
+            f"'matching_prc': '{requirement_summary.matching_prc}'",
+            f"'mismatching': '{str(requirement_summary.mismatching)}'",
+            f"'mismatching_prc': '{requirement_summary.mismatching_prc}'",
+            f"'errors': '{str(requirement_summary.errors)}'",
+            f"'errors_prc': '{requirement_summary.errors_prc}'",
+            f"'unchecked': '{str(requirement_summary.unchecked)}'",
+            f"'unchecked_prc': '{requirement_summary.unchecked_prc}'"
+        ]
+
+        if requirement_summary.unknown > 0:
+            pairs.append(f"'unknown': '{str(requirement_summary.unknown)}'")
+            pairs.append(f"'unknown_prc': '{requirement_summary.unknown_prc}'")
+
+        formatted : str = "{ " + str.join(", ", pairs) + " }"
 
         if (with_details):
             formatted = str.join("\n", [formatted, self.format_requirement_details(requirement_summary.details)])
@@ -369,6 +962,9 @@ class BasicFormatter():
 
         '''Formats the provided object.'''
 
+        if requirement_detail.is_stale:
+            return _MessageCollection.stale_requirement_detail(description = requirement_detail.description, age = requirement_detail.age)
+
         return requirement_detail.description
     def format_requirement_details(self, requirement_details : list[RequirementDetail]) -> str:
 
@@ -389,9 +985,17 @@ class BasicFormatter():
             f"matching: '{str(requirement_summary.matching)}'",
             f"matching_prc: '{requirement_summary.matching_prc}'",
             f"mismatching: '{str(requirement_summary.mismatching)}'",
-            f"mismatching_prc: '{requirement_summary.mismatching_prc}'"
+            f"mismatching_prc: '{requirement_summary.mismatching_prc}'",
+            f"errors: '{str(requirement_summary.errors)}'",
+            f"errors_prc: '{requirement_summary.errors_prc}'",
+            f"unchecked: '{str(requirement_summary.unchecked)}'",
+            f"unchecked_prc: '{requirement_summary.unchecked_prc}'"
         ]
 
+        if requirement_summary.unknown > 0:
+            lines.append(f"unknown: '{str(requirement_summary.unknown)}'")
+            lines.append(f"unknown_prc: '{requirement_summary.unknown_prc}'")
+
         formatted : str = str.join("\n", lines)
 
         if (with_details):
@@ -589,402 +1193,2981 @@ class LocalPackageLoader():
             raise Exception(_MessageCollection.no_packages_found(file_path))
 
         return cast(LSession, l_session)
-class PyPiBadgeFetcher():
+    def get_loader_type(self, file_path : str) -> Literal["requirements", "dockerfile"]:
 
-    '''This is an utility method to retrieve the badges associated to every release.'''
+        '''Returns the loading strategy that load() would adopt for file_path.'''
 
-    __get_function : Callable[[str], Response]
+        if self.__is_requirements(file_path = file_path):
+            return "requirements"
+        
+        if self.__is_dockerfile(file_path = file_path):
+            return "dockerfile"
 
-    def __init__(
-            self,
-            get_function : Callable[[str], Response] = LambdaCollection.get_function()
-            ) -> None:
+        raise Exception(_MessageCollection.no_loading_strategy_found(file_path))
+    def get_content_hash(self, file_path : str) -> str:
 
-        self.__get_function = get_function
+        '''Returns the SHA-256 of the content of file_path without parsing it.'''
 
-    def __format_url(self, package_name : str) -> str:
+        content : str = self.__file_reader_function(file_path)
 
-        '''Returns the URL for the package's #history page.'''
+        return hashlib.sha256(content.encode()).hexdigest()
+class SingleFlight():
 
-        url : str =  f"https://pypi.org/project/{package_name}/#history"
+    '''
+        Coalesces concurrent calls that share the same key into a single execution.
 
-        return url  
-    def __extract_and_strip_text(self, tree : HtmlElement, pattern : str, remove_empty_items : bool = True) -> list[str]:
+        The first caller (the "leader") runs the function, while all the other callers wait for its result (or exception).
+        Threaded and asyncio callers share the same in-flight table, therefore they coalesce with each other too.
+    '''
 
-        '''
-            Extracts strings from the provided tree using a XPath pattern that ends in "text()".
-            
-            Whitespaces, newlines and tabs are stripped out from each string.
+    __lock : Lock
+    __in_flight : dict[Hashable, Future]
+    __leaders : int
+    __coalesced : int
 
-            Optional: empty items are removed from the returned list.
-        '''
+    def __init__(self) -> None:
 
-        elements : list[HtmlElement] = tree.xpath(pattern)
-        strs : list[str] = [element.strip() for element in elements]
+        self.__lock = Lock()
+        self.__in_flight = {}
+        self.__leaders = 0
+        self.__coalesced = 0
 
-        if remove_empty_items:
-            strs = [str for str in strs if str]
+    def __join(self, key : Hashable) -> Tuple[Future, bool]:
 
-        return strs
-    def __create_badge(self, package_name : str, version : str, label : str) -> Badge:
+        '''Returns (future, is_leader) for the provided key.'''
 
-        '''Creates a Badge object out of the provided arguments.'''
+        with self.__lock:
 
-        badge : Badge = Badge(
-            package_name = package_name, 
-            version = version, 
-            label = cast(Literal["pre-release", "yanked"], label)
-        )
+            future : Optional[Future] = self.__in_flight.get(key)
 
-        return badge
-    def __create_badges(self, package_name : str, versions_labels : list[Tuple[str, str]]) -> list[Badge]:
+            if future is not None:
+                self.__coalesced += 1
+                return (future, False)
 
-        '''Creates a list of Badge objects out of the provided arguments.'''
+            future = Future()
+            self.__in_flight[key] = future
+            self.__leaders += 1
 
-        badges : list[Badge] = []
-        for tpl in versions_labels:
-            badge : Badge = self.__create_badge(package_name = package_name, version = tpl[0], label = tpl[1])
-            badges.append(badge)
+            return (future, True)
+    def __execute(self, key : Hashable, future : Future, function : Callable[[], Any]) -> None:
 
-        return badges
+        '''Runs function, stores its outcome into future and removes key from the in-flight table.'''
 
-    def try_fetch(self, package_name : str) -> Optional[list[Badge]]:
+        try:
+            future.set_result(function())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self.__lock:
+                self.__in_flight.pop(key, None)
 
-        '''
-            Fetches all the Badges for the provided package_name.
+    def run(self, key : Hashable, function : Callable[[], Any]) -> Any:
 
-            If no badges are found, None is returned. 
-        '''
+        '''Runs function once for all the concurrent callers sharing key and returns its result.'''
 
-        url : str = self.__format_url(package_name = package_name)
-        
-        response : Response = self.__get_function(url)
-        tree : HtmlElement = html.fromstring(response.content)
+        future, is_leader = self.__join(key = key)
 
-        version_pattern : str = "//p[@class='release__version'][span]/text()"
-        versions : list[str] = self.__extract_and_strip_text(tree = tree, pattern = version_pattern)
+        if is_leader:
+            self.__execute(key = key, future = future, function = function)
 
-        if len(versions) == 0: 
-            return None
+        return future.result()
+    async def run_async(self, key : Hashable, function : Callable[[], Any]) -> Any:
 
-        label_pattern : str = "//p[@class='release__version']/span[1]/text()"
-        labels : list[str] = self.__extract_and_strip_text(tree = tree, pattern = label_pattern)
+        '''Same as run(), but the blocking function is executed in a worker thread and awaited.'''
 
-        versions_labels : list[Tuple[str, str]] = list(zip(versions, labels, strict = True))
-        badges : list[Badge] = self.__create_badges(package_name = package_name, versions_labels = versions_labels)
+        future, is_leader = self.__join(key = key)
 
-        return badges
-class PyPiReleaseFetcher():
+        if is_leader:
+            await asyncio.to_thread(self.__execute, key, future, function)
 
-    '''This is a client for PyPi release pages.'''
+        return await asyncio.wrap_future(future)
+    def get_stats(self) -> SingleFlightStats:
 
-    __get_function : Callable[[str], Response]
-    __badge_fetcher : PyPiBadgeFetcher
+        '''Returns the number of executions ("leaders") and the number of duplicate calls avoided ("coalesced").'''
+
+        with self.__lock:
+            return SingleFlightStats(leaders = self.__leaders, coalesced = self.__coalesced)
+class NegativeCache():
+
+    '''
+        Remembers the packages that don't exist on the index (HTTP 404, empty feeds) for "ttl" seconds.
+        
+        It allows to avoid a full network round trip for each internal package in every run.
+        Package names are normalized according to PEP 503, so that "Acme_Internal" and "acme-internal" share the same entry.
+
+        If file_path is provided, the entries are also kept in a JSON file, so that they survive the process and can be shared 
+        by several processes. The file is reloaded whenever another process has changed it and it's replaced atomically on each change. 
+        Concurrent changes can overwrite each other, which only costs a network round trip for the lost entries.
+    '''
+
+    __ttl : int
+    __now_function : Callable[[], float]
+    __file_path : Optional[str]
+    __lock : Lock
+    __entries : dict[str, Tuple[str, float]]
+    __loaded_mtime : Optional[int]
 
     def __init__(
             self,
-            get_function : Callable[[str], Response] = LambdaCollection.get_function(),
-            badge_fetcher : PyPiBadgeFetcher = PyPiBadgeFetcher()
+            ttl : int = DEFAULT.NEGATIVE_CACHE_TTL,
+            now_function : Callable[[], float] = LambdaCollection.now_function(),
+            file_path : Optional[str] = None
             ) -> None:
 
-        self.__get_function = get_function
-        self.__badge_fetcher = badge_fetcher
+        self.__ttl = ttl
+        self.__now_function = now_function
+        self.__file_path = file_path
+        self.__lock = Lock()
+        self.__entries = {}
+        self.__loaded_mtime = None
 
-    def __format_url(self, package_name : str) -> str:
+    def __get_mtime(self) -> Optional[int]:
 
-        '''Returns the URL for the package's releases.xml.'''
+        '''Returns the modification time of the file or None if it doesn't exist.'''
 
-        url : str =  f"https://pypi.org/rss/project/{package_name}/releases.xml"
+        try:
+            return os.stat(cast(str, self.__file_path)).st_mtime_ns
+        except FileNotFoundError:
+            return None
+    def __load(self) -> None:
 
-        return url  
-    def __try_extract_text(self, element : Element, path : str) -> Optional[str]:
+        '''Replaces the entries with the content of the file, if it has changed since it's been loaded or written. The lock must be held.'''
 
-        '''Extracts the text from the provided element according to path or returns None.'''
+        if self.__file_path is None:
+            return
+
+        mtime : Optional[int] = self.__get_mtime()
+
+        if mtime == self.__loaded_mtime:
+            return
+
+        entries : dict[str, Tuple[str, float]] = {}
 
         try:
+            with open(self.__file_path, "r", encoding = "utf-8") as file:
+                entries = { package_name : (reason, expires_at) for package_name, (reason, expires_at) in json.load(file).items() }
+        except (FileNotFoundError, ValueError, TypeError, AttributeError):
+            pass
 
-            result : Optional[Element] = element.find(path = path)
+        self.__entries = entries
+        self.__loaded_mtime = mtime
+    def __save(self) -> None:
 
-            return cast(Element, result).text
+        '''Writes the entries to a temporary file and atomically renames it to the file. The lock must be held.'''
 
-        except:
-            return None
-    def __try_extract_title(self, element : Element) -> Optional[str]:
+        if self.__file_path is None:
+            return
 
-        '''Extracts the title from the provided element or returns None.'''
+        directory : str = os.path.dirname(os.path.abspath(self.__file_path))
+        os.makedirs(directory, exist_ok = True)
+        fd, temp_path = tempfile.mkstemp(dir = directory, suffix = ".tmp")
 
-        return self.__try_extract_text(element = element, path = "title")
-    def __try_extract_link(self, element : Element) -> Optional[str]:
+        try:
+            with os.fdopen(fd, "w", encoding = "utf-8") as file:
+                json.dump(self.__entries, file)
+            os.replace(temp_path, self.__file_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
 
-        '''Extracts the link from the provided element or returns None.'''
+        self.__loaded_mtime = self.__get_mtime()
 
-        return self.__try_extract_text(element = element, path = "link")
-    def __try_extract_description(self, element : Element) -> Optional[str]:
+    def try_get(self, package_name : str) -> Optional[str]:
 
-        '''Extracts the description from the provided element or returns None.'''
+        '''Returns the reason why package_name has been cached or None if it's not cached (or expired).'''
 
-        return self.__try_extract_text(element = element, path = "description")
-    def __try_extract_author(self, element : Element) -> Optional[str]:
+        key : str = PackageFilter.normalize(package_name)
 
-        '''Extracts the author from the provided element or returns None.'''
+        with self.__lock:
 
-        return self.__try_extract_text(element = element, path = "author")
-    def __try_extract_pubdate_str(self, element : Element) -> Optional[str]:
+            self.__load()
+            entry : Optional[Tuple[str, float]] = self.__entries.get(key)
 
-        '''Extracts the pubDate from the provided element or returns None.'''
+            if entry is None:
+                return None
 
-        return self.__try_extract_text(element = element, path = "pubDate")
-    def __parse_pubdate_str(self, pubdate_str : Optional[str]) -> Optional[datetime]:
+            reason, expires_at = entry
 
-        '''
-            This method expect a dt_str as in the following examples:
+            if self.__now_function() >= expires_at:
+                del self.__entries[key]
+                self.__save()
+                return None
 
-                Fri, 20 Sep 2024 13:08:42 GMT
-                Wed, 10 Apr 2024 19:44:10 GMT
-                Fri, 23 Feb 2024 15:30:19 GMT
-                Sat, 20 Jan 2024 02:10:54 GMT
-                ...
-        '''
+            return reason
+    def add(self, package_name : str, reason : str) -> None:
 
-        if pubdate_str:
+        '''Caches package_name as missing for "ttl" seconds.'''
 
-            format : str = "%a, %d %b %Y %H:%M:%S %Z"
-            pubdate = datetime.strptime(pubdate_str, format)
+        with self.__lock:
+            self.__load()
+            self.__entries[PackageFilter.normalize(package_name)] = (reason, self.__now_function() + self.__ttl)
+            self.__save()
+    def invalidate(self, package_name : str) -> None:
 
-            return pubdate
-        
-        else:
-            return None
-    def __parse_response(self, response : Response) -> list[XMLItem]:
+        '''Removes package_name from the cache, if present.'''
 
-        '''Convert the provided response to a list of PyPiRelease objects.'''
-    
-        root : Element = ET.fromstring(text = response.text)
+        with self.__lock:
+            self.__load()
+            if self.__entries.pop(PackageFilter.normalize(package_name), None) is not None:
+                self.__save()
+    def clear(self) -> None:
 
-        releases : list[XMLItem] = []
-        for channel in root.findall("channel"):
-            for item in channel.findall("item"):
-                
-                title : Optional[str] = self.__try_extract_title(element = item)
-                link : Optional[str] = self.__try_extract_link(element = item)
-                description : Optional[str] = self.__try_extract_description(element = item)
-                author : Optional[str] = self.__try_extract_author(element = item)
-                pubdate_str : Optional[str] = self.__try_extract_pubdate_str(element = item)
-                pubdate : Optional[datetime] = self.__parse_pubdate_str(pubdate_str = pubdate_str)
-                
-                release : XMLItem = XMLItem(
-                    title = title,
-                    link = link,
-                    description = description,
-                    author = author,
-                    pubdate_str = pubdate_str,
-                    pubdate = pubdate
-                )
+        '''Removes all the entries and, if any, the file.'''
 
-                releases.append(release)
+        with self.__lock:
 
-        return releases
-    def __has_title(self, xml_item : XMLItem) -> bool:
+            self.__entries.clear()
+            self.__loaded_mtime = None
 
-        '''Retuns False if xml_item.title is None.'''
+            if self.__file_path is not None and os.path.exists(self.__file_path):
+                os.remove(self.__file_path)
+    def get_package_names(self) -> list[str]:
 
-        if xml_item.title:
-            return True
-        else:
-            return False
-    def __has_pubdate(self, xml_item : XMLItem) -> bool:
+        '''Returns the normalized names of the cached packages, expired ones included.'''
 
-        '''Retuns False if xml_item.pubdate is None.'''
+        with self.__lock:
+            self.__load()
+            return list(self.__entries.keys())
+class PackageFilter():
 
-        if xml_item.pubdate:
-            return True
-        else:
-            return False
-    def __filter(self, items : list[Any], function : Callable[[Any], bool]) -> list[Any]:
+    '''
+        Routes known-private package names away from the index.
 
-        '''Runs function on items.'''
+        Both lists accept Unix shell-style wildcards (e.g. "acme-*") and are matched case-insensitively:
 
-        lst : list[Any] = [item for item in items if function(item)]
+            - allowed = None => all packages are allowed, unless denied.
+            - allowed = [...] => only the matching packages are allowed, unless denied.
+    '''
 
-        return lst
-    def __convert_to_release(self, package_name : str, xml_item : XMLItem) -> Release:
+    __allowed : Optional[list[str]]
+    __denied : list[str]
 
-        '''Converts the provided xml_item to a Release object.'''
+    def __init__(self, allowed : Optional[list[str]] = None, denied : Optional[list[str]] = None) -> None:
 
-        release : Release = Release(
-            package_name = package_name,
-            version = cast(str, xml_item.title),
-            date = cast(datetime, xml_item.pubdate)
-        )
+        self.__allowed = None if allowed is None else [self.normalize(pattern) for pattern in allowed]
+        self.__denied = [] if denied is None else [self.normalize(pattern) for pattern in denied]
 
-        return release
-    def __convert_to_releases(self, package_name : str, xml_items : list[XMLItem]) -> list[Release]:
+    @staticmethod
+    def normalize(name : str) -> str:
 
-        '''Converts the provided xml_items to a list of Release objects.'''
+        '''Normalizes name according to PEP 503 (e.g. "Typed_AstUnparse" => "typed-astunparse").'''
 
-        releases : list[Release] = []
+        return re.sub(r"[-_.]+", "-", name).lower()
+    def __matches_any(self, package_name : str, patterns : list[str]) -> bool:
 
-        for xml_item in xml_items:
-            release : Release = self.__convert_to_release(package_name = package_name, xml_item = xml_item)
-            releases.append(release)
+        '''Returns True if package_name matches at least one of patterns.'''
 
-        return releases
-    def __sort_by_date(self, releases : list[Release], reverse : bool = True) -> list[Release]:
+        return any(fnmatch.fnmatchcase(package_name, pattern) for pattern in patterns)
 
-        '''
-            reverse = True => Descending
-            reverse = False => Ascending
-        '''
+    def is_allowed(self, package_name : str) -> bool:
 
-        lst : list[Release] = copy.deepcopy(releases)
-        lst.sort(key = lambda release : release.date, reverse = reverse)
+        '''Returns True if package_name can be fetched from the index.'''
 
-        return lst
-    def __get_most_recent(self, releases : list[Release]) -> Release:
-        
-        '''Returns most_recent_release by assuming releases are sorted in descending order.'''
-        
-        most_recent_release : Release = releases[0]
+        normalized : str = self.normalize(package_name)
 
-        return most_recent_release
-    def __is_stable_release(self, xml_item : XMLItem, badge_versions : list[str]) -> bool:
+        if self.__matches_any(package_name = normalized, patterns = self.__denied):
+            return False
 
-        '''
-            (xml_item.title not in badge_versions) == True => stable
-            (xml_item.title not in badge_versions) == False => unstable
-        '''
+        if self.__allowed is None:
+            return True
 
-        return (xml_item.title not in badge_versions)
-    def __process_stable_releases(self, package_name : str, xml_items_clean : list[XMLItem], only_stable_releases : bool) -> Tuple[list[XMLItem], Optional[list[Badge]]]:
+        return self.__matches_any(package_name = normalized, patterns = self.__allowed)
+class SummaryCache():
 
-        '''Encapsulates all the logic related to stable releases.'''
+    '''
+        Caches whole RequirementSummary objects.
 
-        badges : Optional[list[Badge]] = None
+        Entries younger than "ttl" seconds are fresh. Entries younger than "ttl" + "grace" seconds are stale: 
+        they are still served, but the caller is expected to refresh them. Older entries are dropped.
+    '''
 
-        if only_stable_releases == False:
-            return (xml_items_clean, badges)
-        
-        badges = self.__badge_fetcher.try_fetch(package_name = package_name)       
-        
-        if badges is None:
-            return (xml_items_clean, badges)
+    __ttl : int
+    __grace : int
+    __now_function : Callable[[], float]
+    __lock : Lock
+    __entries : dict[SummaryCacheKey, Tuple[RequirementSummary, float]]
+    __refreshing : set[SummaryCacheKey]
 
-        badge_versions : list[str] = [badge.version for badge in badges]
-        xml_items_clean = self.__filter(
-            items = xml_items_clean, 
-            function = lambda x : self.__is_stable_release(xml_item = x, badge_versions = badge_versions)
-        )
+    def __init__(
+            self,
+            ttl : int = DEFAULT.SUMMARY_CACHE_TTL,
+            grace : int = DEFAULT.SUMMARY_CACHE_GRACE,
+            now_function : Callable[[], float] = LambdaCollection.now_function()
+            ) -> None:
 
-        return (xml_items_clean, badges)
+        self.__ttl = ttl
+        self.__grace = grace
+        self.__now_function = now_function
+        self.__lock = Lock()
+        self.__entries = {}
+        self.__refreshing = set()
 
-    def fetch(self, package_name : str, only_stable_releases : bool) -> FSession:
+    def try_get(self, key : SummaryCacheKey) -> Optional[CachedSummary]:
 
-        '''
-            Retrieves all the releases from PyPi.org for the provided package_name.
-            
-            The "only_stable_releases" flag, if True, will filter out all the releases that have been badged as "pre-release" or "yanked".
-        '''
+        '''Returns the cached summary for key or None if it's not cached (or expired).'''
 
-        url : str =  self.__format_url(package_name = package_name)
-        response : Response = self.__get_function(url)
-        xml_items_raw : list[XMLItem] = self.__parse_response(response = response)
+        with self.__lock:
 
-        xml_items_clean : list[XMLItem] = copy.deepcopy(xml_items_raw)
-        xml_items_clean = self.__filter(items = xml_items_clean, function = lambda x : self.__has_title(xml_item = x))
-        xml_items_clean = self.__filter(items = xml_items_clean, function = lambda x : self.__has_pubdate(xml_item = x))
-        xml_items_clean, badges = self.__process_stable_releases(package_name = package_name, xml_items_clean = xml_items_clean, only_stable_releases = only_stable_releases)
-            
-        if len(xml_items_clean) == 0:
-            raise Exception(_MessageCollection.no_suitable_xml_items_found(url = url))
+            entry : Optional[Tuple[RequirementSummary, float]] = self.__entries.get(key)
 
-        releases : list[Release] = self.__convert_to_releases(package_name = package_name, xml_items = xml_items_clean)
-        releases = self.__sort_by_date(releases = releases)
+            if entry is None:
+                return None
 
-        f_session : FSession = FSession(
-            package_name = package_name,
-            most_recent_release = self.__get_most_recent(releases = releases),
-            releases = releases,
-            xml_items = xml_items_raw,
-            badges = badges
-        )
+            summary, stored_at = entry
+            age : float = self.__now_function() - stored_at
 
-        return f_session
-class RuntimeChecker():
+            if age >= self.__ttl + self.__grace:
+                del self.__entries[key]
+                return None
 
-    '''Collects all the logic related to Python runtime checks.'''
+            return CachedSummary(summary = summary, age = age, is_stale = age >= self.__ttl)
+    def add(self, key : SummaryCacheKey, summary : RequirementSummary) -> None:
 
-    def __get_runtime_version(self) -> Tuple[int, int, int]:
+        '''Caches summary for key and ends any refresh in progress for it.'''
 
-        '''
-            Runs:
-                - "python --version" on Windows
-                - "python3 --version" on Linux
-        
-            Expected output: "Python 3.12.5" -> (3, 12, 5)
-        '''
+        with self.__lock:
+            self.__entries[key] = (summary, self.__now_function())
+            self.__refreshing.discard(key)
+    def try_start_refresh(self, key : SummaryCacheKey) -> bool:
 
-        executable : str = "python3"
-        
-        if platform.system() == "Windows":
-            executable = "python"
+        '''Returns True if the caller is the one in charge of refreshing key, False if a refresh is already in progress.'''
 
-        command : list[str] = [executable, "--version"]
+        with self.__lock:
 
-        process : CompletedProcess = subprocess.run(
-            command,
-            capture_output = True,
-            text = True,
-            check = True
-        )
+            if key in self.__refreshing:
+                return False
 
-        version_lst : list[str] = str(process.stdout).replace("Python", "").replace("\n", "").strip().split(".")
+            self.__refreshing.add(key)
 
-        if (len(version_lst) != 3):
-            raise Exception(_MessageCollection.python_version_unexpected_output())
-        
-        version_tpl : Tuple[int, int, int] = (int(version_lst[0]), int(version_lst[1]), int(version_lst[2]))
+            return True
+    def end_refresh(self, key : SummaryCacheKey) -> None:
 
-        return version_tpl
+        '''Ends the refresh in progress for key without updating its entry (e.g. the refresh failed).'''
 
-    def get_status(self, required : Tuple[int, int, int]) -> str:
+        with self.__lock:
+            self.__refreshing.discard(key)
+    def invalidate(self, key : SummaryCacheKey) -> None:
 
-        '''Returns a warning message if the installed Python version doesn't match the required one.'''
+        '''Removes key from the cache, if present.'''
 
-        runtime_version : Tuple[int, int, int] = self.__get_runtime_version()
-        
-        if runtime_version == required:
-            return _MessageCollection.installed_python_version_matching(installed = runtime_version, required = required)
-        else:
-            return _MessageCollection.installed_python_version_not_matching(installed = runtime_version, required = required)
-    def try_get_status(self, required : Tuple[int, int, int]) -> str:
+        with self.__lock:
+            self.__entries.pop(key, None)
+    def clear(self) -> None:
 
-        try:
+        '''Removes all the entries.'''
 
-            return self.get_status(required = required)
-        
-        except Exception as e:
-            return str(e)
-class RequirementChecker():
+        with self.__lock:
+            self.__entries.clear()
+class CadenceTTLPolicy():
 
-    '''This class collects all the logic related to requirement status checking.'''
+    '''
+        Derives a cache TTL for a package from its release history.
 
-    __package_loader : LocalPackageLoader
-    __release_fetcher : PyPiReleaseFetcher
-    __formatter : Formatter
-    __sleeping_function : Callable[[int], None]
+        The TTL is "factor" times the shortest of the median interval between its most recent releases ("window") 
+        and the time elapsed since its last release, clamped between "min_ttl" and "max_ttl". Therefore:
+
+            - a package that releases weekly is revalidated every few hours;
+            - a package that has just released is revalidated often, since fixes tend to follow;
+            - a package that releases rarely and hasn't released in a long time is revalidated up to every "max_ttl" seconds.
+    '''
+
+    __min_ttl : int
+    __max_ttl : int
+    __factor : float
+    __window : int
+    __now_function : Callable[[], float]
 
     def __init__(
-            self, 
-            package_loader : LocalPackageLoader = LocalPackageLoader(),
-            release_fetcher : PyPiReleaseFetcher = PyPiReleaseFetcher(),
-            formatter : Formatter = BasicFormatter(),
-            sleeping_function : Callable[[int], None] = LambdaCollection.sleeping_function()
+            self,
+            min_ttl : int = DEFAULT.MIN_RELEASE_CACHE_TTL,
+            max_ttl : int = DEFAULT.MAX_RELEASE_CACHE_TTL,
+            factor : float = DEFAULT.CADENCE_TTL_FACTOR,
+            window : int = DEFAULT.CADENCE_WINDOW,
+            now_function : Callable[[], float] = LambdaCollection.now_function()
             ) -> None:
-      
-        self.__package_loader = package_loader
+
+        self.__min_ttl = min_ttl
+        self.__max_ttl = max_ttl
+        self.__factor = factor
+        self.__window = window
+        self.__now_function = now_function
+
+    def __calculate_intervals(self, releases : list[Release]) -> list[float]:
+
+        '''Returns the intervals (in seconds) between the most recent "window" + 1 releases.'''
+
+        dates : list[datetime] = sorted([release.date for release in releases], reverse = True)[:self.__window + 1]
+
+        return [(newer - older).total_seconds() for newer, older in zip(dates, dates[1:])]
+    def __calculate_median(self, values : list[float]) -> float:
+
+        '''Returns the median of the provided non-empty list of values.'''
+
+        ordered : list[float] = sorted(values)
+        middle : int = len(ordered) // 2
+
+        if len(ordered) % 2 == 1:
+            return ordered[middle]
+
+        return (ordered[middle - 1] + ordered[middle]) / 2
+    def __calculate_since_last_release(self, most_recent_release : Release) -> float:
+
+        '''Returns the seconds elapsed since most_recent_release. Release dates are naive UTC datetimes.'''
+
+        now : datetime = datetime.fromtimestamp(self.__now_function(), timezone.utc).replace(tzinfo = None)
+
+        return max(0.0, (now - most_recent_release.date).total_seconds())
+    def calculate(self, f_session : FSession) -> float:
+
+        '''Returns the TTL (in seconds) for the provided FSession.'''
+
+        since_last_release : float = self.__calculate_since_last_release(most_recent_release = f_session.most_recent_release)
+        intervals : list[float] = self.__calculate_intervals(releases = f_session.releases)
+        cadence : float = since_last_release
+
+        if len(intervals) > 0:
+            cadence = min(cadence, self.__calculate_median(values = intervals))
+
+        ttl : float = self.__factor * cadence
+
+        return min(max(ttl, self.__min_ttl), self.__max_ttl)
+class InMemoryReleaseCache():
+
+    '''
+        Caches FSession objects in memory according to a stale-while-revalidate policy.
+
+        Entries younger than "ttl" seconds are fresh. Entries younger than "ttl" + "grace" seconds are stale: 
+        they are still served, but the caller is expected to revalidate them. Older entries are dropped.
+
+        If ttl_function is provided (e.g. CadenceTTLPolicy().calculate), "ttl" is computed for each entry when it's added.
+    '''
+
+    __ttl : int
+    __grace : int
+    __now_function : Callable[[], float]
+    __ttl_function : Optional[Callable[[FSession], float]]
+    __lock : Lock
+    __entries : dict[Tuple[str, bool], Tuple[FSession, float, float]]
+
+    def __init__(
+            self,
+            ttl : int = DEFAULT.RELEASE_CACHE_TTL,
+            grace : int = DEFAULT.RELEASE_CACHE_GRACE,
+            now_function : Callable[[], float] = LambdaCollection.now_function(),
+            ttl_function : Optional[Callable[[FSession], float]] = None
+            ) -> None:
+
+        self.__ttl = ttl
+        self.__grace = grace
+        self.__now_function = now_function
+        self.__ttl_function = ttl_function
+        self.__lock = Lock()
+        self.__entries = {}
+
+    def try_get(self, package_name : str, only_stable_releases : bool, include_expired : bool = False, count_lookup : bool = True) -> Optional[FSession]:
+
+        '''Returns the cached FSession, marked with its age and staleness, or None if it's not cached (or expired, unless include_expired is True).'''
+
+        key : Tuple[str, bool] = (package_name, only_stable_releases)
+
+        with self.__lock:
+
+            entry : Optional[Tuple[FSession, float, float]] = self.__entries.get(key)
+
+            if entry is None:
+                return None
+
+            f_session, stored_at, ttl = entry
+            age : float = self.__now_function() - stored_at
+
+            if age >= ttl + self.__grace and not include_expired:
+                del self.__entries[key]
+                return None
+
+            return replace(f_session, age = age, is_stale = age >= ttl)
+    def add(self, package_name : str, only_stable_releases : bool, f_session : FSession, stored_at : Optional[float] = None) -> None:
+
+        '''Caches f_session as fetched at stored_at (now, if not provided).'''
+
+        ttl : float = self.__ttl if self.__ttl_function is None else self.__ttl_function(f_session)
+
+        with self.__lock:
+            self.__entries[(package_name, only_stable_releases)] = (f_session, self.__now_function() if stored_at is None else stored_at, ttl)
+    def invalidate(self, package_name : str) -> None:
+
+        '''Removes all the entries for package_name, if present.'''
+
+        with self.__lock:
+            self.__entries.pop((package_name, True), None)
+            self.__entries.pop((package_name, False), None)
+    def clear(self) -> None:
+
+        '''Removes all the entries.'''
+
+        with self.__lock:
+            self.__entries.clear()
+    def get_package_names(self) -> list[str]:
+
+        '''Returns the names of the cached packages, expired ones included.'''
+
+        with self.__lock:
+            return sorted({package_name for package_name, _ in self.__entries.keys()})
+    def lock(self, package_name : str, only_stable_releases : bool) -> AbstractContextManager[None]:
+
+        '''Does nothing: within a process, concurrent fills are already coalesced by SingleFlight.'''
+
+        return nullcontext()
+class FSessionSerializer():
+
+    '''Converts FSession objects to and from JSON. The "age" and "is_stale" fields are not serialized.'''
+
+    def __to_release(self, item : dict[str, Any]) -> Release:
+
+        '''Converts the provided dictionary to a Release object.'''
+
+        return Release(package_name = item["package_name"], version = item["version"], date = datetime.fromisoformat(item["date"]))
+    def __to_xml_item(self, item : dict[str, Any]) -> XMLItem:
+
+        '''Converts the provided dictionary to a XMLItem object.'''
+
+        return XMLItem(
+            title = item["title"],
+            link = item["link"],
+            description = item["description"],
+            author = item["author"],
+            pubdate = None if item["pubdate"] is None else datetime.fromisoformat(item["pubdate"]),
+            pubdate_str = item["pubdate_str"]
+        )
+    def __to_badge(self, item : dict[str, Any]) -> Badge:
+
+        '''Converts the provided dictionary to a Badge object.'''
+
+        return Badge(package_name = item["package_name"], version = item["version"], label = item["label"])
+
+    def to_dict(self, f_session : FSession) -> dict[str, Any]:
+
+        '''Converts f_session to a dictionary that can be dumped as JSON.'''
+
+        item : dict[str, Any] = json.loads(json.dumps(asdict(f_session), default = lambda dt : dt.isoformat()))
+        item.pop("age")
+        item.pop("is_stale")
+
+        return item
+    def from_dict(self, item : dict[str, Any]) -> FSession:
+
+        '''Converts the provided dictionary (see to_dict()) back to a FSession object.'''
+
+        f_session : FSession = FSession(
+            package_name = item["package_name"],
+            most_recent_release = self.__to_release(item = item["most_recent_release"]),
+            releases = [self.__to_release(item = release) for release in item["releases"]],
+            xml_items = [self.__to_xml_item(item = xml_item) for xml_item in item["xml_items"]],
+            badges = None if item["badges"] is None else [self.__to_badge(item = badge) for badge in item["badges"]]
+        )
+
+        return f_session
+class RequirementDetailSerializer():
+
+    '''Converts RequirementDetail objects to and from JSON. The "age" and "is_stale" fields are not serialized.'''
+
+    def __to_release(self, item : Optional[dict[str, Any]]) -> Optional[Release]:
+
+        '''Converts the provided dictionary to a Release object.'''
+
+        if item is None:
+            return None
+
+        return Release(package_name = item["package_name"], version = item["version"], date = datetime.fromisoformat(item["date"]))
+
+    def to_dict(self, requirement_detail : RequirementDetail) -> dict[str, Any]:
+
+        '''Converts requirement_detail to a dictionary that can be dumped as JSON.'''
+
+        item : dict[str, Any] = json.loads(json.dumps(asdict(requirement_detail), default = lambda dt : dt.isoformat()))
+        item.pop("age")
+        item.pop("is_stale")
+
+        return item
+    def from_dict(self, item : dict[str, Any]) -> RequirementDetail:
+
+        '''Converts the provided dictionary (see to_dict()) back to a RequirementDetail object.'''
+
+        requirement_detail : RequirementDetail = RequirementDetail(
+            current_package = Package(name = item["current_package"]["name"], version = item["current_package"]["version"]),
+            most_recent_release = self.__to_release(item = item["most_recent_release"]),
+            is_version_matching = item["is_version_matching"],
+            description = item["description"],
+            outcome = item["outcome"]
+        )
+
+        return requirement_detail
+class BaselineSerializer():
+
+    '''Converts Baseline objects to and from JSON. The "age" and "is_stale" fields of the details are not serialized, since "fetched_at" supersedes them.'''
+
+    __requirement_detail_serializer : RequirementDetailSerializer
+
+    def __init__(self, requirement_detail_serializer : RequirementDetailSerializer = RequirementDetailSerializer()) -> None:
+
+        self.__requirement_detail_serializer = requirement_detail_serializer
+
+    def to_dict(self, baseline : Baseline) -> dict[str, Any]:
+
+        '''Converts baseline to a dictionary that can be dumped as JSON.'''
+
+        item : dict[str, Any] = {
+            "only_stable_releases": baseline.only_stable_releases,
+            "saved_at": baseline.saved_at,
+            "entries": [
+                {
+                    "requirement_detail": self.__requirement_detail_serializer.to_dict(requirement_detail = entry.requirement_detail),
+                    "fetched_at": entry.fetched_at
+                }
+                for entry in baseline.entries
+            ]
+        }
+
+        return item
+    def from_dict(self, item : dict[str, Any]) -> Baseline:
+
+        '''Converts the provided dictionary (see to_dict()) back to a Baseline object.'''
+
+        baseline : Baseline = Baseline(
+            only_stable_releases = item["only_stable_releases"],
+            saved_at = item["saved_at"],
+            entries = [
+                BaselineEntry(requirement_detail = self.__requirement_detail_serializer.from_dict(item = entry["requirement_detail"]), fetched_at = entry["fetched_at"])
+                for entry in item["entries"]
+            ]
+        )
+
+        return baseline
+class BaselineStore():
+
+    '''Saves Baseline objects to JSON files and loads them back.'''
+
+    __serializer : BaselineSerializer
+
+    def __init__(self, serializer : BaselineSerializer = BaselineSerializer()) -> None:
+
+        self.__serializer = serializer
+
+    def load(self, file_path : str) -> Optional[Baseline]:
+
+        '''Returns the Baseline saved in file_path or None if file_path doesn't exist. It raises an Exception if file_path isn't a valid baseline.'''
+
+        try:
+            with open(file_path, "r", encoding = "utf-8") as file:
+                return self.__serializer.from_dict(item = json.load(file))
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError) as e:
+            raise Exception(_MessageCollection.provided_file_isnt_a_baseline(file_path = file_path)) from e
+    def save(self, file_path : str, baseline : Baseline) -> None:
+
+        '''Saves baseline to file_path. The file is written to a temporary file and atomically renamed.'''
+
+        directory : str = os.path.dirname(os.path.abspath(file_path))
+        os.makedirs(directory, exist_ok = True)
+        fd, temp_path = tempfile.mkstemp(dir = directory, suffix = ".tmp")
+
+        try:
+            with os.fdopen(fd, "w", encoding = "utf-8") as file:
+                json.dump(self.__serializer.to_dict(baseline = baseline), file)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+class RequirementJournal():
+
+    '''
+        Checkpoints the RequirementDetail objects of a run to an append-only file (one JSON line each), so that an interrupted run can be resumed.
+
+        The first line is a header, which records the only_stable_releases value of the run and when it started.
+        Each line is flushed to disk as soon as it's appended, therefore an interruption loses at most the line that was being written.
+
+        Journals older than "max_age" seconds are not resumed, since the releases they recorded might be outdated.
+    '''
+
+    __file_path : str
+    __serializer : RequirementDetailSerializer
+    __now_function : Callable[[], float]
+    __max_age : int
+
+    def __init__(
+            self, 
+            file_path : str, 
+            serializer : RequirementDetailSerializer = RequirementDetailSerializer(),
+            now_function : Callable[[], float] = LambdaCollection.now_function(),
+            max_age : int = DEFAULT.JOURNAL_MAX_AGE
+            ) -> None:
+
+        self.__file_path = file_path
+        self.__serializer = serializer
+        self.__now_function = now_function
+        self.__max_age = max_age
+
+    def __create_header(self, only_stable_releases : bool) -> str:
+
+        '''Returns the header line of a journal for only_stable_releases that starts now.'''
+
+        return json.dumps({ "only_stable_releases": only_stable_releases, "started_at": self.__now_function() })
+    def __is_resumable(self, line : str, only_stable_releases : bool) -> bool:
+
+        '''Returns True if line is the header of a journal for only_stable_releases that isn't older than max_age.'''
+
+        try:
+            header : dict[str, Any] = json.loads(line)
+            return header["only_stable_releases"] == only_stable_releases and self.__now_function() - header["started_at"] < self.__max_age
+        except (ValueError, KeyError, TypeError):
+            return False
+    def __read_lines(self) -> list[str]:
+
+        '''Returns the lines of the journal or an empty list if it doesn't exist.'''
+
+        try:
+            with open(self.__file_path, "r", encoding = "utf-8") as file:
+                return file.read().splitlines()
+        except FileNotFoundError:
+            return []
+    def __try_parse(self, line : str) -> Optional[RequirementDetail]:
+
+        '''Returns the RequirementDetail on line or None if line has been truncated by an interruption.'''
+
+        try:
+            return self.__serializer.from_dict(item = json.loads(line))
+        except (ValueError, KeyError, TypeError):
+            return None
+    def __write(self, lines : list[str]) -> None:
+
+        '''Replaces the journal with lines. The file is written to a temporary file and atomically renamed.'''
+
+        directory : str = os.path.dirname(os.path.abspath(self.__file_path))
+        os.makedirs(directory, exist_ok = True)
+        fd, temp_path = tempfile.mkstemp(dir = directory, suffix = ".tmp")
+
+        try:
+            with os.fdopen(fd, "w", encoding = "utf-8") as file:
+                file.writelines(f"{line}\n" for line in lines)
+            os.replace(temp_path, self.__file_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    def start(self, only_stable_releases : bool) -> None:
+
+        '''Replaces the journal with an empty one.'''
+
+        self.__write(lines = [self.__create_header(only_stable_releases = only_stable_releases)])
+    def resume(self, only_stable_releases : bool) -> list[RequirementDetail]:
+
+        '''
+            Returns the RequirementDetail objects checkpointed by a previous run with the same only_stable_releases and keeps appending to the journal.
+
+            Truncated lines are dropped. If the journal doesn't exist, has been written by a run with a different only_stable_releases 
+            or is older than max_age, it's started anew.
+        '''
+
+        lines : list[str] = self.__read_lines()
+
+        if len(lines) == 0 or not self.__is_resumable(line = lines[0], only_stable_releases = only_stable_releases):
+            self.start(only_stable_releases = only_stable_releases)
+            return []
+
+        requirement_details : list[RequirementDetail] = []
+        valid_lines : list[str] = [lines[0]]
+
+        for line in lines[1:]:
+            requirement_detail : Optional[RequirementDetail] = self.__try_parse(line = line)
+            if requirement_detail is not None:
+                requirement_details.append(requirement_detail)
+                valid_lines.append(line)
+
+        if len(valid_lines) != len(lines):
+            self.__write(lines = valid_lines)
+
+        return requirement_details
+    def append(self, requirement_detail : RequirementDetail) -> None:
+
+        '''Appends requirement_detail to the journal and flushes it to disk.'''
+
+        with open(self.__file_path, "a", encoding = "utf-8") as file:
+            file.write(json.dumps(self.__serializer.to_dict(requirement_detail = requirement_detail)) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+    def remove(self) -> None:
+
+        '''Removes the journal, if it exists.'''
+
+        try:
+            os.remove(self.__file_path)
+        except FileNotFoundError:
+            pass
+class FileReleaseCache():
+
+    '''
+        Caches FSession objects as JSON files in cache_dir, so that several processes (e.g. concurrent CI jobs) can share them.
+
+        It follows the same stale-while-revalidate policy of InMemoryReleaseCache and it's safe with concurrent writers:
+
+            - entries are written to a temporary file and atomically renamed, so readers never see partial files.
+            - lock() takes an exclusive lock (fcntl.flock or, on Windows, msvcrt.locking) per entry, so only one process fills a missing entry while the others wait for it.
+
+        Hits refresh the modification time of their entry, which is used by prune() to evict the least recently used entries.
+        Expired entries are only removed by prune(), so that offline runs can still use them (see try_get()).
+        Hits and misses are counted in memory and added to a shared file in batches (see flush_stats()), so that get_stats() can report 
+        the hit ratio across runs without serializing lookups among processes. The remaining ones are added when the instance is 
+        garbage collected or at exit, whichever comes first.
+    '''
+
+    __cache_dir : str
+    __ttl : int
+    __grace : int
+    __now_function : Callable[[], float]
+    __ttl_function : Optional[Callable[[FSession], float]]
+    __serializer : FSessionSerializer
+    __stats_batch : int
+    __counters_lock : Lock
+    __counters : dict[str, int]
+
+    def __init__(
+            self,
+            cache_dir : str = DEFAULT.CACHE_DIR,
+            ttl : int = DEFAULT.RELEASE_CACHE_TTL,
+            grace : int = DEFAULT.RELEASE_CACHE_GRACE,
+            now_function : Callable[[], float] = LambdaCollection.now_function(),
+            ttl_function : Optional[Callable[[FSession], float]] = None,
+            serializer : FSessionSerializer = FSessionSerializer(),
+            stats_batch : int = DEFAULT.CACHE_STATS_BATCH
+            ) -> None:
+
+        self.__cache_dir = cache_dir
+        self.__ttl = ttl
+        self.__grace = grace
+        self.__now_function = now_function
+        self.__ttl_function = ttl_function
+        self.__serializer = serializer
+        self.__stats_batch = stats_batch
+        self.__counters_lock = Lock()
+        self.__counters = { "hits": 0, "misses": 0 }
+
+        os.makedirs(self.__get_entries_dir(), exist_ok = True)
+        os.makedirs(self.__get_locks_dir(), exist_ok = True)
+
+        weakref.finalize(self, FileReleaseCache.__flush_counters, cache_dir, self.__counters_lock, self.__counters)
+
+    @staticmethod
+    def __acquire(file : Any) -> None:
+
+        '''Blocks until the exclusive lock on file is acquired. fcntl isn't available on Windows, where msvcrt locks the first byte instead.'''
+
+        if platform.system() == "Windows":
+            import msvcrt
+            file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)    # type: ignore
+                    return
+                except OSError:
+                    continue    # LK_LOCK gives up after 10 attempts (1 second apart).
+
+        import fcntl
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+    @staticmethod
+    def __release(file : Any) -> None:
+
+        '''Releases the lock acquired by __acquire().'''
+
+        if platform.system() == "Windows":
+            import msvcrt
+            file.seek(0)
+            msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)    # type: ignore
+            return
+
+        import fcntl
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+    @staticmethod
+    @contextmanager
+    def __lock_path(path : str) -> Iterator[None]:
+
+        '''Holds an exclusive lock on the lock file in path.'''
+
+        with open(path, "a+") as file:
+            FileReleaseCache.__acquire(file = file)
+            try:
+                yield
+            finally:
+                FileReleaseCache.__release(file = file)
+    @contextmanager
+    def __lock_file(self, name : str) -> Iterator[None]:
+
+        '''Holds an exclusive lock on the lock file with the provided name.'''
+
+        with self.__lock_path(path = os.path.join(self.__get_locks_dir(), name)):
+            yield
+    @staticmethod
+    def __read_counters(cache_dir : str) -> dict[str, int]:
+
+        '''Returns the hits and misses collected so far in cache_dir.'''
+
+        return FileReleaseCache.__read(path = os.path.join(cache_dir, "stats.json")) or { "hits": 0, "misses": 0 }
+    @staticmethod
+    def __flush_counters(cache_dir : str, counters_lock : Lock, counters : dict[str, int]) -> None:
+
+        '''
+            Adds counters to the shared file in cache_dir and resets them. 
+            
+            It doesn't reference the instance, so that it can be called by the finalizer after the instance has been garbage collected.
+        '''
+
+        with counters_lock:
+            counted : dict[str, int] = dict(counters)
+            counters.update({ "hits": 0, "misses": 0 })
+
+        if sum(counted.values()) == 0:
+            return
+
+        try:
+            with FileReleaseCache.__lock_path(path = os.path.join(cache_dir, "locks", "stats.lock")):
+                shared : dict[str, int] = FileReleaseCache.__read_counters(cache_dir = cache_dir)
+                shared["hits"] += counted["hits"]
+                shared["misses"] += counted["misses"]
+                FileReleaseCache.__write(path = os.path.join(cache_dir, "stats.json"), entry = shared)
+        except OSError:
+            pass
+    def __count(self, is_hit : bool) -> None:
+
+        '''Increments the hits or misses counter in memory and flushes the counters once "stats_batch" lookups have been counted.'''
+
+        with self.__counters_lock:
+            self.__counters["hits" if is_hit else "misses"] += 1
+            is_batch_full : bool = sum(self.__counters.values()) >= self.__stats_batch
+
+        if is_batch_full:
+            self.flush_stats()
+    def __calculate_age_histogram(self, ages : list[float]) -> dict[str, int]:
+
+        '''Counts ages by bucket (see DEFAULT.AGE_HISTOGRAM_BUCKETS).'''
+
+        histogram : dict[str, int] = { bucket : 0 for bucket, _ in DEFAULT.AGE_HISTOGRAM_BUCKETS }
+
+        for age in ages:
+            bucket : str = next(bucket for bucket, upper_bound in DEFAULT.AGE_HISTOGRAM_BUCKETS if age < upper_bound)
+            histogram[bucket] += 1
+
+        return histogram
+
+    def __get_entries_dir(self) -> str:
+
+        '''Returns the directory that contains the entries.'''
+
+        return os.path.join(self.__cache_dir, "releases")
+    def __get_locks_dir(self) -> str:
+
+        '''Returns the directory that contains the lock files.'''
+
+        return os.path.join(self.__cache_dir, "locks")
+    def __get_file_name(self, package_name : str, only_stable_releases : bool) -> str:
+
+        '''Returns a file name that is safe for any package_name.'''
+
+        return hashlib.sha256(f"{package_name}|{only_stable_releases}".encode("utf-8")).hexdigest()
+    def __get_entry_path(self, package_name : str, only_stable_releases : bool) -> str:
+
+        '''Returns the path of the entry for the provided key.'''
+
+        return os.path.join(self.__get_entries_dir(), self.__get_file_name(package_name = package_name, only_stable_releases = only_stable_releases) + ".json")
+    def __get_entry_paths(self) -> list[str]:
+
+        '''Returns the paths of all the entries. Temporary files are excluded.'''
+
+        return [os.path.join(self.__get_entries_dir(), name) for name in os.listdir(self.__get_entries_dir()) if name.endswith(".json")]
+    @staticmethod
+    def __remove(path : str) -> None:
+
+        '''Removes path, if it still exists.'''
+
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+    @staticmethod
+    def __read(path : str) -> Optional[dict[str, Any]]:
+
+        '''Reads the entry in path or returns None if it's missing or unreadable.'''
+
+        try:
+            with open(path, "r", encoding = "utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            FileReleaseCache.__remove(path = path)
+            return None
+    @staticmethod
+    def __write(path : str, entry : dict[str, Any]) -> None:
+
+        '''Writes entry to a temporary file in the same directory and renames it to path in one atomic step.'''
+
+        fd, temp_path = tempfile.mkstemp(dir = os.path.dirname(path), suffix = ".tmp")
+
+        try:
+            with os.fdopen(fd, "w", encoding = "utf-8") as file:
+                json.dump(entry, file)
+            os.replace(temp_path, path)
+        except BaseException:
+            FileReleaseCache.__remove(path = temp_path)
+            raise
+
+    def try_get(self, package_name : str, only_stable_releases : bool, include_expired : bool = False, count_lookup : bool = True) -> Optional[FSession]:
+
+        '''
+            Returns the cached FSession, marked with its age and staleness, or None if it's not cached (or expired, unless include_expired is True).
+
+            Expired entries are left in place, since they are removed by prune(). If count_lookup is False, the lookup isn't counted in the stats.
+        '''
+
+        path : str = self.__get_entry_path(package_name = package_name, only_stable_releases = only_stable_releases)
+        entry : Optional[dict[str, Any]] = self.__read(path = path)
+
+        if entry is None:
+            if count_lookup:
+                self.__count(is_hit = False)
+            return None
+
+        age : float = self.__now_function() - entry["stored_at"]
+
+        if age >= entry["ttl"] + self.__grace and not include_expired:
+            if count_lookup:
+                self.__count(is_hit = False)
+            return None
+
+        f_session : FSession = self.__serializer.from_dict(item = entry["f_session"])
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        if count_lookup:
+            self.__count(is_hit = True)
+
+        return replace(f_session, age = age, is_stale = age >= entry["ttl"])
+    def add(self, package_name : str, only_stable_releases : bool, f_session : FSession, stored_at : Optional[float] = None) -> None:
+
+        '''Caches f_session as fetched at stored_at (now, if not provided).'''
+
+        entry : dict[str, Any] = {
+            "package_name": package_name,
+            "only_stable_releases": only_stable_releases,
+            "stored_at": self.__now_function() if stored_at is None else stored_at,
+            "ttl": self.__ttl if self.__ttl_function is None else self.__ttl_function(f_session),
+            "f_session": self.__serializer.to_dict(f_session = f_session)
+        }
+
+        self.__write(path = self.__get_entry_path(package_name = package_name, only_stable_releases = only_stable_releases), entry = entry)
+    def invalidate(self, package_name : str) -> None:
+
+        '''Removes all the entries for package_name, if present.'''
+
+        self.__remove(path = self.__get_entry_path(package_name = package_name, only_stable_releases = True))
+        self.__remove(path = self.__get_entry_path(package_name = package_name, only_stable_releases = False))
+    def clear(self) -> None:
+
+        '''Removes all the entries. Lock files are kept, since other processes might be holding them.'''
+
+        for path in self.__get_entry_paths():
+            self.__remove(path = path)
+    def get_package_names(self) -> list[str]:
+
+        '''Returns the names of the cached packages, expired ones included.'''
+
+        package_names : set[str] = set()
+
+        for path in self.__get_entry_paths():
+            entry : Optional[dict[str, Any]] = self.__read(path = path)
+            if entry is not None:
+                package_names.add(entry["package_name"])
+
+        return sorted(package_names)
+    @contextmanager
+    def lock(self, package_name : str, only_stable_releases : bool) -> Iterator[None]:
+
+        '''Holds an exclusive advisory lock on the entry for the provided key. It blocks while another process (or thread) holds it.'''
+
+        with self.__lock_file(name = self.__get_file_name(package_name = package_name, only_stable_releases = only_stable_releases) + ".lock"):
+            yield
+    def flush_stats(self) -> None:
+
+        '''
+            Adds the hits and misses counted in memory to the shared file and resets them. 
+            It's also called by get_stats() and, for the remaining ones, when the instance is garbage collected or at exit.
+
+            Failures (e.g. a read-only cache directory) are ignored, since the stats are informational only.
+        '''
+
+        self.__flush_counters(cache_dir = self.__cache_dir, counters_lock = self.__counters_lock, counters = self.__counters)
+    def get_stats(self) -> CacheStats:
+
+        '''Returns the number of entries, their size in bytes, the hit ratio and the age histogram.'''
+
+        self.flush_stats()
+
+        size : int = 0
+        ages : list[float] = []
+        now : float = self.__now_function()
+
+        for path in self.__get_entry_paths():
+            entry : Optional[dict[str, Any]] = self.__read(path = path)
+            if entry is not None:
+                size += os.path.getsize(path)
+                ages.append(now - entry["stored_at"])
+
+        counters : dict[str, int] = self.__read_counters(cache_dir = self.__cache_dir)
+        lookups : int = counters["hits"] + counters["misses"]
+
+        cache_stats : CacheStats = CacheStats(
+            entries = len(ages),
+            size = size,
+            hits = counters["hits"],
+            misses = counters["misses"],
+            hit_ratio = f"{(counters['hits'] / lookups if lookups > 0 else 0) * 100:.2f}%",
+            age_histogram = self.__calculate_age_histogram(ages = ages)
+        )
+
+        return cache_stats
+    def prune(self, max_size : Optional[int] = None) -> PruneSummary:
+
+        '''
+            Removes the expired entries and then, if max_size (in bytes) is provided, the least recently used entries 
+            until the cache isn't bigger than max_size.
+        '''
+
+        expired : int = 0
+        evicted : int = 0
+        freed : int = 0
+        remaining : list[Tuple[float, int, str]] = []
+        now : float = self.__now_function()
+
+        for path in self.__get_entry_paths():
+
+            entry : Optional[dict[str, Any]] = self.__read(path = path)
+
+            if entry is None:
+                continue
+
+            try:
+                stat_result : os.stat_result = os.stat(path)
+            except FileNotFoundError:
+                continue
+
+            if now - entry["stored_at"] >= entry["ttl"] + self.__grace:
+                self.__remove(path = path)
+                expired += 1
+                freed += stat_result.st_size
+            else:
+                remaining.append((stat_result.st_mtime, stat_result.st_size, path))
+
+        size : int = sum(item[1] for item in remaining)
+
+        for _, file_size, path in sorted(remaining):
+
+            if max_size is None or size <= max_size:
+                break
+
+            self.__remove(path = path)
+            evicted += 1
+            freed += file_size
+            size -= file_size
+
+        return PruneSummary(expired = expired, evicted = evicted, freed = freed)
+class SnapshotWriter():
+
+    '''Writes SnapshotEntry objects to a single compressed, indexed file (see SnapshotFormat).'''
+
+    __serializer : FSessionSerializer
+
+    def __init__(self, serializer : FSessionSerializer = FSessionSerializer()) -> None:
+
+        self.__serializer = serializer
+
+    def __create_record(self, snapshot_entry : SnapshotEntry) -> bytes:
+
+        '''Converts snapshot_entry to a compressed JSON record.'''
+
+        item : dict[str, Any] = {
+            "package_name": snapshot_entry.package_name,
+            "only_stable_releases": snapshot_entry.only_stable_releases,
+            "fetched_at": snapshot_entry.fetched_at,
+            "f_session": self.__serializer.to_dict(f_session = snapshot_entry.f_session)
+        }
+
+        return zlib.compress(json.dumps(item).encode("utf-8"))
+
+    def write(self, file_path : str, snapshot_entries : list[SnapshotEntry]) -> None:
+
+        '''Writes snapshot_entries to file_path. The file is written to a temporary file and atomically renamed.'''
+
+        records : list[bytes] = []
+        offset : int = SnapshotFormat.HEADER.size
+        index : dict[bytes, Tuple[int, int]] = {}
+        package_names : set[str] = set()
+
+        for snapshot_entry in snapshot_entries:
+            record : bytes = self.__create_record(snapshot_entry = snapshot_entry)
+            key : bytes = SnapshotFormat.create_key(package_name = snapshot_entry.package_name, only_stable_releases = snapshot_entry.only_stable_releases)
+            index[key] = (offset, len(record))
+            records.append(record)
+            offset += len(record)
+            package_names.add(snapshot_entry.package_name)
+
+        index_offset : int = offset
+        index_content : bytes = b"".join(SnapshotFormat.INDEX_ITEM.pack(key, offset, length) for key, (offset, length) in sorted(index.items()))
+        names_content : bytes = zlib.compress(json.dumps(sorted(package_names)).encode("utf-8"))
+        header : bytes = SnapshotFormat.HEADER.pack(SnapshotFormat.MAGIC, len(index), index_offset, index_offset + len(index_content), len(names_content))
+
+        fd, temp_path = tempfile.mkstemp(dir = os.path.dirname(os.path.abspath(file_path)), suffix = ".tmp")
+
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(header)
+                file.writelines(records)
+                file.write(index_content)
+                file.write(names_content)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+class SnapshotReleaseCache():
+
+    '''
+        Serves the FSession objects of a snapshot file (see SnapshotWriter) as a read-only ReleaseCache.
+
+        The file is memory-mapped and only the header is read when it's opened: each try_get() performs a binary search 
+        on the index and decompresses one record, therefore opening a snapshot costs the same regardless of its size.
+
+        Entries never expire. They are stale once they are older than "ttl" seconds. add(), invalidate() and clear() do nothing.
+    '''
+
+    __file_path : str
+    __ttl : int
+    __now_function : Callable[[], float]
+    __serializer : FSessionSerializer
+    __file : Any
+    __mmap : mmap.mmap
+    __count : int
+    __index_offset : int
+    __names_offset : int
+    __names_length : int
+
+    def __init__(
+            self,
+            file_path : str,
+            ttl : int = DEFAULT.RELEASE_CACHE_TTL,
+            now_function : Callable[[], float] = LambdaCollection.now_function(),
+            serializer : FSessionSerializer = FSessionSerializer()
+            ) -> None:
+
+        self.__file_path = file_path
+        self.__ttl = ttl
+        self.__now_function = now_function
+        self.__serializer = serializer
+        self.__file = open(file_path, "rb")
+
+        try:
+            self.__mmap = mmap.mmap(self.__file.fileno(), 0, access = mmap.ACCESS_READ)
+            magic, self.__count, self.__index_offset, self.__names_offset, self.__names_length = SnapshotFormat.HEADER.unpack_from(self.__mmap, 0)
+        except (ValueError, struct.error):
+            self.__file.close()
+            raise Exception(_MessageCollection.provided_file_isnt_a_snapshot(file_path = file_path))
+
+        if magic != SnapshotFormat.MAGIC:
+            self.close()
+            raise Exception(_MessageCollection.provided_file_isnt_a_snapshot(file_path = file_path))
+
+    def __find(self, key : bytes) -> Optional[Tuple[int, int]]:
+
+        '''Returns (offset, length) of the record for key or None, by binary search on the memory-mapped index.'''
+
+        low : int = 0
+        high : int = self.__count - 1
+
+        while low <= high:
+
+            middle : int = (low + high) // 2
+            current_key, offset, length = SnapshotFormat.INDEX_ITEM.unpack_from(self.__mmap, self.__index_offset + middle * SnapshotFormat.INDEX_ITEM.size)
+
+            if current_key == key:
+                return (offset, length)
+            elif current_key < key:
+                low = middle + 1
+            else:
+                high = middle - 1
+
+        return None
+    def __read_record(self, offset : int, length : int) -> dict[str, Any]:
+
+        '''Decompresses and parses the record at offset.'''
+
+        return json.loads(zlib.decompress(self.__mmap[offset:offset + length]))
+    def __create_entries(self) -> list[SnapshotEntry]:
+
+        '''Returns all the entries of the snapshot.'''
+
+        snapshot_entries : list[SnapshotEntry] = []
+
+        for i in range(self.__count):
+            _, offset, length = SnapshotFormat.INDEX_ITEM.unpack_from(self.__mmap, self.__index_offset + i * SnapshotFormat.INDEX_ITEM.size)
+            item : dict[str, Any] = self.__read_record(offset = offset, length = length)
+            snapshot_entries.append(SnapshotEntry(
+                package_name = item["package_name"],
+                only_stable_releases = item["only_stable_releases"],
+                fetched_at = item["fetched_at"],
+                f_session = self.__serializer.from_dict(item = item["f_session"])
+            ))
+
+        return snapshot_entries
+
+    def try_get(self, package_name : str, only_stable_releases : bool, include_expired : bool = False, count_lookup : bool = True) -> Optional[FSession]:
+
+        '''Returns the FSession stored in the snapshot, marked with its age and staleness, or None if it's not stored. Snapshot entries never expire.'''
+
+        location : Optional[Tuple[int, int]] = self.__find(key = SnapshotFormat.create_key(package_name = package_name, only_stable_releases = only_stable_releases))
+
+        if location is None:
+            return None
+
+        item : dict[str, Any] = self.__read_record(offset = location[0], length = location[1])
+        age : float = self.__now_function() - item["fetched_at"]
+
+        return replace(self.__serializer.from_dict(item = item["f_session"]), age = age, is_stale = age >= self.__ttl)
+    def add(self, package_name : str, only_stable_releases : bool, f_session : FSession, stored_at : Optional[float] = None) -> None:
+
+        '''Does nothing: snapshots are read-only.'''
+
+        pass
+    def invalidate(self, package_name : str) -> None:
+
+        '''Does nothing: snapshots are read-only.'''
+
+        pass
+    def clear(self) -> None:
+
+        '''Does nothing: snapshots are read-only.'''
+
+        pass
+    def get_package_names(self) -> list[str]:
+
+        '''Returns the names of the packages stored in the snapshot.'''
+
+        return json.loads(zlib.decompress(self.__mmap[self.__names_offset:self.__names_offset + self.__names_length]))
+    def lock(self, package_name : str, only_stable_releases : bool) -> AbstractContextManager[None]:
+
+        '''Does nothing: snapshots are never filled.'''
+
+        return nullcontext()
+    def copy_to(self, release_cache : ReleaseCache) -> int:
+
+        '''
+            Adds all the entries of the snapshot to release_cache (e.g. a FileReleaseCache on another machine) and returns how many they are.
+
+            Entries keep their "fetched_at", so their age and staleness in release_cache are the same as in the snapshot.
+        '''
+
+        snapshot_entries : list[SnapshotEntry] = self.__create_entries()
+
+        for snapshot_entry in snapshot_entries:
+            release_cache.add(
+                package_name = snapshot_entry.package_name,
+                only_stable_releases = snapshot_entry.only_stable_releases,
+                f_session = snapshot_entry.f_session,
+                stored_at = snapshot_entry.fetched_at
+            )
+
+        return len(snapshot_entries)
+    def close(self) -> None:
+
+        '''Releases the memory map and the file.'''
+
+        self.__mmap.close()
+        self.__file.close()
+class RateLimiter():
+
+    '''Spaces out the calls to acquire() so that no more than "rate" of them per second go through, whatever the number of calling threads.'''
+
+    __interval : float
+    __now_function : Callable[[], float]
+    __sleeping_function : Callable[[float], None]
+    __lock : Lock
+    __next_time : float
+
+    def __init__(
+            self,
+            rate : float = DEFAULT.PROXY_RATE_LIMIT,
+            now_function : Callable[[], float] = LambdaCollection.now_function(),
+            sleeping_function : Callable[[float], None] = sleep
+            ) -> None:
+
+        self.__interval = 1 / rate
+        self.__now_function = now_function
+        self.__sleeping_function = sleeping_function
+        self.__lock = Lock()
+        self.__next_time = 0.0
+
+    def acquire(self) -> float:
+
+        '''Reserves the next free slot, waits for it and returns the waited time (in seconds).'''
+
+        with self.__lock:
+            now : float = self.__now_function()
+            start : float = max(now, self.__next_time)
+            self.__next_time = start + self.__interval
+
+        delay : float = start - now
+
+        if delay > 0:
+            self.__sleeping_function(delay)
+
+        return delay
+class CachingProxy():
+
+    '''
+        Serves the index paths used by the fetchers from a disk cache, and falls back to upstream_url on a miss.
+
+        - Only the paths the fetchers use are served. All the other paths get a 404 without reaching upstream.
+        - Concurrent misses for the same path are coalesced into one upstream request (SingleFlight).
+        - All the upstream requests share one RateLimiter, whatever the number of clients.
+        - Only 200 and 404 responses are cached. Other statuses and network errors (502) are returned as they are.
+        - 404 responses are cached for "not_found_ttl" seconds at most, so that a package that has just been published 
+          (e.g. a private package moved to the index) becomes visible soon.
+    '''
+
+    __upstream_url : str
+    __cache_dir : str
+    __ttl : int
+    __feed_ttl : int
+    __not_found_ttl : int
+    __get_function : Callable[[str], Response]
+    __single_flight : SingleFlight
+    __rate_limiter : RateLimiter
+    __now_function : Callable[[], float]
+
+    def __init__(
+            self,
+            upstream_url : str = DEFAULT.INDEX_URL,
+            cache_dir : str = DEFAULT.CACHE_DIR,
+            ttl : int = DEFAULT.RELEASE_CACHE_TTL,
+            feed_ttl : int = DEFAULT.PROXY_FEED_TTL,
+            not_found_ttl : int = DEFAULT.PROXY_NOT_FOUND_TTL,
+            get_function : Optional[Callable[[str], Response]] = None,
+            single_flight : Optional[SingleFlight] = None,
+            rate_limiter : Optional[RateLimiter] = None,
+            now_function : Callable[[], float] = LambdaCollection.now_function()
+            ) -> None:
+
+        if get_function is None:
+            get_function = LambdaCollection.pooled_get_function()
+
+        if single_flight is None:
+            single_flight = SingleFlight()
+
+        if rate_limiter is None:
+            rate_limiter = RateLimiter()
+
+        self.__upstream_url = upstream_url.rstrip("/")
+        self.__cache_dir = cache_dir
+        self.__ttl = ttl
+        self.__feed_ttl = feed_ttl
+        self.__not_found_ttl = not_found_ttl
+        self.__get_function = get_function
+        self.__single_flight = single_flight
+        self.__rate_limiter = rate_limiter
+        self.__now_function = now_function
+
+        os.makedirs(self.__get_responses_dir(), exist_ok = True)
+
+    def __get_responses_dir(self) -> str:
+
+        '''Returns the directory that contains the cached responses.'''
+
+        return os.path.join(self.__cache_dir, "responses")
+    def __get_response_path(self, path : str) -> str:
+
+        '''Returns the file path of the cached response for path.'''
+
+        return os.path.join(self.__get_responses_dir(), hashlib.sha256(path.encode("utf-8")).hexdigest())
+    def __get_ttl(self, path : str) -> Optional[int]:
+
+        '''Returns the TTL for path or None if path isn't one of the paths used by the fetchers.'''
+
+        if re.fullmatch(r"/rss/project/[^/]+/releases\.xml", path) or re.fullmatch(r"/project/[^/]+/", path):
+            return self.__ttl
+
+        if path in ["/rss/updates.xml", "/rss/packages.xml"]:
+            return self.__feed_ttl
+
+        return None
+    def __try_read(self, path : str) -> Optional[ProxyResponse]:
+
+        '''
+            Returns the cached response for path or None if it's missing or expired. 
+            
+            Each file contains a JSON header line followed by the body.
+        '''
+
+        try:
+            with open(self.__get_response_path(path = path), "rb") as file:
+                header : dict[str, Any] = json.loads(file.readline())
+                body : bytes = file.read()
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            return None
+
+        if self.__now_function() - header["stored_at"] >= header["ttl"]:
+            return None
+
+        return ProxyResponse(status = header["status"], content_type = header["content_type"], body = body, is_hit = True)
+    def __write(self, path : str, ttl : int, proxy_response : ProxyResponse) -> None:
+
+        '''Writes proxy_response to a temporary file and renames it in one atomic step.'''
+
+        header : dict[str, Any] = {
+            "path": path,
+            "status": proxy_response.status,
+            "content_type": proxy_response.content_type,
+            "stored_at": self.__now_function(),
+            "ttl": ttl
+        }
+
+        fd, temp_path = tempfile.mkstemp(dir = self.__get_responses_dir(), suffix = ".tmp")
+
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(json.dumps(header).encode("utf-8") + b"\n")
+                file.write(proxy_response.body)
+            os.replace(temp_path, self.__get_response_path(path = path))
+        except BaseException:
+            os.remove(temp_path)
+            raise
+    def __fetch(self, path : str, ttl : int) -> ProxyResponse:
+
+        '''Downloads path from upstream (respecting the rate limit) and caches the response, unless another leader cached it meanwhile.'''
+
+        cached : Optional[ProxyResponse] = self.__try_read(path = path)
+
+        if cached is not None:
+            return cached
+
+        self.__rate_limiter.acquire()
+
+        try:
+            response : Response = self.__get_function(f"{self.__upstream_url}{path}")
+        except requests.RequestException as e:
+            return ProxyResponse(status = 502, content_type = "text/plain", body = str(e).encode("utf-8"), is_hit = False)
+
+        proxy_response : ProxyResponse = ProxyResponse(
+            status = response.status_code,
+            content_type = response.headers.get("Content-Type", "application/octet-stream"),
+            body = response.content,
+            is_hit = False
+        )
+
+        if proxy_response.status == 200:
+            self.__write(path = path, ttl = ttl, proxy_response = proxy_response)
+
+        if proxy_response.status == 404:
+            self.__write(path = path, ttl = min(ttl, self.__not_found_ttl), proxy_response = proxy_response)
+
+        return proxy_response
+
+    def get(self, path : str) -> ProxyResponse:
+
+        '''Returns the response for path (query string and fragment are ignored).'''
+
+        path = path.split("?")[0].split("#")[0]
+        ttl : Optional[int] = self.__get_ttl(path = path)
+
+        if ttl is None:
+            return ProxyResponse(status = 404, content_type = "text/plain", body = b"Not Found", is_hit = False)
+
+        cached : Optional[ProxyResponse] = self.__try_read(path = path)
+
+        if cached is not None:
+            return cached
+
+        return self.__single_flight.run(key = path, function = lambda : self.__fetch(path = path, ttl = ttl))
+class HedgedGetter():
+
+    '''
+        Sends the same request to an ordered list of equivalent URLs (e.g. a mirror and pypi.org) to cut tail latency.
+
+        The first URL is requested immediately. If it hasn't answered within hedge_delay seconds (or it failed), 
+        the next URL is requested too and the first successful (2xx) response that arrives wins. The losers are cancelled if they 
+        didn't start yet, otherwise their responses are closed and discarded as soon as they arrive.
+        An error or a non-2xx response (e.g. a 503 from an overloaded mirror) counts as a failure: if every URL fails, 
+        the last non-2xx response is returned or, if there's none, the last error is raised.
+
+        Unless an executor is provided, the requests run on a pool shared by all the instances, so that creating 
+        many instances doesn't leave idle threads behind.
+    '''
+
+    __shared_executor : Optional[ThreadPoolExecutor] = None
+    __shared_executor_lock : Lock = Lock()
+
+    __get_function : Callable[[str], Response]
+    __hedge_delay : float
+    __now_function : Callable[[], float]
+    __executor : ThreadPoolExecutor
+    __lock : Lock
+    __requests : int
+    __hedges_fired : int
+    __hedges_won : int
+    __time_saved : float
+
+    def __init__(
+            self,
+            get_function : Callable[[str], Response] = LambdaCollection.get_function(),
+            hedge_delay : float = DEFAULT.HEDGE_DELAY,
+            now_function : Callable[[], float] = LambdaCollection.now_function(),
+            executor : Optional[ThreadPoolExecutor] = None
+            ) -> None:
+
+        if executor is None:
+            executor = HedgedGetter.__get_shared_executor()
+
+        self.__get_function = get_function
+        self.__hedge_delay = hedge_delay
+        self.__now_function = now_function
+        self.__executor = executor
+        self.__lock = Lock()
+        self.__requests = 0
+        self.__hedges_fired = 0
+        self.__hedges_won = 0
+        self.__time_saved = 0.0
+
+    @staticmethod
+    def __get_shared_executor() -> ThreadPoolExecutor:
+
+        '''Returns the executor shared by all the instances. It's created on first use and its threads are started on demand.'''
+
+        with HedgedGetter.__shared_executor_lock:
+            if HedgedGetter.__shared_executor is None:
+                HedgedGetter.__shared_executor = ThreadPoolExecutor(max_workers = DEFAULT.HEDGE_WORKERS, thread_name_prefix = "hedged-getter")
+
+            return HedgedGetter.__shared_executor
+    def __submit(self, url : str) -> Future:
+
+        '''Submits a request for url to the executor.'''
+
+        return self.__executor.submit(self.__get_function, url)
+    def __discard(self, future : Future) -> None:
+
+        '''Cancels future if it didn't start yet, otherwise closes its response once it arrives.'''
+
+        if future.cancel():
+            return
+
+        future.add_done_callback(lambda f : None if f.exception() is not None else f.result().close())
+    def __is_failed(self, future : Future) -> bool:
+
+        '''Returns True if the completed future raised an error or returned a non-2xx response.'''
+
+        if future.exception() is not None:
+            return True
+
+        return not (200 <= cast(Response, future.result()).status_code < 300)
+    def __track_time_saved(self, primary : Future, answered_at : float) -> None:
+
+        '''Once the primary request completes, adds the difference with answered_at to time_saved.'''
+
+        def callback(f : Future) -> None:
+            with self.__lock:
+                self.__time_saved += max(0.0, self.__now_function() - answered_at)
+
+        primary.add_done_callback(callback)
+    def __count(self, hedges_fired : int = 0, hedges_won : int = 0) -> None:
+
+        '''Updates the counters in a thread-safe way.'''
+
+        with self.__lock:
+            self.__requests += 1
+            self.__hedges_fired += hedges_fired
+            self.__hedges_won += hedges_won
+
+    def get(self, urls : list[str]) -> Response:
+
+        '''Returns the first response among urls, according to the hedging policy described in the class docstring.'''
+
+        if len(urls) == 1:
+            self.__count()
+            return self.__get_function(urls[0])
+
+        futures : list[Future] = [self.__submit(urls[0])]
+        pending : set[Future] = set(futures)
+        last_error : Optional[BaseException] = None
+        last_response : Optional[Response] = None
+
+        while len(pending) > 0 or len(futures) < len(urls):
+
+            can_hedge : bool = len(futures) < len(urls)
+            done : set[Future] = set()
+
+            if len(pending) > 0:
+                done, _ = wait(pending, timeout = self.__hedge_delay if can_hedge else None, return_when = FIRST_COMPLETED)
+
+            if all(self.__is_failed(future) for future in done):
+
+                for future in [future for future in futures if future in done]:
+                    pending.remove(future)
+                    if future.exception() is not None:
+                        last_error = future.exception()
+                        continue
+                    if last_response is not None:
+                        last_response.close()
+                    last_response = cast(Response, future.result())
+
+                if can_hedge:
+                    hedge : Future = self.__submit(urls[len(futures)])
+                    futures.append(hedge)
+                    pending.add(hedge)
+
+                continue
+
+            winner : Future = next(future for future in futures if future in done and not self.__is_failed(future))
+
+            for future in pending:
+                if future is not winner:
+                    self.__discard(future)
+
+            if last_response is not None:
+                last_response.close()
+
+            hedges_fired : int = len(futures) - 1
+            hedges_won : int = 0 if winner is futures[0] else 1
+
+            if hedges_won == 1 and not futures[0].done():
+                self.__track_time_saved(primary = futures[0], answered_at = self.__now_function())
+
+            self.__count(hedges_fired = hedges_fired, hedges_won = hedges_won)
+
+            return cast(Response, winner.result())
+
+        self.__count(hedges_fired = len(futures) - 1)
+
+        if last_response is not None:
+            return last_response
+
+        raise cast(BaseException, last_error)
+    def get_stats(self) -> HedgingStats:
+
+        '''Returns how often hedging fired, how often the hedge won and how much time it saved (in seconds).'''
+
+        with self.__lock:
+            return HedgingStats(
+                requests = self.__requests,
+                hedges_fired = self.__hedges_fired,
+                hedges_won = self.__hedges_won,
+                time_saved = self.__time_saved
+            )
+class AIMDController():
+
+    '''
+        Limits the number of concurrent fetches with an Additive Increase/Multiplicative Decrease policy.
+
+            - Additive increase: once "limit" successful fetches in a row have been observed, limit is raised by 1.
+            - Multiplicative decrease: on HTTP 429/503, timeouts or latency spikes, limit is multiplied by decrease_factor.
+
+        A latency spike is a latency greater than spike_factor times the exponentially weighted moving average of the previous latencies.
+    '''
+
+    __min_limit : int
+    __max_limit : int
+    __decrease_factor : float
+    __spike_factor : float
+    __condition : Condition
+    __limit : int
+    __in_flight : int
+    __successes : int
+    __latency_avg : Optional[float]
+    __increases : int
+    __decreases : int
+
+    def __init__(
+            self,
+            initial_limit : int = DEFAULT.MIN_CONCURRENCY,
+            min_limit : int = DEFAULT.MIN_CONCURRENCY,
+            max_limit : int = DEFAULT.MAX_CONCURRENCY,
+            decrease_factor : float = 0.5,
+            spike_factor : float = DEFAULT.LATENCY_SPIKE_FACTOR
+            ) -> None:
+
+        self.__min_limit = min_limit
+        self.__max_limit = max_limit
+        self.__decrease_factor = decrease_factor
+        self.__spike_factor = spike_factor
+        self.__condition = Condition()
+        self.__limit = max(min_limit, min(initial_limit, max_limit))
+        self.__in_flight = 0
+        self.__successes = 0
+        self.__latency_avg = None
+        self.__increases = 0
+        self.__decreases = 0
+
+    def __is_congestion(self, error : Exception) -> bool:
+
+        '''Returns True if error signals that the index is overloaded or throttling us.'''
+
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            return error.response.status_code in [429, 503]
+
+        return isinstance(error, requests.Timeout)
+    def __is_spike(self, latency : float) -> bool:
+
+        '''Returns True if latency is much greater than the average latency observed so far.'''
+
+        return self.__latency_avg is not None and latency > self.__latency_avg * self.__spike_factor
+    def __update_average(self, latency : float) -> None:
+
+        '''Updates the exponentially weighted moving average of the latencies.'''
+
+        alpha : float = 0.2
+
+        if self.__latency_avg is None:
+            self.__latency_avg = latency
+        else:
+            self.__latency_avg = (alpha * latency) + ((1 - alpha) * self.__latency_avg)
+    def __decrease(self) -> None:
+
+        '''Cuts the limit multiplicatively. The caller must hold the condition.'''
+
+        self.__limit = max(self.__min_limit, int(self.__limit * self.__decrease_factor))
+        self.__successes = 0
+        self.__decreases += 1
+    def __increase(self) -> None:
+
+        '''Raises the limit additively once enough successes have been observed. The caller must hold the condition.'''
+
+        self.__successes += 1
+
+        if self.__successes >= self.__limit and self.__limit < self.__max_limit:
+            self.__limit += 1
+            self.__successes = 0
+            self.__increases += 1
+            self.__condition.notify_all()
+
+    @property
+    def limit(self) -> int:
+
+        '''The current concurrency limit.'''
+
+        with self.__condition:
+            return self.__limit
+    @property
+    def max_limit(self) -> int:
+
+        '''The upper bound of the concurrency limit.'''
+
+        return self.__max_limit
+
+    def acquire(self) -> None:
+
+        '''Blocks until the number of in-flight fetches is below the current limit.'''
+
+        with self.__condition:
+            self.__condition.wait_for(lambda : self.__in_flight < self.__limit)
+            self.__in_flight += 1
+    def release(self) -> None:
+
+        '''Frees a slot acquired by acquire().'''
+
+        with self.__condition:
+            self.__in_flight -= 1
+            self.__condition.notify_all()
+    def on_success(self, latency : float) -> None:
+
+        '''Records a successful fetch that took latency seconds.'''
+
+        with self.__condition:
+
+            if self.__is_spike(latency = latency):
+                self.__decrease()
+            else:
+                self.__increase()
+
+            self.__update_average(latency = latency)
+    def on_failure(self, error : Exception) -> None:
+
+        '''Records a failed fetch. Only congestion-related errors cut the limit.'''
+
+        with self.__condition:
+
+            if self.__is_congestion(error = error):
+                self.__decrease()
+    def get_stats(self) -> ConcurrencyStats:
+
+        '''Returns the live metrics.'''
+
+        with self.__condition:
+            return ConcurrencyStats(
+                limit = self.__limit,
+                in_flight = self.__in_flight,
+                increases = self.__increases,
+                decreases = self.__decreases
+            )
+class ContentParser():
+
+    '''
+        Collects all the CPU-bound logic to convert the raw content of the PyPi pages into objects.
+
+        It holds no runtime state and its results are picklable, therefore it can be safely used from within worker processes.
+
+        If stop_at_first_unbadged is True, badge extraction stops at the first release without badges: the #history page is sorted 
+        from the newest release, therefore older badges can't change the most recent stable release.
+    '''
+
+    __stop_at_first_unbadged : bool
+
+    def __init__(self, stop_at_first_unbadged : bool = False) -> None:
+
+        self.__stop_at_first_unbadged = stop_at_first_unbadged
+
+    def __try_extract_text(self, element : Element, path : str) -> Optional[str]:
+
+        '''Extracts the text from the provided element according to path or returns None.'''
+
+        try:
+
+            result : Optional[Element] = element.find(path = path)
+
+            return cast(Element, result).text
+
+        except:
+            return None
+    def __try_extract_title(self, element : Element) -> Optional[str]:
+
+        '''Extracts the title from the provided element or returns None.'''
+
+        return self.__try_extract_text(element = element, path = "title")
+    def __try_extract_link(self, element : Element) -> Optional[str]:
+
+        '''Extracts the link from the provided element or returns None.'''
+
+        return self.__try_extract_text(element = element, path = "link")
+    def __try_extract_description(self, element : Element) -> Optional[str]:
+
+        '''Extracts the description from the provided element or returns None.'''
+
+        return self.__try_extract_text(element = element, path = "description")
+    def __try_extract_author(self, element : Element) -> Optional[str]:
+
+        '''Extracts the author from the provided element or returns None.'''
+
+        return self.__try_extract_text(element = element, path = "author")
+    def __try_extract_pubdate_str(self, element : Element) -> Optional[str]:
+
+        '''Extracts the pubDate from the provided element or returns None.'''
+
+        return self.__try_extract_text(element = element, path = "pubDate")
+    def __parse_pubdate_str(self, pubdate_str : Optional[str]) -> Optional[datetime]:
+
+        '''
+            This method expect a dt_str as in the following examples:
+
+                Fri, 20 Sep 2024 13:08:42 GMT
+                Wed, 10 Apr 2024 19:44:10 GMT
+                Fri, 23 Feb 2024 15:30:19 GMT
+                Sat, 20 Jan 2024 02:10:54 GMT
+                ...
+        '''
+
+        if pubdate_str:
+
+            format : str = "%a, %d %b %Y %H:%M:%S %Z"
+            pubdate = datetime.strptime(pubdate_str, format)
+
+            return pubdate
+        
+        else:
+            return None
+    def parse_releases(self, releases_content : str) -> list[XMLItem]:
+
+        '''Convert the provided releases.xml content to a list of XMLItem objects.'''
+    
+        root : Element = ET.fromstring(text = releases_content)
+
+        releases : list[XMLItem] = []
+        for channel in root.findall("channel"):
+            for item in channel.findall("item"):
+                
+                title : Optional[str] = self.__try_extract_title(element = item)
+                link : Optional[str] = self.__try_extract_link(element = item)
+                description : Optional[str] = self.__try_extract_description(element = item)
+                author : Optional[str] = self.__try_extract_author(element = item)
+                pubdate_str : Optional[str] = self.__try_extract_pubdate_str(element = item)
+                pubdate : Optional[datetime] = self.__parse_pubdate_str(pubdate_str = pubdate_str)
+                
+                release : XMLItem = XMLItem(
+                    title = title,
+                    link = link,
+                    description = description,
+                    author = author,
+                    pubdate_str = pubdate_str,
+                    pubdate = pubdate
+                )
+
+                releases.append(release)
+
+        return releases
+    def __extract_and_strip_text(self, tree : HtmlElement, pattern : str, remove_empty_items : bool = True) -> list[str]:
+
+        '''
+            Extracts strings from the provided tree using a XPath pattern that ends in "text()".
+            
+            Whitespaces, newlines and tabs are stripped out from each string.
+
+            Optional: empty items are removed from the returned list.
+        '''
+
+        elements : list[HtmlElement] = tree.xpath(pattern)
+        strs : list[str] = [element.strip() for element in elements]
+
+        if remove_empty_items:
+            strs = [str for str in strs if str]
+
+        return strs
+    def __create_badge(self, package_name : str, version : str, label : str) -> Badge:
+
+        '''Creates a Badge object out of the provided arguments.'''
+
+        badge : Badge = Badge(
+            package_name = package_name, 
+            version = version, 
+            label = cast(Literal["pre-release", "yanked"], label)
+        )
+
+        return badge
+    def __create_badges(self, package_name : str, versions_labels : list[Tuple[str, str]]) -> list[Badge]:
+
+        '''Creates a list of Badge objects out of the provided arguments.'''
+
+        badges : list[Badge] = []
+        for tpl in versions_labels:
+            badge : Badge = self.__create_badge(package_name = package_name, version = tpl[0], label = tpl[1])
+            badges.append(badge)
+
+        return badges
+    def __extract_versions_labels_until_unbadged(self, tree : HtmlElement) -> list[Tuple[str, str]]:
+
+        '''Walks the release-version elements from the newest one and returns their (version, label) pairs until a release without badges is found.'''
+
+        versions_labels : list[Tuple[str, str]] = []
+
+        for element in tree.iterfind(".//p[@class='release__version']"):
+
+            span : Optional[HtmlElement] = element.find("span")
+
+            if span is None:
+                break
+
+            versions_labels.append((cast(str, element.text).strip(), cast(str, span.text).strip()))
+
+        return versions_labels
+    def __extract_versions_labels(self, tree : HtmlElement) -> list[Tuple[str, str]]:
+
+        '''Returns the (version, label) pairs of all the badged releases in tree.'''
+
+        version_pattern : str = "//p[@class='release__version'][span]/text()"
+        versions : list[str] = self.__extract_and_strip_text(tree = tree, pattern = version_pattern)
+
+        if len(versions) == 0: 
+            return []
+
+        label_pattern : str = "//p[@class='release__version']/span[1]/text()"
+        labels : list[str] = self.__extract_and_strip_text(tree = tree, pattern = label_pattern)
+
+        return list(zip(versions, labels, strict = True))
+    def parse_badges(self, package_name : str, content : bytes) -> Optional[list[Badge]]:
+
+        '''
+            Extracts all the Badges from the provided #history page content.
+
+            If no badges are found, None is returned. 
+        '''
+
+        tree : HtmlElement = html.fromstring(content)
+
+        versions_labels : list[Tuple[str, str]] = []
+
+        if self.__stop_at_first_unbadged:
+            versions_labels = self.__extract_versions_labels_until_unbadged(tree = tree)
+        else:
+            versions_labels = self.__extract_versions_labels(tree = tree)
+
+        if len(versions_labels) == 0: 
+            return None
+
+        badges : list[Badge] = self.__create_badges(package_name = package_name, versions_labels = versions_labels)
+
+        return badges
+    def parse(self, d_session : DSession) -> PSession:
+
+        '''Parses both the releases.xml and the #history page contents of the provided DSession.'''
+
+        badges : Optional[list[Badge]] = None
+
+        if d_session.history_content is not None:
+            badges = self.parse_badges(package_name = d_session.package_name, content = d_session.history_content)
+
+        p_session : PSession = PSession(
+            package_name = d_session.package_name,
+            only_stable_releases = d_session.only_stable_releases,
+            url = d_session.url,
+            xml_items = self.parse_releases(releases_content = d_session.releases_content),
+            badges = badges
+        )
+
+        return p_session
+class PyPiBadgeFetcher():
+
+    '''
+        This is an utility method to retrieve the badges associated to every release.
+
+        If stream_function is provided, the #history page is streamed instead of being downloaded as a whole.
+        Only the release-version elements are kept, and reading stops at the first release without badges 
+        (older releases can't change the most recent stable one). If max_bytes are read before such a release
+        is found, the kept elements may miss the most recent stable one, so the whole page is downloaded instead.
+    '''
+
+    __get_function : Callable[[str], Response]
+    __index_urls : list[str]
+    __hedged_getter : HedgedGetter
+    __fallback_getter : HedgedGetter
+    __content_parser : ContentParser
+    __streaming : bool
+    __max_bytes : int
+    __chunk_size : int
+    __streaming_stats : dict[str, StreamingStats]
+    __lock : Lock
+
+    def __init__(
+            self,
+            get_function : Callable[[str], Response] = LambdaCollection.get_function(),
+            index_urls : Optional[list[str]] = None,
+            hedge_delay : float = DEFAULT.HEDGE_DELAY,
+            content_parser : ContentParser = ContentParser(),
+            stream_function : Optional[Callable[[str], Response]] = None,
+            max_bytes : int = DEFAULT.HISTORY_MAX_BYTES,
+            chunk_size : int = DEFAULT.HISTORY_CHUNK_SIZE
+            ) -> None:
+
+        if index_urls is None:
+            index_urls = [DEFAULT.INDEX_URL]
+
+        self.__get_function = get_function
+        self.__index_urls = index_urls
+        self.__hedged_getter = HedgedGetter(get_function = get_function if stream_function is None else stream_function, hedge_delay = hedge_delay)
+        self.__fallback_getter = self.__hedged_getter if stream_function is None else HedgedGetter(get_function = get_function, hedge_delay = hedge_delay)
+        self.__content_parser = content_parser
+        self.__streaming = stream_function is not None
+        self.__max_bytes = max_bytes
+        self.__chunk_size = chunk_size
+        self.__streaming_stats = {}
+        self.__lock = Lock()
+
+    def __format_url(self, package_name : str, index_url : str = DEFAULT.INDEX_URL) -> str:
+
+        '''Returns the URL for the package's #history page.'''
+
+        url : str =  f"{index_url}/project/{package_name}/#history"
+
+        return url  
+    def __format_urls(self, package_name : str) -> list[str]:
+
+        '''Returns the URLs for the package's #history page, one for each index URL.'''
+
+        return [self.__format_url(package_name = package_name, index_url = index_url) for index_url in self.__index_urls]
+    def __release(self, element : HtmlElement) -> None:
+
+        '''
+            Frees element and deletes the elements that precede it and its ancestors, which have already been processed.
+
+            This way the tree holds only the path to the element being parsed, whatever the size of the page.
+        '''
+
+        element.clear(keep_tail = True)
+
+        for node in [element, *element.iterancestors()]:
+            while node.getprevious() is not None:
+                del cast(HtmlElement, node.getparent())[0]
+    def __collect_release_versions(self, parser : etree.HTMLPullParser, kept : list[bytes]) -> bool:
+
+        '''
+            Moves the release-version elements parsed so far into kept and frees all the processed elements (div.release subtrees included).
+
+            Returns True as soon as a release without badges is found.
+        '''
+
+        for _, element in parser.read_events():
+
+            if element.tag != "p" or element.get("class") != "release__version":
+                self.__release(element = element)
+                continue
+
+            kept.append(etree.tostring(element, with_tail = False))
+            is_badged : bool = element.find("span") is not None
+            self.__release(element = element)
+
+            if not is_badged:
+                return True
+
+        return False
+    def __stream(self, package_name : str, response : Response) -> Tuple[bytes, StreamingStats]:
+
+        '''
+            Reads response chunk by chunk and returns a compact document made of the release-version elements only.
+
+            The peak bytes held are the kept elements plus the chunk being parsed, the parsed tree staying the same size.
+        '''
+
+        parser : etree.HTMLPullParser = etree.HTMLPullParser(events = ("end",), tag = ("p", "div"))
+        kept : list[bytes] = []
+        bytes_read : int = 0
+        bytes_kept : int = 0
+        kept_count : int = 0
+        peak_bytes_held : int = 0
+        stopped_early : bool = False
+
+        try:
+
+            for chunk in response.iter_content(chunk_size = self.__chunk_size):
+
+                bytes_read += len(chunk)
+                parser.feed(chunk)
+                stopped_early = self.__collect_release_versions(parser = parser, kept = kept)
+                bytes_kept += sum(len(element) for element in kept[kept_count:])
+                kept_count = len(kept)
+                peak_bytes_held = max(peak_bytes_held, bytes_kept + len(chunk))
+
+                if stopped_early or bytes_read >= self.__max_bytes:
+                    break
+
+        finally:
+            response.close()
+
+        content : bytes = b"<div>" + b"".join(kept) + b"</div>"
+        stats : StreamingStats = StreamingStats(
+            package_name = package_name,
+            bytes_read = bytes_read,
+            bytes_kept = len(content),
+            stopped_early = stopped_early,
+            truncated = not stopped_early and bytes_read >= self.__max_bytes,
+            peak_bytes_held = max(peak_bytes_held, len(content))
+        )
+
+        return (content, stats)
+    def download(self, package_name : str) -> bytes:
+
+        '''
+            Downloads the #history page for the provided package_name and returns its raw content.
+
+            In streaming mode, the returned content contains only the release-version elements needed to extract the badges,
+            unless max_bytes were read before the first release without badges and the whole page had to be downloaded.
+        '''
+
+        urls : list[str] = self.__format_urls(package_name = package_name)
+        
+        response : Response = self.__hedged_getter.get(urls = urls)
+        response.raise_for_status()
+
+        if not self.__streaming:
+            return response.content
+
+        content, stats = self.__stream(package_name = package_name, response = response)
+
+        if stats.truncated:
+            response = self.__fallback_getter.get(urls = urls)
+            response.raise_for_status()
+            content = response.content
+            stats = replace(stats, peak_bytes_held = max(stats.peak_bytes_held, len(content)), fell_back = True)
+
+        with self.__lock:
+            self.__streaming_stats[package_name] = stats
+
+        return content
+    def parse(self, package_name : str, content : bytes) -> Optional[list[Badge]]:
+
+        '''
+            Extracts all the Badges from the provided #history page content.
+
+            If no badges are found, None is returned. 
+        '''
+
+        return self.__content_parser.parse_badges(package_name = package_name, content = content)
+    def try_fetch(self, package_name : str) -> Optional[list[Badge]]:
+
+        '''
+            Fetches all the Badges for the provided package_name.
+
+            If no badges are found, None is returned. 
+        '''
+
+        content : bytes = self.download(package_name = package_name)
+
+        return self.parse(package_name = package_name, content = content)
+    def get_hedging_stats(self) -> HedgingStats:
+
+        '''Returns the hedging counters for the #history requests.'''
+
+        return self.__hedged_getter.get_stats()
+    def get_streaming_stats(self) -> list[StreamingStats]:
+
+        '''Returns the bytes read, kept and held for each streamed #history page, in download order.'''
+
+        with self.__lock:
+            return list(self.__streaming_stats.values())
+class PyPiReleaseFetcher():
+
+    '''This is a client for PyPi release pages.'''
+
+    __get_function : Callable[[str], Response]
+    __badge_fetcher : PyPiBadgeFetcher
+    __single_flight : SingleFlight
+    __negative_cache : NegativeCache
+    __package_filter : PackageFilter
+    __index_urls : list[str]
+    __hedged_getter : HedgedGetter
+    __content_parser : ContentParser
+    __release_cache : Optional[ReleaseCache]
+    __refreshing : set[Tuple[str, bool]]
+    __lock : Lock
+
+    def __init__(
+            self,
+            get_function : Callable[[str], Response] = LambdaCollection.get_function(),
+            badge_fetcher : Optional[PyPiBadgeFetcher] = None,
+            single_flight : Optional[SingleFlight] = None,
+            negative_cache : Optional[NegativeCache] = None,
+            package_filter : Optional[PackageFilter] = None,
+            index_urls : Optional[list[str]] = None,
+            hedge_delay : float = DEFAULT.HEDGE_DELAY,
+            content_parser : ContentParser = ContentParser(),
+            release_cache : Optional[ReleaseCache] = None
+            ) -> None:
+
+        if index_urls is None:
+            index_urls = [DEFAULT.INDEX_URL]
+
+        if badge_fetcher is None:
+            badge_fetcher = PyPiBadgeFetcher(get_function = get_function, index_urls = index_urls, hedge_delay = hedge_delay, content_parser = content_parser)
+
+        if single_flight is None:
+            single_flight = SingleFlight()
+
+        if negative_cache is None:
+            negative_cache = NegativeCache()
+
+        if package_filter is None:
+            package_filter = PackageFilter()
+
+        self.__get_function = get_function
+        self.__badge_fetcher = badge_fetcher
+        self.__single_flight = single_flight
+        self.__negative_cache = negative_cache
+        self.__package_filter = package_filter
+        self.__index_urls = index_urls
+        self.__hedged_getter = HedgedGetter(get_function = get_function, hedge_delay = hedge_delay)
+        self.__content_parser = content_parser
+        self.__release_cache = release_cache
+        self.__refreshing = set()
+        self.__lock = Lock()
+
+    def __format_url(self, package_name : str, index_url : str = DEFAULT.INDEX_URL) -> str:
+
+        '''Returns the URL for the package's releases.xml.'''
+
+        url : str =  f"{index_url}/rss/project/{package_name}/releases.xml"
+
+        return url  
+    def __format_urls(self, package_name : str) -> list[str]:
+
+        '''Returns the URLs for the package's releases.xml, one for each index URL (ordered by priority).'''
+
+        return [self.__format_url(package_name = package_name, index_url = index_url) for index_url in self.__index_urls]
+    def __has_title(self, xml_item : XMLItem) -> bool:
+
+        '''Retuns False if xml_item.title is None.'''
+
+        if xml_item.title:
+            return True
+        else:
+            return False
+    def __has_pubdate(self, xml_item : XMLItem) -> bool:
+
+        '''Retuns False if xml_item.pubdate is None.'''
+
+        if xml_item.pubdate:
+            return True
+        else:
+            return False
+    def __filter(self, items : list[Any], function : Callable[[Any], bool]) -> list[Any]:
+
+        '''Runs function on items.'''
+
+        lst : list[Any] = [item for item in items if function(item)]
+
+        return lst
+    def __convert_to_release(self, package_name : str, xml_item : XMLItem) -> Release:
+
+        '''Converts the provided xml_item to a Release object.'''
+
+        release : Release = Release(
+            package_name = package_name,
+            version = cast(str, xml_item.title),
+            date = cast(datetime, xml_item.pubdate)
+        )
+
+        return release
+    def __convert_to_releases(self, package_name : str, xml_items : list[XMLItem]) -> list[Release]:
+
+        '''Converts the provided xml_items to a list of Release objects.'''
+
+        releases : list[Release] = []
+
+        for xml_item in xml_items:
+            release : Release = self.__convert_to_release(package_name = package_name, xml_item = xml_item)
+            releases.append(release)
+
+        return releases
+    def __sort_by_date(self, releases : list[Release], reverse : bool = True) -> list[Release]:
+
+        '''
+            reverse = True => Descending
+            reverse = False => Ascending
+        '''
+
+        lst : list[Release] = copy.deepcopy(releases)
+        lst.sort(key = lambda release : release.date, reverse = reverse)
+
+        return lst
+    def __get_most_recent(self, releases : list[Release]) -> Release:
+        
+        '''Returns most_recent_release by assuming releases are sorted in descending order.'''
+        
+        most_recent_release : Release = releases[0]
+
+        return most_recent_release
+    def __is_stable_release(self, xml_item : XMLItem, badge_versions : set[str]) -> bool:
+
+        '''
+            (xml_item.title not in badge_versions) == True => stable
+            (xml_item.title not in badge_versions) == False => unstable
+        '''
+
+        return (xml_item.title not in badge_versions)
+    def __process_stable_releases(self, xml_items_clean : list[XMLItem], badges : Optional[list[Badge]]) -> list[XMLItem]:
+
+        '''Encapsulates all the logic related to stable releases.'''
+
+        if badges is None:
+            return xml_items_clean
+
+        badge_versions : set[str] = {badge.version for badge in badges}
+        xml_items_clean = self.__filter(
+            items = xml_items_clean, 
+            function = lambda x : self.__is_stable_release(xml_item = x, badge_versions = badge_versions)
+        )
+
+        return xml_items_clean
+    def __submit_history_download(self, executor : ThreadPoolExecutor, package_name : str, only_stable_releases : bool) -> Optional[Future]:
+
+        '''Starts downloading the #history page in the background if only_stable_releases is True, otherwise returns None.'''
+
+        if only_stable_releases == False:
+            return None
+
+        return executor.submit(self.__badge_fetcher.download, package_name = package_name)
+    def __raise_for_status(self, package_name : str, response : Response) -> None:
+
+        '''Raises an HTTPError if response is unsuccessful. HTTP 404s are added to the negative cache beforehand.'''
+
+        try:
+            response.raise_for_status()
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                self.__negative_cache.add(package_name = package_name, reason = str(e))
+            raise
+    def __validate_package_name(self, package_name : str) -> None:
+
+        '''Raises an Exception without any network call if package_name is not allowed or is known to be missing.'''
+
+        if not self.__package_filter.is_allowed(package_name = package_name):
+            raise Exception(_MessageCollection.package_not_allowed(package_name = package_name))
+
+        reason : Optional[str] = self.__negative_cache.try_get(package_name = package_name)
+
+        if reason is not None:
+            raise Exception(_MessageCollection.package_known_to_be_missing(package_name = package_name, reason = reason))
+    def __download(self, package_name : str, only_stable_releases : bool) -> DSession:
+
+        '''
+            Downloads the releases.xml and (if needed) the #history page for the provided package_name without any coalescing.
+
+            The two requests don't depend on each other, therefore they are issued concurrently.
+        '''
+
+        urls : list[str] = self.__format_urls(package_name = package_name)
+
+        with ThreadPoolExecutor(max_workers = 1) as executor:
+
+            history_future : Optional[Future] = self.__submit_history_download(executor = executor, package_name = package_name, only_stable_releases = only_stable_releases)
+
+            response : Response = self.__hedged_getter.get(urls = urls)
+            self.__raise_for_status(package_name = package_name, response = response)
+
+            history_content : Optional[bytes] = None if history_future is None else history_future.result()
+
+        d_session : DSession = DSession(
+            package_name = package_name,
+            only_stable_releases = only_stable_releases,
+            url = urls[0],
+            releases_content = response.text,
+            history_content = history_content
+        )
+
+        return d_session
+
+    def download(self, package_name : str, only_stable_releases : bool) -> DSession:
+
+        '''
+            Downloads the raw content needed to establish the releases of the provided package_name. It performs network I/O only.
+
+            Concurrent calls for the same package_name and only_stable_releases are coalesced into a single download.
+
+            Packages that are not allowed by the package filter or that are in the negative cache fail without any network call.
+        '''
+
+        self.__validate_package_name(package_name = package_name)
+
+        return self.__single_flight.run(
+            key = (package_name, only_stable_releases),
+            function = lambda : self.__download(package_name = package_name, only_stable_releases = only_stable_releases)
+        )
+    def parse_content(self, d_session : DSession) -> PSession:
+
+        '''Parses the raw content of the provided DSession. It's the CPU-heavy half of parse().'''
+
+        badges : Optional[list[Badge]] = None
+
+        if d_session.history_content is not None:
+            badges = self.__badge_fetcher.parse(package_name = d_session.package_name, content = d_session.history_content)
+
+        p_session : PSession = PSession(
+            package_name = d_session.package_name,
+            only_stable_releases = d_session.only_stable_releases,
+            url = d_session.url,
+            xml_items = self.__content_parser.parse_releases(releases_content = d_session.releases_content),
+            badges = badges
+        )
+
+        return p_session
+    def create_fsession(self, p_session : PSession) -> FSession:
+
+        '''
+            Converts the provided PSession to a FSession. It's the lightweight half of parse().
+
+            If badges are available, all the releases that have been badged as "pre-release" or "yanked" are filtered out.
+
+            If a release cache has been provided, the returned FSession is stored into it.
+        '''
+
+        package_name : str = p_session.package_name
+        url : str = p_session.url
+
+        xml_items_clean : list[XMLItem] = copy.deepcopy(p_session.xml_items)
+        xml_items_clean = self.__filter(items = xml_items_clean, function = lambda x : self.__has_title(xml_item = x))
+        xml_items_clean = self.__filter(items = xml_items_clean, function = lambda x : self.__has_pubdate(xml_item = x))
+
+        if len(xml_items_clean) == 0:
+            self.__negative_cache.add(package_name = package_name, reason = _MessageCollection.no_suitable_xml_items_found(url = url))
+
+        xml_items_clean = self.__process_stable_releases(xml_items_clean = xml_items_clean, badges = p_session.badges)
+            
+        if len(xml_items_clean) == 0:
+            raise Exception(_MessageCollection.no_suitable_xml_items_found(url = url))
+
+        releases : list[Release] = self.__convert_to_releases(package_name = package_name, xml_items = xml_items_clean)
+        releases = self.__sort_by_date(releases = releases)
+
+        f_session : FSession = FSession(
+            package_name = package_name,
+            most_recent_release = self.__get_most_recent(releases = releases),
+            releases = releases,
+            xml_items = p_session.xml_items,
+            badges = p_session.badges
+        )
+
+        if self.__release_cache is not None:
+            self.__release_cache.add(package_name = package_name, only_stable_releases = p_session.only_stable_releases, f_session = f_session)
+
+        return f_session
+    def parse(self, d_session : DSession) -> FSession:
+
+        '''
+            Converts the provided DSession to a FSession. It performs CPU-bound work only.
+
+            The "only_stable_releases" flag of d_session, if True, will filter out all the releases that have been badged as "pre-release" or "yanked".
+        '''
+
+        p_session : PSession = self.parse_content(d_session = d_session)
+
+        return self.create_fsession(p_session = p_session)
+    def __refresh(self, package_name : str, only_stable_releases : bool) -> None:
+
+        '''Revalidates a stale entry. Errors are ignored: the stale entry keeps being served until it expires.'''
+
+        try:
+            self.parse(d_session = self.download(package_name = package_name, only_stable_releases = only_stable_releases))
+        except Exception:
+            pass
+        finally:
+            with self.__lock:
+                self.__refreshing.discard((package_name, only_stable_releases))
+    def __refresh_in_background(self, package_name : str, only_stable_releases : bool) -> None:
+
+        '''Starts revalidating a stale entry on a daemon thread, unless a revalidation for the same entry is already in progress.'''
+
+        key : Tuple[str, bool] = (package_name, only_stable_releases)
+
+        with self.__lock:
+
+            if key in self.__refreshing:
+                return
+
+            self.__refreshing.add(key)
+
+        Thread(target = self.__refresh, args = key, daemon = True).start()
+    def try_get_cached(self, package_name : str, only_stable_releases : bool, revalidate : bool = True, count_lookup : bool = True) -> Optional[FSession]:
+
+        '''
+            Returns the FSession for package_name from the release cache or None if it's not available (or no cache has been provided).
+
+            A stale FSession is returned as well (see its "is_stale" and "age" fields), while it's revalidated on a background thread.
+            If revalidate is False, no network call is ever performed and expired FSession objects are returned as stale, since they can't be refetched.
+            If count_lookup is False, the lookup isn't counted in the cache's stats (e.g. when a miss is checked again under lock_cached()).
+        '''
+
+        if self.__release_cache is None:
+            return None
+
+        f_session : Optional[FSession] = self.__release_cache.try_get(
+            package_name = package_name,
+            only_stable_releases = only_stable_releases,
+            include_expired = not revalidate,
+            count_lookup = count_lookup
+        )
+
+        if f_session is not None and f_session.is_stale and revalidate:
+            self.__refresh_in_background(package_name = package_name, only_stable_releases = only_stable_releases)
+
+        return f_session
+    def lock_cached(self, package_name : str, only_stable_releases : bool) -> AbstractContextManager[None]:
+
+        '''Returns the release cache's lock for the provided package_name (a no-op context manager if no release cache has been provided).'''
+
+        if self.__release_cache is None:
+            return nullcontext()
+
+        return self.__release_cache.lock(package_name = package_name, only_stable_releases = only_stable_releases)
+    def fetch(self, package_name : str, only_stable_releases : bool) -> FSession:
+
+        '''
+            Retrieves all the releases from PyPi.org for the provided package_name.
+            
+            The "only_stable_releases" flag, if True, will filter out all the releases that have been badged as "pre-release" or "yanked".
+
+            It's equivalent to parse(download()), therefore concurrent calls are coalesced and the package filter/negative cache apply.
+
+            If a release cache has been provided, cached FSession objects are returned without any network call (stale-while-revalidate)
+            and missing ones are filled under the cache's lock, so that processes sharing the cache don't download them twice.
+        '''
+
+        self.__validate_package_name(package_name = package_name)
+
+        cached_f_session : Optional[FSession] = self.try_get_cached(package_name = package_name, only_stable_releases = only_stable_releases)
+
+        if cached_f_session is not None:
+            return cached_f_session
+
+        if self.__release_cache is None:
+            return self.parse(d_session = self.download(package_name = package_name, only_stable_releases = only_stable_releases))
+
+        with self.lock_cached(package_name = package_name, only_stable_releases = only_stable_releases):
+
+            # Another process might have filled the entry while we were waiting for the lock.
+            cached_f_session = self.try_get_cached(package_name = package_name, only_stable_releases = only_stable_releases, count_lookup = False)
+
+            if cached_f_session is not None:
+                return cached_f_session
+
+            return self.parse(d_session = self.download(package_name = package_name, only_stable_releases = only_stable_releases))
+    async def fetch_async(self, package_name : str, only_stable_releases : bool) -> FSession:
+
+        '''Same as fetch(), but awaitable. Coalesces with both asyncio and threaded callers.'''
+
+        self.__validate_package_name(package_name = package_name)
+
+        cached_f_session : Optional[FSession] = self.try_get_cached(package_name = package_name, only_stable_releases = only_stable_releases)
+
+        if cached_f_session is not None:
+            return cached_f_session
+
+        d_session : DSession = await self.__single_flight.run_async(
+            key = (package_name, only_stable_releases),
+            function = lambda : self.__download(package_name = package_name, only_stable_releases = only_stable_releases)
+        )
+
+        return await asyncio.to_thread(self.parse, d_session)
+    def __format_feed_urls(self, feed_name : str) -> list[str]:
+
+        '''Returns the URLs for one of the index's global feeds (e.g. "updates.xml"), one for each index URL (ordered by priority).'''
+
+        return [f"{index_url}/rss/{feed_name}" for index_url in self.__index_urls]
+    def __download_feed(self, feed_name : str) -> list[XMLItem]:
+
+        '''Downloads and parses one of the index's global feeds. Items without a pubdate are discarded.'''
+
+        response : Response = self.__hedged_getter.get(urls = self.__format_feed_urls(feed_name = feed_name))
+        response.raise_for_status()
+
+        xml_items : list[XMLItem] = self.__content_parser.parse_releases(releases_content = response.text)
+
+        return self.__filter(items = xml_items, function = self.__has_pubdate)
+    def __extract_package_name(self, xml_item : XMLItem) -> Optional[str]:
+
+        '''
+            Extracts the normalized package name from a global feed item or returns None:
+
+                link: "https://pypi.org/project/requests/2.32.3/" => "requests"
+                title: "requests 2.32.3" => "requests"
+        '''
+
+        if xml_item.link:
+            match : Optional[re.Match] = re.search(r"/project/([^/]+)/", xml_item.link)
+            if match is not None:
+                return self.__package_filter.normalize(match.group(1))
+
+        if xml_item.title:
+            return self.__package_filter.normalize(xml_item.title.split(" ")[0])
+
+        return None
+    def __extract_changed(self, xml_items : list[XMLItem], watermark : datetime) -> set[str]:
+
+        '''Returns the normalized names of the packages published after watermark.'''
+
+        changed : set[str] = set()
+
+        for xml_item in xml_items:
+            package_name : Optional[str] = self.__extract_package_name(xml_item = xml_item)
+            if package_name is not None and cast(datetime, xml_item.pubdate) > watermark:
+                changed.add(package_name)
+
+        return changed
+    def __is_gap(self, xml_items : list[XMLItem], watermark : Optional[datetime]) -> bool:
+
+        '''
+            Returns True if the feed can't tell what changed since watermark.
+
+            The feed only lists the most recent events: when even its oldest item is newer than watermark, some events might be missing.
+        '''
+
+        if watermark is None or len(xml_items) == 0:
+            return watermark is None
+
+        oldest : datetime = min(cast(datetime, xml_item.pubdate) for xml_item in xml_items)
+
+        return oldest > watermark
+    def __invalidate_matching(self, cache : Union[ReleaseCache, NegativeCache], changed : set[str]) -> list[str]:
+
+        '''Invalidates the entries of cache whose normalized package name is in changed and returns their names.'''
+
+        invalidated : list[str] = []
+
+        for package_name in cache.get_package_names():
+            if self.__package_filter.normalize(package_name) in changed:
+                cache.invalidate(package_name = package_name)
+                invalidated.append(package_name)
+
+        return invalidated
+    def __calculate_watermark(self, xml_items : list[XMLItem], watermark : Optional[datetime]) -> Optional[datetime]:
+
+        '''Returns the most recent pubdate among xml_items and watermark.'''
+
+        pubdates : list[datetime] = [cast(datetime, xml_item.pubdate) for xml_item in xml_items]
+
+        if watermark is not None:
+            pubdates.append(watermark)
+
+        return max(pubdates) if len(pubdates) > 0 else None
+
+    def sync(self, watermark : Optional[datetime] = None) -> SyncReport:
+
+        '''
+            Invalidates only the cached packages that changed on the index since watermark, by reading the global "updates.xml" feed once.
+
+            Pass the returned "watermark" to the next call. If watermark is None or the feed doesn't reach back to it (see "is_gap"), 
+            only the packages listed in the feed are invalidated: the changes that fell out of the feed can't be told apart, 
+            therefore the other entries are left to their own TTL instead of being cleared.
+
+            The "packages.xml" feed (new packages) is read only if the negative cache isn't empty: packages that have been created 
+            since watermark are removed from it.
+        '''
+
+        xml_items : list[XMLItem] = self.__download_feed(feed_name = "updates.xml")
+        is_gap : bool = self.__is_gap(xml_items = xml_items, watermark = watermark)
+        changed : set[str] = self.__extract_changed(xml_items = xml_items, watermark = datetime.min if watermark is None else watermark)
+        invalidated : list[str] = []
+
+        if self.__release_cache is not None:
+            invalidated = self.__invalidate_matching(cache = self.__release_cache, changed = changed)
+
+        if watermark is not None and len(self.__negative_cache.get_package_names()) > 0:
+            new_xml_items : list[XMLItem] = self.__download_feed(feed_name = "packages.xml")
+            created : set[str] = self.__extract_changed(xml_items = new_xml_items, watermark = watermark)
+            self.__invalidate_matching(cache = self.__negative_cache, changed = changed | created)
+
+        sync_report : SyncReport = SyncReport(
+            watermark = self.__calculate_watermark(xml_items = xml_items, watermark = watermark),
+            changed = sorted(changed),
+            invalidated = invalidated,
+            is_gap = is_gap
+        )
+
+        return sync_report
+    def get_index_urls(self) -> list[str]:
+
+        '''Returns the index URLs, ordered by priority.'''
+
+        return list(self.__index_urls)
+    def get_coalescing_stats(self) -> SingleFlightStats:
+
+        '''Returns how many downloads have been performed and how many duplicate requests have been avoided.'''
+
+        return self.__single_flight.get_stats()
+    def get_hedging_stats(self) -> HedgingStats:
+
+        '''Returns how often hedging fired for the releases.xml requests and how much time it saved.'''
+
+        return self.__hedged_getter.get_stats()
+class RuntimeChecker():
+
+    '''Collects all the logic related to Python runtime checks.'''
+
+    def __get_runtime_version(self) -> Tuple[int, int, int]:
+
+        '''
+            Runs:
+                - "python --version" on Windows
+                - "python3 --version" on Linux
+        
+            Expected output: "Python 3.12.5" -> (3, 12, 5)
+        '''
+
+        executable : str = "python3"
+        
+        if platform.system() == "Windows":
+            executable = "python"
+
+        command : list[str] = [executable, "--version"]
+
+        process : CompletedProcess = subprocess.run(
+            command,
+            capture_output = True,
+            text = True,
+            check = True
+        )
+
+        version_lst : list[str] = str(process.stdout).replace("Python", "").replace("\n", "").strip().split(".")
+
+        if (len(version_lst) != 3):
+            raise Exception(_MessageCollection.python_version_unexpected_output())
+        
+        version_tpl : Tuple[int, int, int] = (int(version_lst[0]), int(version_lst[1]), int(version_lst[2]))
+
+        return version_tpl
+
+    def get_status(self, required : Tuple[int, int, int]) -> str:
+
+        '''Returns a warning message if the installed Python version doesn't match the required one.'''
+
+        runtime_version : Tuple[int, int, int] = self.__get_runtime_version()
+        
+        if runtime_version == required:
+            return _MessageCollection.installed_python_version_matching(installed = runtime_version, required = required)
+        else:
+            return _MessageCollection.installed_python_version_not_matching(installed = runtime_version, required = required)
+    def try_get_status(self, required : Tuple[int, int, int]) -> str:
+
+        try:
+
+            return self.get_status(required = required)
+        
+        except Exception as e:
+            return str(e)
+class RequirementChecker():
+
+    '''This class collects all the logic related to requirement status checking.'''
+
+    __package_loader : LocalPackageLoader
+    __release_fetcher : PyPiReleaseFetcher
+    __formatter : Formatter
+    __sleeping_function : Callable[[int], None]
+    __max_retries : int
+    __retry_backoff : int
+    __now_function : Callable[[], float]
+    __concurrency_controller : Optional[AIMDController]
+    __pipeline_settings : Optional[PipelineSettings]
+    __content_parser : ContentParser
+    __summary_cache : Optional[SummaryCache]
+    __offline : bool
+    __snapshot_writer : SnapshotWriter
+    __baseline_store : BaselineStore
+
+    def __init__(
+            self, 
+            package_loader : LocalPackageLoader = LocalPackageLoader(),
+            release_fetcher : Optional[PyPiReleaseFetcher] = None,
+            formatter : Formatter = BasicFormatter(),
+            sleeping_function : Callable[[int], None] = LambdaCollection.sleeping_function(),
+            max_retries : int = DEFAULT.MAX_RETRIES,
+            retry_backoff : int = DEFAULT.RETRY_BACKOFF,
+            now_function : Callable[[], float] = LambdaCollection.now_function(),
+            concurrency_controller : Optional[AIMDController] = None,
+            pipeline_settings : Optional[PipelineSettings] = None,
+            content_parser : ContentParser = ContentParser(),
+            summary_cache : Optional[SummaryCache] = None,
+            offline : bool = False,
+            snapshot_writer : SnapshotWriter = SnapshotWriter(),
+            baseline_store : BaselineStore = BaselineStore()
+            ) -> None:
+
+        if release_fetcher is None:
+            release_fetcher = PyPiReleaseFetcher()
+      
+        self.__package_loader = package_loader
         self.__release_fetcher = release_fetcher
         self.__formatter = formatter
         self.__sleeping_function = sleeping_function
+        self.__max_retries = max_retries
+        self.__retry_backoff = retry_backoff
+        self.__now_function = now_function
+        self.__concurrency_controller = concurrency_controller
+        self.__pipeline_settings = pipeline_settings
+        self.__content_parser = content_parser
+        self.__summary_cache = summary_cache
+        self.__offline = offline
+        self.__snapshot_writer = snapshot_writer
+        self.__baseline_store = baseline_store
 
     def __compare(self, current_package : Package, most_recent_release : Release) -> Tuple[bool, str]:
 
@@ -1001,7 +4184,7 @@ class RequirementChecker():
             description = _MessageCollection.current_version_doesnt_match(current_package, most_recent_release)
 
         return (cast(bool, is_version_matching), cast(str, description))
-    def __create_requirement_detail(self, current_package : Package, most_recent_release : Release) -> RequirementDetail:
+    def __create_requirement_detail(self, current_package : Package, most_recent_release : Release, age : float = 0.0, is_stale : bool = False) -> RequirementDetail:
 
         '''Creates a RequirementDetail object out of the provided current_package and most_recent_release.'''
 
@@ -1014,27 +4197,533 @@ class RequirementChecker():
             current_package = current_package,
             most_recent_release = most_recent_release,
             is_version_matching = is_version_matching,
-            description = description
+            description = description,
+            outcome = "matching" if is_version_matching else "mismatching",
+            age = age,
+            is_stale = is_stale
+        )
+
+        return requirement_detail
+    def __create_error_requirement_detail(self, current_package : Package, error : Exception) -> RequirementDetail:
+
+        '''Creates a RequirementDetail object for a current_package that couldn't be fetched.'''
+
+        requirement_detail : RequirementDetail = RequirementDetail(
+            current_package = current_package,
+            most_recent_release = None,
+            is_version_matching = False,
+            description = _MessageCollection.current_version_couldnt_be_checked(current_package = current_package, error = str(error)),
+            outcome = "error"
+        )
+
+        return requirement_detail
+    def __create_unchecked_requirement_detail(self, current_package : Package, deadline : int) -> RequirementDetail:
+
+        '''Creates a RequirementDetail object for a current_package that hasn't been fetched because the deadline has been hit.'''
+
+        requirement_detail : RequirementDetail = RequirementDetail(
+            current_package = current_package,
+            most_recent_release = None,
+            is_version_matching = False,
+            description = _MessageCollection.current_version_not_checked_deadline(current_package = current_package, deadline = deadline),
+            outcome = "unchecked"
+        )
+
+        return requirement_detail
+    def __create_unknown_requirement_detail(self, current_package : Package) -> RequirementDetail:
+
+        '''Creates a RequirementDetail object for a current_package that isn't available locally while offline.'''
+
+        requirement_detail : RequirementDetail = RequirementDetail(
+            current_package = current_package,
+            most_recent_release = None,
+            is_version_matching = False,
+            description = _MessageCollection.current_version_unknown_offline(current_package = current_package),
+            outcome = "unknown"
         )
 
         return requirement_detail
-    def __create_requirement_details(self, l_session : LSession, only_stable_releases : bool, waiting_time : int) -> list[RequirementDetail]:
+    def __calculate_deadline_at(self, deadline : Optional[int]) -> Optional[float]:
+
+        '''Converts the provided deadline (a duration in seconds) to a point in time according to now_function.'''
+
+        if deadline is None:
+            return None
+
+        return self.__now_function() + deadline
+    def __is_deadline_reached(self, deadline_at : Optional[float]) -> bool:
+
+        '''Returns True if deadline_at is not None and it's in the past.'''
+
+        return deadline_at is not None and self.__now_function() >= deadline_at
+    def __is_transient(self, error : Exception) -> bool:
+
+        '''
+            Returns True if error is worth a retry: connection errors, timeouts, HTTP 429 and HTTP 5xx.
+
+            HTTP 4xx errors (e.g. 404 for a private package) and parsing errors are not transient.
+        '''
+
+        if isinstance(error, requests.HTTPError):
+
+            if error.response is None:
+                return True
+
+            return error.response.status_code == 429 or error.response.status_code >= 500
+
+        return isinstance(error, requests.RequestException)
+    def __call_and_signal(self, function : Callable[[], Any]) -> Any:
+
+        '''Calls function and reports its latency or its error to the concurrency controller, if any.'''
+
+        if self.__concurrency_controller is None:
+            return function()
+
+        start : float = self.__now_function()
+
+        try:
+            result : Any = function()
+        except Exception as e:
+            self.__concurrency_controller.on_failure(error = e)
+            raise
+
+        self.__concurrency_controller.on_success(latency = self.__now_function() - start)
+
+        return result
+    def __with_retries(self, function : Callable[[], Any], deadline_at : Optional[float] = None) -> Any:
+
+        '''
+            Calls function and retries up to max_retries times with an exponential backoff when a transient error occurs.
+
+            No retry is attempted once deadline_at has been reached.
+        '''
+
+        attempt : int = 0
+
+        while True:
+
+            try:
+
+                return self.__call_and_signal(function = function)
+
+            except Exception as e:
+
+                if attempt >= self.__max_retries or not self.__is_transient(error = e) or self.__is_deadline_reached(deadline_at = deadline_at):
+                    raise
+
+                self.__sleeping_function(self.__retry_backoff * (2 ** attempt))
+                attempt += 1
+    def __check_package_offline(self, current_package : Package, only_stable_releases : bool) -> RequirementDetail:
+
+        '''Creates a RequirementDetail object for current_package out of the local data only. Stale data is used as it is.'''
+
+        f_session : Optional[FSession] = self.__release_fetcher.try_get_cached(package_name = current_package.name, only_stable_releases = only_stable_releases, revalidate = False)
+
+        if f_session is None:
+            return self.__create_unknown_requirement_detail(current_package = current_package)
+
+        return self.__create_requirement_detail(
+            current_package = current_package, 
+            most_recent_release = f_session.most_recent_release,
+            age = f_session.age,
+            is_stale = f_session.is_stale
+        )
+    def __check_package(self, current_package : Package, only_stable_releases : bool, deadline_at : Optional[float] = None) -> RequirementDetail:
+
+        '''Creates a RequirementDetail object for current_package. Errors are captured into the returned object instead of being raised.'''
+
+        if self.__offline:
+            return self.__check_package_offline(current_package = current_package, only_stable_releases = only_stable_releases)
+
+        try:
+
+            f_session : FSession = self.__with_retries(
+                function = lambda : self.__release_fetcher.fetch(package_name = current_package.name, only_stable_releases = only_stable_releases),
+                deadline_at = deadline_at
+            )
+
+            return self.__create_requirement_detail(
+                current_package = current_package, 
+                most_recent_release = f_session.most_recent_release,
+                age = f_session.age,
+                is_stale = f_session.is_stale
+            )
+
+        except Exception as e:
+            return self.__create_error_requirement_detail(current_package = current_package, error = e)
+    def __checkpoint(self, journal : Optional[RequirementJournal], requirement_detail : RequirementDetail) -> None:
+
+        '''Appends requirement_detail to journal, if provided and if requirement_detail is conclusive (the other ones have to be checked again on resume).'''
+
+        if journal is not None and requirement_detail.outcome in ["matching", "mismatching"]:
+            journal.append(requirement_detail = requirement_detail)
+    def __get_pipeline_settings(self) -> Optional[PipelineSettings]:
+
+        '''
+            Returns the settings of the pipeline or None if the packages have to be checked sequentially.
+
+            When only a concurrency controller has been provided, the fetch stage is sized on its max_limit.
+        '''
+
+        if self.__pipeline_settings is not None:
+            return self.__pipeline_settings
+
+        if self.__concurrency_controller is not None:
+            return PipelineSettings(fetch_workers = self.__concurrency_controller.max_limit)
+
+        return None
+    def __start_workers(self, target : Callable[..., None], count : int, args : Tuple[Any, ...]) -> list[Thread]:
+
+        '''Starts count daemon threads running target with args.'''
+
+        threads : list[Thread] = [Thread(target = target, args = args, daemon = True) for _ in range(count)]
+
+        for thread in threads:
+            thread.start()
+
+        return threads
+    def __countdown(self, countdown : list[int], lock : Lock, next_queue : Queue, sentinels : int) -> None:
+
+        '''Decrements countdown and, once the last worker of a stage is done, puts sentinels into next_queue.'''
+
+        with lock:
+            countdown[0] -= 1
+            is_last : bool = countdown[0] == 0
+
+        if is_last:
+            for _ in range(sentinels):
+                next_queue.put(None)
+    def __feed(self, l_session : LSession, load_queue : Queue, fetch_workers : int) -> None:
+
+        '''Load stage: feeds the packages of l_session to the fetch stage. It blocks whenever load_queue is full.'''
+
+        for index, current_package in enumerate(l_session.packages):
+            load_queue.put((index, current_package))
+
+        for _ in range(fetch_workers):
+            load_queue.put(None)
+    def __download_within_lock(
+            self, 
+            index : int,
+            current_package : Package, 
+            only_stable_releases : bool, 
+            waiting_time : int, 
+            deadline : Optional[int], 
+            deadline_at : Optional[float]
+            ) -> Tuple[int, Package, Any, Optional[ExitStack]]:
+
+        '''
+            Downloads current_package while holding the release cache's lock for it, so that processes sharing the cache don't download it twice.
+
+            Returns (index, current_package, DSession, ExitStack): the lock is still held and the parse stage releases it (by closing the ExitStack) 
+            once the FSession has been cached. If no parsing is needed, it returns (index, current_package, FSession, None) for cached packages
+            and (index, current_package, RequirementDetail, None) for errors, unchecked and unknown packages.
+        '''
+
+        if self.__offline:
+            return (index, current_package, self.__check_package_offline(current_package = current_package, only_stable_releases = only_stable_releases), None)
+
+        cached_f_session : Optional[FSession] = self.__release_fetcher.try_get_cached(package_name = current_package.name, only_stable_releases = only_stable_releases)
+
+        if cached_f_session is not None:
+            return (index, current_package, cached_f_session, None)
+
+        with ExitStack() as cache_lock:
+
+            cache_lock.enter_context(self.__release_fetcher.lock_cached(package_name = current_package.name, only_stable_releases = only_stable_releases))
+
+            # Another process might have filled the entry while we were waiting for the lock.
+            cached_f_session = self.__release_fetcher.try_get_cached(package_name = current_package.name, only_stable_releases = only_stable_releases, count_lookup = False)
+
+            if cached_f_session is not None:
+                return (index, current_package, cached_f_session, None)
+
+            result : Tuple[int, Package, Any] = self.__download_within_slot(
+                index = index,
+                current_package = current_package,
+                only_stable_releases = only_stable_releases,
+                waiting_time = waiting_time,
+                deadline = deadline,
+                deadline_at = deadline_at
+            )
+
+            if isinstance(result[2], DSession):
+                return (*result, cache_lock.pop_all())
+
+            return (*result, None)
+    def __download_within_slot(
+            self, 
+            index : int,
+            current_package : Package, 
+            only_stable_releases : bool, 
+            waiting_time : int, 
+            deadline : Optional[int], 
+            deadline_at : Optional[float]
+            ) -> Tuple[int, Package, Any]:
+
+        '''
+            Downloads current_package while holding a slot of the concurrency controller, if any. The waiting time is spent inside the slot.
+
+            Returns (index, current_package, DSession) or (index, current_package, RequirementDetail) for errors and unchecked packages.
+        '''
+
+        if self.__concurrency_controller is not None:
+            self.__concurrency_controller.acquire()
+
+        try:
+
+            if self.__is_deadline_reached(deadline_at = deadline_at):
+                return (index, current_package, self.__create_unchecked_requirement_detail(current_package = current_package, deadline = cast(int, deadline)))
+
+            try:
+                d_session : DSession = self.__with_retries(
+                    function = lambda : self.__release_fetcher.download(package_name = current_package.name, only_stable_releases = only_stable_releases),
+                    deadline_at = deadline_at
+                )
+            except Exception as e:
+                return (index, current_package, self.__create_error_requirement_detail(current_package = current_package, error = e))
+
+            self.__sleeping_function(waiting_time)
+
+            return (index, current_package, d_session)
+
+        finally:
+            if self.__concurrency_controller is not None:
+                self.__concurrency_controller.release()
+    def __fetch_stage(
+            self,
+            load_queue : Queue,
+            parse_queue : Queue,
+            compare_queue : Queue,
+            only_stable_releases : bool, 
+            waiting_time : int, 
+            deadline : Optional[int], 
+            deadline_at : Optional[float],
+            countdown : list[int],
+            lock : Lock,
+            parse_workers : int
+            ) -> None:
+
+        '''
+            Fetch stage (network I/O): downloads the packages and forwards them to the parse stage.
+
+            Packages that don't need any parsing (cached, errors, unchecked) are forwarded straight to the compare stage.
+            Unexpected failures (e.g. an unreadable release cache) are turned into "error" details, so that the worker keeps consuming load_queue.
+        '''
+
+        try:
+
+            while True:
+
+                item : Optional[Tuple[int, Package]] = load_queue.get()
+
+                if item is None:
+                    break
+
+                index, current_package = item
+
+                try:
+                    result : Tuple[int, Package, Any, Optional[ExitStack]] = self.__download_within_lock(
+                        index = index,
+                        current_package = current_package,
+                        only_stable_releases = only_stable_releases,
+                        waiting_time = waiting_time,
+                        deadline = deadline,
+                        deadline_at = deadline_at
+                    )
+                except Exception as e:
+                    result = (index, current_package, self.__create_error_requirement_detail(current_package = current_package, error = e), None)
+
+                if isinstance(result[2], DSession):
+                    parse_queue.put(result)
+                else:
+                    compare_queue.put(result[:3])
+
+        finally:
+            self.__countdown(countdown = countdown, lock = lock, next_queue = parse_queue, sentinels = parse_workers)
+    def __parse(self, d_session : DSession, process_executor : Optional[ProcessPoolExecutor]) -> FSession:
+
+        '''
+            Converts d_session to a FSession.
+            
+            If process_executor is provided, the raw content is parsed in a worker process, which returns a compact PSession.
+        '''
+
+        if process_executor is None:
+            return self.__release_fetcher.parse(d_session = d_session)
+
+        p_session : PSession = process_executor.submit(self.__content_parser.parse, d_session).result()
+
+        return self.__release_fetcher.create_fsession(p_session = p_session)
+    def __parse_stage(self, parse_queue : Queue, compare_queue : Queue, countdown : list[int], lock : Lock, process_executor : Optional[ProcessPoolExecutor]) -> None:
+
+        '''
+            Parse stage (CPU-bound): converts the downloaded DSession objects to FSession objects.
+            
+            The release cache's lock taken by the fetch stage is released once the FSession has been cached (or parsing has failed).
+        '''
+
+        try:
+
+            while True:
+
+                item : Optional[Tuple[int, Package, DSession, ExitStack]] = parse_queue.get()
+
+                if item is None:
+                    break
+
+                index, current_package, d_session, cache_lock = item
+
+                try:
+                    with cache_lock:
+                        f_session : FSession = self.__parse(d_session = d_session, process_executor = process_executor)
+                    compare_queue.put((index, current_package, f_session))
+                except Exception as e:
+                    compare_queue.put((index, current_package, self.__create_error_requirement_detail(current_package = current_package, error = e)))
+
+        finally:
+            self.__countdown(countdown = countdown, lock = lock, next_queue = compare_queue, sentinels = 1)
+    def __compare_stage(self, compare_queue : Queue, journal : Optional[RequirementJournal] = None) -> list[RequirementDetail]:
+
+        '''Compare stage: turns the FSession objects into RequirementDetail objects, preserving the order of the packages. Each of them is checkpointed as soon as it's available.'''
+
+        indexed : list[Tuple[int, RequirementDetail]] = []
+
+        while True:
+
+            item : Optional[Tuple[int, Package, Any]] = compare_queue.get()
+
+            if item is None:
+                break
+
+            index, current_package, result = item
+
+            if isinstance(result, FSession):
+                result = self.__create_requirement_detail(
+                    current_package = current_package, 
+                    most_recent_release = result.most_recent_release, 
+                    age = result.age, 
+                    is_stale = result.is_stale)
+
+            self.__checkpoint(journal = journal, requirement_detail = result)
+            indexed.append((index, result))
+
+        indexed.sort(key = lambda x : x[0])
+
+        return [requirement_detail for _, requirement_detail in indexed]
+    def __create_process_executor(self, pipeline_settings : PipelineSettings) -> Optional[ProcessPoolExecutor]:
+
+        '''Returns a pool of parse_workers processes if parse_in_processes is True, otherwise None.'''
+
+        if pipeline_settings.parse_in_processes == False:
+            return None
+
+        return ProcessPoolExecutor(max_workers = pipeline_settings.parse_workers, mp_context = multiprocessing.get_context("spawn"))
+    def __create_requirement_details_with_pipeline(
+            self, 
+            l_session : LSession, 
+            only_stable_releases : bool, 
+            waiting_time : int, 
+            deadline : Optional[int], 
+            deadline_at : Optional[float],
+            pipeline_settings : PipelineSettings,
+            journal : Optional[RequirementJournal] = None
+            ) -> list[RequirementDetail]:
+
+        '''
+            Same as __create_requirement_details(), but packages flow through a staged pipeline: load → fetch → parse → compare.
+
+            Stages are connected by bounded queues, therefore a slow stage applies backpressure to the ones before it.
+            The fetch stage runs on its own threads (network I/O) and the parse stage on a separate pool (CPU-bound), so that they overlap.
+
+            If parse_in_processes is True, the parse stage hands the raw content over to a pool of processes, so that parsing isn't serialized by the GIL.
+        '''
+
+        load_queue : Queue = Queue(maxsize = pipeline_settings.queue_size)
+        parse_queue : Queue = Queue(maxsize = pipeline_settings.queue_size)
+        compare_queue : Queue = Queue(maxsize = pipeline_settings.queue_size)
+
+        fetch_countdown : list[int] = [pipeline_settings.fetch_workers]
+        parse_countdown : list[int] = [pipeline_settings.parse_workers]
+        lock : Lock = Lock()
+
+        process_executor : Optional[ProcessPoolExecutor] = self.__create_process_executor(pipeline_settings = pipeline_settings)
+
+        try:
+
+            threads : list[Thread] = []
+            threads += self.__start_workers(
+                target = self.__feed, 
+                count = 1, 
+                args = (l_session, load_queue, pipeline_settings.fetch_workers))
+            threads += self.__start_workers(
+                target = self.__fetch_stage, 
+                count = pipeline_settings.fetch_workers, 
+                args = (load_queue, parse_queue, compare_queue, only_stable_releases, waiting_time, deadline, deadline_at, fetch_countdown, lock, pipeline_settings.parse_workers))
+            threads += self.__start_workers(
+                target = self.__parse_stage, 
+                count = pipeline_settings.parse_workers, 
+                args = (parse_queue, compare_queue, parse_countdown, lock, process_executor))
+
+            requirement_details : list[RequirementDetail] = self.__compare_stage(compare_queue = compare_queue, journal = journal)
+
+            for thread in threads:
+                thread.join()
+
+        finally:
+            if process_executor is not None:
+                process_executor.shutdown()
+
+        requirement_details.sort(key = lambda x : x.is_version_matching)
+
+        return requirement_details
+    def __create_requirement_details(
+            self,
+            l_session : LSession,
+            only_stable_releases : bool,
+            waiting_time : int,
+            deadline : Optional[int] = None,
+            journal : Optional[RequirementJournal] = None
+            ) -> list[RequirementDetail]:
+
+        '''
+            Creates a list of RequirementDetail objects out of the provided l_session.
+
+            Once deadline (in seconds) is hit, no new fetch is scheduled and the remaining packages are marked as "unchecked".
+
+            If pipeline settings or a concurrency controller have been provided, packages are processed by a staged pipeline.
+
+            If journal is provided, the conclusive RequirementDetail objects are checkpointed as soon as they are created.
+        '''
+
+        deadline_at : Optional[float] = self.__calculate_deadline_at(deadline = deadline)
+        pipeline_settings : Optional[PipelineSettings] = self.__get_pipeline_settings()
 
-        '''Creates a list of RequirementDetail objects out of the provided l_session.'''
+        if pipeline_settings is not None:
+            return self.__create_requirement_details_with_pipeline(
+                l_session = l_session, 
+                only_stable_releases = only_stable_releases, 
+                waiting_time = waiting_time, 
+                deadline = deadline,
+                deadline_at = deadline_at,
+                pipeline_settings = pipeline_settings,
+                journal = journal
+            )
 
         requirement_details : list[RequirementDetail] = []
 
         for current_package in l_session.packages:
 
-            f_session : FSession = self.__release_fetcher.fetch(package_name = current_package.name, only_stable_releases = only_stable_releases)
-            
-            requirement_detail : RequirementDetail = self.__create_requirement_detail(
-                current_package = current_package, 
-                most_recent_release = f_session.most_recent_release
-            )
+            if self.__is_deadline_reached(deadline_at = deadline_at):
+                requirement_details.append(self.__create_unchecked_requirement_detail(current_package = current_package, deadline = cast(int, deadline)))
+                continue
+
+            requirement_detail : RequirementDetail = self.__check_package(current_package = current_package, only_stable_releases = only_stable_releases, deadline_at = deadline_at)
+            self.__checkpoint(journal = journal, requirement_detail = requirement_detail)
             requirement_details.append(requirement_detail)
 
-            self.__sleeping_function(waiting_time)
+            if not self.__offline:
+                self.__sleeping_function(waiting_time)
         
         requirement_details.sort(key = lambda x : x.is_version_matching)
 
@@ -1053,13 +4742,22 @@ class RequirementChecker():
         total_packages : int = len(requirement_details)
         matching : int = 0
         mismatching : int = 0
+        errors : int = 0
+        unchecked : int = 0
+        unknown : int = 0
 
         for requirement_detail in requirement_details:
             
-            if requirement_detail.is_version_matching == True:
+            if requirement_detail.outcome == "matching":
                 matching += 1
-            else:
+            elif requirement_detail.outcome == "mismatching":
                 mismatching += 1
+            elif requirement_detail.outcome == "error":
+                errors += 1
+            elif requirement_detail.outcome == "unchecked":
+                unchecked += 1
+            else:
+                unknown += 1
 
         requirement_summary : RequirementSummary = RequirementSummary(
             total_packages = total_packages,
@@ -1067,12 +4765,242 @@ class RequirementChecker():
             matching_prc = self.__calculate_prc(value = matching, total = total_packages),
             mismatching = mismatching,
             mismatching_prc = self.__calculate_prc(value = mismatching, total = total_packages),
-            details = requirement_details
+            errors = errors,
+            errors_prc = self.__calculate_prc(value = errors, total = total_packages),
+            unchecked = unchecked,
+            unchecked_prc = self.__calculate_prc(value = unchecked, total = total_packages),
+            details = requirement_details,
+            unknown = unknown,
+            unknown_prc = self.__calculate_prc(value = unknown, total = total_packages)
+        )
+
+        return requirement_summary
+    def __compute_summary(
+            self,
+            file_path : str,
+            only_stable_releases : bool,
+            waiting_time : int,
+            deadline : Optional[int],
+            journal_path : Optional[str] = None,
+            resume : bool = False
+            ) -> RequirementSummary:
+
+        '''
+            Loads file_path, checks all its packages and returns a RequirementSummary object, without any caching.
+
+            If journal_path is provided, the progress is checkpointed to it and, if resume is True, the packages it already contains aren't checked again.
+            The journal is removed once all the packages have a conclusive outcome.
+        '''
+
+        l_session : LSession = self.__package_loader.load(file_path = file_path)
+
+        if journal_path is None:
+            requirement_details : list[RequirementDetail] = self.__create_requirement_details(
+                l_session = l_session,
+                waiting_time = waiting_time,
+                only_stable_releases = only_stable_releases,
+                deadline = deadline
+            )
+            return self.__create_requirement_summary(requirement_details = requirement_details)
+
+        journal : RequirementJournal = RequirementJournal(file_path = journal_path, now_function = self.__now_function)
+        completed : dict[Package, RequirementDetail] = {}
+
+        if resume:
+            completed = { requirement_detail.current_package : requirement_detail for requirement_detail in journal.resume(only_stable_releases = only_stable_releases) }
+        else:
+            journal.start(only_stable_releases = only_stable_releases)
+
+        remaining : list[Package] = [package for package in l_session.packages if package not in completed]
+        requirement_details = [completed[package] for package in l_session.packages if package in completed]
+
+        if len(remaining) > 0:
+            requirement_details += self.__create_requirement_details(
+                l_session = LSession(packages = remaining, unparsed_lines = l_session.unparsed_lines),
+                waiting_time = waiting_time,
+                only_stable_releases = only_stable_releases,
+                deadline = deadline,
+                journal = journal
+            )
+
+        requirement_details.sort(key = lambda x : x.is_version_matching)
+        requirement_summary : RequirementSummary = self.__create_requirement_summary(requirement_details = requirement_details)
+
+        if self.__is_cacheable(requirement_summary = requirement_summary):
+            journal.remove()
+
+        return requirement_summary
+    def __diff(self, previous : LSession, current : LSession) -> Tuple[list[Package], list[Package], list[Package]]:
+
+        '''Returns the packages of current that have been added or changed and the packages of previous that have been removed. Packages are matched by name.'''
+
+        previous_packages : dict[str, Package] = { package.name : package for package in previous.packages }
+        current_names : set[str] = { package.name for package in current.packages }
+
+        added : list[Package] = [package for package in current.packages if package.name not in previous_packages]
+        changed : list[Package] = [package for package in current.packages if package.name in previous_packages and previous_packages[package.name] != package]
+        removed : list[Package] = [package for package in previous.packages if package.name not in current_names]
+
+        return (added, changed, removed)
+    def __is_conclusive(self, requirement_detail : RequirementDetail) -> bool:
+
+        '''Returns True if requirement_detail is "matching" or "mismatching".'''
+
+        return requirement_detail.outcome in ["matching", "mismatching"]
+    def __create_baseline(self, requirement_details : list[RequirementDetail], only_stable_releases : bool, previous : Optional[Baseline] = None) -> Baseline:
+
+        '''
+            Creates a Baseline out of requirement_details. The fetching time of each detail is derived from its age, which is then reset.
+
+            An inconclusive detail doesn't replace the entry of the same package in previous, so that the next comparison still has something to compare with.
+        '''
+
+        now : float = self.__now_function()
+        previous_entries : dict[str, BaselineEntry] = {} if previous is None else { entry.requirement_detail.current_package.name : entry for entry in previous.entries }
+        entries : list[BaselineEntry] = []
+
+        for requirement_detail in requirement_details:
+
+            name : str = requirement_detail.current_package.name
+
+            if not self.__is_conclusive(requirement_detail = requirement_detail) and name in previous_entries:
+                entries.append(previous_entries[name])
+            else:
+                entries.append(BaselineEntry(requirement_detail = replace(requirement_detail, age = 0.0, is_stale = False), fetched_at = now - requirement_detail.age))
+
+        return Baseline(only_stable_releases = only_stable_releases, saved_at = now, entries = entries)
+    def __get_reusable_entries(self, baseline : Optional[Baseline], freshness : int, now : float) -> dict[str, BaselineEntry]:
+
+        '''Returns the conclusive entries of baseline that have been fetched within freshness seconds, by package name.'''
+
+        if baseline is None:
+            return {}
+
+        reusable : dict[str, BaselineEntry] = {}
+
+        for entry in baseline.entries:
+            if self.__is_conclusive(requirement_detail = entry.requirement_detail) and now - entry.fetched_at <= freshness:
+                reusable[entry.requirement_detail.current_package.name] = entry
+
+        return reusable
+    def __compare_with_baseline(self, baseline : Optional[Baseline], requirement_details : list[RequirementDetail]) -> Tuple[list[Package], list[Package]]:
+
+        '''Returns the packages that have become outdated and the ones that have become current since baseline. Packages are matched by name.'''
+
+        if baseline is None:
+            return ([], [])
+
+        previous_outcomes : dict[str, str] = { entry.requirement_detail.current_package.name : entry.requirement_detail.outcome for entry in baseline.entries }
+
+        newly_outdated : list[Package] = [
+            requirement_detail.current_package for requirement_detail in requirement_details
+            if requirement_detail.outcome == "mismatching" and previous_outcomes.get(requirement_detail.current_package.name) == "matching"
+        ]
+        newly_current : list[Package] = [
+            requirement_detail.current_package for requirement_detail in requirement_details
+            if requirement_detail.outcome == "matching" and previous_outcomes.get(requirement_detail.current_package.name) == "mismatching"
+        ]
+
+        return (newly_outdated, newly_current)
+    def __create_summary_cache_key(self, file_path : str, only_stable_releases : bool) -> SummaryCacheKey:
+
+        '''Creates the SummaryCacheKey for file_path. The file is read and hashed, but not parsed.'''
+
+        summary_cache_key : SummaryCacheKey = SummaryCacheKey(
+            content_hash = self.__package_loader.get_content_hash(file_path = file_path),
+            loader_type = self.__package_loader.get_loader_type(file_path = file_path),
+            only_stable_releases = only_stable_releases,
+            index_url = ",".join(self.__release_fetcher.get_index_urls())
         )
 
+        return summary_cache_key
+    def __is_cacheable(self, requirement_summary : RequirementSummary) -> bool:
+
+        '''Returns True if requirement_summary is complete: partial summaries (errors, unchecked or unknown packages) are never cached.'''
+
+        return requirement_summary.errors == 0 and requirement_summary.unchecked == 0 and requirement_summary.unknown == 0
+    def __compute_and_cache_summary(
+            self, 
+            key : SummaryCacheKey, 
+            summary_cache : SummaryCache, 
+            file_path : str, 
+            only_stable_releases : bool, 
+            waiting_time : int,
+            deadline : Optional[int],
+            journal_path : Optional[str] = None,
+            resume : bool = False
+            ) -> RequirementSummary:
+
+        '''Computes the RequirementSummary for file_path and stores it in summary_cache, if cacheable.'''
+
+        requirement_summary : RequirementSummary = self.__compute_summary(
+            file_path = file_path,
+            only_stable_releases = only_stable_releases,
+            waiting_time = waiting_time,
+            deadline = deadline,
+            journal_path = journal_path,
+            resume = resume)
+
+        if self.__is_cacheable(requirement_summary = requirement_summary):
+            summary_cache.add(key = key, summary = requirement_summary)
+
         return requirement_summary
+    def __refresh(
+            self, 
+            key : SummaryCacheKey, 
+            summary_cache : SummaryCache, 
+            file_path : str, 
+            only_stable_releases : bool, 
+            waiting_time : int, 
+            deadline : Optional[int]
+            ) -> None:
+
+        '''Recomputes a stale entry. Errors are ignored: the stale entry keeps being served until it expires.'''
+
+        try:
+            self.__compute_and_cache_summary(
+                key = key, 
+                summary_cache = summary_cache, 
+                file_path = file_path, 
+                only_stable_releases = only_stable_releases, 
+                waiting_time = waiting_time, 
+                deadline = deadline)
+        except Exception:
+            pass
+        finally:
+            summary_cache.end_refresh(key = key)
+    def __refresh_in_background(
+            self, 
+            key : SummaryCacheKey, 
+            summary_cache : SummaryCache, 
+            file_path : str, 
+            only_stable_releases : bool, 
+            waiting_time : int, 
+            deadline : Optional[int]
+            ) -> Optional[Thread]:
+
+        '''Starts refreshing a stale entry on a daemon thread, unless a refresh for the same key is already in progress.'''
+
+        if not summary_cache.try_start_refresh(key = key):
+            return None
+
+        thread : Thread = Thread(
+            target = self.__refresh, 
+            args = (key, summary_cache, file_path, only_stable_releases, waiting_time, deadline), 
+            daemon = True)
+        thread.start()
+
+        return thread
    
-    def get_summary(self, file_path : str, only_stable_releases : bool = DEFAULT.ONLY_STABLE_RELEASES, waiting_time : int = DEFAULT.WAITING_TIME) -> RequirementSummary:
+    def get_summary(
+            self,
+            file_path : str,
+            only_stable_releases : bool = DEFAULT.ONLY_STABLE_RELEASES,
+            waiting_time : int = DEFAULT.WAITING_TIME,
+            deadline : Optional[int] = None,
+            journal_path : Optional[str] = None,
+            resume : bool = False
+            ) -> RequirementSummary:
 
         '''
             This method:
@@ -1081,24 +5009,70 @@ class RequirementChecker():
                 2. Fetches the latest information about each of them on PyPi.org.
                 3. Returns a RequirementSummary object.
             
-            It raises an Exception if an issue arises.
+            Transient fetching errors are retried with an exponential backoff.
+            A package that can't be fetched is reported as an "error" RequirementDetail, without discarding the others.
+
+            If deadline (in seconds) is provided and it's hit, a partial RequirementSummary is returned: the remaining packages are marked as "unchecked".
+
+            If a summary cache has been provided, the summary of a byte-identical file is returned without loading or fetching anything.
+
+            If the checker is offline, no network call is performed: packages are checked against the release cache only 
+            and the ones that aren't available are marked as "unknown".
+            Stale summaries are returned as well, but they are refreshed in the background.
+
+            If journal_path is provided, each conclusive RequirementDetail is checkpointed to it (see RequirementJournal) as soon as it's created.
+            With resume = True, the packages checkpointed by a previous, interrupted run aren't checked again.
+            The journal is removed once all the packages have a conclusive outcome.
+
+            It raises an Exception if an issue arises while loading file_path.
         '''
 
         Validator().validate_file_path(file_path)
         Validator().validate_waiting_time(waiting_time)
+        Validator().validate_deadline(deadline)
+
+        if self.__summary_cache is None:
+            return self.__compute_summary(
+                file_path = file_path,
+                only_stable_releases = only_stable_releases,
+                waiting_time = waiting_time,
+                deadline = deadline,
+                journal_path = journal_path,
+                resume = resume)
+
+        key : SummaryCacheKey = self.__create_summary_cache_key(file_path = file_path, only_stable_releases = only_stable_releases)
+        cached_summary : Optional[CachedSummary] = self.__summary_cache.try_get(key = key)
+
+        if cached_summary is None:
+            return self.__compute_and_cache_summary(
+                key = key,
+                summary_cache = self.__summary_cache,
+                file_path = file_path,
+                only_stable_releases = only_stable_releases,
+                waiting_time = waiting_time,
+                deadline = deadline,
+                journal_path = journal_path,
+                resume = resume)
+
+        if cached_summary.is_stale:
+            self.__refresh_in_background(
+                key = key, 
+                summary_cache = self.__summary_cache, 
+                file_path = file_path, 
+                only_stable_releases = only_stable_releases, 
+                waiting_time = waiting_time, 
+                deadline = deadline)
 
-        l_session : LSession = self.__package_loader.load(file_path = file_path)
-        
-        requirement_details : list[RequirementDetail] = self.__create_requirement_details(
-            l_session = l_session, 
-            waiting_time = waiting_time, 
-            only_stable_releases = only_stable_releases
-        )
-
-        requirement_summary : RequirementSummary = self.__create_requirement_summary(requirement_details = requirement_details)
-
-        return requirement_summary
-    def get_status(self, file_path : str, only_stable_releases : bool = DEFAULT.ONLY_STABLE_RELEASES, waiting_time : int = DEFAULT.WAITING_TIME) -> str:
+        return cached_summary.summary
+    def get_status(
+            self,
+            file_path : str,
+            only_stable_releases : bool = DEFAULT.ONLY_STABLE_RELEASES,
+            waiting_time : int = DEFAULT.WAITING_TIME,
+            deadline : Optional[int] = None,
+            journal_path : Optional[str] = None,
+            resume : bool = False
+            ) -> str:
 
         '''
             This method:
@@ -1112,14 +5086,25 @@ class RequirementChecker():
         '''
 
         requirement_summary : RequirementSummary = self.get_summary(
-            file_path = file_path, 
-            only_stable_releases = only_stable_releases, 
-            waiting_time = waiting_time)
+            file_path = file_path,
+            only_stable_releases = only_stable_releases,
+            waiting_time = waiting_time,
+            deadline = deadline,
+            journal_path = journal_path,
+            resume = resume)
 
         status : str = self.__formatter.format_requirement_summary(requirement_summary)
 
         return status
-    def try_get_status(self, file_path : str, only_stable_releases : bool = DEFAULT.ONLY_STABLE_RELEASES, waiting_time : int = DEFAULT.WAITING_TIME) -> str:
+    def try_get_status(
+            self,
+            file_path : str,
+            only_stable_releases : bool = DEFAULT.ONLY_STABLE_RELEASES,
+            waiting_time : int = DEFAULT.WAITING_TIME,
+            deadline : Optional[int] = None,
+            journal_path : Optional[str] = None,
+            resume : bool = False
+            ) -> str:
 
         '''
             It performs the same operations as get_status().
@@ -1129,15 +5114,424 @@ class RequirementChecker():
         try:
             
             status : str = self.get_status(
-                file_path = file_path, 
-                only_stable_releases = only_stable_releases, 
-                waiting_time = waiting_time)
+                file_path = file_path,
+                only_stable_releases = only_stable_releases,
+                waiting_time = waiting_time,
+                deadline = deadline,
+                journal_path = journal_path,
+                resume = resume)
+            
+            return status
+
+        except Exception as e:
+
+            return str(e)
+    def recheck(
+            self, 
+            file_path : str, 
+            previous : Optional[WSession] = None, 
+            only_stable_releases : bool = DEFAULT.ONLY_STABLE_RELEASES, 
+            waiting_time : int = DEFAULT.WAITING_TIME, 
+            deadline : Optional[int] = None
+            ) -> WSession:
+
+        '''
+            Loads file_path again and checks only the packages that aren't in previous with the same version.
             
+            The conclusive ("matching" or "mismatching") details of previous are reused as they are, while the inconclusive ones are checked again.
+            Without previous, all the packages are checked.
+
+            It raises an Exception if an issue arises while loading file_path.
+        '''
+
+        Validator().validate_file_path(file_path)
+        Validator().validate_waiting_time(waiting_time)
+        Validator().validate_deadline(deadline)
+
+        l_session : LSession = self.__package_loader.load(file_path = file_path)
+        previous_l_session : LSession = LSession(packages = [], unparsed_lines = []) if previous is None else previous.l_session
+        added, changed, removed = self.__diff(previous = previous_l_session, current = l_session)
+
+        reusable : dict[Package, RequirementDetail] = {}
+
+        if previous is not None:
+            for requirement_detail in previous.requirement_summary.details:
+                if requirement_detail.outcome in ["matching", "mismatching"]:
+                    reusable[requirement_detail.current_package] = requirement_detail
+
+        rechecked : list[Package] = [package for package in l_session.packages if package not in reusable]
+        requirement_details : list[RequirementDetail] = [reusable[package] for package in l_session.packages if package in reusable]
+
+        if len(rechecked) > 0:
+            requirement_details += self.__create_requirement_details(
+                l_session = LSession(packages = rechecked, unparsed_lines = l_session.unparsed_lines),
+                only_stable_releases = only_stable_releases,
+                waiting_time = waiting_time,
+                deadline = deadline
+            )
+
+        requirement_details.sort(key = lambda x : x.is_version_matching)
+
+        w_session : WSession = WSession(
+            l_session = l_session,
+            requirement_summary = self.__create_requirement_summary(requirement_details = requirement_details),
+            added = added,
+            changed = changed,
+            removed = removed,
+            rechecked = rechecked
+        )
+
+        return w_session
+    def watch(
+            self, 
+            file_path : str, 
+            logging_function : Callable[[str], None] = LambdaCollection.logging_function(),
+            only_stable_releases : bool = DEFAULT.ONLY_STABLE_RELEASES, 
+            waiting_time : int = DEFAULT.WAITING_TIME, 
+            deadline : Optional[int] = None,
+            poll_interval : int = DEFAULT.WATCH_POLL_INTERVAL,
+            stop_event : Optional[Event] = None
+            ) -> Optional[WSession]:
+
+        '''
+            Checks file_path and logs its status, then polls it every poll_interval seconds until stop_event is set.
+
+            Whenever the content of file_path changes, it's rechecked incrementally (see recheck()) and the updated status is logged.
+            Errors (e.g. a file that can't be parsed while it's being edited) are logged once, until they change, and the watching goes on.
+
+            It returns the last WSession.
+        '''
+
+        if stop_event is None:
+            stop_event = Event()
+
+        w_session : Optional[WSession] = None
+        content_hash : Optional[str] = None
+        last_error : Optional[str] = None
+
+        while not stop_event.is_set():
+
+            try:
+
+                current_hash : str = self.__package_loader.get_content_hash(file_path = file_path)
+
+                if current_hash != content_hash:
+
+                    content_hash = current_hash
+                    w_session = self.recheck(
+                        file_path = file_path, 
+                        previous = w_session, 
+                        only_stable_releases = only_stable_releases, 
+                        waiting_time = waiting_time, 
+                        deadline = deadline)
+
+                    logging_function(self.__formatter.format_requirement_summary(w_session.requirement_summary))
+                    logging_function(_MessageCollection.file_rechecked(file_path = file_path, w_session = w_session))
+
+                last_error = None
+
+            except Exception as e:
+                if str(e) != last_error:
+                    last_error = str(e)
+                    logging_function(last_error)
+
+            self.__sleeping_function(poll_interval)
+
+        return w_session
+    def load_baseline(self, baseline_path : str) -> Optional[Baseline]:
+
+        '''Returns the Baseline saved in baseline_path or None if it doesn't exist. It raises an Exception if baseline_path isn't a valid baseline.'''
+
+        return self.__baseline_store.load(file_path = baseline_path)
+    def save_baseline(self, baseline_path : str, requirement_summary : RequirementSummary, only_stable_releases : bool = DEFAULT.ONLY_STABLE_RELEASES) -> Baseline:
+
+        '''
+            Saves the details of requirement_summary to baseline_path, along with the point in time each of them has been fetched at, and returns the Baseline.
+
+            It should be called right after requirement_summary has been computed, since the fetching times are derived from the "age" of the details.
+        '''
+
+        baseline : Baseline = self.__create_baseline(requirement_details = requirement_summary.details, only_stable_releases = only_stable_releases)
+        self.__baseline_store.save(file_path = baseline_path, baseline = baseline)
+
+        return baseline
+    def check_against_baseline(
+            self,
+            file_path : str,
+            baseline_path : str,
+            freshness : int = DEFAULT.BASELINE_FRESHNESS,
+            only_stable_releases : bool = DEFAULT.ONLY_STABLE_RELEASES,
+            waiting_time : int = DEFAULT.WAITING_TIME,
+            deadline : Optional[int] = None
+            ) -> BaselineReport:
+
+        '''
+            Checks file_path against the Baseline saved in baseline_path (if any), then replaces it with the outcome of this check.
+
+            The most recent releases that have been fetched within freshness seconds are reused (even if the current version has changed)
+            and only the remaining packages are fetched again. The conclusive details are compared with the baseline to find
+            the packages that have become outdated or current in the meanwhile.
+
+            A baseline saved with a different only_stable_releases value is ignored.
+
+            It raises an Exception if an issue arises while loading file_path or baseline_path.
+        '''
+
+        Validator().validate_file_path(file_path)
+        Validator().validate_waiting_time(waiting_time)
+        Validator().validate_deadline(deadline)
+        Validator().validate_freshness(freshness)
+
+        l_session : LSession = self.__package_loader.load(file_path = file_path)
+        previous : Optional[Baseline] = self.__baseline_store.load(file_path = baseline_path)
+
+        if previous is not None and previous.only_stable_releases != only_stable_releases:
+            previous = None
+
+        now : float = self.__now_function()
+        reusable : dict[str, BaselineEntry] = self.__get_reusable_entries(baseline = previous, freshness = freshness, now = now)
+
+        reused : list[Package] = [package for package in l_session.packages if package.name in reusable]
+        refetched : list[Package] = [package for package in l_session.packages if package.name not in reusable]
+
+        requirement_details : list[RequirementDetail] = [
+            self.__create_requirement_detail(
+                current_package = package,
+                most_recent_release = cast(Release, reusable[package.name].requirement_detail.most_recent_release),
+                age = now - reusable[package.name].fetched_at)
+            for package in reused
+        ]
+
+        if len(refetched) > 0:
+            requirement_details += self.__create_requirement_details(
+                l_session = LSession(packages = refetched, unparsed_lines = l_session.unparsed_lines),
+                only_stable_releases = only_stable_releases,
+                waiting_time = waiting_time,
+                deadline = deadline
+            )
+
+        requirement_details.sort(key = lambda x : x.is_version_matching)
+
+        newly_outdated, newly_current = self.__compare_with_baseline(baseline = previous, requirement_details = requirement_details)
+        baseline : Baseline = self.__create_baseline(requirement_details = requirement_details, only_stable_releases = only_stable_releases, previous = previous)
+        self.__baseline_store.save(file_path = baseline_path, baseline = baseline)
+
+        baseline_report : BaselineReport = BaselineReport(
+            requirement_summary = self.__create_requirement_summary(requirement_details = requirement_details),
+            baseline = baseline,
+            reused = reused,
+            refetched = refetched,
+            newly_outdated = newly_outdated,
+            newly_current = newly_current
+        )
+
+        return baseline_report
+    def get_baseline_status(
+            self,
+            file_path : str,
+            baseline_path : str,
+            freshness : int = DEFAULT.BASELINE_FRESHNESS,
+            only_stable_releases : bool = DEFAULT.ONLY_STABLE_RELEASES,
+            waiting_time : int = DEFAULT.WAITING_TIME,
+            deadline : Optional[int] = None
+            ) -> str:
+
+        '''
+            It performs the same operations as check_against_baseline() and formats the outcome as status,
+            followed by what has changed since the baseline.
+
+            It raises an Exception if an issue arises.
+        '''
+
+        baseline_report : BaselineReport = self.check_against_baseline(
+            file_path = file_path,
+            baseline_path = baseline_path,
+            freshness = freshness,
+            only_stable_releases = only_stable_releases,
+            waiting_time = waiting_time,
+            deadline = deadline)
+
+        lines : list[str] = [
+            self.__formatter.format_requirement_summary(baseline_report.requirement_summary),
+            _MessageCollection.baseline_updated(baseline_path = baseline_path, baseline_report = baseline_report)
+        ]
+
+        if len(baseline_report.newly_outdated) > 0:
+            lines.append(_MessageCollection.packages_newly_outdated(packages = baseline_report.newly_outdated))
+
+        if len(baseline_report.newly_current) > 0:
+            lines.append(_MessageCollection.packages_newly_current(packages = baseline_report.newly_current))
+
+        return str.join("\n", lines)
+    def try_get_baseline_status(
+            self,
+            file_path : str,
+            baseline_path : str,
+            freshness : int = DEFAULT.BASELINE_FRESHNESS,
+            only_stable_releases : bool = DEFAULT.ONLY_STABLE_RELEASES,
+            waiting_time : int = DEFAULT.WAITING_TIME,
+            deadline : Optional[int] = None
+            ) -> str:
+
+        '''
+            It performs the same operations as get_baseline_status().
+            If an issue arises, it returns the message of the Exception.
+        '''
+
+        try:
+
+            status : str = self.get_baseline_status(
+                file_path = file_path,
+                baseline_path = baseline_path,
+                freshness = freshness,
+                only_stable_releases = only_stable_releases,
+                waiting_time = waiting_time,
+                deadline = deadline)
+
             return status
 
         except Exception as e:
 
             return str(e)
+    def warm(self, file_paths : list[str], only_stable_releases : bool = DEFAULT.ONLY_STABLE_RELEASES, waiting_time : int = DEFAULT.WAITING_TIME, deadline : Optional[int] = None) -> WarmSummary:
+
+        '''
+            Fetches all the packages listed in file_paths, so that the release cache of the release fetcher is filled for later runs.
+
+            Packages listed in more than one file are fetched once. They are fetched in parallel by the staged pipeline 
+            (with the default PipelineSettings if none has been provided), within waiting_time and the concurrency controller, if any.
+
+            It's useful only if the release fetcher has been provided with a persistent release cache (e.g. FileReleaseCache).
+        '''
+
+        for file_path in file_paths:
+            Validator().validate_file_path(file_path)
+
+        Validator().validate_waiting_time(waiting_time)
+        Validator().validate_deadline(deadline)
+
+        packages : dict[str, Package] = {}
+
+        for file_path in file_paths:
+            for package in self.__package_loader.load(file_path = file_path).packages:
+                packages.setdefault(package.name, package)
+
+        pipeline_settings : PipelineSettings = self.__get_pipeline_settings() or PipelineSettings()
+
+        requirement_details : list[RequirementDetail] = self.__create_requirement_details_with_pipeline(
+            l_session = LSession(packages = list(packages.values()), unparsed_lines = []),
+            only_stable_releases = only_stable_releases,
+            waiting_time = waiting_time,
+            deadline = deadline,
+            deadline_at = self.__calculate_deadline_at(deadline = deadline),
+            pipeline_settings = pipeline_settings
+        )
+
+        errors : int = sum(1 for requirement_detail in requirement_details if requirement_detail.outcome == "error")
+        unchecked : int = sum(1 for requirement_detail in requirement_details if requirement_detail.outcome == "unchecked")
+
+        warm_summary : WarmSummary = WarmSummary(
+            total_packages = len(requirement_details),
+            warmed = sum(1 for requirement_detail in requirement_details if requirement_detail.outcome in ["matching", "mismatching"]),
+            errors = errors,
+            unchecked = unchecked,
+            details = requirement_details
+        )
+
+        return warm_summary
+    def try_warm(self, file_paths : list[str], only_stable_releases : bool = DEFAULT.ONLY_STABLE_RELEASES, waiting_time : int = DEFAULT.WAITING_TIME, deadline : Optional[int] = None) -> str:
+
+        '''
+            It performs the same operations as warm() and returns the WarmSummary as string, followed by the packages that couldn't be warmed.
+            If an issue arises, it returns the Exception message.
+        '''
+
+        try:
+
+            warm_summary : WarmSummary = self.warm(
+                file_paths = file_paths, 
+                only_stable_releases = only_stable_releases, 
+                waiting_time = waiting_time,
+                deadline = deadline)
+
+            lines : list[str] = [str(warm_summary)]
+            lines += [requirement_detail.description for requirement_detail in warm_summary.details if requirement_detail.outcome in ["error", "unchecked"]]
+
+            return str.join("\n", lines)
+
+        except Exception as e:
+
+            return str(e)
+    def export_snapshot(
+            self, 
+            file_paths : list[str], 
+            snapshot_path : str, 
+            only_stable_releases : bool = DEFAULT.ONLY_STABLE_RELEASES, 
+            waiting_time : int = DEFAULT.WAITING_TIME, 
+            deadline : Optional[int] = None
+            ) -> Tuple[WarmSummary, int]:
+
+        '''
+            Warms the packages listed in file_paths (see warm()) and writes their FSession objects to snapshot_path (see SnapshotWriter).
+
+            The FSession objects are taken from the release cache, without revalidating them. 
+            Packages that aren't available there (e.g. no release cache has been provided) are fetched again.
+
+            Returns the WarmSummary and the number of exported entries.
+        '''
+
+        warm_summary : WarmSummary = self.warm(file_paths = file_paths, only_stable_releases = only_stable_releases, waiting_time = waiting_time, deadline = deadline)
+        snapshot_entries : list[SnapshotEntry] = []
+
+        for requirement_detail in warm_summary.details:
+
+            if requirement_detail.outcome not in ["matching", "mismatching"]:
+                continue
+
+            package_name : str = requirement_detail.current_package.name
+            f_session : FSession = (
+                self.__release_fetcher.try_get_cached(package_name = package_name, only_stable_releases = only_stable_releases, revalidate = False)
+                or self.__release_fetcher.fetch(package_name = package_name, only_stable_releases = only_stable_releases)
+            )
+
+            snapshot_entries.append(SnapshotEntry(
+                package_name = package_name,
+                only_stable_releases = only_stable_releases,
+                fetched_at = self.__now_function() - f_session.age,
+                f_session = replace(f_session, age = 0.0, is_stale = False)
+            ))
+
+        self.__snapshot_writer.write(file_path = snapshot_path, snapshot_entries = snapshot_entries)
+
+        return (warm_summary, len(snapshot_entries))
+    def try_export_snapshot(
+            self, 
+            file_paths : list[str], 
+            snapshot_path : str, 
+            only_stable_releases : bool = DEFAULT.ONLY_STABLE_RELEASES, 
+            waiting_time : int = DEFAULT.WAITING_TIME, 
+            deadline : Optional[int] = None
+            ) -> str:
+
+        '''
+            It performs the same operations as export_snapshot() and returns the WarmSummary as string, followed by the snapshot path.
+            If an issue arises, it returns the Exception message.
+        '''
+
+        try:
+
+            warm_summary, entries = self.export_snapshot(
+                file_paths = file_paths, 
+                snapshot_path = snapshot_path,
+                only_stable_releases = only_stable_releases, 
+                waiting_time = waiting_time,
+                deadline = deadline)
+
+            return str.join("\n", [str(warm_summary), _MessageCollection.snapshot_exported(snapshot_path = snapshot_path, entries = entries)])
+
+        except Exception as e:
+
+            return str(e)
 
 # MAIN
 if __name__ == "__main__":
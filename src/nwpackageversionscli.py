@@ -5,17 +5,27 @@ Alias: nwpver
 '''
 
 # GLOBAL MODULES
+import hashlib
+import json
 import os
 import re
+import socket
+import socketserver
 import subprocess
 from argparse import _SubParsersAction, ArgumentParser, ArgumentTypeError, Namespace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from re import Match
 from shutil import get_terminal_size
+from socketserver import BaseServer, StreamRequestHandler
 from subprocess import CompletedProcess
-from typing import Any, Callable, Final, Optional, Tuple
+from threading import Event, Lock
+from typing import Any, BinaryIO, Callable, Final, Optional, Tuple
 
 # LOCAL/NW MODULES
 from nwpackageversions import RequirementChecker, RuntimeChecker, LambdaCollection, DEFAULT
+from nwpackageversions import FileReleaseCache, PyPiReleaseFetcher, SnapshotReleaseCache
+from nwpackageversions import InMemoryReleaseCache, PyPiBadgeFetcher, ReleaseCache, SummaryCache
+from nwpackageversions import CachingProxy, ProxyResponse, RateLimiter, NegativeCache, PackageFilter
 from setupinfo import CLI_DESCRIPTION, PROJECT_VERSION
 
 # GENERIC CLASSES
@@ -34,6 +44,40 @@ class CLISTRING:
     COMMAND_REQUIREMENTS_NAME : Final[str] = "requirements"
     COMMAND_REQUIREMENTS_HELP : Final[str] = "Checks the status of the required packages."
 
+    COMMAND_WARM_NAME : Final[str] = "warm"
+    COMMAND_WARM_HELP : Final[str] = "Fetches the required packages of one or more files into the persistent cache."
+
+    COMMAND_SNAPSHOT_NAME : Final[str] = "snapshot"
+    COMMAND_SNAPSHOT_HELP : Final[str] = "Exports or imports a portable snapshot of the release data (e.g. for air-gapped builds)."
+
+    COMMAND_SERVE_NAME : Final[str] = "serve"
+    COMMAND_SERVE_HELP : Final[str] = "Runs a daemon that keeps the caches and the connections warm. The other commands use it transparently when it's running."
+
+    COMMAND_PROXY_NAME : Final[str] = "proxy"
+    COMMAND_PROXY_HELP : Final[str] = "Runs a caching HTTP proxy in front of the index, which can be shared by a fleet of CI agents."
+
+    COMMAND_CACHE_NAME : Final[str] = "cache"
+    COMMAND_CACHE_HELP : Final[str] = "Inspects or manages the persistent cache."
+
+    SUBCOMMAND_DEST : Final[str] = "subcommand"
+    SUBCOMMAND_REQUIRED : Final[bool] = True
+    SUBCOMMAND_ARGS : dict[str, Any] = { "dest": SUBCOMMAND_DEST, "required": SUBCOMMAND_REQUIRED }
+
+    SUBCOMMAND_EXPORT_NAME : Final[str] = "export"
+    SUBCOMMAND_EXPORT_HELP : Final[str] = "Fetches the required packages of one or more files and writes them to a snapshot file."
+
+    SUBCOMMAND_IMPORT_NAME : Final[str] = "import"
+    SUBCOMMAND_IMPORT_HELP : Final[str] = "Loads a snapshot file into the persistent cache."
+
+    SUBCOMMAND_STATS_NAME : Final[str] = "stats"
+    SUBCOMMAND_STATS_HELP : Final[str] = "Shows the number of entries, their size, the hit ratio and the age histogram of the persistent cache."
+
+    SUBCOMMAND_PRUNE_NAME : Final[str] = "prune"
+    SUBCOMMAND_PRUNE_HELP : Final[str] = "Removes the expired entries and, if --max_size is provided, the least recently used ones until the cache fits."
+
+    SUBCOMMAND_CLEAR_NAME : Final[str] = "clear"
+    SUBCOMMAND_CLEAR_HELP : Final[str] = "Removes all the entries of the persistent cache, including the packages known to be missing from the index."
+
     OPTION_REQUIRED_FLAGS : Final[list[str]] = ["--required"]
     OPTION_REQUIRED_DEST : Final[str] = "required"
     OPTION_REQUIRED_REQUIRED : Final[bool] = True
@@ -56,6 +100,116 @@ class CLISTRING:
     OPTION_WAITINGTIME_DEFAULT : Final[int] = DEFAULT.WAITING_TIME
     OPTION_WAITINGTIME_HELP : Final[str] = "The waiting time between requests (in seconds)."
 
+    OPTION_DEADLINE_FLAGS : Final[list[str]] = ["--deadline"]
+    OPTION_DEADLINE_DEST : Final[str] = "deadline"
+    OPTION_DEADLINE_TYPE : type = int
+    OPTION_DEADLINE_DEFAULT : Final[Optional[int]] = None
+    OPTION_DEADLINE_HELP : Final[str] = "The maximum duration of the run (in seconds). Once hit, the remaining packages are reported as unchecked."
+
+    OPTION_FILEPATHS_FLAGS : Final[list[str]] = ["--file_path"]
+    OPTION_FILEPATHS_DEST : Final[str] = "file_paths"
+    OPTION_FILEPATHS_REQUIRED : Final[bool] = True
+    OPTION_FILEPATHS_NARGS : Final[str] = "+"
+    OPTION_FILEPATHS_HELP : Final[str] = "The paths to the files containing package requirements."
+
+    OPTION_CACHEDIR_FLAGS : Final[list[str]] = ["--cache_dir"]
+    OPTION_CACHEDIR_DEST : Final[str] = "cache_dir"
+    OPTION_CACHEDIR_DEFAULT : Final[Optional[str]] = None
+    OPTION_CACHEDIR_WARM_DEFAULT : Final[str] = DEFAULT.CACHE_DIR
+    OPTION_CACHEDIR_HELP : Final[str] = "The directory of the persistent cache, which can be shared by several processes. If omitted, nothing is cached on disk."
+    OPTION_CACHEDIR_WARM_HELP : Final[str] = "The directory of the persistent cache, which can be shared by several processes."
+
+    OPTION_OUT_FLAGS : Final[list[str]] = ["--out"]
+    OPTION_OUT_DEST : Final[str] = "snapshot_path"
+    OPTION_OUT_REQUIRED : Final[bool] = True
+    OPTION_OUT_HELP : Final[str] = "The path of the snapshot file to write."
+
+    OPTION_IN_FLAGS : Final[list[str]] = ["--in"]
+    OPTION_IN_DEST : Final[str] = "snapshot_path"
+    OPTION_IN_REQUIRED : Final[bool] = True
+    OPTION_IN_HELP : Final[str] = "The path of the snapshot file to read."
+
+    OPTION_MAXSIZE_FLAGS : Final[list[str]] = ["--max_size", "--max-size"]
+    OPTION_MAXSIZE_DEST : Final[str] = "max_size"
+    OPTION_MAXSIZE_DEFAULT : Final[Optional[int]] = None
+    OPTION_MAXSIZE_HELP : Final[str] = "The maximum size of the persistent cache (e.g., 200MB). Supported units: B, KB, MB, GB (multiples of 1024)."
+
+    OPTION_SOCKET_FLAGS : Final[list[str]] = ["--socket"]
+    OPTION_SOCKET_DEST : Final[str] = "socket_path"
+    OPTION_SOCKET_DEFAULT : Final[str] = os.environ.get("NWPVER_SOCKET", os.path.join(DEFAULT.CACHE_DIR, "nwpver.sock"))
+    OPTION_SOCKET_HELP : Final[str] = "The path of the Unix domain socket the daemon listens on. The other commands look for the daemon in $NWPVER_SOCKET or in the default path."
+
+    OPTION_HOST_FLAGS : Final[list[str]] = ["--host"]
+    OPTION_HOST_DEST : Final[str] = "host"
+    OPTION_HOST_DEFAULT : Final[str] = "127.0.0.1"
+    OPTION_HOST_HELP : Final[str] = "The address the proxy listens on (e.g., 0.0.0.0 to accept connections from other machines)."
+
+    OPTION_PORT_FLAGS : Final[list[str]] = ["--port"]
+    OPTION_PORT_DEST : Final[str] = "port"
+    OPTION_PORT_TYPE : type = int
+    OPTION_PORT_DEFAULT : Final[int] = 8080
+    OPTION_PORT_HELP : Final[str] = "The port the proxy listens on."
+
+    OPTION_UPSTREAM_FLAGS : Final[list[str]] = ["--upstream"]
+    OPTION_UPSTREAM_DEST : Final[str] = "upstream_url"
+    OPTION_UPSTREAM_DEFAULT : Final[str] = DEFAULT.INDEX_URL
+    OPTION_UPSTREAM_HELP : Final[str] = "The index the proxy forwards the cache misses to."
+
+    OPTION_RATELIMIT_FLAGS : Final[list[str]] = ["--rate_limit"]
+    OPTION_RATELIMIT_DEST : Final[str] = "rate_limit"
+    OPTION_RATELIMIT_TYPE : type = float
+    OPTION_RATELIMIT_DEFAULT : Final[float] = DEFAULT.PROXY_RATE_LIMIT
+    OPTION_RATELIMIT_HELP : Final[str] = "The maximum number of requests per second sent upstream, shared by all the clients."
+
+    OPTION_ALLOW_FLAGS : Final[list[str]] = ["--allow"]
+    OPTION_ALLOW_DEST : Final[str] = "allowed"
+    OPTION_ALLOW_NARGS : Final[str] = "+"
+    OPTION_ALLOW_DEFAULT : Final[Optional[list[str]]] = None
+    OPTION_ALLOW_HELP : Final[str] = "Only the packages matching these patterns (e.g., requests numpy*) are fetched from the index. Unix shell-style wildcards are supported."
+
+    OPTION_DENY_FLAGS : Final[list[str]] = ["--deny"]
+    OPTION_DENY_DEST : Final[str] = "denied"
+    OPTION_DENY_NARGS : Final[str] = "+"
+    OPTION_DENY_DEFAULT : Final[Optional[list[str]]] = None
+    OPTION_DENY_HELP : Final[str] = "The packages matching these patterns (e.g., acme-*) are never fetched from the index and are reported as errors. Unix shell-style wildcards are supported."
+
+    OPTION_INDEXURL_FLAGS : Final[list[str]] = ["--index_url"]
+    OPTION_INDEXURL_DEST : Final[str] = "index_urls"
+    OPTION_INDEXURL_NARGS : Final[str] = "+"
+    OPTION_INDEXURL_DEFAULT : Final[Optional[list[str]]] = None
+    OPTION_INDEXURL_HELP : Final[str] = "The index to fetch the releases from (e.g., a mirror or an nwpver proxy). If more than one is provided, the next one is also requested when the previous one is slow or fails."
+
+    OPTION_OFFLINE_FLAGS : Final[list[str]] = ["--offline"]
+    OPTION_OFFLINE_DEST : Final[str] = "offline"
+    OPTION_OFFLINE_ACTION : Final[str] = "store_true"
+    OPTION_OFFLINE_HELP : Final[str] = "Performs no network call: packages are checked against the persistent cache only (--cache_dir or its default) and the missing ones are reported as unknown."
+
+    OPTION_WATCH_FLAGS : Final[list[str]] = ["--watch"]
+    OPTION_WATCH_DEST : Final[str] = "watch"
+    OPTION_WATCH_ACTION : Final[str] = "store_true"
+    OPTION_WATCH_HELP : Final[str] = "Keeps watching the file and, whenever it changes, rechecks only the packages that have been added or changed (until Ctrl+C)."
+
+    OPTION_BASELINE_FLAGS : Final[list[str]] = ["--baseline"]
+    OPTION_BASELINE_DEST : Final[str] = "baseline_path"
+    OPTION_BASELINE_DEFAULT : Final[Optional[str]] = None
+    OPTION_BASELINE_HELP : Final[str] = "The path of the baseline file: the packages fetched within --freshness are reused from it, the changes since it are reported and it's replaced by the outcome of this run."
+
+    OPTION_FRESHNESS_FLAGS : Final[list[str]] = ["--freshness"]
+    OPTION_FRESHNESS_DEST : Final[str] = "freshness"
+    OPTION_FRESHNESS_TYPE : type = int
+    OPTION_FRESHNESS_DEFAULT : Final[int] = DEFAULT.BASELINE_FRESHNESS
+    OPTION_FRESHNESS_HELP : Final[str] = "How long (in seconds) a package fetched in a previous run stays reusable from the baseline."
+
+    OPTION_JOURNAL_FLAGS : Final[list[str]] = ["--journal"]
+    OPTION_JOURNAL_DEST : Final[str] = "journal_path"
+    OPTION_JOURNAL_DEFAULT : Final[Optional[str]] = None
+    OPTION_JOURNAL_HELP : Final[str] = "Checkpoints the progress to the journal in the provided path, so that an interrupted run can be resumed with --resume."
+
+    OPTION_RESUME_FLAGS : Final[list[str]] = ["--resume"]
+    OPTION_RESUME_DEST : Final[str] = "resume"
+    OPTION_RESUME_ACTION : Final[str] = "store_true"
+    OPTION_RESUME_HELP : Final[str] = "Skips the packages that an interrupted run has already checkpointed to the journal. If --journal is omitted, a file named after --file_path is used in the journals directory of the default cache."
+
 # STATIC CLASSES
 class _MessageCollectionAsciiBannerManager():
 
@@ -71,9 +225,57 @@ class _MessageCollectionCLIValidator():
     @staticmethod
     def provided_required_not_valid(required : str) -> str:
         return f"The provided 'required' ('{required}') is not a valid version."
+
+    @staticmethod
+    def provided_size_not_valid(size : str) -> str:
+        return f"The provided 'size' ('{size}') is not a valid size (e.g., 200MB)."
+class _MessageCollectionCLIManager():
+
+    '''Collects all the messages used for logging and for the exceptions used by CLIManager.'''
+
+    @staticmethod
+    def snapshot_imported(snapshot_path : str, cache_dir : str, entries : int) -> str:
+        return f"The snapshot '{snapshot_path}' has been imported into '{cache_dir}' ('entries': '{entries}')."
+
+    @staticmethod
+    def cache_cleared(cache_dir : str) -> str:
+        return f"The persistent cache in '{cache_dir}' has been cleared."
+class _MessageCollectionDaemon():
+
+    '''Collects all the messages used for logging and for the exceptions used by DaemonServer and DaemonClient.'''
+
+    @staticmethod
+    def daemon_listening(socket_path : str) -> str:
+        return f"The daemon is listening on '{socket_path}'."
+
+    @staticmethod
+    def daemon_stopped(socket_path : str) -> str:
+        return f"The daemon listening on '{socket_path}' has been stopped."
+
+    @staticmethod
+    def daemon_already_running(socket_path : str) -> str:
+        return f"A daemon is already listening on '{socket_path}'."
+
+    @staticmethod
+    def daemon_response_not_valid(socket_path : str) -> str:
+        return f"The daemon listening on '{socket_path}' returned an invalid response."
+
+    @staticmethod
+    def daemon_not_supported() -> str:
+        return "The daemon requires Unix domain sockets, which aren't supported on this platform."
+
+    @staticmethod
+    def proxy_listening(url : str, upstream_url : str) -> str:
+        return f"The proxy is listening on '{url}' (upstream: '{upstream_url}')."
+
+    @staticmethod
+    def proxy_stopped(url : str) -> str:
+        return f"The proxy listening on '{url}' has been stopped."
 class _MessageCollection(
     _MessageCollectionAsciiBannerManager,
-    _MessageCollectionCLIValidator):
+    _MessageCollectionCLIValidator,
+    _MessageCollectionCLIManager,
+    _MessageCollectionDaemon):
 
     '''Collects all the messages used for logging and for the exceptions.'''
 
@@ -270,6 +472,20 @@ class CLIValidator:
         version_tpl : Tuple[int, int, int] = (item_1, item_2, item_3)
 
         return version_tpl
+    def validate_size(self, size : str) -> int:
+
+        '''Validates that the size string (e.g., 200MB) can be parsed into a number of bytes.'''
+
+        pattern : str = r"^(\d+)\s*([KMG]?B?)$"
+        match : Optional[Match] = re.match(pattern, size.strip(), flags = re.IGNORECASE)
+
+        if not match:
+            raise ArgumentTypeError(_MessageCollection.provided_size_not_valid(size))
+
+        exponents : dict[str, int] = { "": 0, "K": 1, "M": 2, "G": 3 }
+        unit : str = match.group(2).upper().rstrip("B")
+
+        return int(match.group(1)) * (1024 ** exponents[unit])
 class APFactory():
 
     '''Encapsulates all the logic related to the creation of a custom instance of argparse.ArgumentParser.'''
@@ -286,8 +502,8 @@ class APFactory():
 
             The "prog" argument is not provided in order to make the "usage" statement  dynamic:
 
-                usage: nwpackageversionscli [-h] {runtime,requirements} ...
-                usage: nwpver [-h] {runtime,requirements} ...
+                usage: nwpackageversionscli [-h] {runtime,requirements,warm,snapshot,serve,proxy,cache} ...
+                usage: nwpver [-h] {runtime,requirements,warm,snapshot,serve,proxy,cache} ...
         '''
 
         argument_parser : ArgumentParser = ArgumentParser(description = CLI_DESCRIPTION)
@@ -327,7 +543,558 @@ class APFactory():
             default = CLISTRING.OPTION_WAITINGTIME_DEFAULT,
             help = CLISTRING.OPTION_WAITINGTIME_HELP)
 
+        requirements_parser.add_argument(
+            *CLISTRING.OPTION_DEADLINE_FLAGS,
+            dest = CLISTRING.OPTION_DEADLINE_DEST,
+            type = CLISTRING.OPTION_DEADLINE_TYPE,
+            default = CLISTRING.OPTION_DEADLINE_DEFAULT,
+            help = CLISTRING.OPTION_DEADLINE_HELP)
+
+        requirements_parser.add_argument(
+            *CLISTRING.OPTION_CACHEDIR_FLAGS,
+            dest = CLISTRING.OPTION_CACHEDIR_DEST,
+            default = CLISTRING.OPTION_CACHEDIR_DEFAULT,
+            help = CLISTRING.OPTION_CACHEDIR_HELP)
+
+        requirements_parser.add_argument(
+            *CLISTRING.OPTION_ALLOW_FLAGS,
+            dest = CLISTRING.OPTION_ALLOW_DEST,
+            nargs = CLISTRING.OPTION_ALLOW_NARGS,
+            default = CLISTRING.OPTION_ALLOW_DEFAULT,
+            help = CLISTRING.OPTION_ALLOW_HELP)
+
+        requirements_parser.add_argument(
+            *CLISTRING.OPTION_DENY_FLAGS,
+            dest = CLISTRING.OPTION_DENY_DEST,
+            nargs = CLISTRING.OPTION_DENY_NARGS,
+            default = CLISTRING.OPTION_DENY_DEFAULT,
+            help = CLISTRING.OPTION_DENY_HELP)
+
+        requirements_parser.add_argument(
+            *CLISTRING.OPTION_INDEXURL_FLAGS,
+            dest = CLISTRING.OPTION_INDEXURL_DEST,
+            nargs = CLISTRING.OPTION_INDEXURL_NARGS,
+            default = CLISTRING.OPTION_INDEXURL_DEFAULT,
+            help = CLISTRING.OPTION_INDEXURL_HELP)
+
+        requirements_parser.add_argument(
+            *CLISTRING.OPTION_OFFLINE_FLAGS,
+            dest = CLISTRING.OPTION_OFFLINE_DEST,
+            action = CLISTRING.OPTION_OFFLINE_ACTION,
+            help = CLISTRING.OPTION_OFFLINE_HELP)
+
+        requirements_parser.add_argument(
+            *CLISTRING.OPTION_WATCH_FLAGS,
+            dest = CLISTRING.OPTION_WATCH_DEST,
+            action = CLISTRING.OPTION_WATCH_ACTION,
+            help = CLISTRING.OPTION_WATCH_HELP)
+
+        requirements_parser.add_argument(
+            *CLISTRING.OPTION_BASELINE_FLAGS,
+            dest = CLISTRING.OPTION_BASELINE_DEST,
+            default = CLISTRING.OPTION_BASELINE_DEFAULT,
+            help = CLISTRING.OPTION_BASELINE_HELP)
+
+        requirements_parser.add_argument(
+            *CLISTRING.OPTION_FRESHNESS_FLAGS,
+            dest = CLISTRING.OPTION_FRESHNESS_DEST,
+            type = CLISTRING.OPTION_FRESHNESS_TYPE,
+            default = CLISTRING.OPTION_FRESHNESS_DEFAULT,
+            help = CLISTRING.OPTION_FRESHNESS_HELP)
+
+        requirements_parser.add_argument(
+            *CLISTRING.OPTION_JOURNAL_FLAGS,
+            dest = CLISTRING.OPTION_JOURNAL_DEST,
+            default = CLISTRING.OPTION_JOURNAL_DEFAULT,
+            help = CLISTRING.OPTION_JOURNAL_HELP)
+
+        requirements_parser.add_argument(
+            *CLISTRING.OPTION_RESUME_FLAGS,
+            dest = CLISTRING.OPTION_RESUME_DEST,
+            action = CLISTRING.OPTION_RESUME_ACTION,
+            help = CLISTRING.OPTION_RESUME_HELP)
+
+        warm_parser : ArgumentParser = root.add_parser(
+            name = CLISTRING.COMMAND_WARM_NAME, 
+            help = CLISTRING.COMMAND_WARM_HELP)
+
+        warm_parser.add_argument(
+            *CLISTRING.OPTION_FILEPATHS_FLAGS,
+            dest = CLISTRING.OPTION_FILEPATHS_DEST,
+            required = CLISTRING.OPTION_FILEPATHS_REQUIRED,
+            nargs = CLISTRING.OPTION_FILEPATHS_NARGS,
+            help = CLISTRING.OPTION_FILEPATHS_HELP)
+
+        warm_parser.add_argument(
+            *CLISTRING.OPTION_ONLYSTABLERELEASES_FLAGS,
+            dest = CLISTRING.OPTION_ONLYSTABLERELEASES_DEST,
+            default = CLISTRING.OPTION_ONLYSTABLERELEASES_DEFAULT,
+            help = CLISTRING.OPTION_ONLYSTABLERELEASES_HELP)
+
+        warm_parser.add_argument(
+            *CLISTRING.OPTION_WAITINGTIME_FLAGS,
+            dest = CLISTRING.OPTION_WAITINGTIME_DEST,
+            type = CLISTRING.OPTION_WAITINGTIME_TYPE,
+            default = CLISTRING.OPTION_WAITINGTIME_DEFAULT,
+            help = CLISTRING.OPTION_WAITINGTIME_HELP)
+
+        warm_parser.add_argument(
+            *CLISTRING.OPTION_DEADLINE_FLAGS,
+            dest = CLISTRING.OPTION_DEADLINE_DEST,
+            type = CLISTRING.OPTION_DEADLINE_TYPE,
+            default = CLISTRING.OPTION_DEADLINE_DEFAULT,
+            help = CLISTRING.OPTION_DEADLINE_HELP)
+
+        warm_parser.add_argument(
+            *CLISTRING.OPTION_CACHEDIR_FLAGS,
+            dest = CLISTRING.OPTION_CACHEDIR_DEST,
+            default = CLISTRING.OPTION_CACHEDIR_WARM_DEFAULT,
+            help = CLISTRING.OPTION_CACHEDIR_WARM_HELP)
+
+        warm_parser.add_argument(
+            *CLISTRING.OPTION_ALLOW_FLAGS,
+            dest = CLISTRING.OPTION_ALLOW_DEST,
+            nargs = CLISTRING.OPTION_ALLOW_NARGS,
+            default = CLISTRING.OPTION_ALLOW_DEFAULT,
+            help = CLISTRING.OPTION_ALLOW_HELP)
+
+        warm_parser.add_argument(
+            *CLISTRING.OPTION_DENY_FLAGS,
+            dest = CLISTRING.OPTION_DENY_DEST,
+            nargs = CLISTRING.OPTION_DENY_NARGS,
+            default = CLISTRING.OPTION_DENY_DEFAULT,
+            help = CLISTRING.OPTION_DENY_HELP)
+
+        warm_parser.add_argument(
+            *CLISTRING.OPTION_INDEXURL_FLAGS,
+            dest = CLISTRING.OPTION_INDEXURL_DEST,
+            nargs = CLISTRING.OPTION_INDEXURL_NARGS,
+            default = CLISTRING.OPTION_INDEXURL_DEFAULT,
+            help = CLISTRING.OPTION_INDEXURL_HELP)
+
+        snapshot_parser : ArgumentParser = root.add_parser(
+            name = CLISTRING.COMMAND_SNAPSHOT_NAME, 
+            help = CLISTRING.COMMAND_SNAPSHOT_HELP)
+        snapshot_root : _SubParsersAction = snapshot_parser.add_subparsers(**CLISTRING.SUBCOMMAND_ARGS)
+
+        export_parser : ArgumentParser = snapshot_root.add_parser(
+            name = CLISTRING.SUBCOMMAND_EXPORT_NAME, 
+            help = CLISTRING.SUBCOMMAND_EXPORT_HELP)
+
+        export_parser.add_argument(
+            *CLISTRING.OPTION_FILEPATHS_FLAGS,
+            dest = CLISTRING.OPTION_FILEPATHS_DEST,
+            required = CLISTRING.OPTION_FILEPATHS_REQUIRED,
+            nargs = CLISTRING.OPTION_FILEPATHS_NARGS,
+            help = CLISTRING.OPTION_FILEPATHS_HELP)
+
+        export_parser.add_argument(
+            *CLISTRING.OPTION_OUT_FLAGS,
+            dest = CLISTRING.OPTION_OUT_DEST,
+            required = CLISTRING.OPTION_OUT_REQUIRED,
+            help = CLISTRING.OPTION_OUT_HELP)
+
+        export_parser.add_argument(
+            *CLISTRING.OPTION_ONLYSTABLERELEASES_FLAGS,
+            dest = CLISTRING.OPTION_ONLYSTABLERELEASES_DEST,
+            default = CLISTRING.OPTION_ONLYSTABLERELEASES_DEFAULT,
+            help = CLISTRING.OPTION_ONLYSTABLERELEASES_HELP)
+
+        export_parser.add_argument(
+            *CLISTRING.OPTION_WAITINGTIME_FLAGS,
+            dest = CLISTRING.OPTION_WAITINGTIME_DEST,
+            type = CLISTRING.OPTION_WAITINGTIME_TYPE,
+            default = CLISTRING.OPTION_WAITINGTIME_DEFAULT,
+            help = CLISTRING.OPTION_WAITINGTIME_HELP)
+
+        export_parser.add_argument(
+            *CLISTRING.OPTION_DEADLINE_FLAGS,
+            dest = CLISTRING.OPTION_DEADLINE_DEST,
+            type = CLISTRING.OPTION_DEADLINE_TYPE,
+            default = CLISTRING.OPTION_DEADLINE_DEFAULT,
+            help = CLISTRING.OPTION_DEADLINE_HELP)
+
+        export_parser.add_argument(
+            *CLISTRING.OPTION_CACHEDIR_FLAGS,
+            dest = CLISTRING.OPTION_CACHEDIR_DEST,
+            default = CLISTRING.OPTION_CACHEDIR_WARM_DEFAULT,
+            help = CLISTRING.OPTION_CACHEDIR_WARM_HELP)
+
+        export_parser.add_argument(
+            *CLISTRING.OPTION_ALLOW_FLAGS,
+            dest = CLISTRING.OPTION_ALLOW_DEST,
+            nargs = CLISTRING.OPTION_ALLOW_NARGS,
+            default = CLISTRING.OPTION_ALLOW_DEFAULT,
+            help = CLISTRING.OPTION_ALLOW_HELP)
+
+        export_parser.add_argument(
+            *CLISTRING.OPTION_DENY_FLAGS,
+            dest = CLISTRING.OPTION_DENY_DEST,
+            nargs = CLISTRING.OPTION_DENY_NARGS,
+            default = CLISTRING.OPTION_DENY_DEFAULT,
+            help = CLISTRING.OPTION_DENY_HELP)
+
+        export_parser.add_argument(
+            *CLISTRING.OPTION_INDEXURL_FLAGS,
+            dest = CLISTRING.OPTION_INDEXURL_DEST,
+            nargs = CLISTRING.OPTION_INDEXURL_NARGS,
+            default = CLISTRING.OPTION_INDEXURL_DEFAULT,
+            help = CLISTRING.OPTION_INDEXURL_HELP)
+
+        import_parser : ArgumentParser = snapshot_root.add_parser(
+            name = CLISTRING.SUBCOMMAND_IMPORT_NAME, 
+            help = CLISTRING.SUBCOMMAND_IMPORT_HELP)
+
+        import_parser.add_argument(
+            *CLISTRING.OPTION_IN_FLAGS,
+            dest = CLISTRING.OPTION_IN_DEST,
+            required = CLISTRING.OPTION_IN_REQUIRED,
+            help = CLISTRING.OPTION_IN_HELP)
+
+        import_parser.add_argument(
+            *CLISTRING.OPTION_CACHEDIR_FLAGS,
+            dest = CLISTRING.OPTION_CACHEDIR_DEST,
+            default = CLISTRING.OPTION_CACHEDIR_WARM_DEFAULT,
+            help = CLISTRING.OPTION_CACHEDIR_WARM_HELP)
+
+        serve_parser : ArgumentParser = root.add_parser(
+            name = CLISTRING.COMMAND_SERVE_NAME, 
+            help = CLISTRING.COMMAND_SERVE_HELP)
+
+        serve_parser.add_argument(
+            *CLISTRING.OPTION_SOCKET_FLAGS,
+            dest = CLISTRING.OPTION_SOCKET_DEST,
+            default = CLISTRING.OPTION_SOCKET_DEFAULT,
+            help = CLISTRING.OPTION_SOCKET_HELP)
+
+        proxy_parser : ArgumentParser = root.add_parser(
+            name = CLISTRING.COMMAND_PROXY_NAME, 
+            help = CLISTRING.COMMAND_PROXY_HELP)
+
+        proxy_parser.add_argument(
+            *CLISTRING.OPTION_HOST_FLAGS,
+            dest = CLISTRING.OPTION_HOST_DEST,
+            default = CLISTRING.OPTION_HOST_DEFAULT,
+            help = CLISTRING.OPTION_HOST_HELP)
+
+        proxy_parser.add_argument(
+            *CLISTRING.OPTION_PORT_FLAGS,
+            dest = CLISTRING.OPTION_PORT_DEST,
+            type = CLISTRING.OPTION_PORT_TYPE,
+            default = CLISTRING.OPTION_PORT_DEFAULT,
+            help = CLISTRING.OPTION_PORT_HELP)
+
+        proxy_parser.add_argument(
+            *CLISTRING.OPTION_UPSTREAM_FLAGS,
+            dest = CLISTRING.OPTION_UPSTREAM_DEST,
+            default = CLISTRING.OPTION_UPSTREAM_DEFAULT,
+            help = CLISTRING.OPTION_UPSTREAM_HELP)
+
+        proxy_parser.add_argument(
+            *CLISTRING.OPTION_RATELIMIT_FLAGS,
+            dest = CLISTRING.OPTION_RATELIMIT_DEST,
+            type = CLISTRING.OPTION_RATELIMIT_TYPE,
+            default = CLISTRING.OPTION_RATELIMIT_DEFAULT,
+            help = CLISTRING.OPTION_RATELIMIT_HELP)
+
+        proxy_parser.add_argument(
+            *CLISTRING.OPTION_CACHEDIR_FLAGS,
+            dest = CLISTRING.OPTION_CACHEDIR_DEST,
+            default = CLISTRING.OPTION_CACHEDIR_WARM_DEFAULT,
+            help = CLISTRING.OPTION_CACHEDIR_WARM_HELP)
+
+        cache_parser : ArgumentParser = root.add_parser(
+            name = CLISTRING.COMMAND_CACHE_NAME, 
+            help = CLISTRING.COMMAND_CACHE_HELP)
+        cache_root : _SubParsersAction = cache_parser.add_subparsers(**CLISTRING.SUBCOMMAND_ARGS)
+
+        stats_parser : ArgumentParser = cache_root.add_parser(
+            name = CLISTRING.SUBCOMMAND_STATS_NAME, 
+            help = CLISTRING.SUBCOMMAND_STATS_HELP)
+
+        stats_parser.add_argument(
+            *CLISTRING.OPTION_CACHEDIR_FLAGS,
+            dest = CLISTRING.OPTION_CACHEDIR_DEST,
+            default = CLISTRING.OPTION_CACHEDIR_WARM_DEFAULT,
+            help = CLISTRING.OPTION_CACHEDIR_WARM_HELP)
+
+        prune_parser : ArgumentParser = cache_root.add_parser(
+            name = CLISTRING.SUBCOMMAND_PRUNE_NAME, 
+            help = CLISTRING.SUBCOMMAND_PRUNE_HELP)
+
+        prune_parser.add_argument(
+            *CLISTRING.OPTION_MAXSIZE_FLAGS,
+            dest = CLISTRING.OPTION_MAXSIZE_DEST,
+            type = self.__cli_validator.validate_size,
+            default = CLISTRING.OPTION_MAXSIZE_DEFAULT,
+            help = CLISTRING.OPTION_MAXSIZE_HELP)
+
+        prune_parser.add_argument(
+            *CLISTRING.OPTION_CACHEDIR_FLAGS,
+            dest = CLISTRING.OPTION_CACHEDIR_DEST,
+            default = CLISTRING.OPTION_CACHEDIR_WARM_DEFAULT,
+            help = CLISTRING.OPTION_CACHEDIR_WARM_HELP)
+
+        clear_parser : ArgumentParser = cache_root.add_parser(
+            name = CLISTRING.SUBCOMMAND_CLEAR_NAME, 
+            help = CLISTRING.SUBCOMMAND_CLEAR_HELP)
+
+        clear_parser.add_argument(
+            *CLISTRING.OPTION_CACHEDIR_FLAGS,
+            dest = CLISTRING.OPTION_CACHEDIR_DEST,
+            default = CLISTRING.OPTION_CACHEDIR_WARM_DEFAULT,
+            help = CLISTRING.OPTION_CACHEDIR_WARM_HELP)
+
         return argument_parser
+class DaemonServer():
+
+    '''
+        Answers CLI requests over a Unix domain socket.
+
+        Each connection carries one request: a JSON line with the parsed arguments. The response is a JSON line with the messages 
+        that dispatch_function has logged. Requests are handled one at a time, so dispatch_function doesn't need to be thread-safe.
+        A request that arrives while another one is being handled is answered at once with { "busy": true }, so that the caller can run it itself.
+
+        Unix domain sockets aren't available on every platform (e.g. Windows): there serve_forever() raises an exception.
+    '''
+
+    __socket_path : str
+    __dispatch_function : Callable[[Namespace], list[str]]
+    __server : Optional[BaseServer]
+    __ready : Event
+    __dispatch_lock : Lock
+
+    def __init__(self, socket_path : str, dispatch_function : Callable[[Namespace], list[str]]) -> None:
+
+        self.__socket_path = socket_path
+        self.__dispatch_function = dispatch_function
+        self.__server = None
+        self.__ready = Event()
+        self.__dispatch_lock = Lock()
+
+    def __is_listening(self) -> bool:
+
+        '''Returns True if another process is accepting connections on the socket path.'''
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            try:
+                client.connect(self.__socket_path)
+                return True
+            except OSError:
+                return False
+    def __remove_socket(self) -> None:
+
+        '''Removes the socket file, if it still exists.'''
+
+        try:
+            os.remove(self.__socket_path)
+        except FileNotFoundError:
+            pass
+    def __handle(self, rfile : BinaryIO, wfile : BinaryIO) -> None:
+
+        '''Reads one request from rfile, dispatches it and writes the response to wfile. If another request is being dispatched, it replies that it's busy.'''
+
+        request : dict[str, Any] = json.loads(rfile.readline())
+
+        if not self.__dispatch_lock.acquire(blocking = False):
+            wfile.write(json.dumps({ "busy": True }).encode("utf-8") + b"\n")
+            return
+
+        try:
+            messages : list[str] = self.__dispatch_function(Namespace(**request))
+        finally:
+            self.__dispatch_lock.release()
+
+        wfile.write(json.dumps({ "messages": messages }).encode("utf-8") + b"\n")
+
+    def serve_forever(self) -> None:
+
+        '''Listens on the socket path until shutdown() is called. A stale socket file left by a crashed daemon is replaced.'''
+
+        if not hasattr(socket, "AF_UNIX"):
+            raise Exception(_MessageCollection.daemon_not_supported())
+
+        if os.path.exists(self.__socket_path):
+            if self.__is_listening():
+                raise Exception(_MessageCollection.daemon_already_running(socket_path = self.__socket_path))
+            self.__remove_socket()
+
+        directory : str = os.path.dirname(self.__socket_path)
+        if directory:
+            os.makedirs(directory, exist_ok = True)
+
+        handle : Callable[[BinaryIO, BinaryIO], None] = self.__handle
+
+        class RequestHandler(StreamRequestHandler):
+            def handle(self) -> None:
+                handle(self.rfile, self.wfile)
+
+        with socketserver.ThreadingUnixStreamServer(self.__socket_path, RequestHandler) as server:
+
+            server.daemon_threads = True
+            os.chmod(self.__socket_path, 0o600)
+            self.__server = server
+            self.__ready.set()
+
+            try:
+                server.serve_forever()
+            finally:
+                self.__server = None
+                self.__ready.clear()
+                self.__remove_socket()
+    def wait_until_ready(self, timeout : Optional[float] = None) -> bool:
+
+        '''Waits until the daemon is accepting connections. Returns False if timeout expires first.'''
+
+        return self.__ready.wait(timeout = timeout)
+    def shutdown(self) -> None:
+
+        '''Stops serve_forever(). It must be called from another thread.'''
+
+        if self.__server is not None:
+            self.__server.shutdown()
+class DaemonClient():
+
+    '''Forwards CLI requests to a running DaemonServer. Where Unix domain sockets aren't supported, no daemon is ever found.'''
+
+    __socket_path : str
+    __connect_timeout : float
+
+    def __init__(self, socket_path : str = CLISTRING.OPTION_SOCKET_DEFAULT, connect_timeout : float = 0.5) -> None:
+
+        self.__socket_path = socket_path
+        self.__connect_timeout = connect_timeout
+
+    def __connect(self) -> Optional[socket.socket]:
+
+        '''Connects to the daemon or returns None if none is running.'''
+
+        if not hasattr(socket, "AF_UNIX"):
+            return None
+
+        client : socket.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.settimeout(self.__connect_timeout)
+
+        try:
+            client.connect(self.__socket_path)
+        except OSError:
+            client.close()
+            return None
+
+        client.settimeout(None)
+
+        return client
+    def __create_request(self, args : Namespace) -> dict[str, Any]:
+
+        '''Converts args to a JSON-friendly dictionary. Paths are made absolute, since the daemon runs in a different working directory.'''
+
+        request : dict[str, Any] = dict(vars(args))
+
+        for key in [CLISTRING.OPTION_FILEPATH_DEST, CLISTRING.OPTION_OUT_DEST, CLISTRING.OPTION_CACHEDIR_DEST, CLISTRING.OPTION_BASELINE_DEST, CLISTRING.OPTION_JOURNAL_DEST]:
+            if request.get(key) is not None:
+                request[key] = os.path.abspath(request[key])
+
+        if request.get(CLISTRING.OPTION_FILEPATHS_DEST) is not None:
+            request[CLISTRING.OPTION_FILEPATHS_DEST] = [os.path.abspath(file_path) for file_path in request[CLISTRING.OPTION_FILEPATHS_DEST]]
+
+        return request
+
+    def try_send(self, args : Namespace) -> Optional[list[str]]:
+
+        '''Sends args to the daemon and returns the messages it logged, or None if no daemon is running or it's busy with another request.'''
+
+        client : Optional[socket.socket] = self.__connect()
+
+        if client is None:
+            return None
+
+        with client:
+
+            client.sendall(json.dumps(self.__create_request(args = args)).encode("utf-8") + b"\n")
+
+            with client.makefile("rb") as rfile:
+                line : bytes = rfile.readline()
+
+        try:
+            response : dict[str, Any] = json.loads(line)
+
+            if response.get("busy", False):
+                return None
+
+            return list(response["messages"])
+        except (ValueError, KeyError, TypeError, AttributeError):
+            raise Exception(_MessageCollection.daemon_response_not_valid(socket_path = self.__socket_path))
+class ProxyServer():
+
+    '''
+        Exposes a CachingProxy over HTTP. 
+        
+        Each request is handled in its own thread, so that concurrent misses reach the CachingProxy together and get coalesced.
+        The "X-Cache" response header tells whether the body came from the disk cache ("HIT") or not ("MISS").
+    '''
+
+    __caching_proxy : CachingProxy
+    __host : str
+    __port : int
+    __server : Optional[ThreadingHTTPServer]
+    __ready : Event
+
+    def __init__(self, caching_proxy : CachingProxy, host : str = CLISTRING.OPTION_HOST_DEFAULT, port : int = CLISTRING.OPTION_PORT_DEFAULT) -> None:
+
+        self.__caching_proxy = caching_proxy
+        self.__host = host
+        self.__port = port
+        self.__server = None
+        self.__ready = Event()
+
+    def serve_forever(self) -> None:
+
+        '''Listens on host:port until shutdown() is called. With port 0, a free port is picked (see get_url()).'''
+
+        caching_proxy : CachingProxy = self.__caching_proxy
+
+        class RequestHandler(BaseHTTPRequestHandler):
+
+            def do_GET(self) -> None:
+
+                proxy_response : ProxyResponse = caching_proxy.get(path = self.path)
+
+                self.send_response(proxy_response.status)
+                self.send_header("Content-Type", proxy_response.content_type)
+                self.send_header("Content-Length", str(len(proxy_response.body)))
+                self.send_header("X-Cache", "HIT" if proxy_response.is_hit else "MISS")
+                self.end_headers()
+                self.wfile.write(proxy_response.body)
+            def log_message(self, format : str, *args : Any) -> None:
+                pass
+
+        with ThreadingHTTPServer((self.__host, self.__port), RequestHandler) as server:
+
+            self.__port = server.server_address[1]
+            self.__server = server
+            self.__ready.set()
+
+            try:
+                server.serve_forever()
+            finally:
+                self.__server = None
+                self.__ready.clear()
+    def wait_until_ready(self, timeout : Optional[float] = None) -> bool:
+
+        '''Waits until the proxy is accepting connections. Returns False if timeout expires first.'''
+
+        return self.__ready.wait(timeout = timeout)
+    def get_url(self) -> str:
+
+        '''Returns the URL to use as index URL (e.g., http://127.0.0.1:8080).'''
+
+        return f"http://{self.__host}:{self.__port}"
+    def shutdown(self) -> None:
+
+        '''Stops serve_forever(). It must be called from another thread.'''
+
+        if self.__server is not None:
+            self.__server.shutdown()
 class CLIManager():
 
     '''Collects all the logic related to the CLI management.'''
@@ -338,22 +1105,216 @@ class CLIManager():
     __requirement_checker : RequirementChecker
     __tw_manager : TerminalWindowManager
     __logging_function : Callable[[str], None]
+    __cached_requirement_checker_function : Callable[[Optional[str], bool, Optional[list[str]], Optional[list[str]], Optional[list[str]]], RequirementChecker]
+    __snapshot_import_function : Callable[[str, str], int]
+    __release_cache_function : Callable[[str], FileReleaseCache]
+    __daemon_client : DaemonClient
+    __daemon_manager_function : Callable[[Callable[[str], None]], "CLIManager"]
+    __daemon_server_function : Callable[[str, Callable[[Namespace], list[str]]], DaemonServer]
+    __proxy_server_function : Callable[[str, int, str, str, float], ProxyServer]
+
+    @staticmethod
+    def get_negative_cache_path(cache_dir : str) -> str:
+
+        """Returns the path of the negative cache kept next to the persistent cache in cache_dir."""
+
+        return os.path.join(cache_dir, "negative.json")
+
+    @staticmethod
+    def default_cached_requirement_checker_function(
+            cache_dir : Optional[str], 
+            offline : bool, 
+            allowed : Optional[list[str]], 
+            denied : Optional[list[str]], 
+            index_urls : Optional[list[str]]) -> RequirementChecker:
+
+        """
+            Creates a RequirementChecker that fetches only the packages allowed by allowed and denied from index_urls (or the default index). 
+            
+            If cache_dir is provided, its releases and the packages missing from the index are cached there. If offline is True, it never performs network calls.
+        """
+
+        release_fetcher : PyPiReleaseFetcher = PyPiReleaseFetcher(
+            index_urls = index_urls,
+            negative_cache = NegativeCache(file_path = None if cache_dir is None else CLIManager.get_negative_cache_path(cache_dir = cache_dir)),
+            package_filter = PackageFilter(allowed = allowed, denied = denied),
+            release_cache = None if cache_dir is None else FileReleaseCache(cache_dir = cache_dir)
+        )
+
+        return RequirementChecker(release_fetcher = release_fetcher, offline = offline)
+
+    @staticmethod
+    def __copy_snapshot(snapshot_path : str, release_cache : ReleaseCache) -> int:
+
+        """Copies the entries of the snapshot in snapshot_path to release_cache and returns how many they are."""
+
+        snapshot : SnapshotReleaseCache = SnapshotReleaseCache(file_path = snapshot_path)
+
+        try:
+            return snapshot.copy_to(release_cache = release_cache)
+        finally:
+            snapshot.close()
+
+    @staticmethod
+    def default_snapshot_import_function(snapshot_path : str, cache_dir : str) -> int:
+
+        """Copies the entries of the snapshot in snapshot_path to the persistent cache in cache_dir and returns how many they are."""
+
+        return CLIManager.__copy_snapshot(snapshot_path = snapshot_path, release_cache = FileReleaseCache(cache_dir = cache_dir))
+
+    @staticmethod
+    def default_release_cache_function(cache_dir : str) -> FileReleaseCache:
+
+        """Opens the persistent cache in cache_dir."""
+
+        return FileReleaseCache(cache_dir = cache_dir)
+
+    @staticmethod
+    def default_daemon_manager_function(logging_function : Callable[[str], None]) -> "CLIManager":
+
+        """
+            Creates the CLIManager used by the daemon. 
+            
+            Its checkers share pooled connections and keep their release and summary caches in memory between requests. 
+            The checkers for --cache_dir, --offline, --allow, --deny and --index_url are created once per combination and then reused.
+            The persistent caches are opened once per --cache_dir and shared by the checkers and the "cache" and "snapshot import" commands.
+        """
+
+        get_function : Callable[[str], Any] = LambdaCollection.pooled_get_function()
+        cached_requirement_checkers : dict[Tuple[Optional[str], bool, Optional[Tuple[str, ...]], Optional[Tuple[str, ...]], Optional[Tuple[str, ...]]], RequirementChecker] = {}
+        release_caches : dict[str, FileReleaseCache] = {}
+
+        def get_release_cache(cache_dir : str) -> FileReleaseCache:
+
+            if cache_dir not in release_caches:
+                release_caches[cache_dir] = FileReleaseCache(cache_dir = cache_dir)
+
+            return release_caches[cache_dir]
+
+        def import_snapshot(snapshot_path : str, cache_dir : str) -> int:
+            return CLIManager.__copy_snapshot(snapshot_path = snapshot_path, release_cache = get_release_cache(cache_dir = cache_dir))
+
+        def create_requirement_checker(
+                release_cache : ReleaseCache, 
+                offline : bool, 
+                negative_cache : Optional[NegativeCache] = None, 
+                package_filter : Optional[PackageFilter] = None,
+                index_urls : Optional[list[str]] = None) -> RequirementChecker:
+
+            release_fetcher : PyPiReleaseFetcher = PyPiReleaseFetcher(
+                get_function = get_function,
+                badge_fetcher = PyPiBadgeFetcher(get_function = get_function, index_urls = index_urls),
+                index_urls = index_urls,
+                negative_cache = negative_cache,
+                package_filter = package_filter,
+                release_cache = release_cache
+            )
+
+            return RequirementChecker(release_fetcher = release_fetcher, summary_cache = SummaryCache(), offline = offline)
+
+        def get_cached_requirement_checker(
+                cache_dir : Optional[str], 
+                offline : bool, 
+                allowed : Optional[list[str]], 
+                denied : Optional[list[str]], 
+                index_urls : Optional[list[str]]) -> RequirementChecker:
+
+            key : Tuple[Optional[str], bool, Optional[Tuple[str, ...]], Optional[Tuple[str, ...]], Optional[Tuple[str, ...]]] = (
+                cache_dir, 
+                offline, 
+                None if allowed is None else tuple(allowed), 
+                None if denied is None else tuple(denied),
+                None if index_urls is None else tuple(index_urls)
+            )
+
+            if key not in cached_requirement_checkers:
+                cached_requirement_checkers[key] = create_requirement_checker(
+                    release_cache = InMemoryReleaseCache() if cache_dir is None else get_release_cache(cache_dir = cache_dir), 
+                    offline = offline,
+                    negative_cache = NegativeCache(file_path = None if cache_dir is None else CLIManager.get_negative_cache_path(cache_dir = cache_dir)),
+                    package_filter = PackageFilter(allowed = allowed, denied = denied),
+                    index_urls = index_urls
+                )
+
+            return cached_requirement_checkers[key]
+
+        return CLIManager(
+            requirement_checker = create_requirement_checker(release_cache = InMemoryReleaseCache(), offline = False),
+            logging_function = logging_function,
+            cached_requirement_checker_function = get_cached_requirement_checker,
+            snapshot_import_function = import_snapshot,
+            release_cache_function = get_release_cache
+        )
+
+    @staticmethod
+    def default_daemon_server_function(socket_path : str, dispatch_function : Callable[[Namespace], list[str]]) -> DaemonServer:
+
+        """Creates a DaemonServer listening on socket_path."""
+
+        return DaemonServer(socket_path = socket_path, dispatch_function = dispatch_function)
+
+    @staticmethod
+    def default_proxy_server_function(host : str, port : int, upstream_url : str, cache_dir : str, rate_limit : float) -> ProxyServer:
+
+        """Creates a ProxyServer on host:port, which caches the responses of upstream_url in cache_dir."""
+
+        caching_proxy : CachingProxy = CachingProxy(upstream_url = upstream_url, cache_dir = cache_dir, rate_limiter = RateLimiter(rate = rate_limit))
+
+        return ProxyServer(caching_proxy = caching_proxy, host = host, port = port)
 
     def __init__(
         self, 
         ap_factory : APFactory = APFactory(), 
         ascii_banner_manager : AsciiBannerManager = AsciiBannerManager(),
         runtime_checker : RuntimeChecker = RuntimeChecker(),
-        requirement_checker : RequirementChecker = RequirementChecker(),
+        requirement_checker : Optional[RequirementChecker] = None,
         tw_manager : TerminalWindowManager = TerminalWindowManager(),
-        logging_function : Callable[[str], None] = LambdaCollection.logging_function()) -> None:
+        logging_function : Callable[[str], None] = LambdaCollection.logging_function(),
+        cached_requirement_checker_function : Optional[Callable[[Optional[str], bool, Optional[list[str]], Optional[list[str]], Optional[list[str]]], RequirementChecker]] = None,
+        snapshot_import_function : Optional[Callable[[str, str], int]] = None,
+        release_cache_function : Optional[Callable[[str], FileReleaseCache]] = None,
+        daemon_client : Optional[DaemonClient] = None,
+        daemon_manager_function : Optional[Callable[[Callable[[str], None]], "CLIManager"]] = None,
+        daemon_server_function : Optional[Callable[[str, Callable[[Namespace], list[str]]], DaemonServer]] = None,
+        proxy_server_function : Optional[Callable[[str, int, str, str, float], ProxyServer]] = None) -> None:
+
+        if requirement_checker is None:
+            requirement_checker = RequirementChecker()
         
+        if cached_requirement_checker_function is None:
+            cached_requirement_checker_function = self.default_cached_requirement_checker_function
+
+        if snapshot_import_function is None:
+            snapshot_import_function = self.default_snapshot_import_function
+
+        if release_cache_function is None:
+            release_cache_function = self.default_release_cache_function
+
+        if daemon_client is None:
+            daemon_client = DaemonClient()
+
+        if daemon_manager_function is None:
+            daemon_manager_function = self.default_daemon_manager_function
+
+        if daemon_server_function is None:
+            daemon_server_function = self.default_daemon_server_function
+
+        if proxy_server_function is None:
+            proxy_server_function = self.default_proxy_server_function
+
         self.__ap_factory = ap_factory
         self.__ascii_banner_manager = ascii_banner_manager
         self.__runtime_checker = runtime_checker
         self.__requirement_checker = requirement_checker
         self.__tw_manager = tw_manager
         self.__logging_function = logging_function
+        self.__cached_requirement_checker_function = cached_requirement_checker_function
+        self.__snapshot_import_function = snapshot_import_function
+        self.__release_cache_function = release_cache_function
+        self.__daemon_client = daemon_client
+        self.__daemon_manager_function = daemon_manager_function
+        self.__daemon_server_function = daemon_server_function
+        self.__proxy_server_function = proxy_server_function
 
     def __log_ascii_banner(self) -> None:
 
@@ -372,7 +1333,168 @@ class CLIManager():
             self.__logging_function(f"{key}: '{value}'")
             
         self.__logging_function("")
+    def __get_requirement_checker(
+            self, 
+            cache_dir : Optional[str], 
+            offline : bool = False, 
+            allowed : Optional[list[str]] = None, 
+            denied : Optional[list[str]] = None,
+            index_urls : Optional[list[str]] = None) -> RequirementChecker:
+
+        '''
+            Returns the injected RequirementChecker or, if cache_dir, offline, allowed, denied or index_urls are provided, one that caches its releases 
+            in cache_dir (if any) and fetches only the allowed packages from index_urls (if any).
 
+            When offline is True and cache_dir isn't provided, the default cache directory is used.
+        '''
+
+        if cache_dir is None and not offline and allowed is None and denied is None and index_urls is None:
+            return self.__requirement_checker
+
+        if cache_dir is None and offline:
+            cache_dir = DEFAULT.CACHE_DIR
+
+        return self.__cached_requirement_checker_function(cache_dir, offline, allowed, denied, index_urls)
+
+    def __get_journal_path(self, file_path : str, journal_path : Optional[str], resume : bool) -> Optional[str]:
+
+        '''
+            Returns journal_path or, if it's not provided and resume is True, a path in DEFAULT.JOURNAL_DIR named after the absolute path of file_path.
+
+            If neither is provided, no journal is kept.
+        '''
+
+        if journal_path is not None or not resume:
+            return journal_path
+
+        name : str = hashlib.sha256(os.path.abspath(file_path).encode("utf-8")).hexdigest()[:16]
+
+        return os.path.join(DEFAULT.JOURNAL_DIR, f"{name}.jsonl")
+    def __is_forwardable(self, args : Namespace) -> bool:
+
+        '''
+            Returns True if args can be handled by a running daemon. 
+            
+            "runtime" checks the runtime of the calling process and "--watch" runs until it's interrupted, so they always run locally.
+        '''
+
+        if args.command == CLISTRING.COMMAND_REQUIREMENTS_NAME and args.watch:
+            return False
+
+        return args.command not in [CLISTRING.COMMAND_RUNTIME_NAME, CLISTRING.COMMAND_SERVE_NAME, CLISTRING.COMMAND_PROXY_NAME]
+    def __serve(self, socket_path : str) -> None:
+
+        '''Runs the daemon on socket_path until it's interrupted.'''
+
+        messages : list[str] = []
+        daemon_manager : CLIManager = self.__daemon_manager_function(messages.append)
+
+        def dispatch(args : Namespace) -> list[str]:
+
+            messages.clear()
+
+            try:
+                daemon_manager.dispatch(args = args)
+            except Exception as e:
+                messages.append(str(e))
+
+            return list(messages)
+
+        daemon_server : DaemonServer = self.__daemon_server_function(socket_path, dispatch)
+        self.__logging_function(_MessageCollection.daemon_listening(socket_path = socket_path))
+
+        try:
+            daemon_server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+        self.__logging_function(_MessageCollection.daemon_stopped(socket_path = socket_path))
+    def __run_proxy(self, host : str, port : int, upstream_url : str, cache_dir : str, rate_limit : float) -> None:
+
+        '''Runs the caching proxy until it's interrupted.'''
+
+        proxy_server : ProxyServer = self.__proxy_server_function(host, port, upstream_url, cache_dir, rate_limit)
+        self.__logging_function(_MessageCollection.proxy_listening(url = proxy_server.get_url(), upstream_url = upstream_url))
+
+        try:
+            proxy_server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+        self.__logging_function(_MessageCollection.proxy_stopped(url = proxy_server.get_url()))
+
+    def dispatch(self, args : Namespace) -> None:
+
+        '''Dispatches the already parsed args to the appropriate checker. Exceptions are propagated to the caller.'''
+
+        if args.command == CLISTRING.COMMAND_RUNTIME_NAME:
+            status : str = self.__runtime_checker.try_get_status(required = args.required)
+            self.__logging_function(status)
+        
+        elif args.command == CLISTRING.COMMAND_REQUIREMENTS_NAME and args.watch:
+            try:
+                self.__get_requirement_checker(cache_dir = args.cache_dir, offline = args.offline, allowed = args.allowed, denied = args.denied, index_urls = args.index_urls).watch(
+                    file_path = args.file_path,
+                    logging_function = self.__logging_function,
+                    only_stable_releases = args.only_stable_releases,
+                    waiting_time = args.waiting_time,
+                    deadline = args.deadline)
+            except KeyboardInterrupt:
+                pass
+
+        elif args.command == CLISTRING.COMMAND_REQUIREMENTS_NAME and args.baseline_path is not None:
+            status = self.__get_requirement_checker(cache_dir = args.cache_dir, offline = args.offline, allowed = args.allowed, denied = args.denied, index_urls = args.index_urls).try_get_baseline_status(
+                file_path = args.file_path,
+                baseline_path = args.baseline_path,
+                freshness = args.freshness,
+                only_stable_releases = args.only_stable_releases,
+                waiting_time = args.waiting_time,
+                deadline = args.deadline)
+            self.__logging_function(status)
+
+        elif args.command == CLISTRING.COMMAND_REQUIREMENTS_NAME:
+            status = self.__get_requirement_checker(cache_dir = args.cache_dir, offline = args.offline, allowed = args.allowed, denied = args.denied, index_urls = args.index_urls).try_get_status(
+                file_path = args.file_path,
+                only_stable_releases = args.only_stable_releases,
+                waiting_time = args.waiting_time,
+                deadline = args.deadline,
+                journal_path = self.__get_journal_path(file_path = args.file_path, journal_path = args.journal_path, resume = args.resume),
+                resume = args.resume)
+            self.__logging_function(status)
+
+        elif args.command == CLISTRING.COMMAND_WARM_NAME:
+            status = self.__get_requirement_checker(cache_dir = args.cache_dir, allowed = args.allowed, denied = args.denied, index_urls = args.index_urls).try_warm(
+                file_paths = args.file_paths,
+                only_stable_releases = args.only_stable_releases,
+                waiting_time = args.waiting_time,
+                deadline = args.deadline)
+            self.__logging_function(status)
+
+        elif args.command == CLISTRING.COMMAND_SNAPSHOT_NAME and args.subcommand == CLISTRING.SUBCOMMAND_EXPORT_NAME:
+            status = self.__get_requirement_checker(cache_dir = args.cache_dir, allowed = args.allowed, denied = args.denied, index_urls = args.index_urls).try_export_snapshot(
+                file_paths = args.file_paths,
+                snapshot_path = args.snapshot_path,
+                only_stable_releases = args.only_stable_releases,
+                waiting_time = args.waiting_time,
+                deadline = args.deadline)
+            self.__logging_function(status)
+
+        elif args.command == CLISTRING.COMMAND_SNAPSHOT_NAME and args.subcommand == CLISTRING.SUBCOMMAND_IMPORT_NAME:
+            entries : int = self.__snapshot_import_function(args.snapshot_path, args.cache_dir)
+            self.__logging_function(_MessageCollection.snapshot_imported(snapshot_path = args.snapshot_path, cache_dir = args.cache_dir, entries = entries))
+
+        elif args.command == CLISTRING.COMMAND_CACHE_NAME and args.subcommand == CLISTRING.SUBCOMMAND_STATS_NAME:
+            status = str(self.__release_cache_function(args.cache_dir).get_stats())
+            self.__logging_function(status)
+
+        elif args.command == CLISTRING.COMMAND_CACHE_NAME and args.subcommand == CLISTRING.SUBCOMMAND_PRUNE_NAME:
+            status = str(self.__release_cache_function(args.cache_dir).prune(max_size = args.max_size))
+            self.__logging_function(status)
+
+        elif args.command == CLISTRING.COMMAND_CACHE_NAME and args.subcommand == CLISTRING.SUBCOMMAND_CLEAR_NAME:
+            self.__release_cache_function(args.cache_dir).clear()
+            NegativeCache(file_path = self.get_negative_cache_path(cache_dir = args.cache_dir)).clear()
+            self.__logging_function(_MessageCollection.cache_cleared(cache_dir = args.cache_dir))
     def parse(self) -> None:
 
         '''
@@ -391,16 +1513,29 @@ class CLIManager():
 
             self.__log_namespace(args)
 
-            if args.command == CLISTRING.COMMAND_RUNTIME_NAME:
-                status : str = self.__runtime_checker.try_get_status(required = args.required)
-                self.__logging_function(status)
-            
-            elif args.command == CLISTRING.COMMAND_REQUIREMENTS_NAME:
-                status = self.__requirement_checker.try_get_status(
-                    file_path = args.file_path,
-                    only_stable_releases = args.only_stable_releases,
-                    waiting_time = args.waiting_time)
-                self.__logging_function(status)
+            if args.command == CLISTRING.COMMAND_SERVE_NAME:
+                self.__serve(socket_path = args.socket_path)
+                return
+
+            if args.command == CLISTRING.COMMAND_PROXY_NAME:
+                self.__run_proxy(
+                    host = args.host, 
+                    port = args.port, 
+                    upstream_url = args.upstream_url, 
+                    cache_dir = args.cache_dir, 
+                    rate_limit = args.rate_limit)
+                return
+
+            messages : Optional[list[str]] = None
+
+            if self.__is_forwardable(args = args):
+                messages = self.__daemon_client.try_send(args = args)
+
+            if messages is None:
+                self.dispatch(args = args)
+            else:
+                for message in messages:
+                    self.__logging_function(message)
             
         except (Exception, SystemExit) as e:
 
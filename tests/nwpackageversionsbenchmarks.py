@@ -0,0 +1,305 @@
+# GLOBAL MODULES
+import multiprocessing
+import os
+import sys
+import tempfile
+from datetime import datetime
+from multiprocessing.sharedctypes import Synchronized
+from threading import Lock
+from time import perf_counter, sleep
+from typing import Any, Callable, Optional, Tuple
+from unittest.mock import MagicMock, patch
+
+# LOCAL MODULES
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+from nwpackageversions import Badge, ContentParser, DSession, FSession, LSession, LocalPackageLoader, Package, PipelineSettings
+from nwpackageversions import PyPiReleaseFetcher, RequirementChecker, RequirementSummary
+from nwpackageversions import FileReleaseCache, InMemoryReleaseCache, ReleaseCache, Release
+from nwpackageversions import SnapshotEntry, SnapshotReleaseCache, SnapshotWriter
+
+# CONSTANTS
+PACKAGES : int = 500
+IO_LATENCY : float = 0.005
+XML_ITEMS : int = 200
+HISTORY_RELEASES : int = 2500
+PROCESSES : int = 16
+SHARED_PACKAGES : int = 50
+SNAPSHOT_PACKAGES : int = 10000
+
+# SUPPORT METHODS
+class BusyTracker():
+
+    '''Records the time intervals in which a stage is busy.'''
+
+    __lock : Lock
+    __intervals : list[Tuple[float, float]]
+
+    def __init__(self) -> None:
+
+        self.__lock = Lock()
+        self.__intervals = []
+
+    def track(self, function : Callable[[], object]) -> object:
+
+        '''Calls function and records its busy interval.'''
+
+        start : float = perf_counter()
+
+        try:
+            return function()
+        finally:
+            with self.__lock:
+                self.__intervals.append((start, perf_counter()))
+    def get_merged_intervals(self) -> list[Tuple[float, float]]:
+
+        '''Returns the recorded intervals, merged where they overlap.'''
+
+        merged : list[Tuple[float, float]] = []
+
+        for start, end in sorted(self.__intervals):
+            if len(merged) > 0 and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+
+        return merged
+    def get_busy_time(self) -> float:
+
+        '''Returns the time in which at least one call was running, in seconds.'''
+
+        return sum(end - start for start, end in self.get_merged_intervals())
+    def get_overlap_time(self, other : "BusyTracker") -> float:
+
+        '''Returns the time in which both this tracker and other were busy, in seconds.'''
+
+        mine : list[Tuple[float, float]] = self.get_merged_intervals()
+        theirs : list[Tuple[float, float]] = other.get_merged_intervals()
+        overlap : float = 0.0
+        i : int = 0
+        j : int = 0
+
+        while i < len(mine) and j < len(theirs):
+            overlap += max(0.0, min(mine[i][1], theirs[j][1]) - max(mine[i][0], theirs[j][0]))
+            if mine[i][1] < theirs[j][1]:
+                i += 1
+            else:
+                j += 1
+
+        return overlap
+def create_releases_content(package_name : str) -> str:
+
+    '''Creates a releases.xml feed with XML_ITEMS items.'''
+
+    items : str = "".join(
+        "<item>"
+        f"<title>1.0.{i}</title>"
+        f"<link>https://pypi.org/project/{package_name}/1.0.{i}/</link>"
+        "<description>A description.</description>"
+        "<author>author@example.com</author>"
+        "<pubDate>Wed, 10 Apr 2024 19:44:10 GMT</pubDate>"
+        "</item>"
+        for i in range(XML_ITEMS)
+    )
+
+    return f"<?xml version=\"1.0\" encoding=\"UTF-8\"?><rss version=\"2.0\"><channel>{items}</channel></rss>"
+def create_release_fetcher(download_tracker : BusyTracker, parse_tracker : BusyTracker) -> MagicMock:
+
+    '''
+        Simulates PyPi.org: download sleeps for IO_LATENCY seconds, parse performs real XML parsing.
+
+        When parsing happens in worker processes, parse_tracker only sees the time spent in the main process.
+    '''
+
+    real_fetcher : PyPiReleaseFetcher = PyPiReleaseFetcher()
+
+    def download(package_name : str, only_stable_releases : bool) -> DSession:
+
+        def function() -> DSession:
+            sleep(IO_LATENCY)
+            return DSession(
+                package_name = package_name,
+                only_stable_releases = only_stable_releases,
+                url = f"https://pypi.org/rss/project/{package_name}/releases.xml",
+                releases_content = create_releases_content(package_name = package_name),
+                history_content = None)
+
+        return download_tracker.track(function = function)   # type: ignore
+    def parse(d_session : DSession) -> FSession:
+        return parse_tracker.track(function = lambda : real_fetcher.parse(d_session = d_session))   # type: ignore
+
+    release_fetcher : MagicMock = MagicMock(spec = PyPiReleaseFetcher)
+    release_fetcher.download.side_effect = download
+    release_fetcher.parse.side_effect = parse
+    release_fetcher.try_get_cached.return_value = None
+    release_fetcher.create_fsession.side_effect = lambda p_session : parse_tracker.track(function = lambda : real_fetcher.create_fsession(p_session = p_session))
+    release_fetcher.fetch.side_effect = lambda package_name, only_stable_releases : parse(download(package_name, only_stable_releases))
+
+    return release_fetcher
+def run(pipeline_settings : Optional[PipelineSettings]) -> None:
+
+    '''Checks PACKAGES simulated packages and prints the elapsed time and how much parsing overlapped with network I/O.'''
+
+    packages : list[Package] = [Package(name = f"package{i}", version = "1.0.0") for i in range(PACKAGES)]
+    package_loader : MagicMock = MagicMock(spec = LocalPackageLoader)
+    package_loader.load.return_value = LSession(packages = packages, unparsed_lines = [])
+
+    download_tracker : BusyTracker = BusyTracker()
+    parse_tracker : BusyTracker = BusyTracker()
+
+    requirement_checker : RequirementChecker = RequirementChecker(
+        package_loader = package_loader,
+        release_fetcher = create_release_fetcher(download_tracker = download_tracker, parse_tracker = parse_tracker),
+        sleeping_function = lambda x : None,
+        pipeline_settings = pipeline_settings
+    )
+
+    start : float = perf_counter()
+
+    with patch("os.path.isfile", return_value = True):
+        summary : RequirementSummary = requirement_checker.get_summary(file_path = "requirements.txt", only_stable_releases = False, waiting_time = 5)
+
+    elapsed : float = perf_counter() - start
+    label : str = "sequential" if pipeline_settings is None else f"pipeline {pipeline_settings}"
+
+    print(
+        f"{label}: "
+        f"elapsed: {elapsed:.2f}s, "
+        f"io busy: {download_tracker.get_busy_time():.2f}s, "
+        f"cpu busy: {parse_tracker.get_busy_time():.2f}s, "
+        f"overlap: {download_tracker.get_overlap_time(other = parse_tracker):.2f}s, "
+        f"matching: {summary.matching}/{summary.total_packages}"
+    )
+def create_history_content(releases : int) -> bytes:
+
+    '''Creates a #history page: the five newest releases and every fourth older release are badged.'''
+
+    paragraphs : list[str] = []
+
+    for i in range(releases):
+        badge : str = '<span class="badge badge--warning">pre-release</span>' if i < 5 or i % 4 == 0 else ""
+        paragraphs.append(
+            f'<div class="release"><a class="card release__card" href="/project/acme/{releases - i}.0.0/">'
+            f'<p class="release__version">{releases - i}.0.0{badge}</p>'
+            f'<p class="release__version-date"><time datetime="2024-01-01T00:00:00+0000">Jan 1, 2024</time></p>'
+            '</a></div>'
+        )
+
+    return f'<html><body><div class="release-timeline">{"".join(paragraphs)}</div></body></html>'.encode()
+def measure(function : Callable[[], object], repetitions : int = 20) -> float:
+
+    '''Returns the average duration of function, in milliseconds.'''
+
+    start : float = perf_counter()
+
+    for _ in range(repetitions):
+        function()
+
+    return (perf_counter() - start) / repetitions * 1000
+def run_badges(releases : int = HISTORY_RELEASES) -> None:
+
+    '''Compares full badge extraction with the early stop and list-based with set-based badge lookups on a package with many releases.'''
+
+    content : bytes = create_history_content(releases = releases)
+    full_parser : ContentParser = ContentParser()
+    early_parser : ContentParser = ContentParser(stop_at_first_unbadged = True)
+
+    badges : list[Badge] = full_parser.parse_badges(package_name = "acme", content = content) or []
+    titles : list[str] = [f"{releases - i}.0.0" for i in range(releases)]
+    badge_list : list[str] = [badge.version for badge in badges]
+    badge_set : set[str] = set(badge_list)
+
+    print(
+        f"badges ({releases} releases, {len(badges)} badges): "
+        f"full extraction: {measure(lambda : full_parser.parse_badges(package_name = 'acme', content = content)):.2f}ms, "
+        f"early stop: {measure(lambda : early_parser.parse_badges(package_name = 'acme', content = content)):.2f}ms, "
+        f"list lookup: {measure(lambda : [title for title in titles if title not in badge_list]):.2f}ms, "
+        f"set lookup: {measure(lambda : [title for title in titles if title not in badge_set]):.2f}ms"
+    )
+def fetch_all(cache_dir : Optional[str], downloads : Synchronized) -> None:
+
+    '''Fetches SHARED_PACKAGES packages like a CI job would do, counting the simulated downloads in downloads.'''
+
+    def get_function(url : str) -> MagicMock:
+        with downloads.get_lock():
+            downloads.value += 1
+        sleep(IO_LATENCY * 4)
+        response : MagicMock = MagicMock()
+        response.text = create_releases_content(package_name = url.split("/")[-2])
+        return response
+
+    release_cache : ReleaseCache = InMemoryReleaseCache() if cache_dir is None else FileReleaseCache(cache_dir = cache_dir)
+    release_fetcher : PyPiReleaseFetcher = PyPiReleaseFetcher(get_function = get_function, release_cache = release_cache)
+
+    for i in range(SHARED_PACKAGES):
+        release_fetcher.fetch(package_name = f"package{i}", only_stable_releases = False)
+def run_file_cache() -> None:
+
+    '''Runs PROCESSES concurrent "CI jobs" over the same packages, with a private in-memory cache each and with a shared cache directory.'''
+
+    context : Any = multiprocessing.get_context("fork")
+
+    for label in ["in-memory", "shared directory"]:
+        with tempfile.TemporaryDirectory() as temporary_directory:
+
+            cache_dir : Optional[str] = None if label == "in-memory" else temporary_directory
+            downloads : Synchronized = context.Value("i", 0)
+            processes : list[Any] = [context.Process(target = fetch_all, args = (cache_dir, downloads)) for _ in range(PROCESSES)]
+
+            start : float = perf_counter()
+
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
+
+            print(
+                f"file cache ({PROCESSES} processes x {SHARED_PACKAGES} packages, {label}): "
+                f"elapsed: {perf_counter() - start:.2f}s, "
+                f"downloads: {downloads.value}, "
+                f"failed processes: {sum(1 for process in processes if process.exitcode != 0)}"
+            )
+def run_snapshot(packages : int = SNAPSHOT_PACKAGES) -> None:
+
+    '''Measures how long it takes to open a snapshot with many packages and to look one of them up.'''
+
+    def create_f_session(package_name : str) -> FSession:
+        releases : list[Release] = [Release(package_name = package_name, version = f"1.0.{i}", date = datetime(2024, 1, 1)) for i in range(20)]
+        return FSession(package_name = package_name, most_recent_release = releases[0], releases = releases, xml_items = [], badges = None)
+
+    snapshot_entries : list[SnapshotEntry] = [
+        SnapshotEntry(package_name = f"package{i}", only_stable_releases = True, fetched_at = 0.0, f_session = create_f_session(package_name = f"package{i}"))
+        for i in range(packages)
+    ]
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+
+        snapshot_path : str = os.path.join(temporary_directory, "deps.snap")
+
+        start : float = perf_counter()
+        SnapshotWriter().write(file_path = snapshot_path, snapshot_entries = snapshot_entries)
+        write_time : float = perf_counter() - start
+
+        def open_and_close() -> None:
+            SnapshotReleaseCache(file_path = snapshot_path).close()
+
+        snapshot : SnapshotReleaseCache = SnapshotReleaseCache(file_path = snapshot_path)
+
+        print(
+            f"snapshot ({packages} packages, {os.path.getsize(snapshot_path) / 1024 / 1024:.1f}MiB): "
+            f"write: {write_time:.2f}s, "
+            f"open: {measure(open_and_close):.3f}ms, "
+            f"lookup: {measure(lambda : snapshot.try_get(package_name = f'package{packages // 2}', only_stable_releases = True)):.3f}ms, "
+            f"copy to memory: {measure(lambda : snapshot.copy_to(release_cache = InMemoryReleaseCache()), repetitions = 1):.0f}ms"
+        )
+
+        snapshot.close()
+
+# MAIN
+if __name__ == "__main__":
+    run(pipeline_settings = None)
+    run(pipeline_settings = PipelineSettings())
+    run(pipeline_settings = PipelineSettings(fetch_workers = 16, parse_workers = 2, queue_size = 64))
+    run(pipeline_settings = PipelineSettings(fetch_workers = 16, parse_workers = 4, queue_size = 64, parse_in_processes = True))
+    run_badges()
+    run_file_cache()
+    run_snapshot()
@@ -1,17 +1,24 @@
 # GLOBAL MODULES
+import requests
+import tempfile
 import unittest
 from argparse import ArgumentParser, ArgumentTypeError, Namespace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from io import StringIO
 from parameterized import parameterized
 from subprocess import CompletedProcess
-from typing import Any, Optional, Tuple
+from threading import Event, Lock, Thread
+from time import sleep
+from typing import Any, Callable, Optional, Tuple
 from unittest.mock import MagicMock, Mock, patch
 
 # LOCAL MODULES
 import sys, os
 sys.path.append(os.path.dirname(__file__).replace('tests', 'src'))
-from nwpackageversions import RequirementChecker, RuntimeChecker
+from nwpackageversions import RequirementChecker, RuntimeChecker, DEFAULT, FileReleaseCache, CacheStats, PruneSummary
+from nwpackageversions import CachingProxy, FSession, PyPiBadgeFetcher, PyPiReleaseFetcher, RateLimiter, NegativeCache
 from nwpackageversionscli import CLISTRING, APFactory, AsciiBannerManager, _MessageCollection, CLIManager, CLIValidator, TerminalWindowManager
+from nwpackageversionscli import DaemonClient, DaemonServer, ProxyServer
 
 # SUPPORT METHODS
 # TEST CLASSES
@@ -329,6 +336,41 @@ class CLIValidatorTestCase(unittest.TestCase):
             validator.validate_required(required = required)
 
         self.assertEqual(str(context.exception), expected)
+
+    @parameterized.expand([
+        ["512", 512],
+        ["512B", 512],
+        ["64KB", 64 * 1024],
+        ["200MB", 200 * 1024 ** 2],
+        ["200mb", 200 * 1024 ** 2],
+        ["2G", 2 * 1024 ** 3]
+    ])
+    def test_validatesize_shouldreturnbytes_whensizestringisvalid(self, size : str, expected : int) -> None:
+
+        # Arrange
+        # Act
+        actual : int = CLIValidator().validate_size(size = size)
+
+        # Assert
+        self.assertEqual(actual, expected)
+
+    @parameterized.expand([
+        ["MB"],
+        ["-1MB"],
+        ["1.5GB"],
+        ["200TB"]
+    ])
+    def test_validatesize_shouldraiseargumenttypeerror_whensizestringisinvalid(self, size : str) -> None:
+
+        # Arrange
+        validator : CLIValidator = CLIValidator()
+        expected : str = _MessageCollection.provided_size_not_valid(size)
+
+        # Act / Assert
+        with self.assertRaises(ArgumentTypeError) as context:
+            validator.validate_size(size = size)
+
+        self.assertEqual(str(context.exception), expected)
 class APFactoryTestCase(unittest.TestCase):
 
     def test_create_shouldreturnargumentparserwithruntimecommand_wheninvoked(self):
@@ -366,6 +408,123 @@ class APFactoryTestCase(unittest.TestCase):
         self.assertEqual(actual.file_path, file_path)
         self.assertEqual(actual.only_stable_releases, CLISTRING.OPTION_ONLYSTABLERELEASES_DEFAULT)
         self.assertEqual(actual.waiting_time, CLISTRING.OPTION_WAITINGTIME_DEFAULT)
+        self.assertEqual(actual.deadline, CLISTRING.OPTION_DEADLINE_DEFAULT)
+        self.assertIsNone(actual.cache_dir)
+        self.assertFalse(actual.offline)
+        self.assertFalse(actual.watch)
+        self.assertIsNone(actual.baseline_path)
+        self.assertEqual(actual.freshness, DEFAULT.BASELINE_FRESHNESS)
+        self.assertIsNone(actual.journal_path)
+        self.assertFalse(actual.resume)
+        self.assertIsNone(actual.allowed)
+        self.assertIsNone(actual.denied)
+        self.assertIsNone(actual.index_urls)
+    @parameterized.expand([
+        [[CLISTRING.COMMAND_REQUIREMENTS_NAME, "--file_path", "requirements.txt"]],
+        [[CLISTRING.COMMAND_WARM_NAME, "--file_path", "requirements.txt"]],
+        [[CLISTRING.COMMAND_SNAPSHOT_NAME, CLISTRING.SUBCOMMAND_EXPORT_NAME, "--file_path", "requirements.txt", "--out", "deps.snap"]]
+    ])
+    def test_create_shouldparsefetcheroptions_whenprovided(self, args_list : list[str]):
+
+        # Arrange
+        ap_factory : APFactory = APFactory()
+        fetcher_args : list[str] = ["--allow", "requests", "numpy*", "--deny", "acme-*", "--index_url", "http://proxy.internal:8080", "https://pypi.org"]
+
+        # Act
+        argument_parser : ArgumentParser = ap_factory.create()
+        actual : Namespace = argument_parser.parse_args(args_list + fetcher_args)
+
+        # Assert
+        self.assertEqual(actual.allowed, ["requests", "numpy*"])
+        self.assertEqual(actual.denied, ["acme-*"])
+        self.assertEqual(actual.index_urls, ["http://proxy.internal:8080", "https://pypi.org"])
+    def test_create_shouldreturnargumentparserwithwarmcommandanddefaultvalues_wheninvoked(self):
+
+        # Arrange
+        ap_factory : APFactory = APFactory()
+        args_list : list[str] = [CLISTRING.COMMAND_WARM_NAME, "--file_path", "requirements.txt", "Dockerfile"]
+
+        # Act
+        argument_parser : ArgumentParser = ap_factory.create()
+        actual : Namespace = argument_parser.parse_args(args_list)
+
+        # Assert
+        self.assertEqual(actual.command, CLISTRING.COMMAND_WARM_NAME)
+        self.assertEqual(actual.file_paths, ["requirements.txt", "Dockerfile"])
+        self.assertEqual(actual.waiting_time, CLISTRING.OPTION_WAITINGTIME_DEFAULT)
+        self.assertEqual(actual.deadline, CLISTRING.OPTION_DEADLINE_DEFAULT)
+        self.assertEqual(actual.cache_dir, DEFAULT.CACHE_DIR)
+    @parameterized.expand([
+        [[CLISTRING.COMMAND_SNAPSHOT_NAME, CLISTRING.SUBCOMMAND_EXPORT_NAME, "--file_path", "requirements.txt", "Dockerfile", "--out", "deps.snap"], CLISTRING.SUBCOMMAND_EXPORT_NAME],
+        [[CLISTRING.COMMAND_SNAPSHOT_NAME, CLISTRING.SUBCOMMAND_IMPORT_NAME, "--in", "deps.snap"], CLISTRING.SUBCOMMAND_IMPORT_NAME]
+    ])
+    def test_create_shouldreturnargumentparserwithsnapshotcommand_wheninvoked(self, args_list : list[str], subcommand : str):
+
+        # Arrange
+        ap_factory : APFactory = APFactory()
+
+        # Act
+        argument_parser : ArgumentParser = ap_factory.create()
+        actual : Namespace = argument_parser.parse_args(args_list)
+
+        # Assert
+        self.assertEqual(actual.command, CLISTRING.COMMAND_SNAPSHOT_NAME)
+        self.assertEqual(actual.subcommand, subcommand)
+        self.assertEqual(actual.snapshot_path, "deps.snap")
+        self.assertEqual(actual.cache_dir, DEFAULT.CACHE_DIR)
+
+    def test_create_shouldreturnargumentparserwithproxycommandanddefaultvalues_wheninvoked(self):
+
+        # Arrange
+        ap_factory : APFactory = APFactory()
+
+        # Act
+        argument_parser : ArgumentParser = ap_factory.create()
+        actual : Namespace = argument_parser.parse_args([CLISTRING.COMMAND_PROXY_NAME])
+
+        # Assert
+        self.assertEqual(actual.command, CLISTRING.COMMAND_PROXY_NAME)
+        self.assertEqual(actual.host, CLISTRING.OPTION_HOST_DEFAULT)
+        self.assertEqual(actual.port, CLISTRING.OPTION_PORT_DEFAULT)
+        self.assertEqual(actual.upstream_url, DEFAULT.INDEX_URL)
+        self.assertEqual(actual.rate_limit, DEFAULT.PROXY_RATE_LIMIT)
+        self.assertEqual(actual.cache_dir, DEFAULT.CACHE_DIR)
+
+    @parameterized.expand([
+        [[CLISTRING.COMMAND_CACHE_NAME, CLISTRING.SUBCOMMAND_STATS_NAME], CLISTRING.SUBCOMMAND_STATS_NAME],
+        [[CLISTRING.COMMAND_CACHE_NAME, CLISTRING.SUBCOMMAND_CLEAR_NAME], CLISTRING.SUBCOMMAND_CLEAR_NAME]
+    ])
+    def test_create_shouldreturnargumentparserwithcachecommand_wheninvoked(self, args_list : list[str], subcommand : str):
+
+        # Arrange
+        ap_factory : APFactory = APFactory()
+
+        # Act
+        argument_parser : ArgumentParser = ap_factory.create()
+        actual : Namespace = argument_parser.parse_args(args_list)
+
+        # Assert
+        self.assertEqual(actual.command, CLISTRING.COMMAND_CACHE_NAME)
+        self.assertEqual(actual.subcommand, subcommand)
+        self.assertEqual(actual.cache_dir, DEFAULT.CACHE_DIR)
+
+    @parameterized.expand([
+        [[CLISTRING.COMMAND_CACHE_NAME, CLISTRING.SUBCOMMAND_PRUNE_NAME], None],
+        [[CLISTRING.COMMAND_CACHE_NAME, CLISTRING.SUBCOMMAND_PRUNE_NAME, "--max_size", "200MB"], 200 * 1024 ** 2],
+        [[CLISTRING.COMMAND_CACHE_NAME, CLISTRING.SUBCOMMAND_PRUNE_NAME, "--max-size", "1GB"], 1024 ** 3]
+    ])
+    def test_create_shouldreturnargumentparserwithcacheprunecommand_wheninvoked(self, args_list : list[str], expected : Optional[int]):
+
+        # Arrange
+        ap_factory : APFactory = APFactory()
+
+        # Act
+        argument_parser : ArgumentParser = ap_factory.create()
+        actual : Namespace = argument_parser.parse_args(args_list)
+
+        # Assert
+        self.assertEqual(actual.subcommand, CLISTRING.SUBCOMMAND_PRUNE_NAME)
+        self.assertEqual(actual.max_size, expected)
     def test_create_shouldraiseerror_whenrequiredruntimeargumentismissing(self):
 
         # Arrange
@@ -415,7 +574,17 @@ class CLIManagerTestCase(unittest.TestCase):
             command = CLISTRING.COMMAND_REQUIREMENTS_NAME, 
             file_path = "C:/Dockerfile", 
             only_stable_releases = True, 
-            waiting_time = 5
+            waiting_time = 5,
+            deadline = 600,
+            cache_dir = None,
+            allowed = None,
+            denied = None,
+            index_urls = None,
+            offline = False,
+            watch = False,
+            baseline_path = None,
+            journal_path = "/tmp/nwpver/journal.jsonl",
+            resume = True
         )
         
         ap_mock : MagicMock = MagicMock(spec = ArgumentParser)
@@ -442,20 +611,176 @@ class CLIManagerTestCase(unittest.TestCase):
         requirement_checker.try_get_status.assert_called_once_with(
             file_path = args.file_path,
             only_stable_releases = args.only_stable_releases,
-            waiting_time = args.waiting_time
+            waiting_time = args.waiting_time,
+            deadline = args.deadline,
+            journal_path = args.journal_path,
+            resume = args.resume
         )
         logging_function.assert_any_call(expected)
-    def test_parse_shouldlogexceptionmessage_whenexceptionisraised(self):
+    @parameterized.expand([
+        [CLISTRING.COMMAND_REQUIREMENTS_NAME, "try_get_status", { "file_path": "requirements.txt", "offline": False, "watch": False, "baseline_path": None, "journal_path": "journal.jsonl", "resume": False }],
+        [CLISTRING.COMMAND_WARM_NAME, "try_warm", { "file_paths": ["requirements.txt", "Dockerfile"] }]
+    ])
+    def test_parse_shoulddispatchtocachedrequirementchecker_whencachedirisprovided(self, command : str, method_name : str, file_args : dict[str, Any]):
 
         # Arrange
-        expected : str = "Unexpected Error"
+        expected : str = "Status"
+        args : Namespace = Namespace(command = command, only_stable_releases = True, waiting_time = 5, deadline = None, cache_dir = "/tmp/nwpver", allowed = None, denied = None, index_urls = None, **file_args)
+        
+        ap_mock : MagicMock = MagicMock(spec = ArgumentParser)
+        ap_mock.parse_args.return_value = args
+        
         ap_factory : MagicMock = MagicMock(spec = APFactory)
-        ap_factory.create.side_effect = Exception(expected)
+        ap_factory.create.return_value = ap_mock
+        
+        requirement_checker : MagicMock = MagicMock(spec = RequirementChecker)
+        cached_requirement_checker : MagicMock = MagicMock(spec = RequirementChecker)
+        getattr(cached_requirement_checker, method_name).return_value = expected
+        cached_requirement_checker_function : MagicMock = MagicMock(return_value = cached_requirement_checker)
         
         logging_function : MagicMock = MagicMock()
         
         cli_manager : CLIManager = CLIManager(
             ap_factory = ap_factory,
+            requirement_checker = requirement_checker,
+            logging_function = logging_function,
+            cached_requirement_checker_function = cached_requirement_checker_function
+        )
+
+        # Act
+        cli_manager.parse()
+
+        # Assert
+        file_args.pop("offline", None)
+        file_args.pop("watch", None)
+        file_args.pop("baseline_path", None)
+        cached_requirement_checker_function.assert_called_once_with("/tmp/nwpver", False, None, None, None)
+        getattr(cached_requirement_checker, method_name).assert_called_once_with(only_stable_releases = True, waiting_time = 5, deadline = None, **file_args)
+        getattr(requirement_checker, method_name).assert_not_called()
+        logging_function.assert_any_call(expected)
+    def test_parse_shouldnotjournal_whenneitherjournalnorresumeisprovided(self):
+
+        # Arrange
+        args : Namespace = Namespace(
+            command = CLISTRING.COMMAND_REQUIREMENTS_NAME,
+            file_path = "requirements.txt",
+            only_stable_releases = True,
+            waiting_time = 5,
+            deadline = None,
+            cache_dir = None,
+            allowed = None,
+            denied = None,
+            index_urls = None,
+            offline = False,
+            watch = False,
+            baseline_path = None,
+            journal_path = None,
+            resume = False
+        )
+
+        ap_mock : MagicMock = MagicMock(spec = ArgumentParser)
+        ap_mock.parse_args.return_value = args
+
+        ap_factory : MagicMock = MagicMock(spec = APFactory)
+        ap_factory.create.return_value = ap_mock
+
+        requirement_checker : MagicMock = MagicMock(spec = RequirementChecker)
+        requirement_checker.try_get_status.return_value = "Status"
+
+        cli_manager : CLIManager = CLIManager(
+            ap_factory = ap_factory,
+            requirement_checker = requirement_checker,
+            logging_function = MagicMock()
+        )
+
+        # Act
+        cli_manager.parse()
+
+        # Assert
+        self.assertIsNone(requirement_checker.try_get_status.call_args.kwargs["journal_path"])
+        self.assertFalse(requirement_checker.try_get_status.call_args.kwargs["resume"])
+    @parameterized.expand([
+        ["requirements.txt"],
+        ["/srv/app/requirements.txt"]
+    ])
+    def test_parse_shouldjournaltodefaultjournaldir_whenresumeisprovidedwithoutjournal(self, file_path : str):
+
+        # Arrange
+        args : Namespace = Namespace(
+            command = CLISTRING.COMMAND_REQUIREMENTS_NAME,
+            file_path = file_path,
+            only_stable_releases = True,
+            waiting_time = 5,
+            deadline = None,
+            cache_dir = None,
+            allowed = None,
+            denied = None,
+            index_urls = None,
+            offline = False,
+            watch = False,
+            baseline_path = None,
+            journal_path = None,
+            resume = True
+        )
+
+        ap_mock : MagicMock = MagicMock(spec = ArgumentParser)
+        ap_mock.parse_args.return_value = args
+
+        ap_factory : MagicMock = MagicMock(spec = APFactory)
+        ap_factory.create.return_value = ap_mock
+
+        requirement_checker : MagicMock = MagicMock(spec = RequirementChecker)
+        requirement_checker.try_get_status.return_value = "Status"
+
+        cli_manager : CLIManager = CLIManager(
+            ap_factory = ap_factory,
+            requirement_checker = requirement_checker,
+            logging_function = MagicMock()
+        )
+
+        # Act
+        cli_manager.parse()
+        cli_manager.parse()
+
+        # Assert
+        first, second = [call.kwargs["journal_path"] for call in requirement_checker.try_get_status.call_args_list]
+        self.assertEqual(first, second)
+        self.assertEqual(os.path.dirname(first), DEFAULT.JOURNAL_DIR)
+        self.assertTrue(first.endswith(".jsonl"))
+        self.assertTrue(requirement_checker.try_get_status.call_args.kwargs["resume"])
+    def test_parse_shoulddispatchtobaselinestatus_whenbaselineisprovided(self):
+
+        # Arrange
+        expected : str = "Baseline Status"
+        args : Namespace = Namespace(
+            command = CLISTRING.COMMAND_REQUIREMENTS_NAME,
+            file_path = "requirements.txt",
+            only_stable_releases = True,
+            waiting_time = 5,
+            deadline = None,
+            cache_dir = None,
+            allowed = None,
+            denied = None,
+            index_urls = None,
+            offline = False,
+            watch = False,
+            baseline_path = "baseline.json",
+            freshness = 86400
+        )
+
+        ap_mock : MagicMock = MagicMock(spec = ArgumentParser)
+        ap_mock.parse_args.return_value = args
+
+        ap_factory : MagicMock = MagicMock(spec = APFactory)
+        ap_factory.create.return_value = ap_mock
+
+        requirement_checker : MagicMock = MagicMock(spec = RequirementChecker)
+        requirement_checker.try_get_baseline_status.return_value = expected
+        logging_function : MagicMock = MagicMock()
+
+        cli_manager : CLIManager = CLIManager(
+            ap_factory = ap_factory,
+            requirement_checker = requirement_checker,
             logging_function = logging_function
         )
 
@@ -463,28 +788,936 @@ class CLIManagerTestCase(unittest.TestCase):
         cli_manager.parse()
 
         # Assert
+        requirement_checker.try_get_baseline_status.assert_called_once_with(
+            file_path = "requirements.txt",
+            baseline_path = "baseline.json",
+            freshness = 86400,
+            only_stable_releases = True,
+            waiting_time = 5,
+            deadline = None
+        )
+        requirement_checker.try_get_status.assert_not_called()
         logging_function.assert_any_call(expected)
-    def test_parse_shoulddonothing_whensystemexitoccurs(self):
+    def test_parse_shoulddispatchtoofflinerequirementcheckerwithdefaultcachedir_whenofflineisprovided(self):
 
         # Arrange
+        args : Namespace = Namespace(
+            command = CLISTRING.COMMAND_REQUIREMENTS_NAME, 
+            file_path = "requirements.txt", 
+            only_stable_releases = True, 
+            waiting_time = 5, 
+            deadline = None, 
+            cache_dir = None,
+            allowed = None,
+            denied = None,
+            index_urls = None,
+            offline = True,
+            watch = False,
+            baseline_path = None,
+            journal_path = None,
+            resume = False
+        )
+        
+        ap_mock : MagicMock = MagicMock(spec = ArgumentParser)
+        ap_mock.parse_args.return_value = args
+        
         ap_factory : MagicMock = MagicMock(spec = APFactory)
-        ap_factory.create.side_effect = SystemExit()
+        ap_factory.create.return_value = ap_mock
         
-        logging_function : MagicMock = MagicMock()
+        cached_requirement_checker_function : MagicMock = MagicMock(return_value = MagicMock(spec = RequirementChecker))
         
         cli_manager : CLIManager = CLIManager(
             ap_factory = ap_factory,
-            logging_function = logging_function
+            requirement_checker = MagicMock(spec = RequirementChecker),
+            logging_function = MagicMock(),
+            cached_requirement_checker_function = cached_requirement_checker_function
         )
 
         # Act
         cli_manager.parse()
 
         # Assert
-        calls : list[Any] = logging_function.call_args_list
+        cached_requirement_checker_function.assert_called_once_with(DEFAULT.CACHE_DIR, True, None, None, None)
+    def test_parse_shoulddispatchtofilteredrequirementchecker_whenallowordenyisprovided(self):
 
-        for call in calls:
-            self.assertNotIsInstance(call.args[0], SystemExit)
+        # Arrange
+        args : Namespace = Namespace(
+            command = CLISTRING.COMMAND_REQUIREMENTS_NAME, 
+            file_path = "requirements.txt", 
+            only_stable_releases = True, 
+            waiting_time = 5, 
+            deadline = None, 
+            cache_dir = None,
+            allowed = ["requests"],
+            denied = ["acme-*"],
+            index_urls = None,
+            offline = False,
+            watch = False,
+            baseline_path = None,
+            journal_path = None,
+            resume = False
+        )
+        
+        ap_mock : MagicMock = MagicMock(spec = ArgumentParser)
+        ap_mock.parse_args.return_value = args
+        
+        ap_factory : MagicMock = MagicMock(spec = APFactory)
+        ap_factory.create.return_value = ap_mock
+        
+        requirement_checker : MagicMock = MagicMock(spec = RequirementChecker)
+        cached_requirement_checker_function : MagicMock = MagicMock(return_value = MagicMock(spec = RequirementChecker))
+        
+        cli_manager : CLIManager = CLIManager(
+            ap_factory = ap_factory,
+            requirement_checker = requirement_checker,
+            logging_function = MagicMock(),
+            cached_requirement_checker_function = cached_requirement_checker_function
+        )
+
+        # Act
+        cli_manager.parse()
+
+        # Assert
+        cached_requirement_checker_function.assert_called_once_with(None, False, ["requests"], ["acme-*"], None)
+        requirement_checker.try_get_status.assert_not_called()
+    @parameterized.expand([
+        [CLISTRING.COMMAND_WARM_NAME, "try_warm", { "file_paths": ["requirements.txt"] }],
+        [CLISTRING.COMMAND_SNAPSHOT_NAME, "try_export_snapshot", { "file_paths": ["requirements.txt"], "snapshot_path": "deps.snap" }]
+    ])
+    def test_parse_shoulddispatchtorequirementcheckerforindexurls_whenindexurlisprovided(self, command : str, method_name : str, file_args : dict[str, Any]):
+
+        # Arrange
+        index_urls : list[str] = ["http://proxy.internal:8080"]
+        args : Namespace = Namespace(
+            command = command, 
+            subcommand = CLISTRING.SUBCOMMAND_EXPORT_NAME,
+            only_stable_releases = True, 
+            waiting_time = 5, 
+            deadline = None, 
+            cache_dir = "/tmp/nwpver", 
+            allowed = None, 
+            denied = None, 
+            index_urls = index_urls, 
+            **file_args
+        )
+        
+        ap_mock : MagicMock = MagicMock(spec = ArgumentParser)
+        ap_mock.parse_args.return_value = args
+        
+        ap_factory : MagicMock = MagicMock(spec = APFactory)
+        ap_factory.create.return_value = ap_mock
+        
+        cached_requirement_checker : MagicMock = MagicMock(spec = RequirementChecker)
+        getattr(cached_requirement_checker, method_name).return_value = "Status"
+        cached_requirement_checker_function : MagicMock = MagicMock(return_value = cached_requirement_checker)
+        
+        cli_manager : CLIManager = CLIManager(
+            ap_factory = ap_factory,
+            logging_function = MagicMock(),
+            daemon_client = MagicMock(spec = DaemonClient, **{ "try_send.return_value": None }),
+            cached_requirement_checker_function = cached_requirement_checker_function
+        )
+
+        # Act
+        cli_manager.parse()
+
+        # Assert
+        cached_requirement_checker_function.assert_called_once_with("/tmp/nwpver", False, None, None, index_urls)
+        getattr(cached_requirement_checker, method_name).assert_called_once()
+    def test_defaultcachedrequirementcheckerfunction_shouldfetchfromindexurls_whenindexurlsareprovided(self):
+
+        # Arrange
+        index_urls : list[str] = ["http://proxy.internal:8080", "https://pypi.org"]
+
+        # Act
+        requirement_checker : RequirementChecker = CLIManager.default_cached_requirement_checker_function(None, False, None, None, index_urls)
+        release_fetcher : PyPiReleaseFetcher = requirement_checker._RequirementChecker__release_fetcher # type: ignore
+
+        # Assert
+        self.assertEqual(release_fetcher.get_index_urls(), index_urls)
+    def test_defaultcachedrequirementcheckerfunction_shouldfilterandpersistnegativecache_whencachedirisprovided(self):
+
+        # Arrange
+        temporary_directory : tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+
+        # Act
+        requirement_checker : RequirementChecker = CLIManager.default_cached_requirement_checker_function(temporary_directory.name, False, None, ["acme-*"], None)
+        release_fetcher : PyPiReleaseFetcher = requirement_checker._RequirementChecker__release_fetcher # type: ignore
+        release_fetcher._PyPiReleaseFetcher__negative_cache.add(package_name = "Private_Package", reason = "404 Client Error") # type: ignore
+
+        # Assert
+        self.assertFalse(release_fetcher._PyPiReleaseFetcher__package_filter.is_allowed(package_name = "acme-internal")) # type: ignore
+        self.assertEqual(
+            NegativeCache(file_path = os.path.join(temporary_directory.name, "negative.json")).try_get(package_name = "private-package"), 
+            "404 Client Error"
+        )
+    def test_parse_shouldimportsnapshotintocachedir_whencommandissnapshotimport(self):
+
+        # Arrange
+        args : Namespace = Namespace(command = CLISTRING.COMMAND_SNAPSHOT_NAME, subcommand = CLISTRING.SUBCOMMAND_IMPORT_NAME, snapshot_path = "deps.snap", cache_dir = "/tmp/nwpver")
+        
+        ap_mock : MagicMock = MagicMock(spec = ArgumentParser)
+        ap_mock.parse_args.return_value = args
+        
+        ap_factory : MagicMock = MagicMock(spec = APFactory)
+        ap_factory.create.return_value = ap_mock
+        
+        snapshot_import_function : MagicMock = MagicMock(return_value = 42)
+        logging_function : MagicMock = MagicMock()
+        
+        cli_manager : CLIManager = CLIManager(
+            ap_factory = ap_factory,
+            logging_function = logging_function,
+            snapshot_import_function = snapshot_import_function
+        )
+
+        # Act
+        cli_manager.parse()
+
+        # Assert
+        snapshot_import_function.assert_called_once_with("deps.snap", "/tmp/nwpver")
+        logging_function.assert_any_call(_MessageCollection.snapshot_imported(snapshot_path = "deps.snap", cache_dir = "/tmp/nwpver", entries = 42))
+    def test_parse_shouldlogcachestats_whencommandiscachestats(self):
+
+        # Arrange
+        cache_stats : CacheStats = CacheStats(entries = 1, size = 512, hits = 3, misses = 1, hit_ratio = "75.00%", age_histogram = { "<1h": 1 })
+        args : Namespace = Namespace(command = CLISTRING.COMMAND_CACHE_NAME, subcommand = CLISTRING.SUBCOMMAND_STATS_NAME, cache_dir = "/tmp/nwpver")
+        
+        ap_mock : MagicMock = MagicMock(spec = ArgumentParser)
+        ap_mock.parse_args.return_value = args
+        
+        ap_factory : MagicMock = MagicMock(spec = APFactory)
+        ap_factory.create.return_value = ap_mock
+        
+        release_cache : MagicMock = MagicMock(spec = FileReleaseCache)
+        release_cache.get_stats.return_value = cache_stats
+        release_cache_function : MagicMock = MagicMock(return_value = release_cache)
+        logging_function : MagicMock = MagicMock()
+        
+        cli_manager : CLIManager = CLIManager(
+            ap_factory = ap_factory,
+            logging_function = logging_function,
+            release_cache_function = release_cache_function
+        )
+
+        # Act
+        cli_manager.parse()
+
+        # Assert
+        release_cache_function.assert_called_once_with("/tmp/nwpver")
+        logging_function.assert_any_call(str(cache_stats))
+    def test_parse_shouldprunecache_whencommandiscacheprune(self):
+
+        # Arrange
+        prune_summary : PruneSummary = PruneSummary(expired = 1, evicted = 2, freed = 300)
+        args : Namespace = Namespace(command = CLISTRING.COMMAND_CACHE_NAME, subcommand = CLISTRING.SUBCOMMAND_PRUNE_NAME, cache_dir = "/tmp/nwpver", max_size = 1024)
+        
+        ap_mock : MagicMock = MagicMock(spec = ArgumentParser)
+        ap_mock.parse_args.return_value = args
+        
+        ap_factory : MagicMock = MagicMock(spec = APFactory)
+        ap_factory.create.return_value = ap_mock
+        
+        release_cache : MagicMock = MagicMock(spec = FileReleaseCache)
+        release_cache.prune.return_value = prune_summary
+        logging_function : MagicMock = MagicMock()
+        
+        cli_manager : CLIManager = CLIManager(
+            ap_factory = ap_factory,
+            logging_function = logging_function,
+            release_cache_function = MagicMock(return_value = release_cache)
+        )
+
+        # Act
+        cli_manager.parse()
+
+        # Assert
+        release_cache.prune.assert_called_once_with(max_size = 1024)
+        logging_function.assert_any_call(str(prune_summary))
+    def test_parse_shouldclearcache_whencommandiscacheclear(self):
+
+        # Arrange
+        args : Namespace = Namespace(command = CLISTRING.COMMAND_CACHE_NAME, subcommand = CLISTRING.SUBCOMMAND_CLEAR_NAME, cache_dir = "/tmp/nwpver")
+        
+        ap_mock : MagicMock = MagicMock(spec = ArgumentParser)
+        ap_mock.parse_args.return_value = args
+        
+        ap_factory : MagicMock = MagicMock(spec = APFactory)
+        ap_factory.create.return_value = ap_mock
+        
+        release_cache : MagicMock = MagicMock(spec = FileReleaseCache)
+        logging_function : MagicMock = MagicMock()
+        
+        cli_manager : CLIManager = CLIManager(
+            ap_factory = ap_factory,
+            logging_function = logging_function,
+            release_cache_function = MagicMock(return_value = release_cache)
+        )
+
+        # Act
+        cli_manager.parse()
+
+        # Assert
+        release_cache.clear.assert_called_once_with()
+        logging_function.assert_any_call(_MessageCollection.cache_cleared(cache_dir = "/tmp/nwpver"))
+    def test_parse_shouldclearnegativecache_whencommandiscacheclear(self):
+
+        # Arrange
+        temporary_directory : tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        negative_cache_path : str = CLIManager.get_negative_cache_path(cache_dir = temporary_directory.name)
+        NegativeCache(file_path = negative_cache_path).add(package_name = "acme-internal", reason = "404 Client Error")
+
+        args : Namespace = Namespace(command = CLISTRING.COMMAND_CACHE_NAME, subcommand = CLISTRING.SUBCOMMAND_CLEAR_NAME, cache_dir = temporary_directory.name)
+        
+        ap_mock : MagicMock = MagicMock(spec = ArgumentParser)
+        ap_mock.parse_args.return_value = args
+        
+        ap_factory : MagicMock = MagicMock(spec = APFactory)
+        ap_factory.create.return_value = ap_mock
+        
+        cli_manager : CLIManager = CLIManager(
+            ap_factory = ap_factory,
+            logging_function = MagicMock(),
+            daemon_client = MagicMock(spec = DaemonClient, **{ "try_send.return_value": None }),
+            release_cache_function = MagicMock(return_value = MagicMock(spec = FileReleaseCache))
+        )
+
+        # Act
+        cli_manager.parse()
+
+        # Assert
+        self.assertFalse(os.path.exists(negative_cache_path))
+        self.assertIsNone(NegativeCache(file_path = negative_cache_path).try_get(package_name = "acme-internal"))
+    def test_parse_shouldexportsnapshotwithcachedrequirementchecker_whencommandissnapshotexport(self):
+
+        # Arrange
+        expected : str = "Export Status"
+        args : Namespace = Namespace(
+            command = CLISTRING.COMMAND_SNAPSHOT_NAME, 
+            subcommand = CLISTRING.SUBCOMMAND_EXPORT_NAME, 
+            file_paths = ["requirements.txt"], 
+            snapshot_path = "deps.snap", 
+            only_stable_releases = True,
+            waiting_time = 5,
+            deadline = None,
+            cache_dir = "/tmp/nwpver",
+            allowed = None,
+            denied = None,
+            index_urls = None
+        )
+        
+        ap_mock : MagicMock = MagicMock(spec = ArgumentParser)
+        ap_mock.parse_args.return_value = args
+        
+        ap_factory : MagicMock = MagicMock(spec = APFactory)
+        ap_factory.create.return_value = ap_mock
+        
+        cached_requirement_checker : MagicMock = MagicMock(spec = RequirementChecker)
+        cached_requirement_checker.try_export_snapshot.return_value = expected
+        logging_function : MagicMock = MagicMock()
+        
+        cli_manager : CLIManager = CLIManager(
+            ap_factory = ap_factory,
+            logging_function = logging_function,
+            cached_requirement_checker_function = MagicMock(return_value = cached_requirement_checker)
+        )
+
+        # Act
+        cli_manager.parse()
+
+        # Assert
+        cached_requirement_checker.try_export_snapshot.assert_called_once_with(
+            file_paths = ["requirements.txt"], 
+            snapshot_path = "deps.snap", 
+            only_stable_releases = True, 
+            waiting_time = 5, 
+            deadline = None
+        )
+        logging_function.assert_any_call(expected)
+    def test_parse_shouldlogexceptionmessage_whenexceptionisraised(self):
+
+        # Arrange
+        expected : str = "Unexpected Error"
+        ap_factory : MagicMock = MagicMock(spec = APFactory)
+        ap_factory.create.side_effect = Exception(expected)
+        
+        logging_function : MagicMock = MagicMock()
+        
+        cli_manager : CLIManager = CLIManager(
+            ap_factory = ap_factory,
+            logging_function = logging_function
+        )
+
+        # Act
+        cli_manager.parse()
+
+        # Assert
+        logging_function.assert_any_call(expected)
+    def test_parse_shoulddonothing_whensystemexitoccurs(self):
+
+        # Arrange
+        ap_factory : MagicMock = MagicMock(spec = APFactory)
+        ap_factory.create.side_effect = SystemExit()
+        
+        logging_function : MagicMock = MagicMock()
+        
+        cli_manager : CLIManager = CLIManager(
+            ap_factory = ap_factory,
+            logging_function = logging_function
+        )
+
+        # Act
+        cli_manager.parse()
+
+        # Assert
+        calls : list[Any] = logging_function.call_args_list
+
+        for call in calls:
+            self.assertNotIsInstance(call.args[0], SystemExit)
+    def test_parse_shouldlogdaemonmessagesandnotdispatchlocally_whendaemonisrunning(self):
+
+        # Arrange
+        args : Namespace = Namespace(command = CLISTRING.COMMAND_REQUIREMENTS_NAME, file_path = "requirements.txt", cache_dir = None, allowed = None, denied = None, index_urls = None, offline = False, watch = False)
+        
+        ap_mock : MagicMock = MagicMock(spec = ArgumentParser)
+        ap_mock.parse_args.return_value = args
+        
+        ap_factory : MagicMock = MagicMock(spec = APFactory)
+        ap_factory.create.return_value = ap_mock
+        
+        daemon_client : MagicMock = MagicMock(spec = DaemonClient)
+        daemon_client.try_send.return_value = ["Daemon Status"]
+        requirement_checker : MagicMock = MagicMock(spec = RequirementChecker)
+        logging_function : MagicMock = MagicMock()
+        
+        cli_manager : CLIManager = CLIManager(
+            ap_factory = ap_factory,
+            requirement_checker = requirement_checker,
+            logging_function = logging_function,
+            daemon_client = daemon_client
+        )
+
+        # Act
+        cli_manager.parse()
+
+        # Assert
+        daemon_client.try_send.assert_called_once_with(args = args)
+        requirement_checker.try_get_status.assert_not_called()
+        logging_function.assert_any_call("Daemon Status")
+    def test_parse_shoulddispatchlocally_whendaemonisnotrunning(self):
+
+        # Arrange
+        args : Namespace = Namespace(
+            command = CLISTRING.COMMAND_REQUIREMENTS_NAME, 
+            file_path = "requirements.txt", 
+            only_stable_releases = True, 
+            waiting_time = 5, 
+            deadline = None,
+            cache_dir = None,
+            allowed = None,
+            denied = None,
+            index_urls = None,
+            offline = False,
+            watch = False,
+            baseline_path = None,
+            journal_path = None,
+            resume = False
+        )
+        
+        ap_mock : MagicMock = MagicMock(spec = ArgumentParser)
+        ap_mock.parse_args.return_value = args
+        
+        ap_factory : MagicMock = MagicMock(spec = APFactory)
+        ap_factory.create.return_value = ap_mock
+        
+        daemon_client : MagicMock = MagicMock(spec = DaemonClient)
+        daemon_client.try_send.return_value = None
+        requirement_checker : MagicMock = MagicMock(spec = RequirementChecker)
+        requirement_checker.try_get_status.return_value = "Local Status"
+        logging_function : MagicMock = MagicMock()
+        
+        cli_manager : CLIManager = CLIManager(
+            ap_factory = ap_factory,
+            requirement_checker = requirement_checker,
+            logging_function = logging_function,
+            daemon_client = daemon_client
+        )
+
+        # Act
+        cli_manager.parse()
+
+        # Assert
+        requirement_checker.try_get_status.assert_called_once()
+        logging_function.assert_any_call("Local Status")
+    def test_parse_shouldwatchlocally_whenwatchisprovided(self):
+
+        # Arrange
+        args : Namespace = Namespace(
+            command = CLISTRING.COMMAND_REQUIREMENTS_NAME, 
+            file_path = "requirements.txt", 
+            only_stable_releases = True, 
+            waiting_time = 5, 
+            deadline = None, 
+            cache_dir = None,
+            allowed = None,
+            denied = None,
+            index_urls = None,
+            offline = False,
+            watch = True
+        )
+        
+        ap_mock : MagicMock = MagicMock(spec = ArgumentParser)
+        ap_mock.parse_args.return_value = args
+        
+        ap_factory : MagicMock = MagicMock(spec = APFactory)
+        ap_factory.create.return_value = ap_mock
+        
+        daemon_client : MagicMock = MagicMock(spec = DaemonClient)
+        requirement_checker : MagicMock = MagicMock(spec = RequirementChecker)
+        requirement_checker.watch.side_effect = KeyboardInterrupt()
+        logging_function : MagicMock = MagicMock()
+        
+        cli_manager : CLIManager = CLIManager(
+            ap_factory = ap_factory,
+            requirement_checker = requirement_checker,
+            logging_function = logging_function,
+            daemon_client = daemon_client
+        )
+
+        # Act
+        cli_manager.parse()
+
+        # Assert
+        daemon_client.try_send.assert_not_called()
+        requirement_checker.try_get_status.assert_not_called()
+        requirement_checker.watch.assert_called_once_with(
+            file_path = "requirements.txt",
+            logging_function = logging_function,
+            only_stable_releases = True,
+            waiting_time = 5,
+            deadline = None
+        )
+    def test_parse_shouldnotforwardtodaemon_whencommandisruntime(self):
+
+        # Arrange
+        args : Namespace = Namespace(command = CLISTRING.COMMAND_RUNTIME_NAME, required = (3, 12, 5))
+        
+        ap_mock : MagicMock = MagicMock(spec = ArgumentParser)
+        ap_mock.parse_args.return_value = args
+        
+        ap_factory : MagicMock = MagicMock(spec = APFactory)
+        ap_factory.create.return_value = ap_mock
+        
+        daemon_client : MagicMock = MagicMock(spec = DaemonClient)
+        
+        cli_manager : CLIManager = CLIManager(
+            ap_factory = ap_factory,
+            runtime_checker = MagicMock(spec = RuntimeChecker),
+            logging_function = MagicMock(),
+            daemon_client = daemon_client
+        )
+
+        # Act
+        cli_manager.parse()
+
+        # Assert
+        daemon_client.try_send.assert_not_called()
+    def test_parse_shouldservewithdaemonmanager_whencommandisserve(self):
+
+        # Arrange
+        args : Namespace = Namespace(command = CLISTRING.COMMAND_SERVE_NAME, socket_path = "/tmp/nwpver.sock")
+        
+        ap_mock : MagicMock = MagicMock(spec = ArgumentParser)
+        ap_mock.parse_args.return_value = args
+        
+        ap_factory : MagicMock = MagicMock(spec = APFactory)
+        ap_factory.create.return_value = ap_mock
+
+        daemon_manager : MagicMock = MagicMock(spec = CLIManager)
+        daemon_manager_function : MagicMock = MagicMock(return_value = daemon_manager)
+        daemon_server_function : MagicMock = MagicMock()
+        logging_function : MagicMock = MagicMock()
+        
+        cli_manager : CLIManager = CLIManager(
+            ap_factory = ap_factory,
+            logging_function = logging_function,
+            daemon_manager_function = daemon_manager_function,
+            daemon_server_function = daemon_server_function
+        )
+
+        # Act
+        cli_manager.parse()
+        socket_path, dispatch_function = daemon_server_function.call_args.args
+        daemon_logging_function : Callable[[str], None] = daemon_manager_function.call_args.args[0]
+        daemon_manager.dispatch.side_effect = lambda args : daemon_logging_function("Daemon Status")
+        first : list[str] = dispatch_function(Namespace(command = CLISTRING.COMMAND_REQUIREMENTS_NAME))
+        daemon_manager.dispatch.side_effect = Exception("Unexpected Error")
+        second : list[str] = dispatch_function(Namespace(command = CLISTRING.COMMAND_REQUIREMENTS_NAME))
+
+        # Assert
+        self.assertEqual(socket_path, "/tmp/nwpver.sock")
+        daemon_server_function.return_value.serve_forever.assert_called_once_with()
+        self.assertEqual(first, ["Daemon Status"])
+        self.assertEqual(second, ["Unexpected Error"])
+        logging_function.assert_any_call(_MessageCollection.daemon_listening(socket_path = "/tmp/nwpver.sock"))
+        logging_function.assert_any_call(_MessageCollection.daemon_stopped(socket_path = "/tmp/nwpver.sock"))
+    def test_defaultdaemonmanagerfunction_shouldopenpersistentcacheonce_whencachedirisrepeated(self):
+
+        # Arrange
+        messages : list[str] = []
+
+        # Act
+        with patch("nwpackageversionscli.FileReleaseCache") as file_release_cache:
+            daemon_manager : CLIManager = CLIManager.default_daemon_manager_function(messages.append)
+            daemon_manager.dispatch(args = Namespace(command = CLISTRING.COMMAND_CACHE_NAME, subcommand = CLISTRING.SUBCOMMAND_STATS_NAME, cache_dir = "/tmp/nwpver"))
+            daemon_manager.dispatch(args = Namespace(command = CLISTRING.COMMAND_CACHE_NAME, subcommand = CLISTRING.SUBCOMMAND_CLEAR_NAME, cache_dir = "/tmp/nwpver"))
+            daemon_manager.dispatch(args = Namespace(command = CLISTRING.COMMAND_CACHE_NAME, subcommand = CLISTRING.SUBCOMMAND_STATS_NAME, cache_dir = "/tmp/other"))
+
+        # Assert
+        self.assertEqual(file_release_cache.call_count, 2)
+        file_release_cache.assert_any_call(cache_dir = "/tmp/nwpver")
+        file_release_cache.assert_any_call(cache_dir = "/tmp/other")
+        self.assertEqual(len(messages), 3)
+    def test_parse_shouldrunproxyserver_whencommandisproxy(self):
+
+        # Arrange
+        args : Namespace = Namespace(
+            command = CLISTRING.COMMAND_PROXY_NAME, 
+            host = "0.0.0.0", 
+            port = 3141, 
+            upstream_url = "https://pypi.org", 
+            cache_dir = "/tmp/nwpver", 
+            rate_limit = 2.0
+        )
+        
+        ap_mock : MagicMock = MagicMock(spec = ArgumentParser)
+        ap_mock.parse_args.return_value = args
+        
+        ap_factory : MagicMock = MagicMock(spec = APFactory)
+        ap_factory.create.return_value = ap_mock
+
+        daemon_client : MagicMock = MagicMock(spec = DaemonClient)
+        proxy_server : MagicMock = MagicMock(spec = ProxyServer)
+        proxy_server.get_url.return_value = "http://0.0.0.0:3141"
+        proxy_server_function : MagicMock = MagicMock(return_value = proxy_server)
+        logging_function : MagicMock = MagicMock()
+        
+        cli_manager : CLIManager = CLIManager(
+            ap_factory = ap_factory,
+            logging_function = logging_function,
+            daemon_client = daemon_client,
+            proxy_server_function = proxy_server_function
+        )
+
+        # Act
+        cli_manager.parse()
+
+        # Assert
+        proxy_server_function.assert_called_once_with("0.0.0.0", 3141, "https://pypi.org", "/tmp/nwpver", 2.0)
+        proxy_server.serve_forever.assert_called_once_with()
+        daemon_client.try_send.assert_not_called()
+        logging_function.assert_any_call(_MessageCollection.proxy_listening(url = "http://0.0.0.0:3141", upstream_url = "https://pypi.org"))
+class DaemonTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        temporary_directory : tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+
+        self.socket_path : str = os.path.join(temporary_directory.name, "nwpver.sock")
+        self.received : list[Namespace] = []
+
+    def dispatch(self, args : Namespace) -> list[str]:
+
+        '''Records args and returns one message per received request.'''
+
+        self.received.append(args)
+
+        return [f"Request {len(self.received)}"]
+    def start_daemon_server(self, dispatch_function : Optional[Callable[[Namespace], list[str]]] = None) -> DaemonServer:
+
+        '''Starts a DaemonServer on self.socket_path in a background thread and stops it on cleanup. If dispatch_function isn't provided, self.dispatch is used.'''
+
+        if dispatch_function is None:
+            dispatch_function = self.dispatch
+
+        daemon_server : DaemonServer = DaemonServer(socket_path = self.socket_path, dispatch_function = dispatch_function)
+        thread : Thread = Thread(target = daemon_server.serve_forever, daemon = True)
+        thread.start()
+        daemon_server.wait_until_ready(timeout = 5)
+
+        def stop() -> None:
+            daemon_server.shutdown()
+            thread.join(timeout = 5)
+
+        self.addCleanup(stop)
+
+        return daemon_server
+
+    def test_trysend_shouldreturnmessagesfromdaemon_whendaemonisrunning(self) -> None:
+
+        # Arrange
+        self.start_daemon_server()
+        daemon_client : DaemonClient = DaemonClient(socket_path = self.socket_path)
+        args : Namespace = Namespace(command = CLISTRING.COMMAND_WARM_NAME, file_paths = ["requirements.txt"], cache_dir = None, waiting_time = 5)
+
+        # Act
+        first : Optional[list[str]] = daemon_client.try_send(args = args)
+        second : Optional[list[str]] = daemon_client.try_send(args = args)
+
+        # Assert
+        self.assertEqual(first, ["Request 1"])
+        self.assertEqual(second, ["Request 2"])
+        self.assertEqual(self.received[0].command, CLISTRING.COMMAND_WARM_NAME)
+        self.assertEqual(self.received[0].file_paths, [os.path.abspath("requirements.txt")])
+        self.assertIsNone(self.received[0].cache_dir)
+        self.assertEqual(self.received[0].waiting_time, 5)
+    def test_trysend_shouldsendabsolutebaselinepath_whenbaselineisprovided(self) -> None:
+
+        # Arrange
+        self.start_daemon_server()
+        args : Namespace = Namespace(command = CLISTRING.COMMAND_REQUIREMENTS_NAME, file_path = "requirements.txt", baseline_path = "baseline.json")
+
+        # Act
+        DaemonClient(socket_path = self.socket_path).try_send(args = args)
+
+        # Assert
+        self.assertEqual(self.received[0].file_path, os.path.abspath("requirements.txt"))
+        self.assertEqual(self.received[0].baseline_path, os.path.abspath("baseline.json"))
+    def test_trysend_shouldsendabsolutejournalpath_whenjournalisprovided(self) -> None:
+
+        # Arrange
+        self.start_daemon_server()
+        args : Namespace = Namespace(command = CLISTRING.COMMAND_REQUIREMENTS_NAME, file_path = "requirements.txt", journal_path = "journal.jsonl", resume = True)
+
+        # Act
+        DaemonClient(socket_path = self.socket_path).try_send(args = args)
+
+        # Assert
+        self.assertEqual(self.received[0].journal_path, os.path.abspath("journal.jsonl"))
+        self.assertTrue(self.received[0].resume)
+    def test_trysend_shouldreturnnone_whendaemonisnotrunning(self) -> None:
+
+        # Arrange
+        daemon_client : DaemonClient = DaemonClient(socket_path = self.socket_path)
+
+        # Act
+        actual : Optional[list[str]] = daemon_client.try_send(args = Namespace(command = CLISTRING.COMMAND_WARM_NAME))
+
+        # Assert
+        self.assertIsNone(actual)
+    def test_serveforever_shouldreplacesocketfile_whensocketfileisstale(self) -> None:
+
+        # Arrange
+        with open(self.socket_path, "w") as file:
+            file.write("")
+
+        # Act
+        self.start_daemon_server()
+        actual : Optional[list[str]] = DaemonClient(socket_path = self.socket_path).try_send(args = Namespace(command = CLISTRING.COMMAND_WARM_NAME))
+
+        # Assert
+        self.assertEqual(actual, ["Request 1"])
+    def test_serveforever_shouldraiseexception_whenanotherdaemonislistening(self) -> None:
+
+        # Arrange
+        self.start_daemon_server()
+        daemon_server : DaemonServer = DaemonServer(socket_path = self.socket_path, dispatch_function = self.dispatch)
+
+        # Act
+        with self.assertRaises(Exception) as context:
+            daemon_server.serve_forever()
+
+        # Assert
+        self.assertEqual(str(context.exception), _MessageCollection.daemon_already_running(socket_path = self.socket_path))
+    def test_trysend_shouldreturnnone_whendaemonisbusy(self) -> None:
+
+        # Arrange
+        started : Event = Event()
+        finished : Event = Event()
+
+        def dispatch(args : Namespace) -> list[str]:
+            started.set()
+            finished.wait(timeout = 5)
+            return self.dispatch(args = args)
+
+        self.start_daemon_server(dispatch_function = dispatch)
+        daemon_client : DaemonClient = DaemonClient(socket_path = self.socket_path)
+        args : Namespace = Namespace(command = CLISTRING.COMMAND_WARM_NAME)
+        first : list[Optional[list[str]]] = []
+        thread : Thread = Thread(target = lambda : first.append(daemon_client.try_send(args = args)), daemon = True)
+
+        # Act
+        thread.start()
+        started.wait(timeout = 5)
+        second : Optional[list[str]] = daemon_client.try_send(args = args)
+        finished.set()
+        thread.join(timeout = 5)
+        third : Optional[list[str]] = daemon_client.try_send(args = args)
+
+        # Assert
+        self.assertIsNone(second)
+        self.assertEqual(first, [["Request 1"]])
+        self.assertEqual(third, ["Request 2"])
+    def test_trysend_shouldreturnnone_whenunixsocketsarenotsupported(self) -> None:
+
+        # Arrange
+        self.start_daemon_server()
+        daemon_client : DaemonClient = DaemonClient(socket_path = self.socket_path)
+
+        # Act
+        with patch("nwpackageversionscli.socket", MagicMock(spec = ["socket", "SOCK_STREAM"])):
+            actual : Optional[list[str]] = daemon_client.try_send(args = Namespace(command = CLISTRING.COMMAND_WARM_NAME))
+
+        # Assert
+        self.assertIsNone(actual)
+        self.assertEqual(self.received, [])
+    def test_serveforever_shouldraiseexception_whenunixsocketsarenotsupported(self) -> None:
+
+        # Arrange
+        daemon_server : DaemonServer = DaemonServer(socket_path = self.socket_path, dispatch_function = self.dispatch)
+
+        # Act
+        with patch("nwpackageversionscli.socket", MagicMock(spec = ["socket", "SOCK_STREAM"])):
+            with self.assertRaises(Exception) as context:
+                daemon_server.serve_forever()
+
+        # Assert
+        self.assertEqual(str(context.exception), _MessageCollection.daemon_not_supported())
+        self.assertFalse(os.path.exists(self.socket_path))
+
+class ProxyServerTestCase(unittest.TestCase):
+
+    '''Tests ProxyServer end to end: a real PyPiReleaseFetcher talks to the proxy, which talks to a local stand-in for the index.'''
+
+    def setUp(self) -> None:
+
+        temporary_directory : tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+
+        self.cache_dir : str = temporary_directory.name
+        self.upstream_requests : list[str] = []
+        self.upstream_delay : float = 0.0
+        self.upstream_url : str = self.start_upstream()
+
+    def start_upstream(self) -> str:
+
+        '''Starts a stand-in index that serves pandas' releases and #history page, records each request and returns its URL.'''
+
+        test_case : ProxyServerTestCase = self
+        lock : Lock = Lock()
+        pages : dict[str, Tuple[str, bytes]] = {
+            "/rss/project/pandas/releases.xml": ("text/xml", "\n".join([
+                '<?xml version="1.0" encoding="UTF-8"?>',
+                '<rss version="2.0"><channel>',
+                '<item><title>2.2.3</title><link>https://pypi.org/project/pandas/2.2.3/</link><pubDate>Fri, 20 Sep 2024 13:08:42 GMT</pubDate></item>',
+                '<item><title>2.2.2</title><link>https://pypi.org/project/pandas/2.2.2/</link><pubDate>Wed, 10 Apr 2024 19:44:10 GMT</pubDate></item>',
+                '</channel></rss>'
+            ]).encode("utf-8")),
+            "/project/pandas/": ("text/html", b"<html><body></body></html>")
+        }
+
+        class UpstreamHandler(BaseHTTPRequestHandler):
+
+            def do_GET(self) -> None:
+
+                with lock:
+                    test_case.upstream_requests.append(self.path)
+
+                sleep(test_case.upstream_delay)
+                content_type, body = pages.get(self.path, ("text/plain", b"Not Found"))
+
+                self.send_response(200 if self.path in pages else 404)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            def log_message(self, format : str, *args : Any) -> None:
+                pass
+
+        upstream : ThreadingHTTPServer = ThreadingHTTPServer(("127.0.0.1", 0), UpstreamHandler)
+        thread : Thread = Thread(target = upstream.serve_forever, daemon = True)
+        thread.start()
+
+        def stop() -> None:
+            upstream.shutdown()
+            upstream.server_close()
+            thread.join(timeout = 5)
+
+        self.addCleanup(stop)
+
+        return f"http://127.0.0.1:{upstream.server_address[1]}"
+    def start_proxy_server(self) -> ProxyServer:
+
+        '''Starts a ProxyServer on a free port in front of the stand-in index and stops it on cleanup.'''
+
+        caching_proxy : CachingProxy = CachingProxy(upstream_url = self.upstream_url, cache_dir = self.cache_dir, rate_limiter = RateLimiter(rate = 1000))
+        proxy_server : ProxyServer = ProxyServer(caching_proxy = caching_proxy, host = "127.0.0.1", port = 0)
+        thread : Thread = Thread(target = proxy_server.serve_forever, daemon = True)
+        thread.start()
+        proxy_server.wait_until_ready(timeout = 5)
+
+        def stop() -> None:
+            proxy_server.shutdown()
+            thread.join(timeout = 5)
+
+        self.addCleanup(stop)
+
+        return proxy_server
+    def create_release_fetcher(self, index_url : str) -> PyPiReleaseFetcher:
+
+        '''Creates a PyPiReleaseFetcher whose release and badge requests go to index_url.'''
+
+        return PyPiReleaseFetcher(index_urls = [index_url], badge_fetcher = PyPiBadgeFetcher(index_urls = [index_url]))
+
+    def test_fetch_shouldreturnreleasesthroughproxy_andhitupstreamonce(self) -> None:
+
+        # Arrange
+        proxy_server : ProxyServer = self.start_proxy_server()
+
+        # Act
+        first : FSession = self.create_release_fetcher(index_url = proxy_server.get_url()).fetch(package_name = "pandas", only_stable_releases = True)
+        second : FSession = self.create_release_fetcher(index_url = proxy_server.get_url()).fetch(package_name = "pandas", only_stable_releases = True)
+        x_cache : str = requests.get(f"{proxy_server.get_url()}/rss/project/pandas/releases.xml", timeout = 5).headers["X-Cache"]
+
+        # Assert
+        self.assertEqual([release.version for release in first.releases], ["2.2.3", "2.2.2"])
+        self.assertEqual(first.releases, second.releases)
+        self.assertEqual(sorted(self.upstream_requests), ["/project/pandas/", "/rss/project/pandas/releases.xml"])
+        self.assertEqual(x_cache, "HIT")
+    def test_get_shouldcoalesceconcurrentmisses_whenclientsrequestthesamepath(self) -> None:
+
+        # Arrange
+        proxy_server : ProxyServer = self.start_proxy_server()
+        self.upstream_delay = 0.3
+        url : str = f"{proxy_server.get_url()}/rss/project/pandas/releases.xml"
+        status_codes : list[int] = []
+
+        # Act
+        threads : list[Thread] = [Thread(target = lambda : status_codes.append(requests.get(url, timeout = 5).status_code)) for _ in range(8)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join(timeout = 10)
+
+        # Assert
+        self.assertEqual(status_codes, [200] * 8)
+        self.assertEqual(self.upstream_requests, ["/rss/project/pandas/releases.xml"])
+    def test_get_shouldreturnnotfoundwithoutupstreamcall_whenpathisnotused(self) -> None:
+
+        # Arrange
+        proxy_server : ProxyServer = self.start_proxy_server()
+
+        # Act
+        actual : int = requests.get(f"{proxy_server.get_url()}/admin", timeout = 5).status_code
+
+        # Assert
+        self.assertEqual(actual, 404)
+        self.assertEqual(self.upstream_requests, [])
 
 # MAIN
 if __name__ == "__main__":
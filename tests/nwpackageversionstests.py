@@ -1,12 +1,21 @@
 # GLOBAL MODULES
+import asyncio
+import gc
+import multiprocessing
 import os
+import pickle
 import subprocess
 import sys
+import tempfile
 import unittest
-from datetime import datetime
+import weakref
+from datetime import datetime, timedelta, timezone
+import requests
+from lxml import etree
 from parameterized import parameterized
 from requests import Response
-from time import time
+from threading import Event, Thread
+from time import sleep, time
 from typing import Any, Literal, Optional, Callable, Tuple, cast
 from unittest.mock import Mock, patch, mock_open, MagicMock
 
@@ -15,7 +24,17 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 from nwpackageversions import _MessageCollection, Badge, BasicFormatter, Formatter, LSession, LambdaCollection
 from nwpackageversions import LocalPackageLoader, Package, RuntimeChecker, PyPiBadgeFetcher, Validator
 from nwpackageversions import PyPiReleaseFetcher, RequirementChecker, RequirementDetail, RequirementSummary
-from nwpackageversions import XMLItem, Release, FSession, JsonFormatter
+from nwpackageversions import XMLItem, Release, FSession, JsonFormatter, SingleFlight, SingleFlightStats
+from nwpackageversions import NegativeCache, PackageFilter, HedgedGetter, HedgingStats
+from nwpackageversions import AIMDController, ConcurrencyStats, DSession, PipelineSettings, ContentParser, PSession
+from nwpackageversions import StreamingStats, SummaryCache, SummaryCacheKey, CachedSummary
+from nwpackageversions import InMemoryReleaseCache, ReleaseCache, CadenceTTLPolicy, SyncReport
+from nwpackageversions import FSessionSerializer, FileReleaseCache, WarmSummary
+from nwpackageversions import SnapshotEntry, SnapshotWriter, SnapshotReleaseCache, CacheStats, PruneSummary
+from nwpackageversions import RateLimiter, CachingProxy, ProxyResponse, WSession
+from nwpackageversions import Baseline, BaselineEntry, BaselineReport, BaselineSerializer, BaselineStore
+from nwpackageversions import RequirementDetailSerializer, RequirementJournal
+from dataclasses import replace
 
 # SUPPORT METHODS
 class ObjectMother():
@@ -41,7 +60,8 @@ class ObjectMother():
             current_package = ObjectMother.get_package_1(),
             most_recent_release = ObjectMother.get_release_1(),
             is_version_matching = True,
-            description = "The current version matches the most recent release."
+            description = "The current version matches the most recent release.",
+            outcome = "matching"
         )
 
         return requirement_detail_1
@@ -72,7 +92,8 @@ class ObjectMother():
             current_package = ObjectMother.get_package_2(),
             most_recent_release = ObjectMother.get_release_2(),
             is_version_matching = False,
-            description = "The current version ('4.5.0') of 'opencv-python' doesn't match with the most recent release ('4.10.0', '2023-08-12')."
+            description = "The current version ('4.5.0') of 'opencv-python' doesn't match with the most recent release ('4.10.0', '2023-08-12').",
+            outcome = "mismatching"
         )
 
         return requirement_detail_2
@@ -112,6 +133,10 @@ class ObjectMother():
             matching_prc = "50.00%",
             mismatching = 1,
             mismatching_prc = "50.00%",
+            errors = 0,
+            errors_prc = "0.00%",
+            unchecked = 0,
+            unchecked_prc = "0.00%",
             details = ObjectMother.get_requirement_details()
         )
 
@@ -119,7 +144,7 @@ class ObjectMother():
     @staticmethod
     def get_requirement_summary_as_json_without_details() -> str:
 
-        formatted : str = "{ 'total_packages': '2', 'matching': '1', 'matching_prc': '50.00%', 'mismatching': '1', 'mismatching_prc': '50.00%' }"
+        formatted : str = "{ 'total_packages': '2', 'matching': '1', 'matching_prc': '50.00%', 'mismatching': '1', 'mismatching_prc': '50.00%', 'errors': '0', 'errors_prc': '0.00%', 'unchecked': '0', 'unchecked_prc': '0.00%' }"
 
         return formatted
     @staticmethod
@@ -175,10 +200,13 @@ class SupportMethodProvider():
             )
 
     @staticmethod
-    def are_releases_equal(r1 : Release, r2 : Release) -> bool:
+    def are_releases_equal(r1 : Optional[Release], r2 : Optional[Release]) -> bool:
 
         '''Returns True if all the fields of the two objects contain the same values.'''
 
+        if (r1 == None or r2 == None):
+            return r1 == r2
+
         return (
             r1.package_name == r2.package_name and
             r1.version == r2.version and
@@ -204,7 +232,8 @@ class SupportMethodProvider():
             SupportMethodProvider.are_packages_equal(sd1.current_package, sd2.current_package) and
             SupportMethodProvider.are_releases_equal(sd1.most_recent_release, sd2.most_recent_release) and
             sd1.is_version_matching == sd2.is_version_matching and
-            sd1.description == sd2.description
+            sd1.description == sd2.description and
+            sd1.outcome == sd2.outcome
             )
     @staticmethod
     def are_lists_of_requirementdetails_equal(list1 : list[RequirementDetail], list2 : list[RequirementDetail]) -> bool:
@@ -487,6 +516,53 @@ class ReleaseTestCase(unittest.TestCase):
         # Assert
         self.assertEqual(actual_str, expected)
         self.assertEqual(actual_repr, expected)
+class RequirementDetailTestCase(unittest.TestCase):
+
+    @parameterized.expand([
+        [True, "matching"],
+        [False, "mismatching"]
+    ])
+    def test_requirementdetail_shouldderiveoutcome_whenoutcomeisnotprovided(self, is_version_matching : bool, expected : str) -> None:
+        
+        # Arrange
+        # Act
+        actual : RequirementDetail = RequirementDetail(
+            current_package = ObjectMother.get_package_1(),
+            most_recent_release = ObjectMother.get_release_1(),
+            is_version_matching = is_version_matching,
+            description = "The current version has been checked."
+        )
+        
+        # Assert
+        self.assertEqual(actual.outcome, expected)
+    def test_requirementdetail_shouldkeepoutcome_whenoutcomeisprovided(self) -> None:
+        
+        # Arrange
+        # Act
+        actual : RequirementDetail = RequirementDetail(
+            current_package = ObjectMother.get_package_1(),
+            most_recent_release = None,
+            is_version_matching = False,
+            description = "The current version couldn't be checked.",
+            outcome = "error"
+        )
+        
+        # Assert
+        self.assertEqual(actual.outcome, "error")
+class RequirementSummaryTestCase(unittest.TestCase):
+
+    def test_requirementsummary_shoulddefaultnewcounters_whenonlyoriginalfieldsareprovided(self) -> None:
+        
+        # Arrange
+        details : list[RequirementDetail] = ObjectMother.get_requirement_details()
+
+        # Act
+        actual : RequirementSummary = RequirementSummary(2, 1, "50.00%", 1, "50.00%", details)
+        
+        # Assert
+        self.assertEqual(actual.details, details)
+        self.assertEqual((actual.errors, actual.errors_prc, actual.unchecked, actual.unchecked_prc), (0, "0.00%", 0, "0.00%"))
+        self.assertEqual((actual.unknown, actual.unknown_prc), (0, "0.00%"))
 class FSessionTestCase(unittest.TestCase):
 
     def setUp(self):
@@ -549,7 +625,9 @@ class FSessionTestCase(unittest.TestCase):
             f"'most_recent_release': '{self.mrr_formatter(self.most_recent_release)}', "
             "'releases': '4', "
             "'xml_items': '4', "
-            f"'badges': '{self.badge_formatter(self.badges)}' "
+            f"'badges': '{self.badge_formatter(self.badges)}', "
+            "'age': '0.00', "
+            "'is_stale': 'False' "
             "}"
         )
 		
@@ -566,7 +644,9 @@ class FSessionTestCase(unittest.TestCase):
             f"'most_recent_release': '{self.mrr_formatter(self.most_recent_release)}', "
             "'releases': '4', "
             "'xml_items': '4', "
-            "'badges': 'None' "
+            "'badges': 'None', "
+            "'age': '0.00', "
+            "'is_stale': 'False' "
             "}"
         )
 		
@@ -603,6 +683,45 @@ class LambdaCollectionTestCase(unittest.TestCase):
         # Assert
         self.assertEqual(cast(Response, actual).status_code, expected_sc)
         self.assertEqual(cast(Response, actual).text, expected_text)
+    def test_getfunction_shouldpasstimeouts_wheninvoked(self):
+	
+        # Arrange
+        url : str = "https://pypi.org/rss/project/numpy/releases.xml"
+
+		# Act
+        with patch("requests.get") as get_mock:
+            get_function : Callable[[str], Response] = LambdaCollection.get_function(connect_timeout = 3.0, read_timeout = 20.0)
+            get_function(url)
+
+        # Assert
+        get_mock.assert_called_once_with(url, timeout = (3.0, 20.0))
+    def test_streamfunction_shouldpasstimeoutsandstream_wheninvoked(self):
+	
+        # Arrange
+        url : str = "https://pypi.org/project/numpy/#history"
+
+		# Act
+        with patch("requests.get") as get_mock:
+            stream_function : Callable[[str], Response] = LambdaCollection.stream_function(connect_timeout = 3.0, read_timeout = 20.0)
+            stream_function(url)
+
+        # Assert
+        get_mock.assert_called_once_with(url, timeout = (3.0, 20.0), stream = True)
+    def test_pooledgetfunction_shouldreuseonesession_wheninvokedmultipletimes(self):
+	
+        # Arrange
+        url : str = "https://pypi.org/rss/project/numpy/releases.xml"
+
+		# Act
+        with patch("requests.Session") as session_mock:
+            get_function : Callable[[str], Response] = LambdaCollection.pooled_get_function(connect_timeout = 3.0, read_timeout = 20.0)
+            get_function(url)
+            get_function(url)
+
+        # Assert
+        session_mock.assert_called_once_with()
+        self.assertEqual(session_mock.return_value.get.call_count, 2)
+        session_mock.return_value.get.assert_called_with(url, timeout = (3.0, 20.0))
     def test_loggingfunction_shouldbecalledwithexpectedmessage_wheninvoked(self):
         
         # Arrange
@@ -674,6 +793,39 @@ class ValidatorTestCase(unittest.TestCase):
         # Act, Assert
         Validator.validate_waiting_time(waiting_time = waiting_time)
 
+    @parameterized.expand([
+        [0],
+        [-5]
+    ])
+    def test_validatedeadline_shouldraiseexceptionwithexpectedmessage_whendeadlineisnotpositive(self, deadline : int):
+
+        # Arrange
+        expected : str = _MessageCollection.deadline_must_be_greater_than_zero(deadline)
+
+        # Act, Assert
+        with self.assertRaises(Exception) as context:
+            Validator.validate_deadline(deadline)
+
+        self.assertEqual(str(context.exception), expected)
+    @parameterized.expand([
+        [None],
+        [60]
+    ])
+    def test_validatedeadline_shoulddonothing_whendeadlineisnoneorpositive(self, deadline : Optional[int]):
+
+        # Arrange, Act, Assert
+        Validator.validate_deadline(deadline)
+    def test_validatefreshness_shouldraiseexceptionwithexpectedmessage_whenfreshnessisnegative(self):
+
+        # Arrange
+        freshness : int = -1
+        expected : str = _MessageCollection.freshness_cant_be_negative(freshness)
+
+        # Act, Assert
+        with self.assertRaises(Exception) as context:
+            Validator.validate_freshness(freshness)
+
+        self.assertEqual(str(context.exception), expected)
     def test_validatefilepath_shouldraiseexceptionwithexpectedmessage_whenfiledoesnotexist(self):
 
         # Arrange
@@ -705,6 +857,17 @@ class JsonFormatterTestCase(unittest.TestCase):
         # Act
         actual : str = JsonFormatter().format_requirement_detail(requirement_detail)
 
+        # Assert
+        self.assertEqual(actual, expected)
+    def test_formatrequirementdetail_shouldincludeage_whendetailisstale(self):
+
+        # Arrange
+        requirement_detail : RequirementDetail = replace(ObjectMother.get_requirement_detail_2(), age = 7200.4, is_stale = True)
+        expected : str = "{ " f"'description': '{requirement_detail.description}', 'age': '7200', 'is_stale': 'True'" " }"
+
+        # Act
+        actual : str = JsonFormatter().format_requirement_detail(requirement_detail)
+
         # Assert
         self.assertEqual(actual, expected)
     def test_formatrequirementdetails_shouldreturnexpectedstring_wheninvoked(self):
@@ -738,6 +901,17 @@ class JsonFormatterTestCase(unittest.TestCase):
         # Act
         actual : str = JsonFormatter().format_requirement_summary(requirement_summary, with_details = True)
 
+        # Assert
+        self.assertEqual(actual, expected)
+    def test_formatrequirementsummary_shouldappendunknown_whenunknownisgreaterthanzero(self):
+
+        # Arrange
+        requirement_summary : RequirementSummary = replace(ObjectMother.get_requirement_summary(), unknown = 1, unknown_prc = "50.00%")
+        expected : str = ObjectMother.get_requirement_summary_as_json_without_details()[:-2] + ", 'unknown': '1', 'unknown_prc': '50.00%' }"
+
+        # Act
+        actual : str = JsonFormatter().format_requirement_summary(requirement_summary, with_details = False)
+
         # Assert
         self.assertEqual(actual, expected)
 class BasicFormatterTestCase(unittest.TestCase):
@@ -753,6 +927,18 @@ class BasicFormatterTestCase(unittest.TestCase):
 
         # Assert
         self.assertEqual(actual, expected)
+    def test_formatrequirementdetail_shouldincludeage_whendetailisstale(self):
+
+        # Arrange
+        requirement_detail : RequirementDetail = replace(ObjectMother.get_requirement_detail_2(), age = 7200.4, is_stale = True)
+        expected : str = _MessageCollection.stale_requirement_detail(description = requirement_detail.description, age = 7200.4)
+
+        # Act
+        actual : str = BasicFormatter().format_requirement_detail(requirement_detail)
+
+        # Assert
+        self.assertEqual(actual, expected)
+        self.assertTrue(actual.startswith(requirement_detail.description))
     def test_formatrequirementdetails_shouldreturnexpectedstring_wheninvoked(self):
 
         # Arrange
@@ -773,7 +959,11 @@ class BasicFormatterTestCase(unittest.TestCase):
             f"matching: '{str(requirement_summary.matching)}'",
             f"matching_prc: '{requirement_summary.matching_prc}'",
             f"mismatching: '{str(requirement_summary.mismatching)}'",
-            f"mismatching_prc: '{requirement_summary.mismatching_prc}'"
+            f"mismatching_prc: '{requirement_summary.mismatching_prc}'",
+            f"errors: '{str(requirement_summary.errors)}'",
+            f"errors_prc: '{requirement_summary.errors_prc}'",
+            f"unchecked: '{str(requirement_summary.unchecked)}'",
+            f"unchecked_prc: '{requirement_summary.unchecked_prc}'"
         ]
         expected : str = str.join("\n", expected_lines)
 
@@ -782,6 +972,16 @@ class BasicFormatterTestCase(unittest.TestCase):
 
         # Assert
         self.assertEqual(actual, expected)
+    def test_formatrequirementsummary_shouldappendunknown_whenunknownisgreaterthanzero(self):
+
+        # Arrange
+        requirement_summary : RequirementSummary = replace(ObjectMother.get_requirement_summary(), unknown = 1, unknown_prc = "50.00%")
+
+        # Act
+        actual : str = BasicFormatter().format_requirement_summary(requirement_summary, with_details = False)
+
+        # Assert
+        self.assertTrue(actual.endswith("unchecked_prc: '0.00%'\nunknown: '1'\nunknown_prc: '50.00%'"))
     def test_formatrequirementsummary_shouldreturnexpectedstring_whenwithdetailsistrue(self):
 
         # Arrange
@@ -793,7 +993,11 @@ class BasicFormatterTestCase(unittest.TestCase):
             f"matching: '{str(requirement_summary.matching)}'",
             f"matching_prc: '{requirement_summary.matching_prc}'",
             f"mismatching: '{str(requirement_summary.mismatching)}'",
-            f"mismatching_prc: '{requirement_summary.mismatching_prc}'"
+            f"mismatching_prc: '{requirement_summary.mismatching_prc}'",
+            f"errors: '{str(requirement_summary.errors)}'",
+            f"errors_prc: '{requirement_summary.errors_prc}'",
+            f"unchecked: '{str(requirement_summary.unchecked)}'",
+            f"unchecked_prc: '{requirement_summary.unchecked_prc}'"
         ]
         details : str = formatter.format_requirement_details(requirement_summary.details)
         expected : str = str.join("\n", [str.join("\n", summary_lines), "", details])
@@ -863,6 +1067,44 @@ class LocalPackageLoaderTestCase(unittest.TestCase):
         # Assert
         self.assertEqual(actual, expected)
 
+    @parameterized.expand([
+        [r"C:/requirements.txt", "requirements"],
+        [r"C:/Dockerfile_demo", "dockerfile"]
+    ])
+    def test_getloadertype_shouldreturnexpectedstrategy_wheninvoked(self, file_path : str, expected : str) -> None:
+        
+        # Arrange
+        # Act
+        package_loader : LocalPackageLoader = LocalPackageLoader(file_reader_function = self.file_reader_mock)
+        actual : str = package_loader.get_loader_type(file_path = file_path)
+
+        # Assert
+        self.assertEqual(actual, expected)
+    def test_getloadertype_shouldraiseexception_whennostrategyisfound(self) -> None:
+        
+        # Arrange
+        file_path : str = r"C:/some_file_name"
+
+        # Act
+        package_loader : LocalPackageLoader = LocalPackageLoader(file_reader_function = self.file_reader_mock)
+
+        with self.assertRaises(Exception) as context:
+            package_loader.get_loader_type(file_path = file_path)
+
+        # Assert
+        self.assertEqual(str(context.exception), _MessageCollection.no_loading_strategy_found(file_path))
+    def test_getcontenthash_shouldreturnsha256ofcontent_wheninvoked(self) -> None:
+        
+        # Arrange
+        expected : str = "ed7002b439e9ac845f22357d822bac1444730fbdb6016d3ec9432297b9ec9f73"
+
+        # Act
+        package_loader : LocalPackageLoader = LocalPackageLoader(file_reader_function = self.file_reader_mock)
+        actual : str = package_loader.get_content_hash(file_path = r"C:/requirements.txt")
+
+        # Assert
+        self.assertEqual(actual, expected)
+
     def test_load_shouldreturnexpectedlsession_whenrequirements(self) -> None:
         
         # Arrange
@@ -935,530 +1177,3480 @@ class LocalPackageLoaderTestCase(unittest.TestCase):
         with self.assertRaises(expected_exception = Exception, msg = msg):
             package_loader : LocalPackageLoader = LocalPackageLoader(file_reader_function = self.file_reader_mock)
             package_loader.load(file_path = file_path)
-class PyPiBadgeFetcherTestCase(unittest.TestCase):
+class SingleFlightTestCase(unittest.TestCase):
 
-    def setUp(self) -> None:
+    def test_run_shouldreturnfunctionresult_wheninvoked(self) -> None:
 
-        self.badge_fetcher : PyPiBadgeFetcher = PyPiBadgeFetcher()
-    
-        self.html_response : str = str(
-            '<div class="release-timeline">'
-            '<div class="release release--latest">'
-            '<div class="release__meta"></div>'
-            '<div class="release__graphic">'
-            '<div class="release__line"></div>'
-            '<img class="release__node" alt="" src="https://pypi.org/static/images/white-cube.2351a86c.svg">'
-            '</div>'
-            '<a class="card release__card" href="/project/ipykernel/7.0.0a0/">'
-            '<p class="release__version">7.0.0a0'
-            '<span class="badge badge--warning">pre-release</span>'
-            '</p>'
-            '<p class="release__version-date">'
-            '<time datetime="2024-10-22T08:26:22+0000">Oct 22, 2024</time>'
-            '</p>'
-            '</a>'
-            '</div>'
-            '<div class="release release--current">'
-            '<div class="release__meta"><span class="badge">This version</span></div>'
-            '<div class="release__graphic">'
-            '<div class="release__line"></div>'
-            '<img class="release__node" alt="" src="https://pypi.org/static/images/blue-cube.572a5bfb.svg">'
-            '</div>'
-            '<a class="card release__card" href="/project/ipykernel/6.29.5/">'
-            '<p class="release__version">6.29.5</p>'
-            '<p class="release__version-date">'
-            '<time datetime="2024-07-01T14:07:19+0000">Jul 1, 2024</time>'
-            '</p>'
-            '</a>'
-            '</div>'
-            '<div class="release">'
-            '<div class="release__meta"></div>'
-            '<div class="release__graphic">'
-            '<div class="release__line"></div>'
-            '<img class="release__node" alt="" src="https://pypi.org/static/images/white-cube.2351a86c.svg">'
-            '</div>'
-            '<a class="card release__card" href="/project/ipykernel/6.29.4/">'
-            '<p class="release__version">6.29.4</p>'
-            '<p class="release__version-date">'
-            '<time datetime="2024-03-27T22:25:41+0000">Mar 27, 2024</time>'
-            '</p>'
-            '</a>'
-            '</div>'
-            '<div class="release__graphic">'
-            '<div class="release__line"></div>'
-            '<img class="release__node" alt="" src="https://pypi.org/static/images/white-cube.2351a86c.svg">'
-            '</div>'
-            '<a class="card release__card" href="/project/ipykernel/6.27.0/">'
-            '<p class="release__version">6.27.0'
-            '<span class="badge badge--danger">yanked</span>'
-            '</p>'
-            '<p class="release__version-date">'
-            '<time datetime="2023-11-21T11:23:46+0000">Nov 21, 2023</time>'
-            '</p>'
-            '<div class="callout-block callout-block--danger release__yanked-reason">'
-            '<p>Reason this release was yanked:</p><p>broke %edit magic</p>'
-            '</div>'
-            '</a>'
-            '</div>'
-        ) 
-        self.package_name : str = "ipykernel"
-        self.badges : list[Badge] = [
-            Badge(package_name = "ipykernel", version = "7.0.0a0", label = "pre-release"),
-            Badge(package_name = "ipykernel", version = "6.27.0", label = "yanked")
-        ]
+        # Arrange
+        single_flight : SingleFlight = SingleFlight()
+        expected : SingleFlightStats = SingleFlightStats(leaders = 1, coalesced = 0)
 
-        self.response_mock : Response = Mock(content = self.html_response)       
-        self.get_function_mock : Callable[[str], Response] = Mock(return_value = self.response_mock)
+        # Act
+        actual : Any = single_flight.run(key = "pandas", function = lambda : 42)
+
+        # Assert
+        self.assertEqual(actual, 42)
+        self.assertEqual(single_flight.get_stats(), expected)
+    def test_run_shouldexecutefunctiononce_whencallersareconcurrent(self) -> None:
 
-    def test_pypibadgefetcher_shouldinitializeasexpected_wheninvoked(self) -> None:
-        
         # Arrange
+        single_flight : SingleFlight = SingleFlight()
+        started : Event = Event()
+        release : Event = Event()
+        calls : list[int] = []
+        results : list[Any] = []
+
+        def function() -> int:
+            calls.append(1)
+            started.set()
+            release.wait(timeout = 5)
+            return 42
+
         # Act
+        leader : Thread = Thread(target = lambda : results.append(single_flight.run(key = "pandas", function = function)))
+        leader.start()
+        started.wait(timeout = 5)
+
+        followers : list[Thread] = [
+            Thread(target = lambda : results.append(single_flight.run(key = "pandas", function = function)))
+            for _ in range(3)
+        ]
+        for follower in followers:
+            follower.start()
+        while single_flight.get_stats().coalesced < 3:
+            pass
+        release.set()
+
+        for thread in [leader] + followers:
+            thread.join(timeout = 5)
+
         # Assert
-        self.assertIsInstance(self.badge_fetcher, PyPiBadgeFetcher)
-        self.assertTrue(callable(self.badge_fetcher._PyPiBadgeFetcher__get_function))   # type: ignore
-    def test_formaturl_shouldreturnexpectedurl_wheninvoked(self) -> None:
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [42, 42, 42, 42])
+        self.assertEqual(single_flight.get_stats(), SingleFlightStats(leaders = 1, coalesced = 3))
+    def test_run_shouldraiseexception_whenfunctionraises(self) -> None:
 
         # Arrange
-        package_name : str = "pandas"
-        expected : str = "https://pypi.org/project/pandas/#history"
-        
+        single_flight : SingleFlight = SingleFlight()
+        expected : str = "Some error occurred."
+
+        def function() -> None:
+            raise Exception(expected)
+
+        # Act, Assert
+        with self.assertRaises(Exception) as context:
+            single_flight.run(key = "pandas", function = function)
+
+        self.assertEqual(str(context.exception), expected)
+    def test_runasync_shouldexecutefunctiononce_whencallersareconcurrent(self) -> None:
+
+        # Arrange
+        single_flight : SingleFlight = SingleFlight()
+        release : Event = Event()
+        calls : list[int] = []
+
+        def function() -> int:
+            calls.append(1)
+            release.wait(timeout = 5)
+            return 42
+
+        async def run_all() -> list[Any]:
+            tasks : list[Any] = [asyncio.create_task(single_flight.run_async(key = "pandas", function = function)) for _ in range(3)]
+            await asyncio.sleep(0.05)
+            release.set()
+            return await asyncio.gather(*tasks)
+
         # Act
-        actual : str = self.badge_fetcher._PyPiBadgeFetcher__format_url(package_name = package_name)  # type: ignore
-        
+        actual : list[Any] = asyncio.run(run_all())
+
         # Assert
-        self.assertEqual(actual, expected)
-    def test_tryfetch_shouldreturnexpectedbadges_wheninvoked(self) -> None:
-        
-        # Arrange       
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(actual, [42, 42, 42])
+        self.assertEqual(single_flight.get_stats(), SingleFlightStats(leaders = 1, coalesced = 2))
+    def test_str_shouldreturnexpectedstring_wheninvoked(self) -> None:
+
+        # Arrange
+        expected : str = "{ 'leaders': '2', 'coalesced': '5' }"
+
         # Act
-        badge_fetcher = PyPiBadgeFetcher(get_function = self.get_function_mock)
-        actual : Optional[list[Badge]] = badge_fetcher.try_fetch(package_name = self.package_name)
-        
+        actual : str = str(SingleFlightStats(leaders = 2, coalesced = 5))
+
         # Assert
-        self.assertTrue(SupportMethodProvider().are_lists_of_badges_equal(list1 = actual, list2 = self.badges))
-    def test_tryfetch_shouldreturnnone_whennobadgesfound(self) -> None:
-        
+        self.assertEqual(actual, expected)
+class NegativeCacheTestCase(unittest.TestCase):
+
+    def test_tryget_shouldreturnnone_whenpackageisnotcached(self) -> None:
+
         # Arrange
-        response_mock : Response = Mock(content = "<html></html>")
-        get_function_mock : Callable[[str], Response] = Mock(return_value = response_mock)
-        package_name : str = "non_existent_package"       
-        
+        negative_cache : NegativeCache = NegativeCache()
+
         # Act
-        badge_fetcher = PyPiBadgeFetcher(get_function = get_function_mock)
-        actual : Optional[list[Badge]] = badge_fetcher.try_fetch(package_name = package_name)
-        
+        actual : Optional[str] = negative_cache.try_get(package_name = "acme-internal")
+
         # Assert
         self.assertIsNone(actual)
-class PyPiReleaseFetcherTestCase(unittest.TestCase):
+    def test_tryget_shouldreturnreason_whenpackageiscachedandnotexpired(self) -> None:
 
-    def setUp(self) -> None:
+        # Arrange
+        now_function : MagicMock = MagicMock(return_value = 1000.0)
+        negative_cache : NegativeCache = NegativeCache(ttl = 60, now_function = now_function)
+        expected : str = "404 Client Error"
+
+        # Act
+        negative_cache.add(package_name = "acme-internal", reason = expected)
+        now_function.return_value = 1059.0
+        actual : Optional[str] = negative_cache.try_get(package_name = "acme-internal")
+
+        # Assert
+        self.assertEqual(actual, expected)
+    def test_tryget_shouldreturnnone_whenentryisexpired(self) -> None:
+
+        # Arrange
+        now_function : MagicMock = MagicMock(return_value = 1000.0)
+        negative_cache : NegativeCache = NegativeCache(ttl = 60, now_function = now_function)
+
+        # Act
+        negative_cache.add(package_name = "acme-internal", reason = "404 Client Error")
+        now_function.return_value = 1060.0
+        actual : Optional[str] = negative_cache.try_get(package_name = "acme-internal")
+
+        # Assert
+        self.assertIsNone(actual)
+    def test_invalidate_shouldremoveentry_wheninvoked(self) -> None:
+
+        # Arrange
+        negative_cache : NegativeCache = NegativeCache()
+        negative_cache.add(package_name = "acme-internal", reason = "404 Client Error")
+
+        # Act
+        negative_cache.invalidate(package_name = "acme-internal")
+
+        # Assert
+        self.assertIsNone(negative_cache.try_get(package_name = "acme-internal"))
+    def test_tryget_shouldreturnreason_whennamediffersonlybynormalization(self) -> None:
+
+        # Arrange
+        negative_cache : NegativeCache = NegativeCache()
+        negative_cache.add(package_name = "Acme_Internal", reason = "404 Client Error")
+
+        # Act
+        actual : Optional[str] = negative_cache.try_get(package_name = "acme-internal")
+        negative_cache.invalidate(package_name = "ACME.internal")
+
+        # Assert
+        self.assertEqual(actual, "404 Client Error")
+        self.assertIsNone(negative_cache.try_get(package_name = "acme-internal"))
+        self.assertEqual(negative_cache.get_package_names(), [])
+    def test_tryget_shouldreturnreason_whenanotherinstancehasaddedittothefile(self) -> None:
+
+        # Arrange
+        temporary_directory : tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        file_path : str = os.path.join(temporary_directory.name, "negative.json")
+        reader : NegativeCache = NegativeCache(file_path = file_path)
+        reader.try_get(package_name = "acme-internal")
+
+        # Act
+        NegativeCache(file_path = file_path).add(package_name = "acme-internal", reason = "404 Client Error")
+        actual : Optional[str] = reader.try_get(package_name = "acme-internal")
+
+        # Assert
+        self.assertEqual(actual, "404 Client Error")
+    def test_clear_shouldremovefile_whenfilepathisprovided(self) -> None:
+
+        # Arrange
+        temporary_directory : tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        file_path : str = os.path.join(temporary_directory.name, "negative.json")
+        negative_cache : NegativeCache = NegativeCache(file_path = file_path)
+        negative_cache.add(package_name = "acme-internal", reason = "404 Client Error")
+
+        # Act
+        negative_cache.clear()
+
+        # Assert
+        self.assertFalse(os.path.exists(file_path))
+        self.assertIsNone(NegativeCache(file_path = file_path).try_get(package_name = "acme-internal"))
+    def test_tryget_shouldreturnnone_whenfileisnotvalid(self) -> None:
+
+        # Arrange
+        temporary_directory : tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        file_path : str = os.path.join(temporary_directory.name, "negative.json")
+
+        with open(file_path, "w", encoding = "utf-8") as file:
+            file.write("{ not json")
+
+        # Act
+        actual : Optional[str] = NegativeCache(file_path = file_path).try_get(package_name = "acme-internal")
+
+        # Assert
+        self.assertIsNone(actual)
+class SummaryCacheTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        self.key : SummaryCacheKey = SummaryCacheKey(
+            content_hash = "ed7002b4", 
+            loader_type = "requirements", 
+            only_stable_releases = True, 
+            index_url = "https://pypi.org"
+        )
+        self.summary : RequirementSummary = ObjectMother.get_requirement_summary()
+
+    def test_tryget_shouldreturnnone_whenkeyisnotcached(self) -> None:
+
+        # Arrange
+        summary_cache : SummaryCache = SummaryCache()
+
+        # Act
+        actual : Optional[CachedSummary] = summary_cache.try_get(key = self.key)
+
+        # Assert
+        self.assertIsNone(actual)
+
+    @parameterized.expand([
+        [1059.0, False],
+        [1060.0, True],
+        [1089.0, True]
+    ])
+    def test_tryget_shouldreturncachedsummarywithstaleness_whenentryisnotexpired(self, now : float, is_stale : bool) -> None:
+
+        # Arrange
+        now_function : MagicMock = MagicMock(return_value = 1000.0)
+        summary_cache : SummaryCache = SummaryCache(ttl = 60, grace = 30, now_function = now_function)
+
+        # Act
+        summary_cache.add(key = self.key, summary = self.summary)
+        now_function.return_value = now
+        actual : Optional[CachedSummary] = summary_cache.try_get(key = self.key)
+
+        # Assert
+        self.assertEqual(actual, CachedSummary(summary = self.summary, age = now - 1000.0, is_stale = is_stale))
+    def test_tryget_shouldreturnnone_whenentryisexpired(self) -> None:
+
+        # Arrange
+        now_function : MagicMock = MagicMock(return_value = 1000.0)
+        summary_cache : SummaryCache = SummaryCache(ttl = 60, grace = 30, now_function = now_function)
+
+        # Act
+        summary_cache.add(key = self.key, summary = self.summary)
+        now_function.return_value = 1090.0
+        actual : Optional[CachedSummary] = summary_cache.try_get(key = self.key)
+
+        # Assert
+        self.assertIsNone(actual)
+    def test_trystartrefresh_shouldreturnfalse_whenrefreshisalreadyinprogress(self) -> None:
+
+        # Arrange
+        summary_cache : SummaryCache = SummaryCache()
+
+        # Act
+        first : bool = summary_cache.try_start_refresh(key = self.key)
+        second : bool = summary_cache.try_start_refresh(key = self.key)
+        summary_cache.add(key = self.key, summary = self.summary)
+        third : bool = summary_cache.try_start_refresh(key = self.key)
+
+        # Assert
+        self.assertEqual([first, second, third], [True, False, True])
+    def test_invalidate_shouldremoveentry_wheninvoked(self) -> None:
+
+        # Arrange
+        summary_cache : SummaryCache = SummaryCache()
+        summary_cache.add(key = self.key, summary = self.summary)
+
+        # Act
+        summary_cache.invalidate(key = self.key)
+
+        # Assert
+        self.assertIsNone(summary_cache.try_get(key = self.key))
+class CadenceTTLPolicyTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        self.now : datetime = datetime(2024, 10, 1)
+        self.now_function : Callable[[], float] = lambda : self.now.replace(tzinfo = timezone.utc).timestamp()
+
+    def create_f_session(self, ages : list[timedelta]) -> FSession:
+
+        releases : list[Release] = [
+            Release(package_name = "acme", version = f"1.0.{i}", date = self.now - age) 
+            for i, age in enumerate(ages)
+        ]
+
+        return FSession(package_name = "acme", most_recent_release = releases[0], releases = releases, xml_items = [], badges = None)
+
+    @parameterized.expand([
+        ["weekly", [timedelta(days = 1 + 7 * i) for i in range(10)], 8640.0],
+        ["justreleased", [timedelta(minutes = 1), timedelta(days = 200)], 900.0],
+        ["dormant", [timedelta(days = 3 * 365 + 365 * i) for i in range(5)], 604800.0],
+        ["single", [timedelta(days = 30)], 259200.0]
+    ])
+    def test_calculate_shouldreturnexpectedttl_wheninvoked(self, name : str, ages : list[timedelta], expected : float) -> None:
+
+        # Arrange
+        policy : CadenceTTLPolicy = CadenceTTLPolicy(min_ttl = 900, max_ttl = 604800, factor = 0.1, now_function = self.now_function)
+
+        # Act
+        actual : float = policy.calculate(f_session = self.create_f_session(ages = ages))
+
+        # Assert
+        self.assertAlmostEqual(actual, expected)
+    def test_calculate_shouldconsideronlymostrecentreleases_whenhistoryislongerthanwindow(self) -> None:
+
+        # Arrange
+        ages : list[timedelta] = [timedelta(days = 400 + 2 * i) for i in range(3)] + [timedelta(days = 1000 + 300 * i) for i in range(20)]
+        policy : CadenceTTLPolicy = CadenceTTLPolicy(max_ttl = 10**9, window = 2, now_function = self.now_function)
+
+        # Act
+        actual : float = policy.calculate(f_session = self.create_f_session(ages = ages))
+
+        # Assert
+        self.assertAlmostEqual(actual, 0.1 * 2 * 86400)
+class InMemoryReleaseCacheTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        release : Release = Release(package_name = "pandas", version = "2.2.3", date = datetime(2024, 9, 20, 13, 8, 42))
+        self.f_session : FSession = FSession(package_name = "pandas", most_recent_release = release, releases = [release], xml_items = [], badges = None)
+
+    def test_inmemoryreleasecache_shouldimplementreleasecache_wheninvoked(self) -> None:
+
+        # Arrange
+        # Act
+        release_cache : InMemoryReleaseCache = InMemoryReleaseCache()
+
+        # Assert
+        self.assertIsInstance(release_cache, ReleaseCache)
+
+    @parameterized.expand([
+        [1059.0, False],
+        [1060.0, True],
+        [1089.0, True]
+    ])
+    def test_tryget_shouldreturnmarkedfsession_whenentryisnotexpired(self, now : float, is_stale : bool) -> None:
+
+        # Arrange
+        now_function : MagicMock = MagicMock(return_value = 1000.0)
+        release_cache : InMemoryReleaseCache = InMemoryReleaseCache(ttl = 60, grace = 30, now_function = now_function)
+
+        # Act
+        release_cache.add(package_name = "pandas", only_stable_releases = True, f_session = self.f_session)
+        now_function.return_value = now
+        actual : Optional[FSession] = release_cache.try_get(package_name = "pandas", only_stable_releases = True)
+
+        # Assert
+        self.assertEqual(actual, replace(self.f_session, age = now - 1000.0, is_stale = is_stale))
+    def test_tryget_shouldreturnnone_whenentryisexpiredormissing(self) -> None:
+
+        # Arrange
+        now_function : MagicMock = MagicMock(return_value = 1000.0)
+        release_cache : InMemoryReleaseCache = InMemoryReleaseCache(ttl = 60, grace = 30, now_function = now_function)
+
+        # Act
+        release_cache.add(package_name = "pandas", only_stable_releases = True, f_session = self.f_session)
+        missing : Optional[FSession] = release_cache.try_get(package_name = "pandas", only_stable_releases = False)
+        now_function.return_value = 1090.0
+        expired : Optional[FSession] = release_cache.try_get(package_name = "pandas", only_stable_releases = True)
+
+        # Assert
+        self.assertIsNone(missing)
+        self.assertIsNone(expired)
+    def test_tryget_shouldusepackagettl_whenttlfunctionisprovided(self) -> None:
+
+        # Arrange
+        now_function : MagicMock = MagicMock(return_value = 1000.0)
+        ttl_function : Callable[[FSession], float] = lambda f_session : 600.0 if f_session.package_name == "pandas" else 60.0
+        release_cache : InMemoryReleaseCache = InMemoryReleaseCache(ttl = 60, grace = 0, now_function = now_function, ttl_function = ttl_function)
+        other : FSession = replace(self.f_session, package_name = "numpy")
+
+        # Act
+        release_cache.add(package_name = "pandas", only_stable_releases = True, f_session = self.f_session)
+        release_cache.add(package_name = "numpy", only_stable_releases = True, f_session = other)
+        now_function.return_value = 1300.0
+
+        # Assert
+        self.assertIsNotNone(release_cache.try_get(package_name = "pandas", only_stable_releases = True))
+        self.assertIsNone(release_cache.try_get(package_name = "numpy", only_stable_releases = True))
+    def test_invalidate_shouldremovebothvariants_wheninvoked(self) -> None:
+
+        # Arrange
+        release_cache : InMemoryReleaseCache = InMemoryReleaseCache()
+        release_cache.add(package_name = "pandas", only_stable_releases = True, f_session = self.f_session)
+        release_cache.add(package_name = "pandas", only_stable_releases = False, f_session = self.f_session)
+
+        # Act
+        release_cache.invalidate(package_name = "pandas")
+
+        # Assert
+        self.assertIsNone(release_cache.try_get(package_name = "pandas", only_stable_releases = True))
+        self.assertIsNone(release_cache.try_get(package_name = "pandas", only_stable_releases = False))
+    def test_getpackagenames_shouldreturneachpackageonce_wheninvoked(self) -> None:
+
+        # Arrange
+        release_cache : InMemoryReleaseCache = InMemoryReleaseCache()
+        release_cache.add(package_name = "pandas", only_stable_releases = True, f_session = self.f_session)
+        release_cache.add(package_name = "pandas", only_stable_releases = False, f_session = self.f_session)
+        release_cache.add(package_name = "Django", only_stable_releases = True, f_session = self.f_session)
+
+        # Act
+        actual : list[str] = release_cache.get_package_names()
+
+        # Assert
+        self.assertEqual(actual, ["Django", "pandas"])
+class FSessionSerializerTestCase(unittest.TestCase):
+
+    @parameterized.expand([
+        [None],
+        [[Badge(package_name = "pandas", version = "3.0.0rc0", label = "pre-release")]]
+    ])
+    def test_fromdict_shouldreturnequalfsession_whenitstodictoutputisprovided(self, badges : Optional[list[Badge]]) -> None:
+
+        # Arrange
+        release : Release = Release(package_name = "pandas", version = "2.2.3", date = datetime(2024, 9, 20, 13, 8, 42))
+        xml_item : XMLItem = XMLItem(
+            title = "2.2.3", 
+            link = "https://pypi.org/project/pandas/2.2.3/", 
+            description = None, 
+            author = None, 
+            pubdate = datetime(2024, 9, 20, 13, 8, 42), 
+            pubdate_str = "Fri, 20 Sep 2024 13:08:42 GMT"
+        )
+        expected : FSession = FSession(package_name = "pandas", most_recent_release = release, releases = [release], xml_items = [xml_item], badges = badges)
+        serializer : FSessionSerializer = FSessionSerializer()
+
+        # Act
+        actual : FSession = serializer.from_dict(item = serializer.to_dict(f_session = replace(expected, age = 10.0, is_stale = True)))
+
+        # Assert
+        self.assertEqual(actual, expected)
+class BaselineStoreTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        temporary_directory : tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+
+        self.baseline_path : str = os.path.join(temporary_directory.name, "nightly", "baseline.json")
+
+    def test_load_shouldreturnequalbaseline_whenitssaveoutputisloaded(self) -> None:
+
+        # Arrange
+        release : Release = Release(package_name = "pandas", version = "2.2.3", date = datetime(2024, 9, 20, 13, 8, 42))
+        matching : RequirementDetail = RequirementDetail(
+            current_package = Package(name = "pandas", version = "2.2.3"),
+            most_recent_release = release,
+            is_version_matching = True,
+            description = "pandas matches.",
+            outcome = "matching"
+        )
+        error : RequirementDetail = RequirementDetail(
+            current_package = Package(name = "acme-billing", version = "1.0.0"),
+            most_recent_release = None,
+            is_version_matching = False,
+            description = "acme-billing couldn't be checked.",
+            outcome = "error"
+        )
+        expected : Baseline = Baseline(
+            only_stable_releases = True,
+            saved_at = 1000.0,
+            entries = [BaselineEntry(requirement_detail = matching, fetched_at = 900.0), BaselineEntry(requirement_detail = error, fetched_at = 1000.0)]
+        )
+        baseline_store : BaselineStore = BaselineStore()
+
+        # Act
+        baseline_store.save(file_path = self.baseline_path, baseline = replace(expected, entries = [replace(expected.entries[0], requirement_detail = replace(matching, age = 100.0, is_stale = True)), expected.entries[1]]))
+        actual : Optional[Baseline] = baseline_store.load(file_path = self.baseline_path)
+
+        # Assert
+        self.assertEqual(actual, expected)
+    def test_load_shouldreturnnone_whenfiledoesnotexist(self) -> None:
+
+        # Arrange
+        # Act
+        actual : Optional[Baseline] = BaselineStore().load(file_path = self.baseline_path)
+
+        # Assert
+        self.assertIsNone(actual)
+    def test_load_shouldraiseexceptionwithexpectedmessage_whenfileisnotabaseline(self) -> None:
+
+        # Arrange
+        os.makedirs(os.path.dirname(self.baseline_path))
+
+        with open(self.baseline_path, "w", encoding = "utf-8") as file:
+            file.write("pandas==2.2.3")
+
+        expected : str = _MessageCollection.provided_file_isnt_a_baseline(file_path = self.baseline_path)
+
+        # Act, Assert
+        with self.assertRaises(Exception) as context:
+            BaselineStore().load(file_path = self.baseline_path)
+
+        self.assertEqual(str(context.exception), expected)
+    def test_baseline_shouldreturnexpectedstring_wheninvoked(self) -> None:
+
+        # Arrange
+        baseline : Baseline = Baseline(only_stable_releases = True, saved_at = 1000.0, entries = [])
+
+        # Act
+        # Assert
+        self.assertEqual(str(baseline), "{ 'only_stable_releases': 'True', 'saved_at': '1000.0', 'entries': '0' }")
+class RequirementJournalTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        temporary_directory : tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+
+        self.journal_path : str = os.path.join(temporary_directory.name, "journals", "requirements.jsonl")
+        self.requirement_detail : RequirementDetail = RequirementDetail(
+            current_package = Package(name = "pandas", version = "2.2.3"),
+            most_recent_release = Release(package_name = "pandas", version = "2.2.3", date = datetime(2024, 9, 20, 13, 8, 42)),
+            is_version_matching = True,
+            description = "pandas matches.",
+            outcome = "matching"
+        )
+
+    def read_lines(self) -> list[str]:
+
+        '''Returns the lines of the journal.'''
+
+        with open(self.journal_path, "r", encoding = "utf-8") as file:
+            return file.read().splitlines()
+
+    def test_resume_shouldreturnappendeddetails_whenjournalhasbeenstarted(self) -> None:
+
+        # Arrange
+        journal : RequirementJournal = RequirementJournal(file_path = self.journal_path)
+        journal.start(only_stable_releases = True)
+        journal.append(requirement_detail = replace(self.requirement_detail, age = 10.0, is_stale = True))
+
+        # Act
+        actual : list[RequirementDetail] = RequirementJournal(file_path = self.journal_path).resume(only_stable_releases = True)
+
+        # Assert
+        self.assertEqual(actual, [self.requirement_detail])
+    def test_resume_shoulddroptruncatedline_whenwritingwasinterrupted(self) -> None:
+
+        # Arrange
+        journal : RequirementJournal = RequirementJournal(file_path = self.journal_path)
+        journal.start(only_stable_releases = True)
+        journal.append(requirement_detail = self.requirement_detail)
+
+        with open(self.journal_path, "a", encoding = "utf-8") as file:
+            file.write('{"current_package": {"name": "numpy", "vers')
+
+        # Act
+        actual : list[RequirementDetail] = journal.resume(only_stable_releases = True)
+        journal.append(requirement_detail = replace(self.requirement_detail, current_package = Package(name = "numpy", version = "2.2.3")))
+
+        # Assert
+        self.assertEqual(actual, [self.requirement_detail])
+        self.assertEqual(len(self.read_lines()), 3)
+        self.assertEqual(len(journal.resume(only_stable_releases = True)), 2)
+    @parameterized.expand([
+        [False, 1000.0],
+        [True, 1000.0 - 86400],
+        [None, None]
+    ])
+    def test_resume_shouldstartanew_whenjournalisfromanotherrunorisoldorismissing(self, only_stable_releases : Optional[bool], started_at : Optional[float]) -> None:
+
+        # Arrange
+        now_function : MagicMock = MagicMock(return_value = started_at)
+        journal : RequirementJournal = RequirementJournal(file_path = self.journal_path, now_function = now_function, max_age = 86400)
+
+        if only_stable_releases is not None:
+            journal.start(only_stable_releases = only_stable_releases)
+            journal.append(requirement_detail = self.requirement_detail)
+
+        # Act
+        now_function.return_value = 1000.0
+        actual : list[RequirementDetail] = journal.resume(only_stable_releases = True)
+
+        # Assert
+        self.assertEqual(actual, [])
+        self.assertEqual(self.read_lines(), ['{"only_stable_releases": true, "started_at": 1000.0}'])
+    def test_remove_shoulddonothing_whenjournaldoesnotexist(self) -> None:
+
+        # Arrange
+        journal : RequirementJournal = RequirementJournal(file_path = self.journal_path)
+
+        # Act
+        journal.remove()
+
+        # Assert
+        self.assertFalse(os.path.exists(self.journal_path))
+class FileReleaseCacheTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        temporary_directory : tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+
+        self.cache_dir : str = temporary_directory.name
+        self.now_function : MagicMock = MagicMock(return_value = 1000.0)
+        release : Release = Release(package_name = "pandas", version = "2.2.3", date = datetime(2024, 9, 20, 13, 8, 42))
+        self.f_session : FSession = FSession(package_name = "pandas", most_recent_release = release, releases = [release], xml_items = [], badges = None)
+
+    def create_release_cache(self) -> FileReleaseCache:
+
+        '''Creates a FileReleaseCache in self.cache_dir with ttl = 60 and grace = 30.'''
+
+        return FileReleaseCache(cache_dir = self.cache_dir, ttl = 60, grace = 30, now_function = self.now_function)
+
+    def test_filereleasecache_shouldimplementreleasecache_wheninvoked(self) -> None:
+
+        # Arrange
+        # Act
+        release_cache : FileReleaseCache = self.create_release_cache()
+
+        # Assert
+        self.assertIsInstance(release_cache, ReleaseCache)
+
+    @parameterized.expand([
+        [1059.0, False],
+        [1060.0, True],
+        [1089.0, True]
+    ])
+    def test_tryget_shouldreturnmarkedfsession_whenentryisnotexpired(self, now : float, is_stale : bool) -> None:
+
+        # Arrange
+        writer : FileReleaseCache = self.create_release_cache()
+        reader : FileReleaseCache = self.create_release_cache()
+
+        # Act
+        writer.add(package_name = "pandas", only_stable_releases = True, f_session = self.f_session)
+        self.now_function.return_value = now
+        actual : Optional[FSession] = reader.try_get(package_name = "pandas", only_stable_releases = True)
+
+        # Assert
+        self.assertEqual(actual, replace(self.f_session, age = now - 1000.0, is_stale = is_stale))
+    def test_tryget_shouldreturnnone_whenentryisexpiredormissing(self) -> None:
+
+        # Arrange
+        release_cache : FileReleaseCache = self.create_release_cache()
+
+        # Act
+        release_cache.add(package_name = "pandas", only_stable_releases = True, f_session = self.f_session)
+        missing : Optional[FSession] = release_cache.try_get(package_name = "pandas", only_stable_releases = False)
+        self.now_function.return_value = 1090.0
+        expired : Optional[FSession] = release_cache.try_get(package_name = "pandas", only_stable_releases = True)
+
+        # Assert
+        self.assertIsNone(missing)
+        self.assertIsNone(expired)
+        self.assertEqual(release_cache.get_package_names(), ["pandas"])
+    def test_tryget_shouldreturnstalefsession_whenentryisexpiredandincludeexpiredistrue(self) -> None:
+
+        # Arrange
+        release_cache : FileReleaseCache = self.create_release_cache()
+        release_cache.add(package_name = "pandas", only_stable_releases = True, f_session = self.f_session)
+
+        # Act
+        self.now_function.return_value = 1000.0 + 86400
+        actual : Optional[FSession] = release_cache.try_get(package_name = "pandas", only_stable_releases = True, include_expired = True)
+
+        # Assert
+        self.assertEqual(actual, replace(self.f_session, age = 86400.0, is_stale = True))
+        self.assertEqual(release_cache.get_package_names(), ["pandas"])
+    def test_tryget_shouldreturnnone_whenentryiscorrupted(self) -> None:
+
+        # Arrange
+        release_cache : FileReleaseCache = self.create_release_cache()
+        release_cache.add(package_name = "pandas", only_stable_releases = True, f_session = self.f_session)
+        entries_dir : str = os.path.join(self.cache_dir, "releases")
+
+        for name in os.listdir(entries_dir):
+            with open(os.path.join(entries_dir, name), "w") as file:
+                file.write("{ truncated")
+
+        # Act
+        actual : Optional[FSession] = release_cache.try_get(package_name = "pandas", only_stable_releases = True)
+
+        # Assert
+        self.assertIsNone(actual)
+    def test_add_shouldnotleavetemporaryfiles_wheninvoked(self) -> None:
+
+        # Arrange
+        release_cache : FileReleaseCache = self.create_release_cache()
+
+        # Act
+        release_cache.add(package_name = "pandas", only_stable_releases = True, f_session = self.f_session)
+        release_cache.add(package_name = "pandas", only_stable_releases = True, f_session = self.f_session)
+
+        # Assert
+        self.assertEqual(len(os.listdir(os.path.join(self.cache_dir, "releases"))), 1)
+    def test_invalidateandclear_shouldremoveentries_wheninvoked(self) -> None:
+
+        # Arrange
+        release_cache : FileReleaseCache = self.create_release_cache()
+
+        for package_name in ["pandas", "Django", "numpy"]:
+            release_cache.add(package_name = package_name, only_stable_releases = True, f_session = self.f_session)
+            release_cache.add(package_name = package_name, only_stable_releases = False, f_session = self.f_session)
+
+        # Act
+        release_cache.invalidate(package_name = "pandas")
+        after_invalidate : list[str] = release_cache.get_package_names()
+        release_cache.clear()
+        after_clear : list[str] = release_cache.get_package_names()
+
+        # Assert
+        self.assertEqual(after_invalidate, ["Django", "numpy"])
+        self.assertEqual(after_clear, [])
+    def test_lock_shouldblockotherholders_untilreleased(self) -> None:
+
+        # Arrange
+        release_cache : FileReleaseCache = self.create_release_cache()
+        acquired : Event = Event()
+
+        def hold_lock() -> None:
+            with release_cache.lock(package_name = "pandas", only_stable_releases = True):
+                acquired.set()
+
+        # Act
+        with release_cache.lock(package_name = "pandas", only_stable_releases = True):
+            thread : Thread = Thread(target = hold_lock)
+            thread.start()
+            blocked : bool = not acquired.wait(timeout = 0.2)
+
+        thread.join(timeout = 5)
+
+        # Assert
+        self.assertTrue(blocked)
+        self.assertTrue(acquired.is_set())
+    def test_lock_shouldusemsvcrt_whenplatformiswindows(self) -> None:
+
+        # Arrange
+        release_cache : FileReleaseCache = self.create_release_cache()
+        msvcrt_mock : MagicMock = MagicMock()
+        msvcrt_mock.locking.side_effect = [OSError("Resource deadlock avoided"), None, None]
+
+        # Act
+        with patch("platform.system", return_value = "Windows"), patch.dict(sys.modules, { "msvcrt": msvcrt_mock }):
+            with release_cache.lock(package_name = "pandas", only_stable_releases = True):
+                pass
+
+        # Assert
+        self.assertEqual(
+            [call.args[1:] for call in msvcrt_mock.locking.call_args_list],
+            [(msvcrt_mock.LK_LOCK, 1), (msvcrt_mock.LK_LOCK, 1), (msvcrt_mock.LK_UNLCK, 1)]
+        )
+    def test_getstats_shouldreturnexpectedcachestats_wheninvoked(self) -> None:
+
+        # Arrange
+        release_cache : FileReleaseCache = self.create_release_cache()
+        release_cache.add(package_name = "pandas", only_stable_releases = True, f_session = self.f_session)
+        self.now_function.return_value = 1000.0 - 7200.0
+        release_cache.add(package_name = "numpy", only_stable_releases = True, f_session = self.f_session)
+        self.now_function.return_value = 1000.0
+
+        # Act
+        release_cache.try_get(package_name = "pandas", only_stable_releases = True)
+        release_cache.try_get(package_name = "pandas", only_stable_releases = True)
+        release_cache.try_get(package_name = "pandas", only_stable_releases = False)
+        release_cache.flush_stats()
+        actual : CacheStats = self.create_release_cache().get_stats()
+
+        # Assert
+        self.assertEqual(actual.entries, 2)
+        self.assertGreater(actual.size, 0)
+        self.assertEqual((actual.hits, actual.misses, actual.hit_ratio), (2, 1, "66.67%"))
+        self.assertEqual(actual.age_histogram, { "<1h": 1, "1h-1d": 1, "1d-7d": 0, ">7d": 0 })
+    def test_tryget_shouldwritestatsinbatches_wheninvoked(self) -> None:
+
+        # Arrange
+        release_cache : FileReleaseCache = FileReleaseCache(cache_dir = self.cache_dir, now_function = self.now_function, stats_batch = 2)
+        release_cache.add(package_name = "pandas", only_stable_releases = True, f_session = self.f_session)
+        stats_path : str = os.path.join(self.cache_dir, "stats.json")
+
+        # Act
+        release_cache.try_get(package_name = "pandas", only_stable_releases = True)
+        after_first : bool = os.path.exists(stats_path)
+        release_cache.try_get(package_name = "numpy", only_stable_releases = True)
+        after_second : bool = os.path.exists(stats_path)
+
+        # Assert
+        self.assertFalse(after_first)
+        self.assertTrue(after_second)
+        self.assertEqual((self.create_release_cache().get_stats().hits, self.create_release_cache().get_stats().misses), (1, 1))
+    def test_filereleasecache_shouldflushstatsandbecollected_whenlastreferenceisdropped(self) -> None:
+
+        # Arrange
+        release_cache : Optional[FileReleaseCache] = self.create_release_cache()
+        cast(FileReleaseCache, release_cache).try_get(package_name = "pandas", only_stable_releases = True)
+        reference : weakref.ref = weakref.ref(cast(FileReleaseCache, release_cache))
+
+        # Act
+        release_cache = None
+        gc.collect()
+
+        # Assert
+        self.assertIsNone(reference())
+        self.assertEqual((self.create_release_cache().get_stats().hits, self.create_release_cache().get_stats().misses), (0, 1))
+    def test_tryget_shouldreturnfsession_whenstatscantbewritten(self) -> None:
+
+        # Arrange
+        release_cache : FileReleaseCache = FileReleaseCache(cache_dir = self.cache_dir, now_function = self.now_function, stats_batch = 1)
+        release_cache.add(package_name = "pandas", only_stable_releases = True, f_session = self.f_session)
+
+        # Act
+        with patch("tempfile.mkstemp", side_effect = PermissionError("Read-only file system")):
+            actual : Optional[FSession] = release_cache.try_get(package_name = "pandas", only_stable_releases = True)
+
+        # Assert
+        self.assertEqual(actual, replace(self.f_session, age = 0.0))
+        self.assertFalse(os.path.exists(os.path.join(self.cache_dir, "stats.json")))
+    def test_getstats_shouldreturnemptycachestats_whencacheisempty(self) -> None:
+
+        # Arrange
+        release_cache : FileReleaseCache = self.create_release_cache()
+
+        # Act
+        actual : CacheStats = release_cache.get_stats()
+
+        # Assert
+        self.assertEqual(actual, CacheStats(entries = 0, size = 0, hits = 0, misses = 0, hit_ratio = "0.00%", age_histogram = { "<1h": 0, "1h-1d": 0, "1d-7d": 0, ">7d": 0 }))
+    def test_prune_shouldremoveexpiredentries_whenmaxsizeisnone(self) -> None:
+
+        # Arrange
+        release_cache : FileReleaseCache = self.create_release_cache()
+        release_cache.add(package_name = "pandas", only_stable_releases = True, f_session = self.f_session)
+        self.now_function.return_value = 1080.0
+        release_cache.add(package_name = "numpy", only_stable_releases = True, f_session = self.f_session)
+        self.now_function.return_value = 1090.0
+
+        # Act
+        actual : PruneSummary = release_cache.prune()
+
+        # Assert
+        self.assertEqual((actual.expired, actual.evicted), (1, 0))
+        self.assertGreater(actual.freed, 0)
+        self.assertEqual(release_cache.get_package_names(), ["numpy"])
+    def test_prune_shouldevictleastrecentlyusedentries_whencacheisbiggerthanmaxsize(self) -> None:
+
+        # Arrange
+        release_cache : FileReleaseCache = self.create_release_cache()
+        entries_dir : str = os.path.join(self.cache_dir, "releases")
+
+        for package_name in ["pandas", "Django", "numpy"]:
+            release_cache.add(package_name = package_name, only_stable_releases = True, f_session = self.f_session)
+
+        for name in os.listdir(entries_dir):
+            os.utime(os.path.join(entries_dir, name), (1, 1))
+
+        max_size : int = release_cache.get_stats().size - 1
+        release_cache.try_get(package_name = "pandas", only_stable_releases = True)
+
+        # Act
+        actual : PruneSummary = release_cache.prune(max_size = max_size)
+
+        # Assert
+        self.assertEqual((actual.expired, actual.evicted), (0, 1))
+        self.assertIn("pandas", release_cache.get_package_names())
+        self.assertEqual(len(release_cache.get_package_names()), 2)
+        self.assertLessEqual(release_cache.get_stats().size, max_size)
+    def test_cachestats_shouldreturnexpectedstring_wheninvoked(self) -> None:
+
+        # Arrange
+        cache_stats : CacheStats = CacheStats(entries = 2, size = 1024, hits = 3, misses = 1, hit_ratio = "75.00%", age_histogram = { "<1h": 1, ">7d": 1 })
+        prune_summary : PruneSummary = PruneSummary(expired = 1, evicted = 2, freed = 300)
+
+        # Act
+        # Assert
+        self.assertEqual(
+            str(cache_stats), 
+            "{ 'entries': '2', 'size': '1024', 'hits': '3', 'misses': '1', 'hit_ratio': '75.00%', 'age_histogram': '<1h: 1, >7d: 1' }"
+        )
+        self.assertEqual(str(prune_summary), "{ 'expired': '1', 'evicted': '2', 'freed': '300' }")
+class SnapshotReleaseCacheTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        temporary_directory : tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+
+        self.snapshot_path : str = os.path.join(temporary_directory.name, "deps.snap")
+        self.now_function : MagicMock = MagicMock(return_value = 1000.0)
+
+    def create_f_session(self, package_name : str) -> FSession:
+
+        '''Creates a FSession with one release for package_name.'''
+
+        release : Release = Release(package_name = package_name, version = "1.0.0", date = datetime(2024, 9, 20, 13, 8, 42))
+
+        return FSession(package_name = package_name, most_recent_release = release, releases = [release], xml_items = [], badges = None)
+    def create_snapshot(self, package_names : list[str]) -> SnapshotReleaseCache:
+
+        '''Writes a snapshot with one stable entry for each of package_names (fetched at 900.0) and opens it.'''
+
+        snapshot_entries : list[SnapshotEntry] = [
+            SnapshotEntry(package_name = package_name, only_stable_releases = True, fetched_at = 900.0, f_session = self.create_f_session(package_name = package_name))
+            for package_name in package_names
+        ]
+        SnapshotWriter().write(file_path = self.snapshot_path, snapshot_entries = snapshot_entries)
+        snapshot : SnapshotReleaseCache = SnapshotReleaseCache(file_path = self.snapshot_path, ttl = 60, now_function = self.now_function)
+        self.addCleanup(snapshot.close)
+
+        return snapshot
+
+    def test_snapshotreleasecache_shouldimplementreleasecache_wheninvoked(self) -> None:
+
+        # Arrange
+        # Act
+        snapshot : SnapshotReleaseCache = self.create_snapshot(package_names = ["pandas"])
+
+        # Assert
+        self.assertIsInstance(snapshot, ReleaseCache)
+    def test_tryget_shouldreturneachstoredfsession_whensnapshothasmanyentries(self) -> None:
+
+        # Arrange
+        package_names : list[str] = [f"package{i}" for i in range(200)]
+        snapshot : SnapshotReleaseCache = self.create_snapshot(package_names = package_names)
+
+        # Act
+        actual : list[Optional[FSession]] = [snapshot.try_get(package_name = package_name, only_stable_releases = True) for package_name in package_names]
+
+        # Assert
+        self.assertEqual(actual, [replace(self.create_f_session(package_name = package_name), age = 100.0, is_stale = True) for package_name in package_names])
+    def test_tryget_shouldreturnnone_whenentryisnotstored(self) -> None:
+
+        # Arrange
+        snapshot : SnapshotReleaseCache = self.create_snapshot(package_names = ["pandas", "numpy"])
+
+        # Act
+        unstable : Optional[FSession] = snapshot.try_get(package_name = "pandas", only_stable_releases = False)
+        missing : Optional[FSession] = snapshot.try_get(package_name = "requests", only_stable_releases = True)
+
+        # Assert
+        self.assertIsNone(unstable)
+        self.assertIsNone(missing)
+    def test_getpackagenames_shouldreturnsortednames_wheninvoked(self) -> None:
+
+        # Arrange
+        snapshot : SnapshotReleaseCache = self.create_snapshot(package_names = ["pandas", "numpy"])
+
+        # Act
+        actual : list[str] = snapshot.get_package_names()
+
+        # Assert
+        self.assertEqual(actual, ["numpy", "pandas"])
+    def test_copyto_shouldaddallentries_wheninvoked(self) -> None:
+
+        # Arrange
+        snapshot : SnapshotReleaseCache = self.create_snapshot(package_names = ["pandas", "numpy"])
+        release_cache : InMemoryReleaseCache = InMemoryReleaseCache()
+
+        # Act
+        actual : int = snapshot.copy_to(release_cache = release_cache)
+
+        # Assert
+        self.assertEqual(actual, 2)
+        self.assertEqual(release_cache.get_package_names(), ["numpy", "pandas"])
+    def test_copyto_shouldkeepfetchedat_whenreleasecacheisfilereleasecache(self) -> None:
+
+        # Arrange
+        snapshot : SnapshotReleaseCache = self.create_snapshot(package_names = ["pandas"])
+        release_cache : FileReleaseCache = FileReleaseCache(cache_dir = os.path.dirname(self.snapshot_path), ttl = 60, now_function = self.now_function)
+
+        # Act
+        snapshot.copy_to(release_cache = release_cache)
+        actual : Optional[FSession] = release_cache.try_get(package_name = "pandas", only_stable_releases = True)
+
+        # Assert
+        self.assertEqual(actual, snapshot.try_get(package_name = "pandas", only_stable_releases = True))
+        self.assertEqual((cast(FSession, actual).age, cast(FSession, actual).is_stale), (100.0, True))
+    @parameterized.expand([
+        [b""],
+        [b"NWPSNAP"],
+        [b"NOTASNAP" + bytes(24)]
+    ])
+    def test_init_shouldraiseexception_whenfileisnotasnapshot(self, content : bytes) -> None:
+
+        # Arrange
+        with open(self.snapshot_path, "wb") as file:
+            file.write(content)
+
+        expected : str = _MessageCollection.provided_file_isnt_a_snapshot(file_path = self.snapshot_path)
+
+        # Act
+        with self.assertRaises(Exception) as context:
+            SnapshotReleaseCache(file_path = self.snapshot_path)
+
+        # Assert
+        self.assertEqual(str(context.exception), expected)
+class PackageFilterTestCase(unittest.TestCase):
+
+    @parameterized.expand([
+        [None, None, "pandas", True],
+        [None, ["acme-*"], "acme-billing", False],
+        [None, ["acme-*"], "Acme_Billing", False],
+        [None, ["acme-*"], "pandas", True],
+        [["pandas", "numpy"], None, "numpy", True],
+        [["pandas", "numpy"], None, "acme-billing", False],
+        [["*"], ["acme-*"], "acme-billing", False]
+    ])
+    def test_isallowed_shouldreturnexpectedbool_wheninvoked(self, allowed : Optional[list[str]], denied : Optional[list[str]], package_name : str, expected : bool) -> None:
+
+        # Arrange
+        package_filter : PackageFilter = PackageFilter(allowed = allowed, denied = denied)
+
+        # Act
+        actual : bool = package_filter.is_allowed(package_name = package_name)
+
+        # Assert
+        self.assertEqual(actual, expected)
+class RateLimiterTestCase(unittest.TestCase):
+
+    def test_acquire_shouldspaceoutcalls_whencalledinburst(self) -> None:
+
+        # Arrange
+        sleeping_function : MagicMock = MagicMock()
+        rate_limiter : RateLimiter = RateLimiter(rate = 5, now_function = MagicMock(return_value = 100.0), sleeping_function = sleeping_function)
+
+        # Act
+        actual : list[float] = [rate_limiter.acquire() for _ in range(3)]
+
+        # Assert
+        self.assertEqual([round(delay, 6) for delay in actual], [0.0, 0.2, 0.4])
+        self.assertEqual(sleeping_function.call_count, 2)
+    def test_acquire_shouldnotwait_whencallsarespacedoutenough(self) -> None:
+
+        # Arrange
+        now_function : MagicMock = MagicMock(side_effect = [100.0, 100.5, 101.0])
+        sleeping_function : MagicMock = MagicMock()
+        rate_limiter : RateLimiter = RateLimiter(rate = 5, now_function = now_function, sleeping_function = sleeping_function)
+
+        # Act
+        actual : list[float] = [rate_limiter.acquire() for _ in range(3)]
+
+        # Assert
+        self.assertEqual(actual, [0.0, 0.0, 0.0])
+        sleeping_function.assert_not_called()
+class CachingProxyTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        temporary_directory : tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+
+        self.cache_dir : str = temporary_directory.name
+        self.now_function : MagicMock = MagicMock(return_value = 1000.0)
+        self.rate_limiter : MagicMock = MagicMock(spec = RateLimiter)
+
+    def create_response(self, status_code : int, content : bytes = b"<rss></rss>") -> Mock:
+
+        '''Creates a Response mock with the provided status code and content.'''
+
+        response : Mock = Mock()
+        response.status_code = status_code
+        response.content = content
+        response.headers = { "Content-Type": "text/xml" }
+
+        return response
+    def create_caching_proxy(self, get_function : Callable[[str], Response]) -> CachingProxy:
+
+        '''Creates a CachingProxy in front of https://upstream.org with ttl = 60, feed_ttl = 10 and not_found_ttl = 5.'''
+
+        return CachingProxy(
+            upstream_url = "https://upstream.org/",
+            cache_dir = self.cache_dir,
+            ttl = 60,
+            feed_ttl = 10,
+            not_found_ttl = 5,
+            get_function = get_function,
+            rate_limiter = self.rate_limiter,
+            now_function = self.now_function
+        )
+
+    @parameterized.expand([
+        ["/rss/project/numpy/releases.xml"],
+        ["/project/numpy/"],
+        ["/rss/updates.xml"]
+    ])
+    def test_get_shouldservefromcache_whenpathwasalreadyfetched(self, path : str) -> None:
+
+        # Arrange
+        get_function : MagicMock = MagicMock(return_value = self.create_response(status_code = 200))
+        caching_proxy : CachingProxy = self.create_caching_proxy(get_function = get_function)
+
+        # Act
+        first : ProxyResponse = caching_proxy.get(path = path)
+        second : ProxyResponse = self.create_caching_proxy(get_function = get_function).get(path = path + "?cache=no")
+
+        # Assert
+        get_function.assert_called_once_with(f"https://upstream.org{path}")
+        self.rate_limiter.acquire.assert_called_once_with()
+        self.assertEqual(first, ProxyResponse(status = 200, content_type = "text/xml", body = b"<rss></rss>", is_hit = False))
+        self.assertEqual(second, replace(first, is_hit = True))
+    @parameterized.expand([
+        ["/rss/project/numpy/releases.xml", 1059.0, 1],
+        ["/rss/project/numpy/releases.xml", 1060.0, 2],
+        ["/rss/updates.xml", 1009.0, 1],
+        ["/rss/updates.xml", 1010.0, 2]
+    ])
+    def test_get_shouldrefetch_whencachedresponseisexpired(self, path : str, now : float, expected : int) -> None:
+
+        # Arrange
+        get_function : MagicMock = MagicMock(return_value = self.create_response(status_code = 200))
+        caching_proxy : CachingProxy = self.create_caching_proxy(get_function = get_function)
+
+        # Act
+        caching_proxy.get(path = path)
+        self.now_function.return_value = now
+        caching_proxy.get(path = path)
+
+        # Assert
+        self.assertEqual(get_function.call_count, expected)
+    def test_get_shouldreturnnotfoundwithoutupstreamcall_whenpathisnotused(self) -> None:
+
+        # Arrange
+        get_function : MagicMock = MagicMock()
+        caching_proxy : CachingProxy = self.create_caching_proxy(get_function = get_function)
+
+        # Act
+        actual : ProxyResponse = caching_proxy.get(path = "/simple/numpy/")
+
+        # Assert
+        self.assertEqual(actual.status, 404)
+        get_function.assert_not_called()
+    @parameterized.expand([
+        [404, 1],
+        [500, 2],
+        [503, 2]
+    ])
+    def test_get_shouldcacheonlyokandnotfound_wheninvoked(self, status_code : int, expected : int) -> None:
+
+        # Arrange
+        get_function : MagicMock = MagicMock(return_value = self.create_response(status_code = status_code))
+        caching_proxy : CachingProxy = self.create_caching_proxy(get_function = get_function)
+
+        # Act
+        caching_proxy.get(path = "/rss/project/numpy/releases.xml")
+        actual : ProxyResponse = caching_proxy.get(path = "/rss/project/numpy/releases.xml")
+
+        # Assert
+        self.assertEqual(actual.status, status_code)
+        self.assertEqual(get_function.call_count, expected)
+    @parameterized.expand([
+        ["/rss/project/numpy/releases.xml", 1004.0, 1],
+        ["/rss/project/numpy/releases.xml", 1005.0, 2],
+        ["/project/numpy/", 1005.0, 2]
+    ])
+    def test_get_shouldrefetchnotfoundsooner_whennotfoundttlhaspassed(self, path : str, now : float, expected : int) -> None:
+
+        # Arrange
+        get_function : MagicMock = MagicMock(return_value = self.create_response(status_code = 404))
+        caching_proxy : CachingProxy = self.create_caching_proxy(get_function = get_function)
+
+        # Act
+        caching_proxy.get(path = path)
+        self.now_function.return_value = now
+        caching_proxy.get(path = path)
+
+        # Assert
+        self.assertEqual(get_function.call_count, expected)
+    def test_get_shouldreturnbadgateway_whenupstreamisunreachable(self) -> None:
+
+        # Arrange
+        get_function : MagicMock = MagicMock(side_effect = requests.ConnectionError("Connection refused"))
+        caching_proxy : CachingProxy = self.create_caching_proxy(get_function = get_function)
+
+        # Act
+        actual : ProxyResponse = caching_proxy.get(path = "/rss/project/numpy/releases.xml")
+
+        # Assert
+        self.assertEqual(actual.status, 502)
+        self.assertFalse(actual.is_hit)
+    def test_get_shouldcoalesceconcurrentmisses_whenpathisthesame(self) -> None:
+
+        # Arrange
+        release : Event = Event()
+        get_function : MagicMock = MagicMock(side_effect = lambda url : release.wait(timeout = 5) and self.create_response(status_code = 200))
+        caching_proxy : CachingProxy = self.create_caching_proxy(get_function = get_function)
+        results : list[ProxyResponse] = []
+
+        # Act
+        threads : list[Thread] = [Thread(target = lambda : results.append(caching_proxy.get(path = "/project/numpy/"))) for _ in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        while get_function.call_count == 0:
+            sleep(0.01)
+
+        sleep(0.1)
+        release.set()
+
+        for thread in threads:
+            thread.join(timeout = 5)
+
+        # Assert
+        get_function.assert_called_once()
+        self.assertEqual([result.status for result in results], [200, 200, 200, 200])
+class HedgedGetterTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        self.primary_url : str = "https://mirror.local/rss/project/pandas/releases.xml"
+        self.secondary_url : str = "https://pypi.org/rss/project/pandas/releases.xml"
+        self.primary_response : Mock = Mock(name = "primary", status_code = 200)
+        self.secondary_response : Mock = Mock(name = "secondary", status_code = 200)
+
+    def test_get_shouldcallgetfunctiondirectly_whenoneurlisprovided(self) -> None:
+
+        # Arrange
+        get_function : Mock = Mock(return_value = self.primary_response)
+        hedged_getter : HedgedGetter = HedgedGetter(get_function = get_function)
+
+        # Act
+        actual : Response = hedged_getter.get(urls = [self.primary_url])
+
+        # Assert
+        self.assertIs(actual, self.primary_response)
+        get_function.assert_called_once_with(self.primary_url)
+        self.assertEqual(hedged_getter.get_stats(), HedgingStats(requests = 1, hedges_fired = 0, hedges_won = 0, time_saved = 0.0))
+    def test_get_shouldnothedge_whenprimaryanswerswithindelay(self) -> None:
+
+        # Arrange
+        get_function : Mock = Mock(return_value = self.primary_response)
+        hedged_getter : HedgedGetter = HedgedGetter(get_function = get_function, hedge_delay = 5.0)
+
+        # Act
+        actual : Response = hedged_getter.get(urls = [self.primary_url, self.secondary_url])
+
+        # Assert
+        self.assertIs(actual, self.primary_response)
+        get_function.assert_called_once_with(self.primary_url)
+        self.assertEqual(hedged_getter.get_stats().hedges_fired, 0)
+    def test_get_shouldreturnsecondaryresponse_whenprimaryisslow(self) -> None:
+
+        # Arrange
+        release_primary : Event = Event()
+
+        def get_function(url : str) -> Any:
+            if url == self.primary_url:
+                release_primary.wait(timeout = 5)
+                return self.primary_response
+            return self.secondary_response
+
+        hedged_getter : HedgedGetter = HedgedGetter(get_function = get_function, hedge_delay = 0.01)
+
+        # Act
+        actual : Response = hedged_getter.get(urls = [self.primary_url, self.secondary_url])
+        release_primary.set()
+
+        # Assert
+        self.assertIs(actual, self.secondary_response)
+        stats : HedgingStats = hedged_getter.get_stats()
+        self.assertEqual((stats.requests, stats.hedges_fired, stats.hedges_won), (1, 1, 1))
+    def test_get_shouldfailovertosecondary_whenprimaryfails(self) -> None:
+
+        # Arrange
+        def get_function(url : str) -> Any:
+            if url == self.primary_url:
+                raise requests.ConnectionError()
+            return self.secondary_response
+
+        hedged_getter : HedgedGetter = HedgedGetter(get_function = get_function, hedge_delay = 5.0)
+
+        # Act
+        actual : Response = hedged_getter.get(urls = [self.primary_url, self.secondary_url])
+
+        # Assert
+        self.assertIs(actual, self.secondary_response)
+    def test_get_shouldraiselasterror_whenallurlsfail(self) -> None:
+
+        # Arrange
+        get_function : Mock = Mock(side_effect = requests.ConnectionError())
+        hedged_getter : HedgedGetter = HedgedGetter(get_function = get_function, hedge_delay = 5.0)
+
+        # Act, Assert
+        with self.assertRaises(requests.ConnectionError):
+            hedged_getter.get(urls = [self.primary_url, self.secondary_url])
+
+        self.assertEqual(get_function.call_count, 2)
+    def test_get_shouldreturnsecondaryresponse_whenprimaryanswerswithnon2xx(self) -> None:
+
+        # Arrange
+        self.primary_response.status_code = 503
+
+        def get_function(url : str) -> Any:
+            if url == self.primary_url:
+                return self.primary_response
+            sleep(0.05)
+            return self.secondary_response
+
+        hedged_getter : HedgedGetter = HedgedGetter(get_function = get_function, hedge_delay = 5.0)
+
+        # Act
+        actual : Response = hedged_getter.get(urls = [self.primary_url, self.secondary_url])
+
+        # Assert
+        self.assertIs(actual, self.secondary_response)
+        self.primary_response.close.assert_called_once_with()
+        stats : HedgingStats = hedged_getter.get_stats()
+        self.assertEqual((stats.requests, stats.hedges_fired, stats.hedges_won), (1, 1, 1))
+    def test_get_shouldreturnlastresponse_whenallurlsanswerwithnon2xx(self) -> None:
+
+        # Arrange
+        self.primary_response.status_code = 503
+        self.secondary_response.status_code = 429
+        get_function : Mock = Mock(side_effect = [self.primary_response, self.secondary_response])
+        hedged_getter : HedgedGetter = HedgedGetter(get_function = get_function, hedge_delay = 5.0)
+
+        # Act
+        actual : Response = hedged_getter.get(urls = [self.primary_url, self.secondary_url])
+
+        # Assert
+        self.assertIs(actual, self.secondary_response)
+        self.primary_response.close.assert_called_once_with()
+        self.secondary_response.close.assert_not_called()
+    def test_get_shouldreturnlastresponse_whenotherurlsraise(self) -> None:
+
+        # Arrange
+        self.primary_response.status_code = 503
+        get_function : Mock = Mock(side_effect = [self.primary_response, requests.ConnectionError()])
+        hedged_getter : HedgedGetter = HedgedGetter(get_function = get_function, hedge_delay = 5.0)
+
+        # Act
+        actual : Response = hedged_getter.get(urls = [self.primary_url, self.secondary_url])
+
+        # Assert
+        self.assertIs(actual, self.primary_response)
+    def test_init_shouldshareexecutor_whennoneisprovided(self) -> None:
+
+        # Arrange
+        # Act
+        first : HedgedGetter = HedgedGetter()
+        second : HedgedGetter = HedgedGetter()
+
+        # Assert
+        self.assertIs(first._HedgedGetter__executor, second._HedgedGetter__executor) # type: ignore
+    def test_str_shouldreturnexpectedstring_wheninvoked(self) -> None:
+
+        # Arrange
+        expected : str = "{ 'requests': '10', 'hedges_fired': '3', 'hedges_won': '2', 'time_saved': '1.50' }"
+
+        # Act
+        actual : str = str(HedgingStats(requests = 10, hedges_fired = 3, hedges_won = 2, time_saved = 1.5))
+
+        # Assert
+        self.assertEqual(actual, expected)
+class AIMDControllerTestCase(unittest.TestCase):
+
+    def test_onsuccess_shouldincreaselimitadditively_whenlimitsuccessesareobserved(self) -> None:
+
+        # Arrange
+        controller : AIMDController = AIMDController(initial_limit = 2, max_limit = 4)
+
+        # Act
+        controller.on_success(latency = 0.1)
+        limit_after_one : int = controller.limit
+        controller.on_success(latency = 0.1)
+
+        # Assert
+        self.assertEqual(limit_after_one, 2)
+        self.assertEqual(controller.limit, 3)
+    def test_onsuccess_shouldnotexceedmaxlimit_wheninvoked(self) -> None:
+
+        # Arrange
+        controller : AIMDController = AIMDController(initial_limit = 2, max_limit = 2)
+
+        # Act
+        for _ in range(10):
+            controller.on_success(latency = 0.1)
+
+        # Assert
+        self.assertEqual(controller.limit, 2)
+    def test_onsuccess_shoulddecreaselimitmultiplicatively_whenlatencyspikes(self) -> None:
+
+        # Arrange
+        controller : AIMDController = AIMDController(initial_limit = 8, spike_factor = 3.0)
+
+        # Act
+        controller.on_success(latency = 0.1)
+        controller.on_success(latency = 1.0)
+
+        # Assert
+        self.assertEqual(controller.limit, 4)
+        self.assertEqual(controller.get_stats().decreases, 1)
+
+    @parameterized.expand([
+        [requests.HTTPError(response = Mock(status_code = 429)), 4],
+        [requests.HTTPError(response = Mock(status_code = 503)), 4],
+        [requests.Timeout(), 4],
+        [requests.HTTPError(response = Mock(status_code = 404)), 8],
+        [Exception("No suitable XML items found."), 8]
+    ])
+    def test_onfailure_shouldupdatelimitasexpected_wheninvoked(self, error : Exception, expected : int) -> None:
+
+        # Arrange
+        controller : AIMDController = AIMDController(initial_limit = 8)
+
+        # Act
+        controller.on_failure(error = error)
+
+        # Assert
+        self.assertEqual(controller.limit, expected)
+    def test_onfailure_shouldnotgobelowminlimit_wheninvoked(self) -> None:
+
+        # Arrange
+        controller : AIMDController = AIMDController(initial_limit = 1, min_limit = 1)
+
+        # Act
+        controller.on_failure(error = requests.Timeout())
+
+        # Assert
+        self.assertEqual(controller.limit, 1)
+    def test_acquirerelease_shouldtrackinflight_wheninvoked(self) -> None:
+
+        # Arrange
+        controller : AIMDController = AIMDController(initial_limit = 2)
+
+        # Act
+        controller.acquire()
+        controller.acquire()
+        in_flight : int = controller.get_stats().in_flight
+        controller.release()
+
+        # Assert
+        self.assertEqual(in_flight, 2)
+        self.assertEqual(controller.get_stats(), ConcurrencyStats(limit = 2, in_flight = 1, increases = 0, decreases = 0))
+class ContentParserTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        self.releases_content : str = str(
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<rss version="2.0"><channel>'
+            '<item><title>2.0.0b1</title><pubDate>Fri, 20 Sep 2024 13:08:42 GMT</pubDate></item>'
+            '<item><title>1.9.0</title><pubDate>Wed, 10 Apr 2024 19:44:10 GMT</pubDate></item>'
+            '</channel></rss>'
+        )
+        self.history_content : bytes = str(
+            '<div class="release-timeline">'
+            '<p class="release__version">2.0.0b1<span class="badge badge--warning">pre-release</span></p>'
+            '<p class="release__version">1.9.0</p>'
+            '</div>'
+        ).encode()
+        self.d_session : DSession = DSession(
+            package_name = "acme",
+            only_stable_releases = True,
+            url = "https://pypi.org/rss/project/acme/releases.xml",
+            releases_content = self.releases_content,
+            history_content = self.history_content
+        )
+
+    def test_parse_shouldreturnexpectedpsession_whendsessionhashistorycontent(self) -> None:
+        
+        # Arrange
+        content_parser : ContentParser = ContentParser()
+
+        # Act
+        actual : PSession = content_parser.parse(d_session = self.d_session)
+
+        # Assert
+        self.assertEqual(actual.package_name, "acme")
+        self.assertEqual(actual.url, self.d_session.url)
+        self.assertEqual([xml_item.title for xml_item in actual.xml_items], ["2.0.0b1", "1.9.0"])
+        self.assertEqual(actual.badges, [Badge(package_name = "acme", version = "2.0.0b1", label = "pre-release")])
+    def test_parse_shouldreturnpicklableresults_wheninvoked(self) -> None:
+        
+        # Arrange
+        content_parser : ContentParser = ContentParser()
+
+        # Act
+        expected : PSession = content_parser.parse(d_session = self.d_session)
+        actual : PSession = pickle.loads(pickle.dumps(expected))
+
+        # Assert
+        self.assertEqual(actual, expected)
+        self.assertEqual(pickle.loads(pickle.dumps(content_parser)).parse(d_session = self.d_session), expected)
+
+    @parameterized.expand([
+        [False, ["3.0.0a1", "2.9.0b2", "2.8.0"]],
+        [True, ["3.0.0a1", "2.9.0b2"]]
+    ])
+    def test_parsebadges_shouldstopatfirstunbadgedrelease_whenrequested(self, stop_at_first_unbadged : bool, expected : list[str]) -> None:
+        
+        # Arrange
+        content : bytes = str(
+            '<div class="release-timeline">'
+            '<p class="release__version">3.0.0a1<span class="badge">pre-release</span></p>'
+            '<p class="release__version">\n  2.9.0b2\n  <span class="badge">pre-release</span><span class="badge">yanked</span></p>'
+            '<p class="release__version">2.9.0</p>'
+            '<p class="release__version">2.8.0<span class="badge">yanked</span></p>'
+            '</div>'
+        ).encode()
+        content_parser : ContentParser = ContentParser(stop_at_first_unbadged = stop_at_first_unbadged)
+
+        # Act
+        actual : Optional[list[Badge]] = content_parser.parse_badges(package_name = "acme", content = content)
+
+        # Assert
+        self.assertEqual([badge.version for badge in cast(list[Badge], actual)], expected)
+        self.assertEqual(cast(list[Badge], actual)[1].label, "pre-release")
+
+    @parameterized.expand([
+        ["Fri, 20 Sep 2024 13:08:42 GMT", datetime(2024, 9, 20, 13, 8, 42)],
+        [None, None]
+    ])
+    def test_parsepubdatestr_shouldreturndatetimeornone_wheninvoked(self, pubdate_str : Optional[str], expected : Optional[datetime]) -> None:
+        
+        # Arrange      
+        # Act
+        content_parser : ContentParser = ContentParser()
+        actual : Optional[datetime] = content_parser._ContentParser__parse_pubdate_str(pubdate_str) # type: ignore
+
+        # Assert
+        self.assertEqual(actual, expected)
+class PyPiBadgeFetcherTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        self.badge_fetcher : PyPiBadgeFetcher = PyPiBadgeFetcher()
+    
+        self.html_response : str = str(
+            '<div class="release-timeline">'
+            '<div class="release release--latest">'
+            '<div class="release__meta"></div>'
+            '<div class="release__graphic">'
+            '<div class="release__line"></div>'
+            '<img class="release__node" alt="" src="https://pypi.org/static/images/white-cube.2351a86c.svg">'
+            '</div>'
+            '<a class="card release__card" href="/project/ipykernel/7.0.0a0/">'
+            '<p class="release__version">7.0.0a0'
+            '<span class="badge badge--warning">pre-release</span>'
+            '</p>'
+            '<p class="release__version-date">'
+            '<time datetime="2024-10-22T08:26:22+0000">Oct 22, 2024</time>'
+            '</p>'
+            '</a>'
+            '</div>'
+            '<div class="release release--current">'
+            '<div class="release__meta"><span class="badge">This version</span></div>'
+            '<div class="release__graphic">'
+            '<div class="release__line"></div>'
+            '<img class="release__node" alt="" src="https://pypi.org/static/images/blue-cube.572a5bfb.svg">'
+            '</div>'
+            '<a class="card release__card" href="/project/ipykernel/6.29.5/">'
+            '<p class="release__version">6.29.5</p>'
+            '<p class="release__version-date">'
+            '<time datetime="2024-07-01T14:07:19+0000">Jul 1, 2024</time>'
+            '</p>'
+            '</a>'
+            '</div>'
+            '<div class="release">'
+            '<div class="release__meta"></div>'
+            '<div class="release__graphic">'
+            '<div class="release__line"></div>'
+            '<img class="release__node" alt="" src="https://pypi.org/static/images/white-cube.2351a86c.svg">'
+            '</div>'
+            '<a class="card release__card" href="/project/ipykernel/6.29.4/">'
+            '<p class="release__version">6.29.4</p>'
+            '<p class="release__version-date">'
+            '<time datetime="2024-03-27T22:25:41+0000">Mar 27, 2024</time>'
+            '</p>'
+            '</a>'
+            '</div>'
+            '<div class="release__graphic">'
+            '<div class="release__line"></div>'
+            '<img class="release__node" alt="" src="https://pypi.org/static/images/white-cube.2351a86c.svg">'
+            '</div>'
+            '<a class="card release__card" href="/project/ipykernel/6.27.0/">'
+            '<p class="release__version">6.27.0'
+            '<span class="badge badge--danger">yanked</span>'
+            '</p>'
+            '<p class="release__version-date">'
+            '<time datetime="2023-11-21T11:23:46+0000">Nov 21, 2023</time>'
+            '</p>'
+            '<div class="callout-block callout-block--danger release__yanked-reason">'
+            '<p>Reason this release was yanked:</p><p>broke %edit magic</p>'
+            '</div>'
+            '</a>'
+            '</div>'
+        ) 
+        self.package_name : str = "ipykernel"
+        self.badges : list[Badge] = [
+            Badge(package_name = "ipykernel", version = "7.0.0a0", label = "pre-release"),
+            Badge(package_name = "ipykernel", version = "6.27.0", label = "yanked")
+        ]
+
+        self.response_mock : Response = Mock(content = self.html_response)       
+        self.get_function_mock : Callable[[str], Response] = Mock(return_value = self.response_mock)
+
+    def test_pypibadgefetcher_shouldinitializeasexpected_wheninvoked(self) -> None:
+        
+        # Arrange
+        # Act
+        # Assert
+        self.assertIsInstance(self.badge_fetcher, PyPiBadgeFetcher)
+        self.assertTrue(callable(self.badge_fetcher._PyPiBadgeFetcher__get_function))   # type: ignore
+    def test_formaturl_shouldreturnexpectedurl_wheninvoked(self) -> None:
+
+        # Arrange
+        package_name : str = "pandas"
+        expected : str = "https://pypi.org/project/pandas/#history"
+        
+        # Act
+        actual : str = self.badge_fetcher._PyPiBadgeFetcher__format_url(package_name = package_name)  # type: ignore
+        
+        # Assert
+        self.assertEqual(actual, expected)
+    def test_tryfetch_shouldreturnexpectedbadges_wheninvoked(self) -> None:
+        
+        # Arrange       
+        # Act
+        badge_fetcher = PyPiBadgeFetcher(get_function = self.get_function_mock)
+        actual : Optional[list[Badge]] = badge_fetcher.try_fetch(package_name = self.package_name)
+        
+        # Assert
+        self.assertTrue(SupportMethodProvider().are_lists_of_badges_equal(list1 = actual, list2 = self.badges))
+    def test_tryfetch_shouldreturnnone_whennobadgesfound(self) -> None:
+        
+        # Arrange
+        response_mock : Response = Mock(content = "<html></html>")
+        get_function_mock : Callable[[str], Response] = Mock(return_value = response_mock)
+        package_name : str = "non_existent_package"       
+        
+        # Act
+        badge_fetcher = PyPiBadgeFetcher(get_function = get_function_mock)
+        actual : Optional[list[Badge]] = badge_fetcher.try_fetch(package_name = package_name)
+        
+        # Assert
+        self.assertIsNone(actual)
+    def test_tryfetch_shouldstopatfirstunbadgedrelease_whenstreaming(self) -> None:
+        
+        # Arrange
+        content : bytes = self.html_response.encode()
+        chunks : list[bytes] = [content[i:i + 64] for i in range(0, len(content), 64)]
+        response_mock : MagicMock = MagicMock(spec = Response)
+        response_mock.iter_content.return_value = iter(chunks)
+        stream_function_mock : Callable[[str], Response] = Mock(return_value = response_mock)
+        
+        # Act
+        badge_fetcher = PyPiBadgeFetcher(get_function = Mock(), stream_function = stream_function_mock, chunk_size = 64)
+        actual : Optional[list[Badge]] = badge_fetcher.try_fetch(package_name = self.package_name)
+        stats : list[StreamingStats] = badge_fetcher.get_streaming_stats()
+
+        # Assert
+        self.assertEqual(actual, [self.badges[0]])
+        self.assertEqual(len(stats), 1)
+        self.assertTrue(stats[0].stopped_early)
+        self.assertFalse(stats[0].truncated)
+        self.assertLess(stats[0].bytes_read, len(content))
+        self.assertLess(stats[0].bytes_kept, stats[0].bytes_read)
+        response_mock.iter_content.assert_called_once_with(chunk_size = 64)
+        response_mock.close.assert_called_once()
+    def test_tryfetch_shouldreleaseprocessedelements_whenstreaming(self) -> None:
+        
+        # Arrange
+        release : str = str(
+            '<div class="release"><a class="card release__card" href="/project/ipykernel/{0}/">'
+            '<p class="release__version">{0}<span class="badge badge--warning">pre-release</span></p>'
+            '<p class="release__version-date"><time datetime="2023-11-06T15:34:03+0000">Nov 6, 2023</time></p>'
+            '</a></div>'
+        )
+        content : bytes = str(
+            '<html><body><div class="release-timeline">'
+            + "".join(release.format(f"7.0.0a{i}") for i in range(300))
+            + '</div></body></html>'
+        ).encode()
+        chunks : list[bytes] = [content[i:i + 256] for i in range(0, len(content), 256)]
+        response_mock : MagicMock = MagicMock(spec = Response)
+        response_mock.iter_content.return_value = iter(chunks)
+        parsers : list[Any] = []
+        html_pull_parser : Any = etree.HTMLPullParser
+
+        def create_parser(*args : Any, **kwargs : Any) -> Any:
+            parsers.append(html_pull_parser(*args, **kwargs))
+            return parsers[-1]
+
+        # Act
+        badge_fetcher = PyPiBadgeFetcher(get_function = Mock(), stream_function = Mock(return_value = response_mock), chunk_size = 256)
+        with patch.object(etree, "HTMLPullParser", side_effect = create_parser):
+            actual : Optional[list[Badge]] = badge_fetcher.try_fetch(package_name = self.package_name)
+        held : int = len(list(parsers[0].close().iter()))
+
+        # Assert
+        self.assertEqual(len(cast(list[Badge], actual)), 300)
+        self.assertLess(held, 10)
+    def test_tryfetch_shoulddownloadwholepage_whenmaxbytesisreached(self) -> None:
+        
+        # Arrange
+        content : bytes = self.html_response.encode()
+        chunks : list[bytes] = [content[i:i + 64] for i in range(0, len(content), 64)]
+        response_mock : MagicMock = MagicMock(spec = Response)
+        response_mock.iter_content.return_value = iter(chunks)
+        stream_function_mock : Callable[[str], Response] = Mock(return_value = response_mock)
+        get_function_mock : Callable[[str], Response] = Mock(return_value = Mock(content = content, status_code = 200))
+        
+        # Act
+        badge_fetcher = PyPiBadgeFetcher(get_function = get_function_mock, stream_function = stream_function_mock, max_bytes = 128, chunk_size = 64)
+        actual : Optional[list[Badge]] = badge_fetcher.try_fetch(package_name = self.package_name)
+        stats : list[StreamingStats] = badge_fetcher.get_streaming_stats()
+
+        # Assert
+        self.assertTrue(SupportMethodProvider().are_lists_of_badges_equal(list1 = actual, list2 = self.badges))
+        self.assertEqual(
+            stats[0], 
+            StreamingStats(
+                package_name = self.package_name, 
+                bytes_read = 128, 
+                bytes_kept = len(b"<div></div>"), 
+                stopped_early = False, 
+                truncated = True, 
+                peak_bytes_held = len(content), 
+                fell_back = True
+            )
+        )
+        response_mock.close.assert_called_once()
+        cast(Mock, get_function_mock).assert_called_once()
+    def test_tryfetch_shouldreportpeakbytesheld_whenstreaming(self) -> None:
+        
+        # Arrange
+        content : bytes = self.html_response.encode()
+        chunks : list[bytes] = [content[i:i + 64] for i in range(0, len(content), 64)]
+        response_mock : MagicMock = MagicMock(spec = Response)
+        response_mock.iter_content.return_value = iter(chunks)
+        get_function_mock : Callable[[str], Response] = Mock()
+        
+        # Act
+        badge_fetcher = PyPiBadgeFetcher(get_function = get_function_mock, stream_function = Mock(return_value = response_mock), chunk_size = 64)
+        badge_fetcher.try_fetch(package_name = self.package_name)
+        stats : list[StreamingStats] = badge_fetcher.get_streaming_stats()
+
+        # Assert
+        self.assertFalse(stats[0].fell_back)
+        self.assertGreaterEqual(stats[0].peak_bytes_held, stats[0].bytes_kept)
+        self.assertLess(stats[0].peak_bytes_held, len(content))
+        cast(Mock, get_function_mock).assert_not_called()
+class PyPiReleaseFetcherTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        self.xml_content : str = '\n'.join([
+			'<?xml version="1.0" encoding="UTF-8"?>',
+			'<rss version="2.0">',
+			'  <channel>',
+			'    <item>',
+			'      <title>2.2.3</title>',
+			'      <link>https://pypi.org/project/pandas/2.2.3/</link>',
+			'      <description>Powerful data structures for data analysis, time series, and statistics</description>',
+			'      <author>pandas-dev@python.org</author>',
+			'      <pubDate>Fri, 20 Sep 2024 13:08:42 GMT</pubDate>',
+			'    </item>',
+			'    <item>',
+			'      <title>2.2.2</title>',
+			'      <link>https://pypi.org/project/pandas/2.2.2/</link>',
+			'      <description>Powerful data structures for data analysis, time series, and statistics</description>',
+			'      <author>pandas-dev@python.org</author>',
+			'      <pubDate>Wed, 10 Apr 2024 19:44:10 GMT</pubDate>',
+			'    </item>',
+			'  </channel>',
+			'</rss>'
+		])
+        
+        self.xml_response : Response = Mock()
+        self.xml_response.text = self.xml_content
+        self.get_function_mock : Callable[[str], Response] = Mock(return_value = self.xml_response)
+
+        self.xml_items : list[XMLItem] = [
+            XMLItem(
+                title = "2.2.3", 
+                link = "https://pypi.org/project/pandas/2.2.3/", 
+                description = "Powerful data structures for data analysis, time series, and statistics",
+                author = "pandas-dev@python.org",
+                pubdate = datetime(2024, 9, 20, 13, 8, 42),
+                pubdate_str = "Fri, 20 Sep 2024 13:08:42 GMT"
+                ),
+            XMLItem(
+                title = "2.2.2", 
+                link = "https://pypi.org/project/pandas/2.2.2/", 
+                description = "Powerful data structures for data analysis, time series, and statistics",
+                author = "pandas-dev@python.org",
+                pubdate = datetime(2024, 4, 10, 19, 44, 10),
+                pubdate_str = "Wed, 10 Apr 2024 19:44:10 GMT"
+                ),
+        ]
+        self.releases : list[Release] = [
+            Release(package_name = "pandas", version = "2.2.3", date = datetime(2024, 9, 20, 13, 8, 42)),
+            Release(package_name = "pandas", version = "2.2.2", date = datetime(2024, 4, 10, 19, 44, 10))
+        ]
+
+        self.badges : list[Badge] = [
+            Badge(package_name = "numpy", version = "2.2.3alpha", label = "pre-release"),
+            Badge(package_name = "numpy", version = "2.2.2d0", label = "yanked")
+        ]
+    
+        self.badge_fetcher_mock : PyPiBadgeFetcher = Mock()
+        self.badge_fetcher_mock.download.return_value = b"<html></html>"
+        self.badge_fetcher_mock.parse.return_value = self.badges
+
+    def test_pypireleasefetcher_shouldinitializeasexpected_wheninvoked(self) -> None:
+        
+        # Arrange
+        # Act
+        release_fetcher : PyPiReleaseFetcher = PyPiReleaseFetcher()
+
+        # Assert
+        self.assertIsInstance(release_fetcher, PyPiReleaseFetcher)
+        self.assertTrue(callable(release_fetcher._PyPiReleaseFetcher__get_function))                    # type: ignore
+        self.assertIsInstance(release_fetcher._PyPiReleaseFetcher__badge_fetcher, PyPiBadgeFetcher)     # type: ignore
+    def test_fetch_shouldraiseexception_whenxmlitemsarezero(self) -> None:
+        
+        # Arrange
+        xml_content : str = self.xml_content.replace("<title>2.2.3</title>", "<title></title>")
+        xml_content = xml_content.replace("<pubDate>Wed, 10 Apr 2024 19:44:10 GMT</pubDate>", "")       
+        xml_response : Mock = Mock(spec = Response)
+        xml_response.text = xml_content
+
+        get_function_mock : Callable[[str], Response] = Mock(return_value = xml_response)
+        msg : str = _MessageCollection.no_suitable_xml_items_found(url = "https://pypi.org/rss/project/pandas/releases.xml")
+
+        # Act, Assert
+        with self.assertRaises(expected_exception = Exception, msg = msg):
+            release_fetcher : PyPiReleaseFetcher = PyPiReleaseFetcher(get_function = get_function_mock)
+            release_fetcher.fetch(package_name = "pandas", only_stable_releases = False)
+    def test_fetch_shouldreturnexpectedfsession_whenonlystablereleasesisfalse(self) -> None:
+        
+        # Arrange
+        expected : FSession = FSession(
+            package_name = "pandas",
+            most_recent_release = self.releases[0],
+            releases = self.releases,
+            xml_items = self.xml_items,
+            badges = None
+        )
+        
+        # Act
+        release_fetcher : PyPiReleaseFetcher = PyPiReleaseFetcher(get_function = self.get_function_mock)
+        actual : FSession = release_fetcher.fetch(package_name = "pandas", only_stable_releases = False)
+
+        # Assert
+        self.assertEqual(actual, expected)
+    def test_fetch_shouldreturnexpectedfsession_whenonlystablereleasesistrue(self) -> None:
+        
+        # Arrange
+        expected : FSession = FSession(
+            package_name = "pandas",
+            most_recent_release = self.releases[0],
+            releases = self.releases,
+            xml_items = self.xml_items,
+            badges = self.badges
+        )
+        
+        # Act
+        release_fetcher : PyPiReleaseFetcher = PyPiReleaseFetcher(get_function = self.get_function_mock, badge_fetcher = self.badge_fetcher_mock)
+        actual : FSession = release_fetcher.fetch(package_name = "pandas", only_stable_releases = True)
+
+        # Assert
+        self.assertEqual(actual, expected)
+    def test_fetch_shouldreturnexpectedfsession_whenonlystablereleasesistrueandtrycatchreturnsnone(self) -> None:
+        
+        # Arrange
+        badge_fetcher_mock : PyPiBadgeFetcher = Mock()
+        badge_fetcher_mock.download.return_value = b"<html></html>"
+        badge_fetcher_mock.parse.return_value = None
+
+        expected : FSession = FSession(
+            package_name = "pandas",
+            most_recent_release = self.releases[0],
+            releases = self.releases,
+            xml_items = self.xml_items,
+            badges = None
+        )        
+        
+        # Act
+        release_fetcher : PyPiReleaseFetcher = PyPiReleaseFetcher(get_function = self.get_function_mock, badge_fetcher = badge_fetcher_mock)
+        actual : FSession = release_fetcher.fetch(package_name = "pandas", only_stable_releases = True)
+
+        # Assert
+        self.assertEqual(actual, expected)
+    def test_fetch_shouldrequestreleasesandhistoryconcurrently_whenonlystablereleasesistrue(self) -> None:
+        
+        # Arrange
+        rss_requested : Event = Event()
+        overlaps : list[bool] = []
+
+        def download(package_name : str) -> bytes:
+            overlaps.append(rss_requested.wait(timeout = 5))
+            return b"<html></html>"
+
+        def get_function(url : str) -> Response:
+            rss_requested.set()
+            return self.xml_response
+
+        badge_fetcher_mock : PyPiBadgeFetcher = Mock()
+        badge_fetcher_mock.download.side_effect = download
+        badge_fetcher_mock.parse.return_value = self.badges
+
+        # Act
+        release_fetcher : PyPiReleaseFetcher = PyPiReleaseFetcher(get_function = get_function, badge_fetcher = badge_fetcher_mock)
+        actual : FSession = release_fetcher.fetch(package_name = "pandas", only_stable_releases = True)
+
+        # Assert
+        self.assertEqual(overlaps, [True])
+        self.assertEqual(actual.badges, self.badges)
+    def test_parse_shouldreturnsamefsessionasfetch_whendownloadisprovided(self) -> None:
+        
+        # Arrange
+        release_fetcher : PyPiReleaseFetcher = PyPiReleaseFetcher(get_function = self.get_function_mock, badge_fetcher = self.badge_fetcher_mock)
+        expected : FSession = release_fetcher.fetch(package_name = "pandas", only_stable_releases = True)
+
+        # Act
+        d_session : DSession = release_fetcher.download(package_name = "pandas", only_stable_releases = True)
+        actual : FSession = release_fetcher.parse(d_session = d_session)
+
+        # Assert
+        self.assertEqual(d_session.url, "https://pypi.org/rss/project/pandas/releases.xml")
+        self.assertEqual(d_session.history_content, b"<html></html>")
+        self.assertEqual(actual, expected)
+    def test_fetch_shouldreturncachedfsession_whenreleasecacheisfresh(self) -> None:
+        
+        # Arrange
+        release_cache : InMemoryReleaseCache = InMemoryReleaseCache()
+        release_fetcher : PyPiReleaseFetcher = PyPiReleaseFetcher(get_function = self.get_function_mock, release_cache = release_cache)
+
+        # Act
+        expected : FSession = release_fetcher.fetch(package_name = "pandas", only_stable_releases = False)
+        actual : FSession = release_fetcher.fetch(package_name = "pandas", only_stable_releases = False)
+
+        # Assert
+        self.assertEqual(replace(actual, age = 0.0), expected)
+        self.assertFalse(actual.is_stale)
+        self.assertEqual(cast(Mock, self.get_function_mock).call_count, 1)
+    def test_fetch_shouldreturnstalefsessionandrevalidate_whenreleasecacheisstale(self) -> None:
+        
+        # Arrange
+        revalidated : Event = Event()
+
+        def get_function(url : str) -> Response:
+            if get_function_mock.call_count == 2:
+                revalidated.set()
+            return self.xml_response
+
+        get_function_mock : Mock = Mock(side_effect = get_function)
+        now_function : MagicMock = MagicMock(return_value = 1000.0)
+        release_cache : InMemoryReleaseCache = InMemoryReleaseCache(ttl = 60, grace = 3600, now_function = now_function)
+        release_fetcher : PyPiReleaseFetcher = PyPiReleaseFetcher(get_function = get_function_mock, release_cache = release_cache)
+
+        # Act
+        release_fetcher.fetch(package_name = "pandas", only_stable_releases = False)
+        now_function.return_value = 1600.0
+        actual : FSession = release_fetcher.fetch(package_name = "pandas", only_stable_releases = False)
+
+        # Assert
+        self.assertTrue(actual.is_stale)
+        self.assertEqual(actual.age, 600.0)
+        self.assertEqual(actual.most_recent_release, self.releases[0])
+        self.assertTrue(revalidated.wait(timeout = 5))
+    def test_trygetcached_shouldnotrevalidate_whenrevalidateisfalse(self) -> None:
+        
+        # Arrange
+        now_function : MagicMock = MagicMock(return_value = 1000.0)
+        release_cache : InMemoryReleaseCache = InMemoryReleaseCache(ttl = 60, grace = 3600, now_function = now_function)
+        release_fetcher : PyPiReleaseFetcher = PyPiReleaseFetcher(get_function = self.get_function_mock, release_cache = release_cache)
+        release_fetcher.fetch(package_name = "pandas", only_stable_releases = False)
+        now_function.return_value = 1600.0
+
+        # Act
+        actual : Optional[FSession] = release_fetcher.try_get_cached(package_name = "pandas", only_stable_releases = False, revalidate = False)
+
+        # Assert
+        self.assertTrue(cast(FSession, actual).is_stale)
+        self.assertEqual(cast(Mock, self.get_function_mock).call_count, 1)
+    def test_fetch_shouldnotcallnetwork_whenpackageisnotallowed(self) -> None:
+        
+        # Arrange
+        package_filter : PackageFilter = PackageFilter(denied = ["acme-*"])
+        msg : str = _MessageCollection.package_not_allowed(package_name = "acme-billing")
+
+        # Act
+        release_fetcher : PyPiReleaseFetcher = PyPiReleaseFetcher(get_function = self.get_function_mock, package_filter = package_filter)
+
+        with self.assertRaises(Exception) as context:
+            release_fetcher.fetch(package_name = "acme-billing", only_stable_releases = False)
+
+        # Assert
+        self.assertEqual(str(context.exception), msg)
+        cast(Mock, self.get_function_mock).assert_not_called()
+    def test_fetch_shouldusenegativecache_whenpackagewasnotfound(self) -> None:
+        
+        # Arrange
+        response : Response = Response()
+        response.status_code = 404
+        response.url = "https://pypi.org/rss/project/acme-billing/releases.xml"
+        get_function_mock : Mock = Mock(return_value = response)
+        negative_cache : NegativeCache = NegativeCache()
+
+        # Act
+        release_fetcher : PyPiReleaseFetcher = PyPiReleaseFetcher(get_function = get_function_mock, negative_cache = negative_cache)
+
+        with self.assertRaises(requests.HTTPError):
+            release_fetcher.fetch(package_name = "acme-billing", only_stable_releases = False)
+
+        with self.assertRaises(Exception) as context:
+            release_fetcher.fetch(package_name = "acme-billing", only_stable_releases = False)
+
+        # Assert
+        self.assertEqual(get_function_mock.call_count, 1)
+        self.assertIsNotNone(negative_cache.try_get(package_name = "acme-billing"))
+        self.assertIn("negative cache", str(context.exception))
+    def test_fetch_shouldusenegativecache_whenfeedisempty(self) -> None:
+        
+        # Arrange
+        xml_response : Mock = Mock(spec = Response)
+        xml_response.text = '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel></channel></rss>'
+        get_function_mock : Mock = Mock(return_value = xml_response)
+        negative_cache : NegativeCache = NegativeCache()
+
+        # Act
+        release_fetcher : PyPiReleaseFetcher = PyPiReleaseFetcher(get_function = get_function_mock, negative_cache = negative_cache)
+
+        with self.assertRaises(Exception):
+            release_fetcher.fetch(package_name = "acme-billing", only_stable_releases = False)
+
+        # Assert
+        self.assertIsNotNone(negative_cache.try_get(package_name = "acme-billing"))
+    def test_formaturls_shouldreturnoneurlperindexurl_wheninvoked(self) -> None:
+        
+        # Arrange
+        index_urls : list[str] = ["https://mirror.local", "https://pypi.org"]
+        expected : list[str] = [
+            "https://mirror.local/rss/project/pandas/releases.xml",
+            "https://pypi.org/rss/project/pandas/releases.xml"
+        ]
+
+        # Act
+        release_fetcher : PyPiReleaseFetcher = PyPiReleaseFetcher(get_function = self.get_function_mock, index_urls = index_urls)
+        actual : list[str] = release_fetcher._PyPiReleaseFetcher__format_urls(package_name = "pandas") # type: ignore
+
+        # Assert
+        self.assertEqual(actual, expected)
+    def test_fetchasync_shouldreturnexpectedfsession_wheninvoked(self) -> None:
+        
+        # Arrange
+        expected : FSession = FSession(
+            package_name = "pandas",
+            most_recent_release = self.releases[0],
+            releases = self.releases,
+            xml_items = self.xml_items,
+            badges = None
+        )
+        
+        # Act
+        release_fetcher : PyPiReleaseFetcher = PyPiReleaseFetcher(get_function = self.get_function_mock)
+        actual : FSession = asyncio.run(release_fetcher.fetch_async(package_name = "pandas", only_stable_releases = False))
+
+        # Assert
+        self.assertEqual(actual, expected)
+        self.assertEqual(release_fetcher.get_coalescing_stats(), SingleFlightStats(leaders = 1, coalesced = 0))
+    def create_feed_response(self, items : list[Tuple[str, str]]) -> Mock:
+
+        '''Creates a response for a global feed, one item for each (link, pubdate_str).'''
+
+        lines : list[str] = [f"<item><title>x</title><link>{link}</link><pubDate>{pubdate_str}</pubDate></item>" for link, pubdate_str in items]
+        response : Mock = Mock()
+        response.text = f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>{"".join(lines)}</channel></rss>'
+
+        return response
+    def create_cached_release_fetcher(self, get_function : Callable[[str], Response], negative_cache : Optional[NegativeCache] = None) -> Tuple[PyPiReleaseFetcher, InMemoryReleaseCache]:
+
+        '''Creates a PyPiReleaseFetcher whose release cache contains "pandas", "Django" and "numpy".'''
+
+        release_cache : InMemoryReleaseCache = InMemoryReleaseCache()
+        f_session : FSession = FSession(package_name = "pandas", most_recent_release = self.releases[0], releases = self.releases, xml_items = self.xml_items, badges = None)
+
+        for package_name in ["pandas", "Django", "numpy"]:
+            release_cache.add(package_name = package_name, only_stable_releases = True, f_session = f_session)
+
+        release_fetcher : PyPiReleaseFetcher = PyPiReleaseFetcher(get_function = get_function, negative_cache = negative_cache, release_cache = release_cache)
+
+        return (release_fetcher, release_cache)
+    def test_fetch_shouldreusefsession_whenanotherfetchersharesthecachedirectory(self) -> None:
+        
+        # Arrange
+        temporary_directory : tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        first : PyPiReleaseFetcher = PyPiReleaseFetcher(get_function = self.get_function_mock, release_cache = FileReleaseCache(cache_dir = temporary_directory.name))
+        second : PyPiReleaseFetcher = PyPiReleaseFetcher(get_function = self.get_function_mock, release_cache = FileReleaseCache(cache_dir = temporary_directory.name))
+
+        # Act
+        expected : FSession = first.fetch(package_name = "pandas", only_stable_releases = False)
+        actual : FSession = second.fetch(package_name = "pandas", only_stable_releases = False)
+
+        # Assert
+        self.assertEqual(replace(actual, age = 0.0), expected)
+        self.assertEqual(cast(Mock, self.get_function_mock).call_count, 1)
+    def test_fetch_shouldrequesthistoryfromindexurls_whenbadgefetcherisnotprovided(self) -> None:
+        
+        # Arrange
+        response : Mock = Mock()
+        response.text = self.xml_content
+        response.content = b"<html><body></body></html>"
+        get_function_mock : Mock = Mock(return_value = response)
+        release_fetcher : PyPiReleaseFetcher = PyPiReleaseFetcher(get_function = get_function_mock, index_urls = ["http://127.0.0.1:8080"])
+
+        # Act
+        release_fetcher.fetch(package_name = "pandas", only_stable_releases = True)
+
+        # Assert
+        urls : list[str] = [call.args[0] for call in get_function_mock.call_args_list]
+        self.assertEqual(len(urls), 2)
+        self.assertTrue(all(url.startswith("http://127.0.0.1:8080/") for url in urls))
+        self.assertTrue(any("/project/pandas/" in url for url in urls))
+    def test_fetch_shouldcountonemiss_whenpackageisnotcached(self) -> None:
+        
+        # Arrange
+        temporary_directory : tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        release_cache : FileReleaseCache = FileReleaseCache(cache_dir = temporary_directory.name)
+        release_fetcher : PyPiReleaseFetcher = PyPiReleaseFetcher(get_function = self.get_function_mock, release_cache = release_cache)
+
+        # Act
+        release_fetcher.fetch(package_name = "pandas", only_stable_releases = False)
+        actual : CacheStats = release_cache.get_stats()
+
+        # Assert
+        self.assertEqual((actual.hits, actual.misses), (0, 1))
+    def test_sync_shouldinvalidateonlychangedpackages_whenfeedreachesbacktowatermark(self) -> None:
+        
+        # Arrange
+        response : Mock = self.create_feed_response(items = [
+            ("https://pypi.org/project/django/5.1.2/", "Tue, 08 Oct 2024 10:00:00 GMT"),
+            ("https://pypi.org/project/requests/2.32.3/", "Mon, 07 Oct 2024 10:00:00 GMT"),
+            ("https://pypi.org/project/pandas/2.2.3/", "Sun, 06 Oct 2024 10:00:00 GMT")
+        ])
+        get_function_mock : Mock = Mock(return_value = response)
+        release_fetcher, release_cache = self.create_cached_release_fetcher(get_function = get_function_mock)
+        expected : SyncReport = SyncReport(
+            watermark = datetime(2024, 10, 8, 10, 0, 0),
+            changed = ["django", "requests"],
+            invalidated = ["Django"],
+            is_gap = False
+        )
+
+        # Act
+        actual : SyncReport = release_fetcher.sync(watermark = datetime(2024, 10, 6, 12, 0, 0))
+
+        # Assert
+        self.assertEqual(actual, expected)
+        self.assertEqual(release_cache.get_package_names(), ["numpy", "pandas"])
+        get_function_mock.assert_called_once_with("https://pypi.org/rss/updates.xml")
+    @parameterized.expand([
+        [None],
+        [datetime(2024, 10, 1, 0, 0, 0)]
+    ])
+    def test_sync_shouldnotwipeunrelatedfreshentries_whenfeedcantreachbacktowatermark(self, watermark : Optional[datetime]) -> None:
+        
+        # Arrange
+        response : Mock = self.create_feed_response(items = [
+            ("https://pypi.org/project/django/5.1.2/", "Tue, 08 Oct 2024 10:00:00 GMT")
+        ])
+        release_fetcher, release_cache = self.create_cached_release_fetcher(get_function = Mock(return_value = response))
+
+        # Act
+        actual : SyncReport = release_fetcher.sync(watermark = watermark)
+
+        # Assert
+        self.assertTrue(actual.is_gap)
+        self.assertEqual((actual.changed, actual.invalidated), (["django"], ["Django"]))
+        self.assertEqual(actual.watermark, datetime(2024, 10, 8, 10, 0, 0))
+        self.assertEqual(release_cache.get_package_names(), ["numpy", "pandas"])
+        self.assertFalse(cast(FSession, release_cache.try_get(package_name = "numpy", only_stable_releases = True)).is_stale)
+    def test_sync_shouldinvalidatenegativecache_whenpackagehasbeencreated(self) -> None:
+        
+        # Arrange
+        updates_response : Mock = self.create_feed_response(items = [
+            ("https://pypi.org/project/pandas/2.2.3/", "Sun, 06 Oct 2024 10:00:00 GMT")
+        ])
+        packages_response : Mock = self.create_feed_response(items = [
+            ("https://pypi.org/project/acme-billing/", "Mon, 07 Oct 2024 10:00:00 GMT")
+        ])
+        get_function_mock : Mock = Mock(side_effect = lambda url : packages_response if url.endswith("packages.xml") else updates_response)
+        negative_cache : NegativeCache = NegativeCache()
+        negative_cache.add(package_name = "Acme_Billing", reason = "404 Client Error")
+        negative_cache.add(package_name = "acme-internal", reason = "404 Client Error")
+        release_fetcher, _ = self.create_cached_release_fetcher(get_function = get_function_mock, negative_cache = negative_cache)
+
+        # Act
+        release_fetcher.sync(watermark = datetime(2024, 10, 6, 0, 0, 0))
+
+        # Assert
+        self.assertEqual(negative_cache.get_package_names(), ["acme-internal"])
+        self.assertEqual(get_function_mock.call_count, 2)
+    def test_syncreport_shouldreturnexpectedstring_wheninvoked(self) -> None:
+        
+        # Arrange
+        sync_report : SyncReport = SyncReport(watermark = datetime(2024, 10, 8, 10, 0, 0), changed = ["django", "requests"], invalidated = ["Django"], is_gap = False)
+        expected : str = "{ 'watermark': '2024-10-08 10:00:00', 'changed': '2', 'invalidated': '1', 'is_gap': 'False' }"
+
+        # Act
+        actual : str = str(sync_report)
+
+        # Assert
+        self.assertEqual(actual, expected)
+class RuntimeCheckerTestCase(unittest.TestCase):
+
+    def test_getruntimeversion_shouldreturnexpectedtuple_wheninvoked(self):
+
+        # Arrange
+        expected : Tuple[int, int, int] = (3, 12, 5)
+        stdout : str = "Python 3.12.5\n"
+        process : MagicMock = MagicMock(spec = subprocess.CompletedProcess)
+        process.stdout = stdout
+        
+        # Act
+        runtime_checker : RuntimeChecker = RuntimeChecker()
+        actual : Optional[Tuple[int, int, int]] = None
+
+        with patch("platform.system", return_value = "Linux"):
+            with patch("subprocess.run", return_value = process) as run:
+                actual = runtime_checker._RuntimeChecker__get_runtime_version() #type: ignore
+
+        # Assert
+        run.assert_called_once_with(["python3", "--version"], capture_output = True, text = True, check = True)
+        self.assertEqual(actual, expected)
+    def test_getruntimeversion_shouldraiseexception_whenoutputisunexpected(self):
+
+        # Arrange
+        stdout : str = "Invalid Output"
+        process : MagicMock = MagicMock(spec = subprocess.CompletedProcess)
+        process.stdout = stdout
+
+        # Act, Assert
+        runtime_checker : RuntimeChecker = RuntimeChecker()
+
+        with patch("subprocess.run", return_value = process):
+            with self.assertRaises(Exception) as context:
+                runtime_checker._RuntimeChecker__get_runtime_version() #type: ignore
+
+            self.assertEqual(
+                _MessageCollection.python_version_unexpected_output(),
+                str(context.exception))
+
+    @parameterized.expand([
+        [(3, 12, 1), (3, 12, 1), "The installed Python version is matching the expected one (installed: '3.12.1', expected: '3.12.1')."],
+        [(3, 11, 11), (3, 12, 1), "Warning! The installed Python is not matching the expected one (installed: '3.11.11', expected: '3.12.1')."],
+    ])
+    def test_getstatus_shouldreturnexpectedstring_wheninvoked(self, installed : Tuple[int, int, int], required : Tuple[int, int, int], expected : str):
+
+        # Arrange
+        with patch.object(RuntimeChecker, "_RuntimeChecker__get_runtime_version", return_value = installed):
+
+            # Act
+            actual : str = RuntimeChecker().get_status(required = required)
+
+            # Assert
+            self.assertEqual(actual, expected)
+
+    def test_trygetstatus_shouldreturnexpectedstatus_whennoexceptionisraised(self):
+
+        # Arrange
+        installed : Tuple[int, int, int] = (3, 12, 1)
+        required : Tuple[int, int, int] = (3, 12, 1)
+        expected : str = "The installed Python version is matching the expected one (installed: '3.12.1', expected: '3.12.1')."
+        
+        with patch.object(RuntimeChecker, "_RuntimeChecker__get_runtime_version", return_value = installed):
+
+            # Act
+            actual : str = RuntimeChecker().try_get_status(required = required)
+
+            # Assert
+            self.assertEqual(actual, expected)
+    def test_trygetstatus_shouldreturnexceptionmessage_whenexceptionisraised(self):
+
+        # Arrange
+        expected : str = "Some error occurred."
+        required : Tuple[int, int, int] = (3, 12, 1)
+        
+        with patch.object(RuntimeChecker, "_RuntimeChecker__get_runtime_version", side_effect = Exception(expected)):
+
+            # Act
+            actual : str = RuntimeChecker().try_get_status(required = required)
+
+            # Assert
+            self.assertEqual(actual, expected)
+class RequirementCheckerTestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        self.package1 : Package = Package(name = "pandas", version = "2.2.3")
+        self.release1 : Release = Release(package_name = "pandas", version = "2.2.3", date = datetime(2024, 9, 20, 13, 8, 42))
+        self.expected_tpl1 : Tuple[bool, str] = (True, _MessageCollection.current_version_matches(self.package1, self.release1))
+
+        self.l_session1 : LSession = LSession(
+            packages = [ self.package1 ],
+            unparsed_lines = []
+        )
+
+        self.f_session1 : FSession = FSession(
+            package_name = "pandas",
+            most_recent_release = self.release1,
+            releases = [self.release1],
+            xml_items = [
+                XMLItem(title="2.1.2", link="https://pypi.org/project/pandas/2.2.3/", description="", author=None, pubdate=datetime.strptime("Sat, 05 Oct 2024 18:28:18 GMT", "%a, %d %b %Y %H:%M:%S %Z"), pubdate_str="Sat, 05 Oct 2024 18:28:18 GMT"),
+            ],
+            badges = None
+        )
+
+        self.requirement_detail1 : RequirementDetail = RequirementDetail(
+            current_package = self.package1,
+            most_recent_release = self.release1,
+            is_version_matching = self.expected_tpl1[0],
+            description = self.expected_tpl1[1],
+            outcome = "matching"
+        )
+        self.expected_sd1 : list[RequirementDetail] = [ self.requirement_detail1 ]
+
+        self.package2 : Package = Package(name = "pandas", version = "2.2.2")
+        self.release2 : Release = Release(package_name = "pandas", version = "2.2.3", date = datetime(2024, 9, 20, 13, 8, 42))
+        self.expected_tpl2 : Tuple[bool, str] = (False, _MessageCollection.current_version_doesnt_match(self.package2, self.release2))
+
+    def test_compare_shouldreturnexpectedtuple_whenversionsmatch(self) -> None:
+        
+        # Arrange
+        # Act
+        requirement_checker : RequirementChecker = RequirementChecker()
+        actual : Tuple[bool, str] = requirement_checker._RequirementChecker__compare(current_package = self.package1, most_recent_release = self.release1) # type: ignore
+        
+        # Assert
+        self.assertEqual(actual, self.expected_tpl1)
+    def test_compare_shouldreturnexpectedtuple_whenversionsmismatch(self) -> None:
+        
+        # Arrange
+        # Act
+        requirement_checker : RequirementChecker = RequirementChecker()
+        actual : Tuple[bool, str] = requirement_checker._RequirementChecker__compare(current_package = self.package2, most_recent_release = self.release2) # type: ignore
+        
+        # Assert
+        self.assertEqual(actual, self.expected_tpl2)
+    def test_createrequirementdetails_shouldreturnexpectedlistofrequirementdetails_wheninvoked(self) -> None:
+        
+        # Arrange
+        # Act
+        release_fetcher_mock : PyPiReleaseFetcher = Mock()
+        release_fetcher_mock.fetch.return_value = self.f_session1
 
-        self.xml_content : str = '\n'.join([
-			'<?xml version="1.0" encoding="UTF-8"?>',
-			'<rss version="2.0">',
-			'  <channel>',
-			'    <item>',
-			'      <title>2.2.3</title>',
-			'      <link>https://pypi.org/project/pandas/2.2.3/</link>',
-			'      <description>Powerful data structures for data analysis, time series, and statistics</description>',
-			'      <author>pandas-dev@python.org</author>',
-			'      <pubDate>Fri, 20 Sep 2024 13:08:42 GMT</pubDate>',
-			'    </item>',
-			'    <item>',
-			'      <title>2.2.2</title>',
-			'      <link>https://pypi.org/project/pandas/2.2.2/</link>',
-			'      <description>Powerful data structures for data analysis, time series, and statistics</description>',
-			'      <author>pandas-dev@python.org</author>',
-			'      <pubDate>Wed, 10 Apr 2024 19:44:10 GMT</pubDate>',
-			'    </item>',
-			'  </channel>',
-			'</rss>'
-		])
+        requirement_checker : RequirementChecker = RequirementChecker(
+            release_fetcher = release_fetcher_mock
+        )
+        actual : list[RequirementDetail] = requirement_checker._RequirementChecker__create_requirement_details(l_session = self.l_session1, only_stable_releases = False, waiting_time = 0) # type: ignore
+        
+        # Assert
+        self.assertTrue(
+            SupportMethodProvider.are_lists_of_requirementdetails_equal(
+                list1 = actual,
+                list2 = self.expected_sd1
+            ))
+    def test_createrequirementdetails_shouldreturnerrordetail_whenfetchraises(self) -> None:
+        
+        # Arrange
+        error : str = "No suitable XML items found."
+        expected : RequirementDetail = RequirementDetail(
+            current_package = self.package1,
+            most_recent_release = None,
+            is_version_matching = False,
+            description = _MessageCollection.current_version_couldnt_be_checked(current_package = self.package1, error = error),
+            outcome = "error"
+        )
+
+        release_fetcher_mock : PyPiReleaseFetcher = Mock()
+        release_fetcher_mock.fetch.side_effect = Exception(error)
+
+        # Act
+        requirement_checker : RequirementChecker = RequirementChecker(release_fetcher = release_fetcher_mock, sleeping_function = Mock())
+        actual : list[RequirementDetail] = requirement_checker._RequirementChecker__create_requirement_details(l_session = self.l_session1, only_stable_releases = False, waiting_time = 0) # type: ignore
+        
+        # Assert
+        self.assertEqual(actual, [expected])
+        release_fetcher_mock.fetch.assert_called_once()
+    def test_createrequirementdetails_shouldretrywithbackoff_whenerroristransient(self) -> None:
+        
+        # Arrange
+        release_fetcher_mock : PyPiReleaseFetcher = Mock()
+        release_fetcher_mock.fetch.side_effect = [ requests.ConnectionError(), requests.Timeout(), self.f_session1 ]
+        sleeping_function : MagicMock = MagicMock()
+
+        # Act
+        requirement_checker : RequirementChecker = RequirementChecker(
+            release_fetcher = release_fetcher_mock, 
+            sleeping_function = sleeping_function,
+            max_retries = 2,
+            retry_backoff = 5
+        )
+        actual : list[RequirementDetail] = requirement_checker._RequirementChecker__create_requirement_details(l_session = self.l_session1, only_stable_releases = False, waiting_time = 0) # type: ignore
+        
+        # Assert
+        self.assertTrue(SupportMethodProvider.are_lists_of_requirementdetails_equal(list1 = actual, list2 = self.expected_sd1))
+        self.assertEqual([call.args[0] for call in sleeping_function.call_args_list], [5, 10, 0])
+    def test_createrequirementdetails_shouldreturnerrordetail_whenretriesareexhausted(self) -> None:
+        
+        # Arrange
+        release_fetcher_mock : PyPiReleaseFetcher = Mock()
+        release_fetcher_mock.fetch.side_effect = requests.Timeout()
+
+        # Act
+        requirement_checker : RequirementChecker = RequirementChecker(release_fetcher = release_fetcher_mock, sleeping_function = Mock(), max_retries = 2)
+        actual : list[RequirementDetail] = requirement_checker._RequirementChecker__create_requirement_details(l_session = self.l_session1, only_stable_releases = False, waiting_time = 0) # type: ignore
+        
+        # Assert
+        self.assertEqual(actual[0].outcome, "error")
+        self.assertEqual(release_fetcher_mock.fetch.call_count, 3)
+
+    @parameterized.expand([
+        [requests.ConnectionError(), True],
+        [requests.HTTPError(response = Mock(status_code = 503)), True],
+        [requests.HTTPError(response = Mock(status_code = 429)), True],
+        [requests.HTTPError(response = Mock(status_code = 404)), False],
+        [Exception("No suitable XML items found."), False]
+    ])
+    def test_istransient_shouldreturnexpectedbool_wheninvoked(self, error : Exception, expected : bool) -> None:
+        
+        # Arrange
+        # Act
+        actual : bool = RequirementChecker()._RequirementChecker__is_transient(error = error) # type: ignore
+        
+        # Assert
+        self.assertEqual(actual, expected)
+
+    def test_calculateprc_shouldreturnexpectedstring_wheninvoked(self) -> None:
+        
+        # Arrange
+        value : int = 5
+        total : int = 10
+        expected : str = "50.00%"
+        
+        # Act
+        requirement_checker : RequirementChecker = RequirementChecker()
+        actual : str = requirement_checker._RequirementChecker__calculate_prc(value = value, total = total) # type: ignore
+        
+        # Assert
+        self.assertEqual(actual, expected)  
+
+    def test_getsummary_shouldraiseexpectedexceptionandmessage_whenwaitingtimelessthanminimum(self):
+        
+        # Arrange
+        file_path : str = r"C:/Dockerfile"
+        waiting_time : int = 2
+        minimum_wt : int = 5
+        expected : str = _MessageCollection.waiting_time_cant_be_less_than(waiting_time, minimum_wt)
+
+        # Act, Assert
+        with self.assertRaises(expected_exception = Exception, msg = expected):
+            requirement_checker : RequirementChecker = RequirementChecker()
+            requirement_checker.get_summary(file_path = file_path, waiting_time = waiting_time)
+    def test_getsummary_shouldreturnexpectedrequirementsummary_wheninvoked(self):
+        
+        # Arrange
+        requirement_summary : RequirementSummary = ObjectMother.get_requirement_summary()
+        packages : list[Package] = [detail.current_package for detail in requirement_summary.details]
+        l_session : LSession = LSession(packages = packages, unparsed_lines = [])
+
+        f_sessions : list[FSession] = []
+        for detail in requirement_summary.details:
+            f_session : FSession = FSession(
+                package_name = detail.current_package.name,
+                most_recent_release = detail.most_recent_release,
+                releases = [detail.most_recent_release],
+                xml_items = [],
+                badges = None
+            )
+            f_sessions.append(f_session)
+
+        package_loader : MagicMock = MagicMock(spec = LocalPackageLoader)
+        package_loader.load.return_value = l_session
+
+        release_fetcher : MagicMock = MagicMock(spec = PyPiReleaseFetcher)
+        release_fetcher.fetch.side_effect = f_sessions
+
+        sleeping_function : MagicMock = MagicMock()
+
+        file_path : str = r"C:/Dockerfile"
+        only_stable_releases : bool = False
+        waiting_time : int = 5
+
+        # Act
+        requirement_checker : RequirementChecker = RequirementChecker(
+            package_loader = package_loader,
+            release_fetcher = release_fetcher,
+            sleeping_function = sleeping_function
+        )
+        
+        with patch("os.path.isfile", return_value = True):
+            actual : RequirementSummary = requirement_checker.get_summary(
+                file_path = file_path, 
+                only_stable_releases = only_stable_releases, 
+                waiting_time = waiting_time
+            )
+
+        # Assert
+        self.assertEqual(actual.total_packages, requirement_summary.total_packages)
+        self.assertEqual(actual.matching, requirement_summary.matching)
+        self.assertEqual(actual.matching_prc, requirement_summary.matching_prc)
+        self.assertEqual(actual.errors, requirement_summary.errors)
+        self.assertEqual(len(actual.details), len(requirement_summary.details))
+        package_loader.load.assert_called_once_with(file_path = file_path)
+    def test_getsummary_shouldmarkremainingpackagesasunchecked_whendeadlineishit(self):
+        
+        # Arrange
+        requirement_summary : RequirementSummary = ObjectMother.get_requirement_summary()
+        packages : list[Package] = [detail.current_package for detail in requirement_summary.details]
+        l_session : LSession = LSession(packages = packages, unparsed_lines = [])
+        detail : RequirementDetail = requirement_summary.details[0]
+        f_session : FSession = FSession(
+            package_name = detail.current_package.name,
+            most_recent_release = cast(Release, detail.most_recent_release),
+            releases = [cast(Release, detail.most_recent_release)],
+            xml_items = [],
+            badges = None
+        )
+
+        package_loader : MagicMock = MagicMock(spec = LocalPackageLoader)
+        package_loader.load.return_value = l_session
+
+        release_fetcher : MagicMock = MagicMock(spec = PyPiReleaseFetcher)
+        release_fetcher.fetch.return_value = f_session
+
+        now_function : MagicMock = MagicMock(side_effect = [0.0, 1.0, 61.0])
+        deadline : int = 60
+
+        # Act
+        requirement_checker : RequirementChecker = RequirementChecker(
+            package_loader = package_loader,
+            release_fetcher = release_fetcher,
+            sleeping_function = MagicMock(),
+            now_function = now_function
+        )
+        
+        with patch("os.path.isfile", return_value = True):
+            actual : RequirementSummary = requirement_checker.get_summary(file_path = r"C:/Dockerfile", waiting_time = 5, deadline = deadline)
+
+        # Assert
+        self.assertEqual(actual.total_packages, 2)
+        self.assertEqual(actual.matching, 1)
+        self.assertEqual(actual.unchecked, 1)
+        self.assertEqual(actual.unchecked_prc, "50.00%")
+        self.assertEqual(release_fetcher.fetch.call_count, 1)
+        self.assertEqual(
+            actual.details[0].description, 
+            _MessageCollection.current_version_not_checked_deadline(current_package = packages[1], deadline = deadline))
+    def test_getsummary_shouldfetchconcurrently_whenconcurrencycontrollerisprovided(self):
+        
+        # Arrange
+        requirement_summary : RequirementSummary = ObjectMother.get_requirement_summary()
+        packages : list[Package] = [detail.current_package for detail in requirement_summary.details]
+        l_session : LSession = LSession(packages = packages, unparsed_lines = [])
+        f_sessions : dict[str, FSession] = {
+            detail.current_package.name : FSession(
+                package_name = detail.current_package.name,
+                most_recent_release = cast(Release, detail.most_recent_release),
+                releases = [cast(Release, detail.most_recent_release)],
+                xml_items = [],
+                badges = None)
+            for detail in requirement_summary.details
+        }
+
+        both_started : Event = Event()
+        started : list[str] = []
+
+        def download(package_name : str, only_stable_releases : bool) -> DSession:
+            started.append(package_name)
+            if len(started) == 2:
+                both_started.set()
+            both_started.wait(timeout = 5)
+            return DSession(package_name = package_name, only_stable_releases = only_stable_releases, url = "", releases_content = "", history_content = None)
+
+        package_loader : MagicMock = MagicMock(spec = LocalPackageLoader)
+        package_loader.load.return_value = l_session
+
+        release_fetcher : MagicMock = MagicMock(spec = PyPiReleaseFetcher)
+        release_fetcher.download.side_effect = download
+        release_fetcher.parse.side_effect = lambda d_session : f_sessions[d_session.package_name]
+        release_fetcher.try_get_cached.return_value = None
+
+        controller : AIMDController = AIMDController(initial_limit = 2)
+
+        # Act
+        requirement_checker : RequirementChecker = RequirementChecker(
+            package_loader = package_loader,
+            release_fetcher = release_fetcher,
+            sleeping_function = MagicMock(),
+            concurrency_controller = controller
+        )
+        
+        with patch("os.path.isfile", return_value = True):
+            actual : RequirementSummary = requirement_checker.get_summary(file_path = r"C:/Dockerfile", waiting_time = 5)
+
+        # Assert
+        self.assertTrue(both_started.is_set())
+        self.assertEqual(actual.matching, 1)
+        self.assertEqual(actual.mismatching, 1)
+        self.assertEqual(controller.get_stats().in_flight, 0)
+    def test_getsummary_shouldcounterrorsseparately_whenonepackagefails(self):
+        
+        # Arrange
+        requirement_summary : RequirementSummary = ObjectMother.get_requirement_summary()
+        packages : list[Package] = [detail.current_package for detail in requirement_summary.details]
+        l_session : LSession = LSession(packages = packages, unparsed_lines = [])
+        detail : RequirementDetail = requirement_summary.details[0]
+        f_session : FSession = FSession(
+            package_name = detail.current_package.name,
+            most_recent_release = cast(Release, detail.most_recent_release),
+            releases = [cast(Release, detail.most_recent_release)],
+            xml_items = [],
+            badges = None
+        )
+
+        package_loader : MagicMock = MagicMock(spec = LocalPackageLoader)
+        package_loader.load.return_value = l_session
+
+        release_fetcher : MagicMock = MagicMock(spec = PyPiReleaseFetcher)
+        release_fetcher.fetch.side_effect = [ f_session, Exception("404 Client Error") ]
+
+        # Act
+        requirement_checker : RequirementChecker = RequirementChecker(
+            package_loader = package_loader,
+            release_fetcher = release_fetcher,
+            sleeping_function = MagicMock()
+        )
+        
+        with patch("os.path.isfile", return_value = True):
+            actual : RequirementSummary = requirement_checker.get_summary(file_path = r"C:/Dockerfile", waiting_time = 5)
+
+        # Assert
+        self.assertEqual(actual.total_packages, 2)
+        self.assertEqual(actual.matching, 1)
+        self.assertEqual(actual.mismatching, 0)
+        self.assertEqual(actual.errors, 1)
+        self.assertEqual(actual.errors_prc, "50.00%")
+    def test_getsummary_shouldrunstagedpipeline_whenpipelinesettingsareprovided(self):
+        
+        # Arrange
+        packages : list[Package] = [Package(name = f"package{i}", version = "1.0.0") for i in range(10)]
+        l_session : LSession = LSession(packages = packages, unparsed_lines = [])
+
+        def download(package_name : str, only_stable_releases : bool) -> DSession:
+            return DSession(package_name = package_name, only_stable_releases = only_stable_releases, url = "", releases_content = "", history_content = None)
+
+        def parse(d_session : DSession) -> FSession:
+            if d_session.package_name == "package3":
+                raise Exception("Parsing error")
+            version : str = "1.0.0" if d_session.package_name != "package7" else "2.0.0"
+            release : Release = Release(package_name = d_session.package_name, version = version, date = datetime(2024, 1, 1))
+            return FSession(package_name = d_session.package_name, most_recent_release = release, releases = [release], xml_items = [], badges = None)
+
+        package_loader : MagicMock = MagicMock(spec = LocalPackageLoader)
+        package_loader.load.return_value = l_session
+
+        release_fetcher : MagicMock = MagicMock(spec = PyPiReleaseFetcher)
+        release_fetcher.download.side_effect = download
+        release_fetcher.parse.side_effect = parse
+        release_fetcher.try_get_cached.return_value = None
+
+        pipeline_settings : PipelineSettings = PipelineSettings(fetch_workers = 3, parse_workers = 2, queue_size = 1)
+
+        # Act
+        requirement_checker : RequirementChecker = RequirementChecker(
+            package_loader = package_loader,
+            release_fetcher = release_fetcher,
+            sleeping_function = MagicMock(),
+            pipeline_settings = pipeline_settings
+        )
         
-        self.xml_response : Response = Mock()
-        self.xml_response.text = self.xml_content
-        self.get_function_mock : Callable[[str], Response] = Mock(return_value = self.xml_response)
+        with patch("os.path.isfile", return_value = True):
+            actual : RequirementSummary = requirement_checker.get_summary(file_path = r"C:/Dockerfile", waiting_time = 5)
 
-        self.xml_items : list[XMLItem] = [
-            XMLItem(
-                title = "2.2.3", 
-                link = "https://pypi.org/project/pandas/2.2.3/", 
-                description = "Powerful data structures for data analysis, time series, and statistics",
-                author = "pandas-dev@python.org",
-                pubdate = datetime(2024, 9, 20, 13, 8, 42),
-                pubdate_str = "Fri, 20 Sep 2024 13:08:42 GMT"
-                ),
-            XMLItem(
-                title = "2.2.2", 
-                link = "https://pypi.org/project/pandas/2.2.2/", 
-                description = "Powerful data structures for data analysis, time series, and statistics",
-                author = "pandas-dev@python.org",
-                pubdate = datetime(2024, 4, 10, 19, 44, 10),
-                pubdate_str = "Wed, 10 Apr 2024 19:44:10 GMT"
-                ),
-        ]
-        self.releases : list[Release] = [
-            Release(package_name = "pandas", version = "2.2.3", date = datetime(2024, 9, 20, 13, 8, 42)),
-            Release(package_name = "pandas", version = "2.2.2", date = datetime(2024, 4, 10, 19, 44, 10))
-        ]
+        # Assert
+        self.assertEqual(actual.total_packages, 10)
+        self.assertEqual(actual.matching, 8)
+        self.assertEqual(actual.errors, 1)
+        self.assertEqual(actual.mismatching, 1)
+        self.assertEqual(
+            [detail.current_package.name for detail in actual.details], 
+            ["package3", "package7", "package0", "package1", "package2", "package4", "package5", "package6", "package8", "package9"])
+        self.assertEqual(release_fetcher.fetch.call_count, 0)
+    def test_getsummary_shouldreporterrors_whenfetchstagefailsunexpectedly(self):
+        
+        # Arrange
+        packages : list[Package] = [Package(name = f"package{i}", version = "1.0.0") for i in range(20)]
+        package_loader : MagicMock = MagicMock(spec = LocalPackageLoader)
+        package_loader.load.return_value = LSession(packages = packages, unparsed_lines = [])
 
-        self.badges : list[Badge] = [
-            Badge(package_name = "numpy", version = "2.2.3alpha", label = "pre-release"),
-            Badge(package_name = "numpy", version = "2.2.2d0", label = "yanked")
-        ]
-    
-        self.badge_fetcher_mock : PyPiBadgeFetcher = Mock()
-        self.badge_fetcher_mock.try_fetch.return_value = self.badges
+        release_fetcher : MagicMock = MagicMock(spec = PyPiReleaseFetcher)
+        release_fetcher.try_get_cached.side_effect = OSError("Read-only file system")
 
-    def test_pypireleasefetcher_shouldinitializeasexpected_wheninvoked(self) -> None:
+        requirement_checker : RequirementChecker = RequirementChecker(
+            package_loader = package_loader,
+            release_fetcher = release_fetcher,
+            sleeping_function = MagicMock(),
+            pipeline_settings = PipelineSettings(fetch_workers = 2, parse_workers = 1, queue_size = 2)
+        )
+        results : list[RequirementSummary] = []
+
+        # Act
+        with patch("os.path.isfile", return_value = True):
+            thread : Thread = Thread(target = lambda : results.append(requirement_checker.get_summary(file_path = "requirements.txt", waiting_time = 5)), daemon = True)
+            thread.start()
+            thread.join(timeout = 10)
+
+        # Assert
+        self.assertFalse(thread.is_alive())
+        self.assertEqual((results[0].total_packages, results[0].errors), (20, 20))
+        self.assertTrue(all("Read-only file system" in detail.description for detail in results[0].details))
+        release_fetcher.download.assert_not_called()
+    def test_getsummary_shoulddownloadeachpackageonce_whentwoprocessesrunthepipelineonasharedcache(self):
         
         # Arrange
+        temporary_directory : tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        downloads_path : str = os.path.join(temporary_directory.name, "downloads.txt")
+        cache_dir : str = os.path.join(temporary_directory.name, "cache")
+        response : Mock = Mock()
+        response.text = str(
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<rss version="2.0"><channel>'
+            '<item><title>1.0.0</title><pubDate>Wed, 10 Apr 2024 19:44:10 GMT</pubDate></item>'
+            '</channel></rss>'
+        )
+
+        def get_function(url : str, *args : Any, **kwargs : Any) -> Response:
+            with open(downloads_path, "a", encoding = "utf-8") as file:
+                file.write(f"{url}\n")
+            sleep(0.3)
+            return cast(Response, response)
+
+        def check_requirements() -> None:
+            package_loader : MagicMock = MagicMock(spec = LocalPackageLoader)
+            package_loader.load.return_value = LSession(packages = [Package("pandas", "1.0.0"), Package("numpy", "1.0.0")], unparsed_lines = [])
+            requirement_checker : RequirementChecker = RequirementChecker(
+                package_loader = package_loader,
+                release_fetcher = PyPiReleaseFetcher(get_function = get_function, release_cache = FileReleaseCache(cache_dir = cache_dir)),
+                sleeping_function = MagicMock(),
+                pipeline_settings = PipelineSettings(fetch_workers = 2, parse_workers = 1)
+            )
+            with patch("os.path.isfile", return_value = True):
+                summary : RequirementSummary = requirement_checker.get_summary(file_path = "requirements.txt", only_stable_releases = False, waiting_time = 5)
+            os._exit(0 if summary.matching == 2 else 1)
+
+        context : Any = multiprocessing.get_context("fork")
+        processes : list[Any] = [context.Process(target = check_requirements) for _ in range(2)]
+
         # Act
-        release_fetcher : PyPiReleaseFetcher = PyPiReleaseFetcher()
+        for process in processes:
+            process.start()
+
+        for process in processes:
+            process.join(timeout = 30)
+
+        with open(downloads_path, "r", encoding = "utf-8") as file:
+            urls : list[str] = file.read().splitlines()
 
         # Assert
-        self.assertIsInstance(release_fetcher, PyPiReleaseFetcher)
-        self.assertTrue(callable(release_fetcher._PyPiReleaseFetcher__get_function))                    # type: ignore
-        self.assertIsInstance(release_fetcher._PyPiReleaseFetcher__badge_fetcher, PyPiBadgeFetcher)     # type: ignore
-    def test_fetch_shouldraiseexception_whenxmlitemsarezero(self) -> None:
+        self.assertEqual([process.exitcode for process in processes], [0, 0])
+        self.assertEqual(len(urls), 2)
+        self.assertEqual(len(set(urls)), 2)
+    def test_getsummary_shouldparseinprocesses_whenparseinprocessesistrue(self):
         
         # Arrange
-        xml_content : str = self.xml_content.replace("<title>2.2.3</title>", "<title></title>")
-        xml_content = xml_content.replace("<pubDate>Wed, 10 Apr 2024 19:44:10 GMT</pubDate>", "")       
-        xml_response : Mock = Mock(spec = Response)
-        xml_response.text = xml_content
+        releases_content : str = str(
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<rss version="2.0"><channel>'
+            '<item><title>1.0.0</title><pubDate>Wed, 10 Apr 2024 19:44:10 GMT</pubDate></item>'
+            '</channel></rss>'
+        )
+        packages : list[Package] = [Package(name = f"package{i}", version = "1.0.0") for i in range(4)]
+        l_session : LSession = LSession(packages = packages, unparsed_lines = [])
 
-        get_function_mock : Callable[[str], Response] = Mock(return_value = xml_response)
-        msg : str = _MessageCollection.no_suitable_xml_items_found(url = "https://pypi.org/rss/project/pandas/releases.xml")
+        def download(package_name : str, only_stable_releases : bool) -> DSession:
+            return DSession(package_name = package_name, only_stable_releases = only_stable_releases, url = "", releases_content = releases_content, history_content = None)
 
-        # Act, Assert
-        with self.assertRaises(expected_exception = Exception, msg = msg):
-            release_fetcher : PyPiReleaseFetcher = PyPiReleaseFetcher(get_function = get_function_mock)
-            release_fetcher.fetch(package_name = "pandas", only_stable_releases = False)
-    def test_fetch_shouldreturnexpectedfsession_whenonlystablereleasesisfalse(self) -> None:
+        package_loader : MagicMock = MagicMock(spec = LocalPackageLoader)
+        package_loader.load.return_value = l_session
+
+        release_fetcher : MagicMock = MagicMock(spec = PyPiReleaseFetcher)
+        release_fetcher.download.side_effect = download
+        release_fetcher.create_fsession.side_effect = PyPiReleaseFetcher().create_fsession
+        release_fetcher.try_get_cached.return_value = None
+
+        pipeline_settings : PipelineSettings = PipelineSettings(fetch_workers = 2, parse_workers = 2, parse_in_processes = True)
+
+        # Act
+        requirement_checker : RequirementChecker = RequirementChecker(
+            package_loader = package_loader,
+            release_fetcher = release_fetcher,
+            sleeping_function = MagicMock(),
+            pipeline_settings = pipeline_settings
+        )
+        
+        with patch("os.path.isfile", return_value = True):
+            actual : RequirementSummary = requirement_checker.get_summary(file_path = r"C:/Dockerfile", waiting_time = 5)
+
+        # Assert
+        self.assertEqual(actual.matching, 4)
+        self.assertEqual(release_fetcher.create_fsession.call_count, 4)
+        self.assertEqual(release_fetcher.parse.call_count, 0)
+    def test_getsummary_shouldnotloadnorfetch_whensummaryiscached(self):
         
         # Arrange
-        expected : FSession = FSession(
-            package_name = "pandas",
-            most_recent_release = self.releases[0],
-            releases = self.releases,
-            xml_items = self.xml_items,
+        requirement_summary : RequirementSummary = ObjectMother.get_requirement_summary()
+        detail : RequirementDetail = requirement_summary.details[0]
+        f_session : FSession = FSession(
+            package_name = detail.current_package.name,
+            most_recent_release = cast(Release, detail.most_recent_release),
+            releases = [cast(Release, detail.most_recent_release)],
+            xml_items = [],
             badges = None
         )
+
+        package_loader : LocalPackageLoader = LocalPackageLoader(file_reader_function = Mock(return_value = "black==22.12.0"))
+        release_fetcher : MagicMock = MagicMock(spec = PyPiReleaseFetcher)
+        release_fetcher.fetch.return_value = f_session
+        release_fetcher.get_index_urls.return_value = ["https://pypi.org"]
+
+        # Act
+        requirement_checker : RequirementChecker = RequirementChecker(
+            package_loader = package_loader,
+            release_fetcher = release_fetcher,
+            sleeping_function = MagicMock(),
+            summary_cache = SummaryCache()
+        )
         
+        with patch("os.path.isfile", return_value = True):
+            first : RequirementSummary = requirement_checker.get_summary(file_path = r"C:/requirements.txt", waiting_time = 5)
+            second : RequirementSummary = requirement_checker.get_summary(file_path = r"C:/requirements.txt", waiting_time = 5)
+            third : RequirementSummary = requirement_checker.get_summary(file_path = r"C:/requirements.txt", only_stable_releases = False, waiting_time = 5)
+
+        # Assert
+        self.assertIs(second, first)
+        self.assertIsNot(third, first)
+        self.assertEqual(release_fetcher.fetch.call_count, 2)
+    def test_getsummary_shouldrefreshinbackground_whensummaryisstale(self):
+        
+        # Arrange
+        requirement_summary : RequirementSummary = ObjectMother.get_requirement_summary()
+        detail : RequirementDetail = requirement_summary.details[0]
+        f_session : FSession = FSession(
+            package_name = detail.current_package.name,
+            most_recent_release = cast(Release, detail.most_recent_release),
+            releases = [cast(Release, detail.most_recent_release)],
+            xml_items = [],
+            badges = None
+        )
+        refreshed : Event = Event()
+
+        def fetch(package_name : str, only_stable_releases : bool) -> FSession:
+            if release_fetcher.fetch.call_count == 2:
+                refreshed.set()
+            return f_session
+
+        package_loader : LocalPackageLoader = LocalPackageLoader(file_reader_function = Mock(return_value = "black==22.12.0"))
+        release_fetcher : MagicMock = MagicMock(spec = PyPiReleaseFetcher)
+        release_fetcher.fetch.side_effect = fetch
+        release_fetcher.get_index_urls.return_value = ["https://pypi.org"]
+        now_function : MagicMock = MagicMock(return_value = 1000.0)
+
         # Act
-        release_fetcher : PyPiReleaseFetcher = PyPiReleaseFetcher(get_function = self.get_function_mock)
-        actual : FSession = release_fetcher.fetch(package_name = "pandas", only_stable_releases = False)
+        requirement_checker : RequirementChecker = RequirementChecker(
+            package_loader = package_loader,
+            release_fetcher = release_fetcher,
+            sleeping_function = MagicMock(),
+            summary_cache = SummaryCache(ttl = 60, grace = 60, now_function = now_function)
+        )
+        
+        with patch("os.path.isfile", return_value = True):
+            first : RequirementSummary = requirement_checker.get_summary(file_path = r"C:/requirements.txt", waiting_time = 5)
+            now_function.return_value = 1070.0
+            second : RequirementSummary = requirement_checker.get_summary(file_path = r"C:/requirements.txt", waiting_time = 5)
 
         # Assert
-        self.assertEqual(actual, expected)
-    def test_fetch_shouldreturnexpectedfsession_whenonlystablereleasesistrue(self) -> None:
+        self.assertIs(second, first)
+        self.assertTrue(refreshed.wait(timeout = 5))
+    def test_getsummary_shouldnotcachesummary_whenthereareerrors(self):
         
         # Arrange
-        expected : FSession = FSession(
-            package_name = "pandas",
-            most_recent_release = self.releases[0],
-            releases = self.releases,
-            xml_items = self.xml_items,
-            badges = self.badges
+        package_loader : LocalPackageLoader = LocalPackageLoader(file_reader_function = Mock(return_value = "black==22.12.0"))
+        release_fetcher : MagicMock = MagicMock(spec = PyPiReleaseFetcher)
+        release_fetcher.fetch.side_effect = Exception("404 Client Error")
+        release_fetcher.get_index_urls.return_value = ["https://pypi.org"]
+
+        # Act
+        requirement_checker : RequirementChecker = RequirementChecker(
+            package_loader = package_loader,
+            release_fetcher = release_fetcher,
+            sleeping_function = MagicMock(),
+            summary_cache = SummaryCache()
         )
         
+        with patch("os.path.isfile", return_value = True):
+            requirement_checker.get_summary(file_path = r"C:/requirements.txt", waiting_time = 5)
+            actual : RequirementSummary = requirement_checker.get_summary(file_path = r"C:/requirements.txt", waiting_time = 5)
+
+        # Assert
+        self.assertEqual(actual.errors, 1)
+        self.assertEqual(release_fetcher.fetch.call_count, 2)
+    def test_getstatus_shouldreturnformattedstring_wheninvoked(self):
+
+        # Arrange
+        file_path : str = r"C:/Dockerfile"
+        requirement_summary : RequirementSummary = ObjectMother.get_requirement_summary()
+        formatter : MagicMock = MagicMock(spec = Formatter)
+        expected : str = "Formatted Summary"
+        formatter.format_requirement_summary.return_value = expected
+
         # Act
-        release_fetcher : PyPiReleaseFetcher = PyPiReleaseFetcher(get_function = self.get_function_mock, badge_fetcher = self.badge_fetcher_mock)
-        actual : FSession = release_fetcher.fetch(package_name = "pandas", only_stable_releases = True)
+        requirement_checker : RequirementChecker = RequirementChecker(formatter = formatter)
+        
+        with patch.object(RequirementChecker, 'get_summary', return_value = requirement_summary):
+            actual : str = requirement_checker.get_status(file_path)
 
         # Assert
         self.assertEqual(actual, expected)
-    def test_fetch_shouldreturnexpectedfsession_whenonlystablereleasesistrueandtrycatchreturnsnone(self) -> None:
+        formatter.format_requirement_summary.assert_called_once_with(requirement_summary)
+    def test_trygetstatus_shouldreturnexceptionmessage_whenexceptionisraised(self):
         
         # Arrange
-        badge_fetcher_mock : PyPiBadgeFetcher = Mock()
-        badge_fetcher_mock.try_fetch.return_value = None
+        file_path : str = r"C:/Dockerfile"
+        error_message : str = "File not found."
+        
+        # Act       
+        with patch.object(RequirementChecker, 'get_status', side_effect = Exception(error_message)):
+            actual : str = RequirementChecker().try_get_status(file_path = file_path)
+        
+        # Assert
+        self.assertEqual(actual, error_message)
+    @parameterized.expand([
+        [None],
+        [PipelineSettings(fetch_workers = 2, parse_workers = 1, queue_size = 1)]
+    ])
+    def test_getsummary_shouldnotperformnetworkcallsandreportunknown_whenoffline(self, pipeline_settings : Optional[PipelineSettings]):
+        
+        # Arrange
+        packages : list[Package] = [self.package1, Package(name = "numpy", version = "2.1.2")]
+        package_loader : MagicMock = MagicMock(spec = LocalPackageLoader)
+        package_loader.load.return_value = LSession(packages = packages, unparsed_lines = [])
 
-        expected : FSession = FSession(
-            package_name = "pandas",
-            most_recent_release = self.releases[0],
-            releases = self.releases,
-            xml_items = self.xml_items,
-            badges = None
-        )        
+        release_fetcher : MagicMock = MagicMock(spec = PyPiReleaseFetcher)
+        release_fetcher.try_get_cached.side_effect = lambda package_name, only_stable_releases, revalidate : self.f_session1 if package_name == "pandas" else None
+        sleeping_function : MagicMock = MagicMock()
+
+        requirement_checker : RequirementChecker = RequirementChecker(
+            package_loader = package_loader,
+            release_fetcher = release_fetcher,
+            sleeping_function = sleeping_function,
+            pipeline_settings = pipeline_settings,
+            offline = True
+        )
+
+        # Act
+        with patch("os.path.isfile", return_value = True):
+            actual : RequirementSummary = requirement_checker.get_summary(file_path = "requirements.txt", waiting_time = 5)
+
+        # Assert
+        self.assertEqual((actual.matching, actual.unknown, actual.unknown_prc), (1, 1, "50.00%"))
+        self.assertEqual([detail.outcome for detail in actual.details], ["unknown", "matching"])
+        self.assertEqual(release_fetcher.download.call_count + release_fetcher.fetch.call_count, 0)
+        self.assertTrue(all(call.kwargs["revalidate"] == False for call in release_fetcher.try_get_cached.call_args_list))
+        sleeping_function.assert_not_called()
+    def test_getsummary_shouldreportstaleandkeepcache_whenofflinepastgracewindow(self):
         
+        # Arrange
+        temporary_directory : tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        now_function : MagicMock = MagicMock(return_value = 1000.0)
+        release_cache : FileReleaseCache = FileReleaseCache(cache_dir = temporary_directory.name, ttl = 60, grace = 30, now_function = now_function)
+        release_cache.add(package_name = "pandas", only_stable_releases = True, f_session = self.f_session1)
+
+        package_loader : MagicMock = MagicMock(spec = LocalPackageLoader)
+        package_loader.load.return_value = LSession(packages = [self.package1], unparsed_lines = [])
+        get_function : Mock = Mock()
+
+        requirement_checker : RequirementChecker = RequirementChecker(
+            package_loader = package_loader,
+            release_fetcher = PyPiReleaseFetcher(get_function = get_function, release_cache = release_cache),
+            sleeping_function = MagicMock(),
+            offline = True
+        )
+
         # Act
-        release_fetcher : PyPiReleaseFetcher = PyPiReleaseFetcher(get_function = self.get_function_mock, badge_fetcher = badge_fetcher_mock)
-        actual : FSession = release_fetcher.fetch(package_name = "pandas", only_stable_releases = True)
+        now_function.return_value = 1000.0 + 86400
+        with patch("os.path.isfile", return_value = True):
+            actual : RequirementSummary = requirement_checker.get_summary(file_path = "requirements.txt", waiting_time = 5)
 
         # Assert
-        self.assertEqual(actual, expected)
+        self.assertEqual((actual.matching, actual.unknown), (1, 0))
+        self.assertTrue(actual.details[0].is_stale)
+        self.assertEqual(release_cache.get_package_names(), ["pandas"])
+        get_function.assert_not_called()
+    def test_warm_shouldfetcheachpackageonce_whenitislistedinmorethanonefile(self):
+        
+        # Arrange
+        l_sessions : dict[str, LSession] = {
+            "requirements.txt": LSession(packages = [Package(name = "pandas", version = "2.2.3"), Package(name = "numpy", version = "2.1.2")], unparsed_lines = []),
+            "Dockerfile": LSession(packages = [Package(name = "pandas", version = "2.2.2"), Package(name = "acme-billing", version = "1.0.0")], unparsed_lines = [])
+        }
 
-    @parameterized.expand([
-        ["Fri, 20 Sep 2024 13:08:42 GMT", datetime(2024, 9, 20, 13, 8, 42)],
-        [None, None]
-    ])
-    def test_parsepubdatestr_shouldreturndatetimeornone_wheninvoked(self, pubdate_str : Optional[str], expected : Optional[datetime]) -> None:
+        def download(package_name : str, only_stable_releases : bool) -> DSession:
+            if package_name == "acme-billing":
+                raise Exception("404 Client Error")
+            return DSession(package_name = package_name, only_stable_releases = only_stable_releases, url = "", releases_content = "", history_content = None)
+
+        package_loader : MagicMock = MagicMock(spec = LocalPackageLoader)
+        package_loader.load.side_effect = lambda file_path : l_sessions[file_path]
+
+        release_fetcher : MagicMock = MagicMock(spec = PyPiReleaseFetcher)
+        release_fetcher.download.side_effect = download
+        release_fetcher.parse.side_effect = lambda d_session : replace(self.f_session1, package_name = d_session.package_name)
+        release_fetcher.try_get_cached.return_value = None
+
+        requirement_checker : RequirementChecker = RequirementChecker(
+            package_loader = package_loader,
+            release_fetcher = release_fetcher,
+            sleeping_function = MagicMock(),
+            max_retries = 0
+        )
+
+        # Act
+        with patch("os.path.isfile", return_value = True):
+            actual : WarmSummary = requirement_checker.warm(file_paths = ["requirements.txt", "Dockerfile"], waiting_time = 5)
+
+        # Assert
+        self.assertEqual((actual.total_packages, actual.warmed, actual.errors, actual.unchecked), (3, 2, 1, 0))
+        self.assertEqual(sorted(call.kwargs["package_name"] for call in release_fetcher.download.call_args_list), ["acme-billing", "numpy", "pandas"])
+    def create_watch_requirement_checker(self, package_loader : MagicMock, sleeping_function : MagicMock) -> Tuple[RequirementChecker, MagicMock]:
+
+        '''Creates a sequential RequirementChecker whose fetcher returns version 2.0.0 for every package, except "acme-billing" that fails.'''
+
+        def fetch(package_name : str, only_stable_releases : bool) -> FSession:
+            if package_name == "acme-billing":
+                raise Exception("404 Client Error")
+            release : Release = Release(package_name = package_name, version = "2.0.0", date = datetime(2024, 9, 20, 13, 8, 42))
+            return replace(self.f_session1, package_name = package_name, most_recent_release = release, releases = [release])
+
+        release_fetcher : MagicMock = MagicMock(spec = PyPiReleaseFetcher)
+        release_fetcher.fetch.side_effect = fetch
+
+        requirement_checker : RequirementChecker = RequirementChecker(
+            package_loader = package_loader,
+            release_fetcher = release_fetcher,
+            sleeping_function = sleeping_function,
+            max_retries = 0
+        )
+
+        return (requirement_checker, release_fetcher)
+    def test_recheck_shouldfetchonlyaddedchangedandinconclusivepackages_whenpreviousisprovided(self):
         
-        # Arrange      
+        # Arrange
+        package_loader : MagicMock = MagicMock(spec = LocalPackageLoader)
+        package_loader.load.side_effect = [
+            LSession(packages = [Package("pandas", "2.0.0"), Package("numpy", "1.9.0"), Package("flask", "2.0.0"), Package("acme-billing", "1.0.0")], unparsed_lines = []),
+            LSession(packages = [Package("pandas", "2.0.0"), Package("numpy", "2.0.0"), Package("requests", "1.0.0"), Package("acme-billing", "1.0.0")], unparsed_lines = [])
+        ]
+        requirement_checker, release_fetcher = self.create_watch_requirement_checker(package_loader = package_loader, sleeping_function = MagicMock())
+
         # Act
-        release_fetcher : PyPiReleaseFetcher = PyPiReleaseFetcher(get_function = self.get_function_mock)
-        actual : Optional[datetime] = release_fetcher._PyPiReleaseFetcher__parse_pubdate_str(pubdate_str) # type: ignore
+        with patch("os.path.isfile", return_value = True):
+            previous : WSession = requirement_checker.recheck(file_path = "requirements.txt", waiting_time = 5)
+            release_fetcher.fetch.reset_mock()
+            actual : WSession = requirement_checker.recheck(file_path = "requirements.txt", previous = previous, waiting_time = 5)
+
+        # Assert
+        self.assertEqual(len(previous.rechecked), 4)
+        self.assertEqual(sorted(call.kwargs["package_name"] for call in release_fetcher.fetch.call_args_list), ["acme-billing", "numpy", "requests"])
+        self.assertEqual(actual.added, [Package("requests", "1.0.0")])
+        self.assertEqual(actual.changed, [Package("numpy", "2.0.0")])
+        self.assertEqual(actual.removed, [Package("flask", "2.0.0")])
+        self.assertEqual(actual.rechecked, [Package("numpy", "2.0.0"), Package("requests", "1.0.0"), Package("acme-billing", "1.0.0")])
+        self.assertEqual(
+            (actual.requirement_summary.total_packages, actual.requirement_summary.matching, actual.requirement_summary.mismatching, actual.requirement_summary.errors), 
+            (4, 2, 1, 1)
+        )
+    def test_watch_shouldrecheckandlog_whencontentchanges(self):
+        
+        # Arrange
+        stop_event : Event = Event()
+        polls : list[int] = []
+
+        def sleep_or_stop(seconds : int) -> None:
+            if seconds == 1:
+                polls.append(seconds)
+            if len(polls) == 3:
+                stop_event.set()
+
+        sleeping_function : MagicMock = MagicMock(side_effect = sleep_or_stop)
+        package_loader : MagicMock = MagicMock(spec = LocalPackageLoader)
+        package_loader.get_content_hash.side_effect = ["hash1", "hash1", "hash2"]
+        package_loader.load.side_effect = [
+            LSession(packages = [Package("pandas", "2.0.0")], unparsed_lines = []),
+            LSession(packages = [Package("pandas", "2.0.0"), Package("numpy", "1.9.0")], unparsed_lines = [])
+        ]
+        requirement_checker, release_fetcher = self.create_watch_requirement_checker(package_loader = package_loader, sleeping_function = sleeping_function)
+        logging_function : MagicMock = MagicMock()
+
+        # Act
+        with patch("os.path.isfile", return_value = True):
+            actual : Optional[WSession] = requirement_checker.watch(
+                file_path = "requirements.txt", 
+                logging_function = logging_function, 
+                waiting_time = 5, 
+                poll_interval = 1, 
+                stop_event = stop_event)
 
         # Assert
-        self.assertEqual(actual, expected)
-class RuntimeCheckerTestCase(unittest.TestCase):
+        self.assertIsNotNone(actual)
+        self.assertEqual(cast(WSession, actual).rechecked, [Package("numpy", "1.9.0")])
+        self.assertEqual([call.kwargs["package_name"] for call in release_fetcher.fetch.call_args_list], ["pandas", "numpy"])
+        self.assertEqual(package_loader.load.call_count, 2)
+        logging_function.assert_any_call(_MessageCollection.file_rechecked(file_path = "requirements.txt", w_session = cast(WSession, actual)))
+        sleeping_function.assert_any_call(1)
+    def test_watch_shouldlogerroronce_whenerrorrepeats(self):
+        
+        # Arrange
+        stop_event : Event = Event()
+        sleeping_function : MagicMock = MagicMock(side_effect = lambda seconds : sleeping_function.call_count == 3 and stop_event.set())
+        package_loader : MagicMock = MagicMock(spec = LocalPackageLoader)
+        package_loader.get_content_hash.side_effect = FileNotFoundError("No such file: 'requirements.txt'")
+        requirement_checker, _ = self.create_watch_requirement_checker(package_loader = package_loader, sleeping_function = sleeping_function)
+        logging_function : MagicMock = MagicMock()
 
-    def test_getruntimeversion_shouldreturnexpectedtuple_wheninvoked(self):
+        # Act
+        actual : Optional[WSession] = requirement_checker.watch(file_path = "requirements.txt", logging_function = logging_function, stop_event = stop_event)
 
-        # Arrange
-        expected : Tuple[int, int, int] = (3, 12, 5)
-        stdout : str = "Python 3.12.5\n"
-        process : MagicMock = MagicMock(spec = subprocess.CompletedProcess)
-        process.stdout = stdout
+        # Assert
+        self.assertIsNone(actual)
+        logging_function.assert_called_once_with("No such file: 'requirements.txt'")
+    def test_wsession_shouldreturnexpectedstring_wheninvoked(self):
         
+        # Arrange
+        w_session : WSession = WSession(
+            l_session = self.l_session1,
+            requirement_summary = MagicMock(spec = RequirementSummary),
+            added = [self.package1],
+            changed = [],
+            removed = [self.package2],
+            rechecked = [self.package1]
+        )
+
         # Act
-        runtime_checker : RuntimeChecker = RuntimeChecker()
-        actual : Optional[Tuple[int, int, int]] = None
+        # Assert
+        self.assertEqual(str(w_session), "{ 'added': '1', 'changed': '0', 'removed': '1', 'rechecked': '1' }")
+    def test_trywarm_shouldreturnsummaryandfailedpackages_wheninvoked(self):
+        
+        # Arrange
+        requirement_detail : RequirementDetail = RequirementDetail(
+            current_package = Package(name = "acme-billing", version = "1.0.0"),
+            most_recent_release = None,
+            is_version_matching = False,
+            description = "acme-billing couldn't be checked.",
+            outcome = "error"
+        )
+        warm_summary : WarmSummary = WarmSummary(total_packages = 2, warmed = 1, errors = 1, unchecked = 0, details = [self.requirement_detail1, requirement_detail])
+        expected : str = "{ 'total_packages': '2', 'warmed': '1', 'errors': '1', 'unchecked': '0' }\nacme-billing couldn't be checked."
 
-        with patch("platform.system", return_value = "Linux"):
-            with patch("subprocess.run", return_value = process) as run:
-                actual = runtime_checker._RuntimeChecker__get_runtime_version() #type: ignore
+        # Act
+        with patch.object(RequirementChecker, 'warm', return_value = warm_summary):
+            actual : str = RequirementChecker().try_warm(file_paths = ["requirements.txt"])
 
         # Assert
-        run.assert_called_once_with(["python3", "--version"], capture_output = True, text = True, check = True)
         self.assertEqual(actual, expected)
-    def test_getruntimeversion_shouldraiseexception_whenoutputisunexpected(self):
-
+    def test_exportsnapshot_shouldwritecachedfsessions_wheninvoked(self):
+        
         # Arrange
-        stdout : str = "Invalid Output"
-        process : MagicMock = MagicMock(spec = subprocess.CompletedProcess)
-        process.stdout = stdout
-
-        # Act, Assert
-        runtime_checker : RuntimeChecker = RuntimeChecker()
+        temporary_directory : tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        snapshot_path : str = os.path.join(temporary_directory.name, "deps.snap")
 
-        with patch("subprocess.run", return_value = process):
-            with self.assertRaises(Exception) as context:
-                runtime_checker._RuntimeChecker__get_runtime_version() #type: ignore
+        package_loader : MagicMock = MagicMock(spec = LocalPackageLoader)
+        package_loader.load.return_value = self.l_session1
 
-            self.assertEqual(
-                _MessageCollection.python_version_unexpected_output(),
-                str(context.exception))
+        release_fetcher : MagicMock = MagicMock(spec = PyPiReleaseFetcher)
+        release_fetcher.download.return_value = DSession(package_name = "pandas", only_stable_releases = True, url = "", releases_content = "", history_content = None)
+        release_fetcher.parse.return_value = self.f_session1
+        release_fetcher.try_get_cached.side_effect = [None, None, replace(self.f_session1, age = 30.0)]
 
-    @parameterized.expand([
-        [(3, 12, 1), (3, 12, 1), "The installed Python version is matching the expected one (installed: '3.12.1', expected: '3.12.1')."],
-        [(3, 11, 11), (3, 12, 1), "Warning! The installed Python is not matching the expected one (installed: '3.11.11', expected: '3.12.1')."],
-    ])
-    def test_getstatus_shouldreturnexpectedstring_wheninvoked(self, installed : Tuple[int, int, int], required : Tuple[int, int, int], expected : str):
+        requirement_checker : RequirementChecker = RequirementChecker(
+            package_loader = package_loader,
+            release_fetcher = release_fetcher,
+            sleeping_function = MagicMock(),
+            now_function = MagicMock(return_value = 1000.0)
+        )
 
-        # Arrange
-        with patch.object(RuntimeChecker, "_RuntimeChecker__get_runtime_version", return_value = installed):
+        # Act
+        with patch("os.path.isfile", return_value = True):
+            warm_summary, entries = requirement_checker.export_snapshot(file_paths = ["requirements.txt"], snapshot_path = snapshot_path, waiting_time = 5)
 
-            # Act
-            actual : str = RuntimeChecker().get_status(required = required)
+        snapshot : SnapshotReleaseCache = SnapshotReleaseCache(file_path = snapshot_path, now_function = MagicMock(return_value = 1000.0))
+        self.addCleanup(snapshot.close)
+        actual : Optional[FSession] = snapshot.try_get(package_name = "pandas", only_stable_releases = True)
 
-            # Assert
-            self.assertEqual(actual, expected)
+        # Assert
+        self.assertEqual((warm_summary.warmed, entries), (1, 1))
+        self.assertEqual(actual, replace(self.f_session1, age = 30.0))
+        release_fetcher.fetch.assert_not_called()
+    def create_baseline_requirement_checker(self, package_loader : MagicMock, now : float) -> Tuple[RequirementChecker, MagicMock]:
 
-    def test_trygetstatus_shouldreturnexpectedstatus_whennoexceptionisraised(self):
+        '''Creates a sequential RequirementChecker whose fetcher returns version 2.0.0 for every package, except "acme-billing" that fails.'''
 
-        # Arrange
-        installed : Tuple[int, int, int] = (3, 12, 1)
-        required : Tuple[int, int, int] = (3, 12, 1)
-        expected : str = "The installed Python version is matching the expected one (installed: '3.12.1', expected: '3.12.1')."
-        
-        with patch.object(RuntimeChecker, "_RuntimeChecker__get_runtime_version", return_value = installed):
+        def fetch(package_name : str, only_stable_releases : bool) -> FSession:
+            if package_name == "acme-billing":
+                raise Exception("404 Client Error")
+            release : Release = Release(package_name = package_name, version = "2.0.0", date = datetime(2024, 9, 20, 13, 8, 42))
+            return replace(self.f_session1, package_name = package_name, most_recent_release = release, releases = [release])
 
-            # Act
-            actual : str = RuntimeChecker().try_get_status(required = required)
+        release_fetcher : MagicMock = MagicMock(spec = PyPiReleaseFetcher)
+        release_fetcher.fetch.side_effect = fetch
 
-            # Assert
-            self.assertEqual(actual, expected)
-    def test_trygetstatus_shouldreturnexceptionmessage_whenexceptionisraised(self):
+        requirement_checker : RequirementChecker = RequirementChecker(
+            package_loader = package_loader,
+            release_fetcher = release_fetcher,
+            sleeping_function = MagicMock(),
+            max_retries = 0,
+            now_function = MagicMock(return_value = now)
+        )
 
-        # Arrange
-        expected : str = "Some error occurred."
-        required : Tuple[int, int, int] = (3, 12, 1)
-        
-        with patch.object(RuntimeChecker, "_RuntimeChecker__get_runtime_version", side_effect = Exception(expected)):
+        return (requirement_checker, release_fetcher)
+    def create_baseline_entry(self, package : Package, version : str, fetched_at : float) -> BaselineEntry:
 
-            # Act
-            actual : str = RuntimeChecker().try_get_status(required = required)
+        '''Creates a conclusive BaselineEntry for package, whose most recent release is version.'''
 
-            # Assert
-            self.assertEqual(actual, expected)
-class RequirementCheckerTestCase(unittest.TestCase):
+        is_version_matching : bool = package.version == version
+        requirement_detail : RequirementDetail = RequirementDetail(
+            current_package = package,
+            most_recent_release = Release(package_name = package.name, version = version, date = datetime(2024, 9, 20, 13, 8, 42)),
+            is_version_matching = is_version_matching,
+            description = "",
+            outcome = "matching" if is_version_matching else "mismatching"
+        )
 
-    def setUp(self) -> None:
+        return BaselineEntry(requirement_detail = requirement_detail, fetched_at = fetched_at)
+    def test_checkagainstbaseline_shouldreusefreshentriesandreportchanges_whenbaselineexists(self):
 
-        self.package1 : Package = Package(name = "pandas", version = "2.2.3")
-        self.release1 : Release = Release(package_name = "pandas", version = "2.2.3", date = datetime(2024, 9, 20, 13, 8, 42))
-        self.expected_tpl1 : Tuple[bool, str] = (True, _MessageCollection.current_version_matches(self.package1, self.release1))
+        # Arrange
+        temporary_directory : tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        baseline_path : str = os.path.join(temporary_directory.name, "baseline.json")
+
+        now : float = 10 * 86400.0
+        BaselineStore().save(
+            file_path = baseline_path,
+            baseline = Baseline(
+                only_stable_releases = True,
+                saved_at = now - 100,
+                entries = [
+                    self.create_baseline_entry(package = Package("pandas", "2.0.0"), version = "2.0.0", fetched_at = now - 100),
+                    self.create_baseline_entry(package = Package("numpy", "1.9.0"), version = "2.0.0", fetched_at = now - 100),
+                    self.create_baseline_entry(package = Package("flask", "1.0.0"), version = "1.0.0", fetched_at = now - 8 * 86400)
+                ]
+            )
+        )
 
-        self.l_session1 : LSession = LSession(
-            packages = [ self.package1 ],
+        package_loader : MagicMock = MagicMock(spec = LocalPackageLoader)
+        package_loader.load.return_value = LSession(
+            packages = [Package("pandas", "2.0.0"), Package("numpy", "2.0.0"), Package("flask", "1.0.0"), Package("requests", "1.0.0")],
             unparsed_lines = []
         )
+        requirement_checker, release_fetcher = self.create_baseline_requirement_checker(package_loader = package_loader, now = now)
 
-        self.f_session1 : FSession = FSession(
-            package_name = "pandas",
-            most_recent_release = self.release1,
-            releases = [self.release1],
-            xml_items = [
-                XMLItem(title="2.1.2", link="https://pypi.org/project/pandas/2.2.3/", description="", author=None, pubdate=datetime.strptime("Sat, 05 Oct 2024 18:28:18 GMT", "%a, %d %b %Y %H:%M:%S %Z"), pubdate_str="Sat, 05 Oct 2024 18:28:18 GMT"),
-            ],
-            badges = None
-        )
+        # Act
+        with patch("os.path.isfile", return_value = True):
+            actual : BaselineReport = requirement_checker.check_against_baseline(file_path = "requirements.txt", baseline_path = baseline_path, waiting_time = 5)
 
-        self.requirement_detail1 : RequirementDetail = RequirementDetail(
-            current_package = self.package1,
-            most_recent_release = self.release1,
-            is_version_matching = self.expected_tpl1[0],
-            description = self.expected_tpl1[1]
-        )
-        self.expected_sd1 : list[RequirementDetail] = [ self.requirement_detail1 ]
+        saved : Baseline = cast(Baseline, requirement_checker.load_baseline(baseline_path = baseline_path))
 
-        self.package2 : Package = Package(name = "pandas", version = "2.2.2")
-        self.release2 : Release = Release(package_name = "pandas", version = "2.2.3", date = datetime(2024, 9, 20, 13, 8, 42))
-        self.expected_tpl2 : Tuple[bool, str] = (False, _MessageCollection.current_version_doesnt_match(self.package2, self.release2))
+        # Assert
+        self.assertEqual([call.kwargs["package_name"] for call in release_fetcher.fetch.call_args_list], ["flask", "requests"])
+        self.assertEqual(actual.reused, [Package("pandas", "2.0.0"), Package("numpy", "2.0.0")])
+        self.assertEqual(actual.refetched, [Package("flask", "1.0.0"), Package("requests", "1.0.0")])
+        self.assertEqual(actual.newly_outdated, [Package("flask", "1.0.0")])
+        self.assertEqual(actual.newly_current, [Package("numpy", "2.0.0")])
+        self.assertEqual((actual.requirement_summary.matching, actual.requirement_summary.mismatching), (2, 2))
+        self.assertEqual(saved, actual.baseline)
+        self.assertEqual(
+            sorted((entry.requirement_detail.current_package.name, entry.fetched_at) for entry in saved.entries),
+            [("flask", now), ("numpy", now - 100), ("pandas", now - 100), ("requests", now)]
+        )
+    def test_checkagainstbaseline_shouldfetchallandfetchnothingafterwards_whenbaselinedoesnotexist(self):
 
-    def test_compare_shouldreturnexpectedtuple_whenversionsmatch(self) -> None:
-        
         # Arrange
+        temporary_directory : tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        baseline_path : str = os.path.join(temporary_directory.name, "baseline.json")
+
+        package_loader : MagicMock = MagicMock(spec = LocalPackageLoader)
+        package_loader.load.return_value = LSession(packages = [Package("pandas", "2.0.0"), Package("numpy", "1.9.0")], unparsed_lines = [])
+        requirement_checker, release_fetcher = self.create_baseline_requirement_checker(package_loader = package_loader, now = 1000.0)
+
         # Act
-        requirement_checker : RequirementChecker = RequirementChecker()
-        actual : Tuple[bool, str] = requirement_checker._RequirementChecker__compare(current_package = self.package1, most_recent_release = self.release1) # type: ignore
-        
+        with patch("os.path.isfile", return_value = True):
+            first : BaselineReport = requirement_checker.check_against_baseline(file_path = "requirements.txt", baseline_path = baseline_path, waiting_time = 5)
+            second : BaselineReport = requirement_checker.check_against_baseline(file_path = "requirements.txt", baseline_path = baseline_path, waiting_time = 5)
+
         # Assert
-        self.assertEqual(actual, self.expected_tpl1)
-    def test_compare_shouldreturnexpectedtuple_whenversionsmismatch(self) -> None:
-        
+        self.assertEqual(release_fetcher.fetch.call_count, 2)
+        self.assertEqual((len(first.refetched), first.newly_outdated, first.newly_current), (2, [], []))
+        self.assertEqual((len(second.reused), second.refetched, second.newly_outdated, second.newly_current), (2, [], [], []))
+        self.assertEqual(second.requirement_summary.details, first.requirement_summary.details)
+    def test_checkagainstbaseline_shouldkeeppreviousentry_whenpackagecantbefetched(self):
+
         # Arrange
+        temporary_directory : tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        baseline_path : str = os.path.join(temporary_directory.name, "baseline.json")
+
+        now : float = 10 * 86400.0
+        previous_entry : BaselineEntry = self.create_baseline_entry(package = Package("acme-billing", "1.0.0"), version = "1.0.0", fetched_at = 0.0)
+        BaselineStore().save(file_path = baseline_path, baseline = Baseline(only_stable_releases = True, saved_at = 0.0, entries = [previous_entry]))
+
+        package_loader : MagicMock = MagicMock(spec = LocalPackageLoader)
+        package_loader.load.return_value = LSession(packages = [Package("acme-billing", "1.0.0")], unparsed_lines = [])
+        requirement_checker, _ = self.create_baseline_requirement_checker(package_loader = package_loader, now = now)
+
         # Act
-        requirement_checker : RequirementChecker = RequirementChecker()
-        actual : Tuple[bool, str] = requirement_checker._RequirementChecker__compare(current_package = self.package2, most_recent_release = self.release2) # type: ignore
-        
+        with patch("os.path.isfile", return_value = True):
+            actual : BaselineReport = requirement_checker.check_against_baseline(file_path = "requirements.txt", baseline_path = baseline_path, waiting_time = 5)
+
         # Assert
-        self.assertEqual(actual, self.expected_tpl2)
-    def test_createrequirementdetails_shouldreturnexpectedlistofrequirementdetails_wheninvoked(self) -> None:
-        
+        self.assertEqual(actual.requirement_summary.errors, 1)
+        self.assertEqual(actual.baseline.entries, [previous_entry])
+    def test_checkagainstbaseline_shouldignorebaseline_whenonlystablereleasesdiffers(self):
+
         # Arrange
+        temporary_directory : tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        baseline_path : str = os.path.join(temporary_directory.name, "baseline.json")
+
+        entry : BaselineEntry = self.create_baseline_entry(package = Package("pandas", "2.0.0"), version = "1.0.0", fetched_at = 1000.0)
+        BaselineStore().save(file_path = baseline_path, baseline = Baseline(only_stable_releases = False, saved_at = 1000.0, entries = [entry]))
+
+        package_loader : MagicMock = MagicMock(spec = LocalPackageLoader)
+        package_loader.load.return_value = LSession(packages = [Package("pandas", "2.0.0")], unparsed_lines = [])
+        requirement_checker, release_fetcher = self.create_baseline_requirement_checker(package_loader = package_loader, now = 1000.0)
+
         # Act
-        release_fetcher_mock : PyPiReleaseFetcher = Mock()
-        release_fetcher_mock.fetch.return_value = self.f_session1
+        with patch("os.path.isfile", return_value = True):
+            actual : BaselineReport = requirement_checker.check_against_baseline(file_path = "requirements.txt", baseline_path = baseline_path, only_stable_releases = True, waiting_time = 5)
 
-        requirement_checker : RequirementChecker = RequirementChecker(
-            release_fetcher = release_fetcher_mock
-        )
-        actual : list[RequirementDetail] = requirement_checker._RequirementChecker__create_requirement_details(l_session = self.l_session1, only_stable_releases = False, waiting_time = 0) # type: ignore
-        
         # Assert
-        self.assertTrue(
-            SupportMethodProvider.are_lists_of_requirementdetails_equal(
-                list1 = actual,
-                list2 = self.expected_sd1
-            ))
-    def test_calculateprc_shouldreturnexpectedstring_wheninvoked(self) -> None:
-        
+        release_fetcher.fetch.assert_called_once_with(package_name = "pandas", only_stable_releases = True)
+        self.assertEqual((actual.reused, actual.newly_current), ([], []))
+        self.assertTrue(actual.baseline.only_stable_releases)
+    def test_getsummary_shouldskipcheckpointedpackages_whenresumingaftertheinterruption(self):
+
         # Arrange
-        value : int = 5
-        total : int = 10
-        expected : str = "50.00%"
-        
+        temporary_directory : tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        journal_path : str = os.path.join(temporary_directory.name, "requirements.jsonl")
+
+        package_loader : MagicMock = MagicMock(spec = LocalPackageLoader)
+        package_loader.load.return_value = LSession(
+            packages = [Package("pandas", "2.0.0"), Package("numpy", "1.9.0"), Package("flask", "2.0.0"), Package("requests", "2.0.0")],
+            unparsed_lines = []
+        )
+        requirement_checker, release_fetcher = self.create_baseline_requirement_checker(package_loader = package_loader, now = 1000.0)
+        fetch : Callable[..., FSession] = release_fetcher.fetch.side_effect
+
+        def fetch_or_interrupt(package_name : str, only_stable_releases : bool) -> FSession:
+            if package_name == "flask":
+                raise KeyboardInterrupt()
+            return fetch(package_name = package_name, only_stable_releases = only_stable_releases)
+
+        release_fetcher.fetch.side_effect = fetch_or_interrupt
+
         # Act
-        requirement_checker : RequirementChecker = RequirementChecker()
-        actual : str = requirement_checker._RequirementChecker__calculate_prc(value = value, total = total) # type: ignore
-        
+        with patch("os.path.isfile", return_value = True):
+
+            with self.assertRaises(KeyboardInterrupt):
+                requirement_checker.get_summary(file_path = "requirements.txt", waiting_time = 5, journal_path = journal_path)
+
+            release_fetcher.fetch.reset_mock()
+            release_fetcher.fetch.side_effect = fetch
+            actual : RequirementSummary = requirement_checker.get_summary(file_path = "requirements.txt", waiting_time = 5, journal_path = journal_path, resume = True)
+
         # Assert
-        self.assertEqual(actual, expected)  
+        self.assertEqual([call.kwargs["package_name"] for call in release_fetcher.fetch.call_args_list], ["flask", "requests"])
+        self.assertEqual((actual.total_packages, actual.matching, actual.mismatching), (4, 3, 1))
+        self.assertFalse(os.path.exists(journal_path))
+    def test_getsummary_shouldcheckpointandresume_whenpipelinesettingsareprovided(self):
 
-    def test_getsummary_shouldraiseexpectedexceptionandmessage_whenwaitingtimelessthanminimum(self):
-        
         # Arrange
-        file_path : str = r"C:/Dockerfile"
-        waiting_time : int = 2
-        minimum_wt : int = 5
-        expected : str = _MessageCollection.waiting_time_cant_be_less_than(waiting_time, minimum_wt)
+        temporary_directory : tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        journal_path : str = os.path.join(temporary_directory.name, "requirements.jsonl")
+        failing : list[str] = ["package3"]
 
-        # Act, Assert
-        with self.assertRaises(expected_exception = Exception, msg = expected):
-            requirement_checker : RequirementChecker = RequirementChecker()
-            requirement_checker.get_summary(file_path = file_path, waiting_time = waiting_time)
-    def test_getsummary_shouldreturnexpectedrequirementsummary_wheninvoked(self):
-        
-        # Arrange
-        requirement_summary : RequirementSummary = ObjectMother.get_requirement_summary()
-        packages : list[Package] = [detail.current_package for detail in requirement_summary.details]
-        l_session : LSession = LSession(packages = packages, unparsed_lines = [])
+        def download(package_name : str, only_stable_releases : bool) -> DSession:
+            return DSession(package_name = package_name, only_stable_releases = only_stable_releases, url = "", releases_content = "", history_content = None)
 
-        f_sessions : list[FSession] = []
-        for detail in requirement_summary.details:
-            f_session : FSession = FSession(
-                package_name = detail.current_package.name,
-                most_recent_release = detail.most_recent_release,
-                releases = [detail.most_recent_release],
-                xml_items = [],
-                badges = None
-            )
-            f_sessions.append(f_session)
+        def parse(d_session : DSession) -> FSession:
+            if d_session.package_name in failing:
+                raise Exception("Parsing error")
+            release : Release = Release(package_name = d_session.package_name, version = "1.0.0", date = datetime(2024, 1, 1))
+            return FSession(package_name = d_session.package_name, most_recent_release = release, releases = [release], xml_items = [], badges = None)
 
         package_loader : MagicMock = MagicMock(spec = LocalPackageLoader)
-        package_loader.load.return_value = l_session
+        package_loader.load.return_value = LSession(packages = [Package(name = f"package{i}", version = "1.0.0") for i in range(6)], unparsed_lines = [])
 
         release_fetcher : MagicMock = MagicMock(spec = PyPiReleaseFetcher)
-        release_fetcher.fetch.side_effect = f_sessions
-
-        sleeping_function : MagicMock = MagicMock()
-
-        file_path : str = r"C:/Dockerfile"
-        only_stable_releases : bool = False
-        waiting_time : int = 5
+        release_fetcher.download.side_effect = download
+        release_fetcher.parse.side_effect = parse
+        release_fetcher.try_get_cached.return_value = None
 
-        # Act
         requirement_checker : RequirementChecker = RequirementChecker(
             package_loader = package_loader,
             release_fetcher = release_fetcher,
-            sleeping_function = sleeping_function
+            sleeping_function = MagicMock(),
+            max_retries = 0,
+            pipeline_settings = PipelineSettings(fetch_workers = 3, parse_workers = 2, queue_size = 1)
         )
-        
+
+        # Act
         with patch("os.path.isfile", return_value = True):
-            actual : RequirementSummary = requirement_checker.get_summary(
-                file_path = file_path, 
-                only_stable_releases = only_stable_releases, 
-                waiting_time = waiting_time
-            )
+            first : RequirementSummary = requirement_checker.get_summary(file_path = "requirements.txt", waiting_time = 5, journal_path = journal_path)
+            checkpointed : int = len(RequirementJournal(file_path = journal_path).resume(only_stable_releases = True))
+            failing.clear()
+            release_fetcher.download.reset_mock()
+            second : RequirementSummary = requirement_checker.get_summary(file_path = "requirements.txt", waiting_time = 5, journal_path = journal_path, resume = True)
 
         # Assert
-        self.assertEqual(actual.total_packages, requirement_summary.total_packages)
-        self.assertEqual(actual.matching, requirement_summary.matching)
-        self.assertEqual(actual.matching_prc, requirement_summary.matching_prc)
-        self.assertEqual(len(actual.details), len(requirement_summary.details))
-        package_loader.load.assert_called_once_with(file_path = file_path)
-    def test_getstatus_shouldreturnformattedstring_wheninvoked(self):
+        self.assertEqual((first.matching, first.errors, checkpointed), (5, 1, 5))
+        self.assertEqual([call.kwargs["package_name"] for call in release_fetcher.download.call_args_list], ["package3"])
+        self.assertEqual((second.total_packages, second.matching), (6, 6))
+        self.assertFalse(os.path.exists(journal_path))
+    def test_getbaselinestatus_shouldappendchanges_whenpackageshavechanged(self):
 
         # Arrange
-        file_path : str = r"C:/Dockerfile"
-        requirement_summary : RequirementSummary = ObjectMother.get_requirement_summary()
-        formatter : MagicMock = MagicMock(spec = Formatter)
-        expected : str = "Formatted Summary"
-        formatter.format_requirement_summary.return_value = expected
+        baseline_report : BaselineReport = BaselineReport(
+            requirement_summary = MagicMock(spec = RequirementSummary),
+            baseline = Baseline(only_stable_releases = True, saved_at = 1000.0, entries = []),
+            reused = [],
+            refetched = [self.package1],
+            newly_outdated = [Package("flask", "1.0.0"), Package("numpy", "1.9.0")],
+            newly_current = []
+        )
+        formatter : MagicMock = MagicMock(spec = BasicFormatter)
+        formatter.format_requirement_summary.return_value = "Summary"
+        expected : str = str.join("\n", [
+            "Summary",
+            "The baseline 'baseline.json' has been updated: { 'reused': '0', 'refetched': '1', 'newly_outdated': '2', 'newly_current': '0' }.",
+            "Newly outdated since the baseline: 'flask', 'numpy'."
+        ])
 
         # Act
-        requirement_checker : RequirementChecker = RequirementChecker(formatter = formatter)
-        
-        with patch.object(RequirementChecker, 'get_summary', return_value = requirement_summary):
-            actual : str = requirement_checker.get_status(file_path)
+        with patch.object(RequirementChecker, 'check_against_baseline', return_value = baseline_report):
+            actual : str = RequirementChecker(formatter = formatter).try_get_baseline_status(file_path = "requirements.txt", baseline_path = "baseline.json")
 
         # Assert
         self.assertEqual(actual, expected)
-        formatter.format_requirement_summary.assert_called_once_with(requirement_summary)
-    def test_trygetstatus_shouldreturnexceptionmessage_whenexceptionisraised(self):
+    def test_trywarm_shouldreturnexceptionmessage_whenexceptionisraised(self):
         
         # Arrange
-        file_path : str = r"C:/Dockerfile"
         error_message : str = "File not found."
         
         # Act       
-        with patch.object(RequirementChecker, 'get_status', side_effect = Exception(error_message)):
-            actual : str = RequirementChecker().try_get_status(file_path = file_path)
+        with patch.object(RequirementChecker, 'warm', side_effect = Exception(error_message)):
+            actual : str = RequirementChecker().try_warm(file_paths = ["requirements.txt"])
         
         # Assert
         self.assertEqual(actual, error_message)